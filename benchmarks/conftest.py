@@ -0,0 +1,86 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from benchmarks.harness import (
+    BASELINE_PATH,
+    BenchmarkResult,
+    current_environment,
+    format_report,
+    load_baseline,
+    store_baseline,
+)
+from benchmarks.streams import record_session, SESSIONS, StreamingSession
+from umrx_app_v3.mcu_board.comm.capture_comm import Capture, read_capture
+
+RESULTS: list[BenchmarkResult] = []
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("benchmarks")
+    group.addoption("--update-baseline", action="store_true", help="store the measured rates as new baseline")
+    group.addoption(
+        "--benchmark-tolerance",
+        type=float,
+        default=0.3,
+        help="fraction a rate may drop below its baseline before the benchmark fails",
+    )
+    group.addoption(
+        "--replay-capture",
+        type=Path,
+        default=None,
+        help="capture file recorded on hardware, used instead of the emulated byte stream",
+    )
+
+
+@pytest.fixture(scope="session")
+def streaming_sessions(tmp_path_factory: pytest.TempPathFactory) -> dict[str, StreamingSession]:
+    directory = tmp_path_factory.mktemp("captures")
+    return {name: record_session(name, directory) for name in SESSIONS}
+
+
+@pytest.fixture(scope="session")
+def stream_input(request: pytest.FixtureRequest) -> tuple[str, list[Capture]]:
+    capture_path = request.config.getoption("--replay-capture")
+    if capture_path is not None:
+        return capture_path.stem, [read_capture(capture_path)]
+    # the virtual shuttle sessions are only recorded when no capture is given
+    streaming_sessions: dict[str, StreamingSession] = request.getfixturevalue("streaming_sessions")
+    return "emulated", [session.capture for session in streaming_sessions.values()]
+
+
+@pytest.fixture
+def check_baseline(request: pytest.FixtureRequest) -> Callable[[BenchmarkResult], None]:
+    baseline = load_baseline()
+    tolerance = request.config.getoption("--benchmark-tolerance")
+    update = request.config.getoption("--update-baseline")
+
+    def check(result: BenchmarkResult) -> None:
+        RESULTS.append(result)
+        if update:
+            return
+        if not baseline:
+            # without a baseline for this environment a regression would pass unnoticed
+            pytest.fail(
+                f"No baseline for {current_environment()} in {BASELINE_PATH.name}, record it with --update-baseline"
+            )
+        reference = baseline.get(result.name)
+        if reference is None:
+            return
+        assert result.rate >= reference * (
+            1 - tolerance
+        ), f"{result.name}: {result.rate:,.0f} {result.unit}/s is below the baseline of {reference:,.0f}"
+
+    return check
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter, config: pytest.Config) -> None:
+    if not RESULTS:
+        return
+    terminalreporter.section("throughput")
+    for line in format_report(RESULTS, load_baseline()):
+        terminalreporter.write_line(line)
+    if config.getoption("--update-baseline"):
+        store_baseline(RESULTS)
+        terminalreporter.write_line(f"baseline updated with {len(RESULTS)} results")
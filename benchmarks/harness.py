@@ -0,0 +1,79 @@
+import json
+import platform
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    unit: str  # "frames" or "samples"
+    items: int
+    seconds: float
+
+    @property
+    def rate(self) -> float:
+        return self.items / self.seconds
+
+
+def measure(
+    name: str, unit: str, function: Callable[[], int], *, repeat: int = 5, min_time: float = 0.1
+) -> BenchmarkResult:
+    # `function` processes the whole input once and returns how many frames or samples it handled;
+    # it is looped until a round takes `min_time`, the fastest of `repeat` rounds is kept
+    items = function()
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops *= 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        best = min(best, time.perf_counter() - start)
+    return BenchmarkResult(name, unit, items * loops, best)
+
+
+def current_environment() -> str:
+    # rates are only comparable on the machine and interpreter they were measured with,
+    # patch releases of the interpreter share a baseline
+    major, minor, _ = platform.python_version_tuple()
+    return f"{platform.machine()} {platform.system()}, Python {major}.{minor}"
+
+
+def load_baselines(path: Path = BASELINE_PATH) -> dict[str, dict[str, float]]:
+    if not path.exists():
+        return {}
+    baselines: dict[str, dict[str, float]] = json.loads(path.read_text())
+    return baselines
+
+
+def load_baseline(path: Path = BASELINE_PATH, environment: str | None = None) -> dict[str, float]:
+    return load_baselines(path).get(current_environment() if environment is None else environment, {})
+
+
+def store_baseline(results: list[BenchmarkResult], path: Path = BASELINE_PATH) -> None:
+    baselines = load_baselines(path)
+    rates = baselines.get(current_environment(), {})
+    rates.update({result.name: round(result.rate) for result in results})
+    baselines[current_environment()] = dict(sorted(rates.items()))
+    path.write_text(json.dumps(dict(sorted(baselines.items())), indent=2) + "\n")
+
+
+def format_report(results: list[BenchmarkResult], baseline: dict[str, float]) -> list[str]:
+    lines = [f"{'benchmark':<52} {'rate':>14} {'unit':<11} {'baseline':>9}"]
+    for result in sorted(results, key=lambda result: result.name):
+        reference = baseline.get(result.name)
+        change = f"{result.rate / reference - 1:+.0%}" if reference else "-"
+        lines.append(f"{result.name:<52} {result.rate:>14,.0f} {result.unit + '/s':<11} {change:>9}")
+    return lines
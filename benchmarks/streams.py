@@ -0,0 +1,86 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from umrx_app_v3.mcu_board.bst_protocol_constants import CoinesResponse, StreamingDataResponse
+from umrx_app_v3.mcu_board.comm.capture_comm import Capture, Direction, read_capture, RecordingCommunication
+from umrx_app_v3.mcu_board.commands.frame_scanner import FrameScanner
+from umrx_app_v3.shuttle_board.bma400.bma400_virtual import VirtualBMA400Shuttle
+from umrx_app_v3.shuttle_board.bma456.bma456_virtual import VirtualBMA456Shuttle
+from umrx_app_v3.shuttle_board.bma530.bma530_virtual import VirtualBMA530Shuttle
+from umrx_app_v3.shuttle_board.bma580.bma580_virtual import VirtualBMA580Shuttle
+from umrx_app_v3.shuttle_board.bme280.bme280_virtual import VirtualBME280Shuttle
+from umrx_app_v3.shuttle_board.bmi088.bmi088_virtual import VirtualBMI088Shuttle
+from umrx_app_v3.shuttle_board.bmi323.bmi323_virtual import VirtualBMI323Shuttle
+from umrx_app_v3.shuttle_board.bmm350.bmm350_virtual import VirtualBMM350Shuttle
+from umrx_app_v3.shuttle_board.bmp390.bmp390_virtual import VirtualBMP390Shuttle
+from umrx_app_v3.shuttle_board.bmp585.bmp585_virtual import VirtualBMP585Shuttle
+
+# shuttle, interface, streaming mode
+SESSIONS = {
+    "bma400": (VirtualBMA400Shuttle, "spi", "interrupt"),
+    "bma456": (VirtualBMA456Shuttle, "spi", "interrupt"),
+    "bma530": (VirtualBMA530Shuttle, "i2c", "interrupt"),
+    "bma580": (VirtualBMA580Shuttle, "i2c", "interrupt"),
+    "bme280": (VirtualBME280Shuttle, "spi", "polling"),
+    "bmi088": (VirtualBMI088Shuttle, "spi", "interrupt"),
+    "bmi323": (VirtualBMI323Shuttle, "i2c", "interrupt"),
+    "bmm350": (VirtualBMM350Shuttle, "i2c", "interrupt"),
+    "bmp390": (VirtualBMP390Shuttle, "i2c", "interrupt"),
+    "bmp585": (VirtualBMP585Shuttle, "spi", "interrupt"),
+}
+PACKETS_PER_SESSION = 4096
+# serial reads return whatever arrived since the last read, frames are cut at arbitrary points
+SERIAL_READ_SIZE = 512
+
+
+@dataclass
+class StreamingSession:
+    name: str
+    mode: str
+    shuttle: Any
+    capture: Capture
+
+
+def record_session(name: str, directory: Path) -> StreamingSession:
+    virtual_shuttle_class, interface, mode = SESSIONS[name]
+    virtual_shuttle = virtual_shuttle_class()
+    emulator = virtual_shuttle.emulator
+    emulator.max_packets_per_receive = PACKETS_PER_SESSION
+    shuttle = virtual_shuttle.create_shuttle()
+    shuttle.initialize()
+    shuttle.check_connected_hw()
+    getattr(shuttle, f"configure_{interface}")()
+    getattr(shuttle, f"configure_{mode}_streaming")()
+    if mode == "interrupt":
+        shuttle.board.enable_timer()
+    # calibration for the compensation benchmarks
+    if hasattr(shuttle, "read_otp"):
+        shuttle.read_otp()
+    elif hasattr(shuttle.sensor, "read_nvm"):
+        shuttle.sensor.read_nvm()
+
+    recorder = RecordingCommunication(emulator, directory / f"{name}.cap")
+    shuttle.start_streaming()
+    emulator.virtual_time += 120.0
+    list(emulator.receive_multiple_streaming_packets())
+    shuttle.stop_streaming()
+    recorder.disconnect()
+    return StreamingSession(name, mode, shuttle, read_capture(recorder.writer.path))
+
+
+def received_stream(capture: Capture) -> bytes:
+    return b"".join(record.data for record in capture.records if record.direction == Direction.RECEIVED)
+
+
+def streaming_frames(capture: Capture, response: StreamingDataResponse) -> list[bytes]:
+    stream = received_stream(capture)
+    position = CoinesResponse.DD_RESPONSE_COMMAND_ID_POSITION.value
+    return [bytes(frame) for frame in FrameScanner().scan(stream) if frame[position] == response.value]
+
+
+def serial_reads(capture: Capture, *, rechunk: bool) -> list[bytes]:
+    if not rechunk:
+        return [record.data for record in capture.records if record.direction == Direction.RECEIVED]
+    stream = received_stream(capture)
+    return [stream[start : start + SERIAL_READ_SIZE] for start in range(0, len(stream), SERIAL_READ_SIZE)]
@@ -0,0 +1,140 @@
+from collections.abc import Callable
+
+import pytest
+
+from benchmarks.harness import BenchmarkResult, measure
+from benchmarks.streams import serial_reads, SESSIONS, streaming_frames, StreamingSession
+from umrx_app_v3.mcu_board.bst_protocol_constants import StreamingDataResponse
+from umrx_app_v3.mcu_board.comm.capture_comm import Capture
+from umrx_app_v3.mcu_board.comm.ring_buffer import ByteRingBuffer
+from umrx_app_v3.mcu_board.comm.serial_comm import SerialCommunication
+from umrx_app_v3.mcu_board.commands.command import Command
+from umrx_app_v3.mcu_board.commands.streaming_interrupt import StreamingInterruptCmd
+from umrx_app_v3.mcu_board.commands.streaming_polling import StreamingPollingCmd
+
+Check = Callable[[BenchmarkResult], None]
+StreamInput = tuple[str, list[Capture]]
+
+
+def frames_of(stream_input: StreamInput, response: StreamingDataResponse) -> list[bytes]:
+    _, captures = stream_input
+    frames = [frame for capture in captures for frame in streaming_frames(capture, response)]
+    if not frames:
+        pytest.skip(f"no {response.name.lower()} streaming frames in the input")
+    return frames
+
+
+def test_check_message(stream_input: StreamInput, check_baseline: Check) -> None:
+    frames = frames_of(stream_input, StreamingDataResponse.INTERRUPT)
+
+    def run() -> int:
+        for frame in frames:
+            Command.check_message(frame)
+        return len(frames)
+
+    check_baseline(measure(f"check_message[{stream_input[0]}]", "frames", run))
+
+
+def test_parse_interrupt_streaming_packet(stream_input: StreamInput, check_baseline: Check) -> None:
+    frames = frames_of(stream_input, StreamingDataResponse.INTERRUPT)
+
+    def run() -> int:
+        for frame in frames:
+            StreamingInterruptCmd.parse_streaming_packet(frame, includes_mcu_timestamp=True)
+        return len(frames)
+
+    check_baseline(measure(f"parse_interrupt_packet[{stream_input[0]}]", "frames", run))
+
+
+def test_parse_polling_streaming_packet(stream_input: StreamInput, check_baseline: Check) -> None:
+    frames = frames_of(stream_input, StreamingDataResponse.POLLING)
+
+    def run() -> int:
+        for frame in frames:
+            StreamingPollingCmd.parse_streaming_packet(frame)
+        return len(frames)
+
+    check_baseline(measure(f"parse_polling_packet[{stream_input[0]}]", "frames", run))
+
+
+def test_serial_receive_multiple_streaming_packets(stream_input: StreamInput, check_baseline: Check) -> None:
+    name, captures = stream_input
+    # emulated reads hold whole frames only, they are cut like serial reads to exercise the reassembly
+    reads = [read for capture in captures for read in serial_reads(capture, rechunk=name == "emulated")]
+    communication = SerialCommunication()
+    communication.ring_buffer = ByteRingBuffer(capacity=max(len(read) for read in reads))
+
+    def run() -> int:
+        communication.reset_reassembly_buffer()
+        num_frames = 0
+        for read in reads:
+            communication.ring_buffer.write(read)
+            num_frames += sum(1 for _ in communication.receive_multiple_streaming_packets())
+        return num_frames
+
+    check_baseline(measure(f"serial_receive_multiple_streaming_packets[{name}]", "frames", run))
+
+
+@pytest.mark.parametrize("name", SESSIONS)
+def test_decode_batch(name: str, streaming_sessions: dict[str, StreamingSession], check_baseline: Check) -> None:
+    session = streaming_sessions[name]
+    if session.mode == "interrupt":
+        frames = streaming_frames(session.capture, StreamingDataResponse.INTERRUPT)
+
+        def decode_streaming_batch() -> object:
+            return StreamingInterruptCmd.decode_streaming_batch(frames, includes_mcu_timestamp=True)
+
+    else:
+        frames = streaming_frames(session.capture, StreamingDataResponse.POLLING)
+
+        def decode_streaming_batch() -> object:
+            return StreamingPollingCmd.decode_streaming_batch(frames)
+
+    def run() -> int:
+        batch = decode_streaming_batch()
+        session.shuttle.decode_batch(batch)
+        return len(batch)
+
+    check_baseline(measure(f"decode_batch[{name}]", "samples", run))
+
+
+def test_compensate_batch_bmm350(streaming_sessions: dict[str, StreamingSession], check_baseline: Check) -> None:
+    session = streaming_sessions["bmm350"]
+    batch = StreamingInterruptCmd.decode_streaming_batch(
+        streaming_frames(session.capture, StreamingDataResponse.INTERRUPT), includes_mcu_timestamp=True
+    )
+    decoded = session.shuttle.decode_batch(batch)
+
+    def run() -> int:
+        session.shuttle.sensor.compensate_batch(
+            decoded["mag_x"], decoded["mag_y"], decoded["mag_z"], decoded["temperature"]
+        )
+        return len(decoded)
+
+    check_baseline(measure("compensate_batch[bmm350]", "samples", run))
+
+
+def test_compensate_batch_bmp390(streaming_sessions: dict[str, StreamingSession], check_baseline: Check) -> None:
+    session = streaming_sessions["bmp390"]
+    batch = StreamingInterruptCmd.decode_streaming_batch(
+        streaming_frames(session.capture, StreamingDataResponse.INTERRUPT), includes_mcu_timestamp=True
+    )
+    decoded = session.shuttle.decode_batch(batch)
+
+    def run() -> int:
+        session.shuttle.sensor.compensate_batch(decoded["pressure"], decoded["temperature"])
+        return len(decoded)
+
+    check_baseline(measure("compensate_batch[bmp390]", "samples", run))
+
+
+def test_compensate_batch_bme280(streaming_sessions: dict[str, StreamingSession], check_baseline: Check) -> None:
+    session = streaming_sessions["bme280"]
+    batch = StreamingPollingCmd.decode_streaming_batch(streaming_frames(session.capture, StreamingDataResponse.POLLING))
+    decoded = session.shuttle.decode_batch(batch)
+
+    def run() -> int:
+        session.shuttle.sensor.compensate_batch(decoded["pressure"], decoded["temperature"], decoded["humidity"])
+        return len(decoded)
+
+    check_baseline(measure("compensate_batch[bme280]", "samples", run))
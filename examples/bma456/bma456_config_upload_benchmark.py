@@ -0,0 +1,52 @@
+import logging
+import sys
+import time
+from pathlib import Path
+
+from umrx_app_v3.shuttle_board.bma456.bma456_shuttle import BMA456Shuttle
+
+
+def setup_logging(level: int = logging.INFO) -> logging.Logger:
+    logger = logging.getLogger()
+    logger.setLevel(level)
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    log_format = "(%(asctime)s) [%(levelname)-8s] %(filename)s:%(lineno)d:  %(message)s"
+    log_formatter = logging.Formatter(log_format)
+    stdout_handler.setFormatter(log_formatter)
+    file_handler = logging.FileHandler(f"{Path(__file__).parent / Path(__file__).stem}.log", mode="w")
+    file_handler.setFormatter(log_formatter)
+    logger.addHandler(stdout_handler)
+    logger.addHandler(file_handler)
+    return logger
+
+
+def upload(shuttle: BMA456Shuttle, config_file: bytes, chunk_size: int, pipeline_depth: int) -> tuple[float, int]:
+    shuttle.sensor.pwr_conf = 0x00
+    shuttle.sensor.init_ctrl = 0x00
+    start = time.perf_counter()
+    shuttle.write_config_file(config_file, chunk_size=chunk_size, pipeline_depth=pipeline_depth)
+    elapsed = time.perf_counter() - start
+    shuttle.sensor.init_ctrl = 0x01
+    time.sleep(0.15)
+    return elapsed, shuttle.sensor.internal_status
+
+
+if __name__ == "__main__":
+    logger = setup_logging()
+    shuttle = BMA456Shuttle.on_hardware_v3_rev1()
+    shuttle.initialize()
+    shuttle.check_connected_hw()
+
+    shuttle.configure_i2c()
+    config_file = shuttle.load_config_file("mm")
+
+    # (8, 1) uses the former chunk size, with one round trip per write
+    for chunk_size, pipeline_depth in (
+        (8, 1),
+        (BMA456Shuttle.CONFIG_FILE_CHUNK_SIZE, 1),
+        (BMA456Shuttle.CONFIG_FILE_CHUNK_SIZE, 8),
+        (BMA456Shuttle.CONFIG_FILE_CHUNK_SIZE, 32),
+    ):
+        elapsed, internal_status = upload(shuttle, config_file, chunk_size, pipeline_depth)
+        writes = 2 * -(-len(config_file) // chunk_size)
+        logger.info(f"{chunk_size=:2d} {pipeline_depth=:2d}: {writes=:4d} {elapsed=:.3f} s, {internal_status=:#04x}")
@@ -0,0 +1,46 @@
+import logging
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from umrx_app_v3.shuttle_board.bma456.bma456_shuttle import BMA456Shuttle
+
+
+def setup_logging(level: int = logging.INFO) -> logging.Logger:
+    logger = logging.getLogger()
+    logger.setLevel(level)
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    log_format = "(%(asctime)s) [%(levelname)-8s] %(filename)s:%(lineno)d:  %(message)s"
+    log_formatter = logging.Formatter(log_format)
+    stdout_handler.setFormatter(log_formatter)
+    file_handler = logging.FileHandler(f"{Path(__file__).parent / Path(__file__).stem}.log", mode="w")
+    file_handler.setFormatter(log_formatter)
+    logger.addHandler(stdout_handler)
+    logger.addHandler(file_handler)
+    return logger
+
+
+def import_time_us(module: str) -> int:
+    # cumulative import time of `module` in a fresh interpreter, as reported by `python -X importtime`
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True
+    )
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    return -1
+
+
+if __name__ == "__main__":
+    logger = setup_logging()
+    module = "umrx_app_v3.shuttle_board.bma456.bma456_shuttle"
+    runs = sorted(import_time_us(module) for _ in range(10))
+    logger.info(f"import {module}: median {runs[len(runs) // 2]} us, min {runs[0]} us")
+
+    for name in BMA456Shuttle.CONFIG_FILES:
+        start = time.perf_counter()
+        config_file = BMA456Shuttle.load_config_file(name)
+        elapsed_us = (time.perf_counter() - start) * 1e6
+        logger.info(f"first load of bma456_{name}: {len(config_file)} bytes in {elapsed_us:.0f} us")
@@ -29,7 +29,6 @@ if __name__ == "__main__":
     shuttle.check_connected_hw()
 
     shuttle.configure_spi()
-    _ = shuttle.board.read_spi(shuttle.CSB1, 0, 1)  # dummy read is required, do not delete
 
     logger.info(f"acc_chip_id=0x{shuttle.sensor.acc_chip_id:02X}")
     logger.info(f"gyro_chip_id=0x{shuttle.sensor.gyro_chip_id:02X}")
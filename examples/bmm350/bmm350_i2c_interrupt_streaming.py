@@ -6,6 +6,7 @@ from pathlib import Path
 
 from umrx_app_v3.sensors.bmm350 import BMM350
 from umrx_app_v3.shuttle_board.bmm350.bmm350_shuttle import BMM350Shuttle
+from umrx_app_v3.shuttle_board.calibration_cache import CalibrationCache
 
 
 def setup_logging(level: int = logging.DEBUG) -> logging.Logger:
@@ -31,7 +32,7 @@ if __name__ == "__main__":
     shuttle.configure_i2c()
     logger.info(f"chip_id=0x{shuttle.sensor.chip_id:02X}")
     assert shuttle.sensor.chip_id == 0x33
-    _ = shuttle.sensor.compensate_magnetometer_and_temperature(0, 0, 0, 0)  # cache OTP
+    shuttle.read_otp(CalibrationCache())
     shuttle.close_otp()
     shuttle.configure_interrupt_streaming()
     shuttle.start_streaming()
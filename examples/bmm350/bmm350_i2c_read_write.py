@@ -4,6 +4,7 @@ import time
 from pathlib import Path
 
 from umrx_app_v3.shuttle_board.bmm350.bmm350_shuttle import BMM350Shuttle
+from umrx_app_v3.shuttle_board.calibration_cache import CalibrationCache
 
 
 def setup_logging(level: int = logging.DEBUG) -> logging.Logger:
@@ -35,7 +36,7 @@ if __name__ == "__main__":
 
     logger.info(f"magnetometer_raw={shuttle.sensor.magnetometer_raw}")
     logger.info(f"temperature_raw={shuttle.sensor.temperature_raw:08X}")
-    _ = shuttle.sensor.compensate_magnetometer_and_temperature(0, 0, 0, 0)  # cache OTP
+    shuttle.read_otp(CalibrationCache())
     shuttle.close_otp()
     shuttle.start_measurement()
     time.sleep(0.1)
@@ -31,6 +31,7 @@ if __name__ == "__main__":
     shuttle.configure_i2c()
     logger.info(f"chip_id=0x{shuttle.sensor.chip_id:04X}")
     assert shuttle.sensor.chip_id == 0x60
+    shuttle.sensor.read_nvm()
     _ = shuttle.sensor.compensate_temperature(0x0000)  # caching NVM registers
     _ = shuttle.sensor.compensate_pressure(0x00, 24.0)  # caching NVM registers
     shuttle.configure_polling_streaming()
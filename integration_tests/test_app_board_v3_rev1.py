@@ -14,7 +14,6 @@ from umrx_app_v3.mcu_board.bst_protocol_constants import (
     SPIBus,
     StreamingSamplingUnit,
 )
-from umrx_app_v3.mcu_board.commands.spi import SPIConfigureCmd
 
 logger = logging.getLogger(__name__)
 
@@ -138,7 +137,7 @@ def test_app_board_v3_rev1_spi_read_write(app_board_v3_rev1: ApplicationBoardV3R
     time.sleep(0.01)
     app_board_v3_rev1.set_vdd_vddio(3.3, 3.3)
     time.sleep(0.2)
-    SPIConfigureCmd.set_bus(SPIBus.BUS_1)
+    app_board_v3_rev1.spi_bus = SPIBus.BUS_1
     app_board_v3_rev1.configure_spi()
     time.sleep(0.1)
     resp = app_board_v3_rev1.read_spi(MultiIOPin.MINI_SHUTTLE_PIN_2_1, 0x0, 1)
@@ -185,7 +184,7 @@ def test_app_board_v3_rev1_polling_spi_accel_and_gyro(app_board_v3_rev1: Applica
     time.sleep(0.01)
     app_board_v3_rev1.set_vdd_vddio(3.3, 3.3)
     time.sleep(0.2)
-    SPIConfigureCmd.set_bus(SPIBus.BUS_1)
+    app_board_v3_rev1.spi_bus = SPIBus.BUS_1
     app_board_v3_rev1.configure_spi()
     time.sleep(0.2)
     resp = app_board_v3_rev1.read_spi(MultiIOPin.MINI_SHUTTLE_PIN_2_1, 0x0, 1)
@@ -319,7 +318,7 @@ def test_board_v3_rev1_interrupt_spi_accel_and_gyro(app_board_v3_rev1: Applicati
     app_board_v3_rev1.set_pin_config(MultiIOPin.MINI_SHUTTLE_PIN_2_6, PinDirection.OUTPUT, PinValue.LOW)
     app_board_v3_rev1.set_vdd_vddio(3.3, 3.3)
     time.sleep(0.2)
-    SPIConfigureCmd.set_bus(SPIBus.BUS_1)
+    app_board_v3_rev1.spi_bus = SPIBus.BUS_1
     app_board_v3_rev1.configure_spi()
     time.sleep(0.2)
     resp = app_board_v3_rev1.read_spi(MultiIOPin.MINI_SHUTTLE_PIN_2_1, 0x0, 1)
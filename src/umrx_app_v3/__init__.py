@@ -0,0 +1,3 @@
+from umrx_app_v3.lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, submodules=("mcu_board", "sensors", "shuttle_board"))
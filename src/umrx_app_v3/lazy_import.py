@@ -0,0 +1,29 @@
+import importlib
+from collections.abc import Callable
+from typing import Any
+
+
+def attach(
+    package_name: str, submodules: tuple[str, ...] = (), attributes: dict[str, str] | None = None
+) -> tuple[Callable[[str], Any], Callable[[], list[str]], list[str]]:
+    # PEP 562: a package exposes its submodules and their public names, a name is imported on first access
+    attributes = attributes or {}
+    package = importlib.import_module(package_name)
+
+    def __getattr__(name: str) -> Any:  # noqa: N807
+        if name in submodules:
+            value = importlib.import_module(f"{package_name}.{name}")
+        elif name in attributes:
+            value = getattr(importlib.import_module(f"{package_name}.{attributes[name]}"), name)
+        else:
+            error_message = f"module {package_name!r} has no attribute {name!r}"
+            raise AttributeError(error_message)
+        setattr(package, name, value)
+        return value
+
+    __all__ = sorted([*submodules, *attributes])
+
+    def __dir__() -> list[str]:  # noqa: N807
+        return sorted({*vars(package), *__all__})
+
+    return __getattr__, __dir__, __all__
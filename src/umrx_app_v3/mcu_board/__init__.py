@@ -0,0 +1,14 @@
+from umrx_app_v3.lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=("comm", "commands"),
+    attributes={
+        "ApplicationBoard": "bst_app_board",
+        "ApplicationBoardV3Rev0": "app_board_v3_rev0",
+        "ApplicationBoardV3Rev1": "app_board_v3_rev1",
+        "BoardAddress": "board_manager",
+        "BoardManager": "board_manager",
+        "BstProtocol": "bst_protocol",
+    },
+)
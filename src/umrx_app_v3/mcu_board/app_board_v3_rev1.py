@@ -2,8 +2,9 @@ import logging
 from array import array
 from typing import Any
 
+import numpy as np
+
 from umrx_app_v3.mcu_board.bst_app_board import ApplicationBoard
-from umrx_app_v3.mcu_board.comm.usb_comm import UsbCommunication
 from umrx_app_v3.mcu_board.commands.streaming_interrupt import StreamingInterruptCmd
 from umrx_app_v3.mcu_board.commands.streaming_polling import StreamingPollingCmd
 
@@ -18,6 +19,8 @@ class ApplicationBoardV3Rev1(ApplicationBoard):
         super().__init__(**kwargs, comm="serial")
         self.vid = 0x108C  # App Board 3.1
         self.pid = 0xAB38
+        from umrx_app_v3.mcu_board.comm.usb_comm import UsbCommunication
+
         self.usb_comm = UsbCommunication(vid=self.vid, pid=self.pid)
 
     def switch_usb_dfu_bl(self) -> None:
@@ -30,6 +33,33 @@ class ApplicationBoardV3Rev1(ApplicationBoard):
         if not self.usb_comm.is_initialized:
             self.usb_comm.initialize()
 
+    def start_streaming_reader(self) -> None:
+        # while streaming, a background thread reads the port, so frames are not lost while the host is busy
+        communication = self.protocol.communication
+        if hasattr(communication, "start_reader"):
+            communication.start_reader()
+
+    def stop_streaming_reader(self) -> None:
+        communication = self.protocol.communication
+        if hasattr(communication, "stop_reader"):
+            communication.stop_reader()
+
+    def start_polling_streaming(self) -> None:
+        self.start_streaming_reader()
+        super().start_polling_streaming()
+
+    def start_interrupt_streaming(self) -> None:
+        self.start_streaming_reader()
+        super().start_interrupt_streaming()
+
+    def stop_polling_streaming(self) -> None:
+        super().stop_polling_streaming()
+        self.stop_streaming_reader()
+
+    def stop_interrupt_streaming(self) -> None:
+        super().stop_interrupt_streaming()
+        self.stop_streaming_reader()
+
     def receive_polling_streaming_multiple(self) -> tuple[int, array[int]]:
         for message in self.protocol.communication.receive_multiple_streaming_packets():
             yield StreamingPollingCmd.parse(message)
@@ -39,3 +69,11 @@ class ApplicationBoardV3Rev1(ApplicationBoard):
     ) -> tuple[int, int, int, array[int]]:
         for message in self.protocol.communication.receive_multiple_streaming_packets():
             yield StreamingInterruptCmd.parse_streaming_packet(message, includes_mcu_timestamp=includes_mcu_timestamp)
+
+    def receive_polling_streaming_batch(self) -> np.ndarray:
+        frames = list(self.protocol.communication.receive_multiple_streaming_packets())
+        return StreamingPollingCmd.decode_streaming_batch(frames)
+
+    def receive_interrupt_streaming_batch(self, *, includes_mcu_timestamp: bool = False) -> np.ndarray:
+        frames = list(self.protocol.communication.receive_multiple_streaming_packets())
+        return StreamingInterruptCmd.decode_streaming_batch(frames, includes_mcu_timestamp=includes_mcu_timestamp)
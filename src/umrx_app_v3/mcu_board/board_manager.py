@@ -0,0 +1,149 @@
+import logging
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any, Literal, Self, TypeVar
+
+import usb.core
+
+from umrx_app_v3.mcu_board.app_board_v3_rev0 import ApplicationBoardV3Rev0
+from umrx_app_v3.mcu_board.app_board_v3_rev1 import ApplicationBoardV3Rev1
+from umrx_app_v3.mcu_board.bst_app_board import ApplicationBoard
+from umrx_app_v3.mcu_board.comm.serial_comm import SerialCommunication
+from umrx_app_v3.mcu_board.comm.usb_comm import UsbCommunication
+
+logger = logging.getLogger(__name__)
+
+Item = TypeVar("Item")
+Result = TypeVar("Result")
+
+
+class BoardManagerError(Exception): ...
+
+
+@dataclass(frozen=True)
+class BoardAddress:
+    hardware: Literal["v3_rev0", "v3_rev1"]
+    serial_number: str | None = None
+    # serial port of an App Board 3.1, USB "bus:address" of an App Board 3.0
+    port: str | None = None
+
+
+class BoardManager:
+    V3_REV0_VID, V3_REV0_PID = 0x152A, 0x80C0
+    V3_REV1_VID, V3_REV1_PID = 0x108C, 0xAB38
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self.max_workers = max_workers
+        self.boards: dict[BoardAddress, ApplicationBoard] = {}
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        self.close()
+
+    @staticmethod
+    def discover() -> list[BoardAddress]:
+        addresses = [
+            BoardAddress("v3_rev1", serial_number=port_info.serial_number, port=port_info.device)
+            for port_info in SerialCommunication.list_devices(BoardManager.V3_REV1_VID, BoardManager.V3_REV1_PID)
+        ]
+        try:
+            devices = UsbCommunication.list_devices(BoardManager.V3_REV0_VID, BoardManager.V3_REV0_PID)
+        except usb.core.NoBackendError:
+            logger.warning("No USB backend available, App Board 3.0 boards are not discovered")
+            devices = []
+        # the serial number of a 3.0 board may be unreadable, the USB port still tells boards apart
+        addresses.extend(
+            BoardAddress(
+                "v3_rev0",
+                serial_number=UsbCommunication.read_serial_number(device),
+                port=UsbCommunication.device_port(device),
+            )
+            for device in devices
+        )
+        logger.info(f"Discovered {len(addresses)} board(s)")
+        return addresses
+
+    @staticmethod
+    def select(
+        addresses: Iterable[BoardAddress],
+        serial_numbers: Iterable[str] | None = None,
+        ports: Iterable[str] | None = None,
+    ) -> list[BoardAddress]:
+        serial_numbers = None if serial_numbers is None else set(serial_numbers)
+        ports = None if ports is None else set(ports)
+        return [
+            address
+            for address in addresses
+            if (serial_numbers is None or address.serial_number in serial_numbers)
+            and (ports is None or address.port in ports)
+        ]
+
+    @staticmethod
+    def create_board(address: BoardAddress) -> ApplicationBoard:
+        if address.hardware == "v3_rev1":
+            serial_comm = SerialCommunication(port_name=address.port, serial_number=address.serial_number)
+            return ApplicationBoardV3Rev1(serial=serial_comm)
+        if address.hardware == "v3_rev0":
+            usb_comm = UsbCommunication(serial_number=address.serial_number, port=address.port)
+            return ApplicationBoardV3Rev0(usb=usb_comm)
+        error_message = f"Unknown hardware {address.hardware}"
+        raise BoardManagerError(error_message)
+
+    def run_parallel(self, function: Callable[[Item], Result], items: list[Item]) -> list[Result]:
+        # each board is handled by its own worker, the results keep the order of `items`
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=self.max_workers or len(items)) as executor:
+            futures = [executor.submit(function, item) for item in items]
+        errors = [(item, future.exception()) for item, future in zip(items, futures, strict=True) if future.exception()]
+        if errors:
+            for item, error in errors:
+                logger.error(f"{item}: {error!r}")
+            error_message = f"Failed on {len(errors)} of {len(items)} board(s): {', '.join(str(i) for i, _ in errors)}"
+            raise BoardManagerError(error_message) from errors[0][1]
+        return [future.result() for future in futures]
+
+    def open_board(self, address: BoardAddress) -> ApplicationBoard:
+        board = self.boards.get(address)
+        if board is None:
+            board = self.boards[address] = self.create_board(address)
+        return board
+
+    def _initialize_board(self, address: BoardAddress) -> ApplicationBoard:
+        board = self.open_board(address)
+        board.initialize()
+        board.start_communication()
+        return board
+
+    def initialize_boards(self, addresses: list[BoardAddress] | None = None) -> list[ApplicationBoard]:
+        addresses = self.discover() if addresses is None else addresses
+        return self.run_parallel(self._initialize_board, addresses)
+
+    def bring_up(
+        self,
+        shuttle_class: Callable[..., Any],
+        configure: Callable[[Any], None] | None = None,
+        addresses: list[BoardAddress] | None = None,
+    ) -> list[Any]:
+        def bring_up_shuttle(address: BoardAddress) -> Any:
+            shuttle = shuttle_class(board=self.open_board(address))
+            shuttle.initialize()
+            shuttle.check_connected_hw()
+            if configure is not None:
+                configure(shuttle)
+            return shuttle
+
+        addresses = self.discover() if addresses is None else addresses
+        return self.run_parallel(bring_up_shuttle, addresses)
+
+    def close(self) -> None:
+        for board in self.boards.values():
+            if board.protocol.communication is not None:
+                board.protocol.communication.disconnect()
+        self.boards.clear()
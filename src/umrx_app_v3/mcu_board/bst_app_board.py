@@ -1,38 +1,78 @@
 import logging
 import time
 from array import array
+from collections.abc import Callable, Iterable, Sequence
 from typing import Any, Literal
 
+import numpy as np
+
 from umrx_app_v3.mcu_board.bst_protocol import BstProtocol
 from umrx_app_v3.mcu_board.bst_protocol_constants import (
+    CoinesResponse,
+    CommandId,
+    ErrorCode,
+    I2CBus,
     I2CMode,
     MultiIOPin,
     PinDirection,
     PinValue,
+    SPIBus,
+    SPIMode,
     SPISpeed,
     StreamingSamplingUnit,
 )
 from umrx_app_v3.mcu_board.commands.app_switch import AppSwitchCmd
 from umrx_app_v3.mcu_board.commands.board_info import BoardInfo, BoardInfoCmd
+from umrx_app_v3.mcu_board.commands.command import CommandError
+from umrx_app_v3.mcu_board.commands.frame_scanner import FrameScanner
 from umrx_app_v3.mcu_board.commands.i2c import I2CConfigureCmd, I2CReadCmd, I2CWriteCmd
 from umrx_app_v3.mcu_board.commands.pin_config import GetPinConfigCmd, SetPinConfigCmd
 from umrx_app_v3.mcu_board.commands.set_vdd_vddio import SetVddVddioCmd, Volts
 from umrx_app_v3.mcu_board.commands.spi import SPIConfigureCmd, SPIReadCmd, SPIWriteCmd
-from umrx_app_v3.mcu_board.commands.streaming_interrupt import StreamingInterruptCmd
-from umrx_app_v3.mcu_board.commands.streaming_polling import StreamingPollingCmd
+from umrx_app_v3.mcu_board.commands.streaming_batch import StreamingFrames
+from umrx_app_v3.mcu_board.commands.streaming_interrupt import (
+    StreamingInterruptCmd,
+    StreamingInterruptConfig,
+    StreamingInterruptI2cConfig,
+    StreamingInterruptSpiConfig,
+)
+from umrx_app_v3.mcu_board.commands.streaming_polling import (
+    PollingStreamingConfig,
+    PollingStreamingI2cConfig,
+    PollingStreamingSpiConfig,
+    StreamingPollingCmd,
+)
 from umrx_app_v3.mcu_board.commands.timer import TimerCmd
 
 logger = logging.getLogger(__name__)
 
+RegisterRead = tuple[int, int]
+RegisterWrite = tuple[int, array[int] | bytes | Sequence[int]]
+
 
 class AppBoardError(Exception): ...
 
 
 class ApplicationBoard:
+    READY_TIMEOUT = 1.0  # seconds
+    READY_POLL_INTERVAL = 0.002  # seconds
+    # the shuttle supply has to discharge for the sensor to see a power-on reset
+    POWER_OFF_TIME = 0.05  # seconds
+    BOARD_INFO_RESPONSE_LENGTH = 15
+    # longest register burst merged by `read_many`/`write_many`
+    MAX_BURST_LENGTH = 46
+
     def __init__(self, **kw: Any) -> None:
         self.protocol: BstProtocol = (
             kw["protocol"] if kw.get("protocol") and isinstance(kw["protocol"], BstProtocol) else BstProtocol(**kw)
         )
+        # per-board state, so that several boards can be driven from one process;
+        # a bus or mode left as `None` falls back to the command default
+        self.i2c_bus: I2CBus | None = None
+        self.spi_bus: SPIBus | None = None
+        self.spi_mode: SPIMode | None = None
+        self.polling_streaming_config: PollingStreamingConfig | None = None
+        self.interrupt_streaming_config: StreamingInterruptConfig | None = None
 
     def initialize(self) -> None:
         self.protocol.initialize()
@@ -53,11 +93,65 @@ class ApplicationBoard:
 
     def start_communication(self) -> None:
         self.stop_polling_streaming()
-        time.sleep(0.15)
         self.disable_timer()
-        time.sleep(0.15)
         self.stop_interrupt_streaming()
-        time.sleep(0.15)
+        self.wait_until(self.is_responsive, "board response")
+
+    def wait_until(self, condition: Callable[[], bool], description: str, timeout: float | None = None) -> float:
+        # polls `condition` until it holds, returns the time it took so that bring-up can be profiled
+        timeout = self.READY_TIMEOUT if timeout is None else timeout
+        start = time.monotonic()
+        attempts = 0
+        while True:
+            attempts += 1
+            if condition():
+                elapsed = time.monotonic() - start
+                logger.debug(f"Ready: {description} after {elapsed * 1e3:.1f} ms, {attempts=}")
+                return elapsed
+            if time.monotonic() - start > timeout:
+                error_message = f"Not ready: {description} within {timeout} s, {attempts=}"
+                raise AppBoardError(error_message)
+            time.sleep(self.READY_POLL_INTERVAL)
+
+    def wait_for_chip_id(self, read_chip_id: Callable[[], int], description: str) -> float:
+        # a sensor that is not powered up yet NACKs or reads back as 0x00/0xFF
+        def is_ready() -> bool:
+            try:
+                return read_chip_id() not in (0x00, 0xFF)
+            except CommandError:
+                return False
+
+        return self.wait_until(is_ready, description)
+
+    def pause(self, duration: float, description: str) -> None:
+        # fixed delays without a readiness signal, logged so that their cost is visible
+        logger.debug(f"Pause: {description} for {duration * 1e3:.1f} ms")
+        time.sleep(duration)
+
+    def power_off(self) -> None:
+        self.set_vdd_vddio(0.0, 0.0)
+        self.pause(self.POWER_OFF_TIME, "power off")
+
+    @staticmethod
+    def is_board_info_response(frame: memoryview | array[int] | bytes) -> bool:
+        return (
+            len(frame) == ApplicationBoard.BOARD_INFO_RESPONSE_LENGTH
+            and frame[CoinesResponse.DD_RESPONSE_STATUS_POSITION.value] == ErrorCode.SUCCESS.value
+            and frame[CoinesResponse.DD_RESPONSE_FEATURE_POSITION.value] == CommandId.BOARD_INFORMATION.value
+        )
+
+    def is_responsive(self) -> bool:
+        # stale streaming packets are dropped, the board is ready once it answers a board info request
+        discarded = self.protocol.discard_input()
+        if discarded:
+            logger.debug(f"Discarded {discarded} stale bytes")
+        response = self.protocol.send_receive(BoardInfoCmd.assemble())
+        return any(self.is_board_info_response(frame) for frame in FrameScanner().scan(bytes(response)))
+
+    def stop_streaming(self) -> None:
+        self.stop_polling_streaming()
+        self.stop_interrupt_streaming()
+        self.wait_until(self.is_responsive, "board response after streaming stop")
 
     def switch_usb_dfu_bl(self) -> None:
         self.start_communication()
@@ -68,16 +162,13 @@ class ApplicationBoard:
         return self.switch_app(0x28000)
 
     def disable_timer(self) -> None:
-        for payload in TimerCmd.disable():
-            self.protocol.send_receive(payload)
+        self.protocol.send_receive_many(TimerCmd.disable())
 
     def enable_timer(self) -> None:
-        for payload in TimerCmd.enable():
-            self.protocol.send_receive(payload)
+        self.protocol.send_receive_many(TimerCmd.enable())
 
     def configure_i2c(self, mode: I2CMode = I2CMode.STANDARD_MODE) -> None:
-        for payload in I2CConfigureCmd.assemble(mode):
-            self.protocol.send_receive(payload)
+        self.protocol.send_receive_many(I2CConfigureCmd.assemble(mode, self.i2c_bus))
 
     def read_i2c(self, i2c_address: int, register_address: int, bytes_to_read: int) -> array[int]:
         payload = I2CReadCmd.assemble(
@@ -102,8 +193,7 @@ class ApplicationBoard:
         return GetPinConfigCmd.parse(response)
 
     def configure_spi(self, speed: SPISpeed = SPISpeed.MHz_5) -> None:
-        for payload in SPIConfigureCmd.assemble(speed):
-            response = self.protocol.send_receive(payload)
+        for response in self.protocol.send_receive_many(SPIConfigureCmd.assemble(speed, self.spi_bus, self.spi_mode)):
             SPIConfigureCmd.parse(response)
 
     def read_spi(self, cs_pin: MultiIOPin, register_address: int, bytes_to_read: int) -> array[int]:
@@ -117,8 +207,90 @@ class ApplicationBoard:
         )
         self.protocol.send_receive(payload)
 
+    @staticmethod
+    def merge_reads(
+        requests: Sequence[RegisterRead], max_length: int, register_width: int = 1
+    ) -> list[tuple[int, int, list[int]]]:
+        # consecutive requests for adjacent registers become one burst, the request order is kept;
+        # `register_width` is the number of bytes per register address as in `merge_writes`
+        bursts: list[tuple[int, int, list[int]]] = []
+        for idx, (address, length) in enumerate(requests):
+            if bursts:
+                start, burst_length, indices = bursts[-1]
+                is_adjacent = start + burst_length // register_width == address
+                if is_adjacent and burst_length + length <= max_length:
+                    bursts[-1] = start, burst_length + length, [*indices, idx]
+                    continue
+            bursts.append((address, length, [idx]))
+        return bursts
+
+    @staticmethod
+    def merge_writes(
+        requests: Iterable[RegisterWrite], max_length: int, register_width: int = 1
+    ) -> list[tuple[int, array[int]]]:
+        # `register_width` is the number of bytes per register address, e.g. 2 for 16-bit register files
+        bursts: list[tuple[int, array[int]]] = []
+        for address, data in requests:
+            if bursts:
+                start, burst_data = bursts[-1]
+                is_adjacent = start + len(burst_data) // register_width == address
+                if is_adjacent and len(burst_data) + len(data) <= max_length:
+                    burst_data.extend(data)
+                    continue
+            bursts.append((address, array("B", data)))
+        return bursts
+
+    def _check_bus_target(self, i2c_address: int | None, cs_pin: MultiIOPin | None) -> None:
+        if (i2c_address is None) == (cs_pin is None):
+            error_message = f"Specify either `i2c_address` or `cs_pin`, got {i2c_address=}, {cs_pin=}"
+            raise AppBoardError(error_message)
+
+    def read_many(
+        self,
+        requests: Iterable[RegisterRead],
+        i2c_address: int | None = None,
+        cs_pin: MultiIOPin | None = None,
+        dummy_bytes: int = 0,
+        register_width: int = 1,
+    ) -> list[array[int]]:
+        # `dummy_bytes` leading an SPI read are dropped, results are in the order of `requests`
+        self._check_bus_target(i2c_address, cs_pin)
+        requests = list(requests)
+        dummy_bytes = 0 if cs_pin is None else dummy_bytes
+        bursts = self.merge_reads(requests, self.MAX_BURST_LENGTH - dummy_bytes, register_width)
+        if cs_pin is None:
+            messages = [I2CReadCmd.assemble(i2c_address, address, length) for address, length, _ in bursts]
+            parse = I2CReadCmd.parse
+        else:
+            messages = [SPIReadCmd.assemble(cs_pin, address, length + dummy_bytes) for address, length, _ in bursts]
+            parse = SPIReadCmd.parse
+        results: list[array[int]] = [array("B")] * len(requests)
+        for (_, _, indices), response in zip(bursts, self.protocol.send_receive_many(messages), strict=True):
+            data = parse(response)[dummy_bytes:]
+            offset = 0
+            for idx in indices:
+                length = requests[idx][1]
+                results[idx] = data[offset : offset + length]
+                offset += length
+        return results
+
+    def write_many(
+        self,
+        requests: Iterable[RegisterWrite],
+        i2c_address: int | None = None,
+        cs_pin: MultiIOPin | None = None,
+        register_width: int = 1,
+    ) -> None:
+        self._check_bus_target(i2c_address, cs_pin)
+        bursts = self.merge_writes(requests, self.MAX_BURST_LENGTH, register_width)
+        if cs_pin is None:
+            messages = [I2CWriteCmd.assemble(i2c_address, address, data) for address, data in bursts]
+        else:
+            messages = [SPIWriteCmd.assemble(cs_pin, address, data) for address, data in bursts]
+        self.protocol.send_receive_many(messages)
+
     def streaming_polling_set_spi_configuration(self) -> None:
-        StreamingPollingCmd.set_spi_config()
+        self.polling_streaming_config = PollingStreamingSpiConfig()
 
     def streaming_polling_set_spi_channel(
         self,
@@ -128,16 +300,19 @@ class ApplicationBoard:
         register_address: int,
         bytes_to_read: int,
     ) -> None:
+        if self.polling_streaming_config is None:
+            self.streaming_polling_set_spi_configuration()
         StreamingPollingCmd.set_streaming_channel_spi(
             cs_pin=cs_pin,
             sampling_time=sampling_time,
             sampling_unit=sampling_unit,
             register_address=register_address,
             bytes_to_read=bytes_to_read,
+            streaming_config=self.polling_streaming_config,
         )
 
     def streaming_polling_set_i2c_configuration(self) -> None:
-        StreamingPollingCmd.set_i2c_config()
+        self.polling_streaming_config = PollingStreamingI2cConfig()
 
     def streaming_polling_set_i2c_channel(
         self,
@@ -147,17 +322,22 @@ class ApplicationBoard:
         register_address: int,
         bytes_to_read: int,
     ) -> None:
+        if self.polling_streaming_config is None:
+            self.streaming_polling_set_i2c_configuration()
         StreamingPollingCmd.set_streaming_channel_i2c(
             i2c_address=i2c_address,
             sampling_time=sampling_time,
             sampling_unit=sampling_unit,
             register_address=register_address,
             bytes_to_read=bytes_to_read,
+            streaming_config=self.polling_streaming_config,
         )
 
     def configure_streaming_polling(self, interface: Literal["i2c", "spi"]) -> None:
-        for command in StreamingPollingCmd.assemble(interface):
-            self.protocol.send_receive(command)
+        if self.polling_streaming_config is None:
+            error_message = "Specify streaming configuration first, call streaming_polling_set_[i2c|spi]_channel"
+            raise AppBoardError(error_message)
+        self.protocol.send_receive_many(StreamingPollingCmd.assemble(interface, self.polling_streaming_config))
 
     def stop_polling_streaming(self) -> None:
         payload = StreamingPollingCmd.stop_streaming()
@@ -175,6 +355,16 @@ class ApplicationBoard:
         message = self.protocol.receive()
         return StreamingInterruptCmd.parse_streaming_packet(message, includes_mcu_timestamp=includes_mcu_timestamp)
 
+    @staticmethod
+    def decode_polling_streaming_batch(frames: StreamingFrames) -> np.ndarray:
+        return StreamingPollingCmd.decode_streaming_batch(frames)
+
+    @staticmethod
+    def decode_interrupt_streaming_batch(
+        frames: StreamingFrames, *, includes_mcu_timestamp: bool = False
+    ) -> np.ndarray:
+        return StreamingInterruptCmd.decode_streaming_batch(frames, includes_mcu_timestamp=includes_mcu_timestamp)
+
     def stop_interrupt_streaming(self) -> None:
         payload = StreamingInterruptCmd.stop_streaming()
         self.protocol.send_receive(payload)
@@ -184,7 +374,7 @@ class ApplicationBoard:
         self.protocol.send_receive(payload)
 
     def streaming_interrupt_set_spi_configuration(self) -> None:
-        StreamingInterruptCmd.set_spi_config()
+        self.interrupt_streaming_config = StreamingInterruptSpiConfig()
 
     def streaming_interrupt_set_spi_channel(
         self,
@@ -193,15 +383,18 @@ class ApplicationBoard:
         register_address: int,
         bytes_to_read: int,
     ) -> None:
+        if self.interrupt_streaming_config is None:
+            self.streaming_interrupt_set_spi_configuration()
         StreamingInterruptCmd.set_streaming_channel_spi(
             interrupt_pin=interrupt_pin,
             cs_pin=cs_pin,
             register_address=register_address,
             bytes_to_read=bytes_to_read,
+            streaming_config=self.interrupt_streaming_config,
         )
 
     def streaming_interrupt_set_i2c_configuration(self) -> None:
-        StreamingInterruptCmd.set_i2c_config()
+        self.interrupt_streaming_config = StreamingInterruptI2cConfig()
 
     def streaming_interrupt_set_i2c_channel(
         self,
@@ -210,13 +403,18 @@ class ApplicationBoard:
         register_address: int,
         bytes_to_read: int,
     ) -> None:
+        if self.interrupt_streaming_config is None:
+            self.streaming_interrupt_set_i2c_configuration()
         StreamingInterruptCmd.set_streaming_channel_i2c(
             interrupt_pin=interrupt_pin,
             i2c_address=i2c_address,
             register_address=register_address,
             bytes_to_read=bytes_to_read,
+            streaming_config=self.interrupt_streaming_config,
         )
 
     def configure_streaming_interrupt(self, interface: Literal["i2c", "spi"]) -> None:
-        for command in StreamingInterruptCmd.assemble(interface):
-            self.protocol.send_receive(command)
+        if self.interrupt_streaming_config is None:
+            error_message = "Specify streaming configuration first, call streaming_interrupt_set_[i2c|spi]_channel"
+            raise AppBoardError(error_message)
+        self.protocol.send_receive_many(StreamingInterruptCmd.assemble(interface, self.interrupt_streaming_config))
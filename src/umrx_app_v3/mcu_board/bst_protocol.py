@@ -1,9 +1,18 @@
+import contextlib
 import logging
 from array import array
-from typing import Any
+from collections.abc import Generator, Iterable
+from typing import Any, TYPE_CHECKING
 
-from umrx_app_v3.mcu_board.comm.serial_comm import SerialCommunication
-from umrx_app_v3.mcu_board.comm.usb_comm import UsbCommunication
+from umrx_app_v3.mcu_board.bst_protocol_constants import CoinesResponse, ErrorCode, StreamingDataResponse
+from umrx_app_v3.mcu_board.bst_protocol_stats import ProtocolStats
+from umrx_app_v3.mcu_board.comm.comm import Communication
+from umrx_app_v3.mcu_board.commands.command import Command
+from umrx_app_v3.mcu_board.commands.frame_scanner import FrameScanner
+
+if TYPE_CHECKING:
+    from umrx_app_v3.mcu_board.comm.serial_comm import SerialCommunication
+    from umrx_app_v3.mcu_board.comm.usb_comm import UsbCommunication
 
 logger = logging.getLogger(__name__)
 
@@ -11,20 +20,44 @@ logger = logging.getLogger(__name__)
 class BstProtocolError(Exception): ...
 
 
+class BstPipeline:
+    def __init__(self) -> None:
+        self.messages: list[array | tuple | list] = []
+        self.responses: list[array[int]] = []
+
+    def send_receive(self, message: array | tuple | list) -> int:
+        # the response is available as `responses[index]` once the pipeline is flushed
+        self.messages.append(message)
+        return len(self.messages) - 1
+
+
 class BstProtocol:
+    # requests written before the first response is read, bounded so that the board input buffer does not overflow
+    PIPELINE_DEPTH = 16
+    STREAMING_RESPONSES = frozenset(response.value for response in StreamingDataResponse)
+
     def __init__(self, **kw: Any) -> None:
-        self.communication: SerialCommunication | UsbCommunication | None = None
-        if kw.get("comm"):
+        self.communication: SerialCommunication | UsbCommunication | Communication | None = None
+        self.stats: ProtocolStats | None = None
+        if isinstance(kw.get("communication"), Communication):
+            # any other transport, e.g. the in-process board emulator
+            self.communication = kw["communication"]
+        elif kw.get("comm"):
+            # pyusb and pyserial are imported only when a board actually talks over them
             if kw["comm"] == "usb":
-                if kw.get("usb") and isinstance(kw["usb"], UsbCommunication):
+                from umrx_app_v3.mcu_board.comm import usb_comm
+
+                if kw.get("usb") and isinstance(kw["usb"], usb_comm.UsbCommunication):
                     self.communication = kw["usb"]
                 else:
-                    self.communication = UsbCommunication()
+                    self.communication = usb_comm.UsbCommunication()
             elif kw["comm"] == "serial":
-                if kw.get("serial") and isinstance(kw["serial"], SerialCommunication):
+                from umrx_app_v3.mcu_board.comm import serial_comm
+
+                if kw.get("serial") and isinstance(kw["serial"], serial_comm.SerialCommunication):
                     self.communication = kw["serial"]
                 else:
-                    self.communication = SerialCommunication()
+                    self.communication = serial_comm.SerialCommunication()
             else:
                 error_message = f"Provided communication type {kw['comm']} is not supported"
                 raise BstProtocolError(error_message)
@@ -40,3 +73,59 @@ class BstProtocol:
 
     def send_receive(self, message: array | tuple | list) -> array | bytes:
         return self.communication.send_receive(message)
+
+    def discard_input(self) -> int:
+        return self.communication.discard_input()
+
+    def enable_instrumentation(self, summary_interval: float | None = None) -> ProtocolStats:
+        # per command counters and latencies; while disabled send/receive are not touched at all
+        if self.stats is None:
+            self.stats = ProtocolStats(self, summary_interval=summary_interval)
+        self.stats.summary_interval = summary_interval
+        return self.stats.attach()
+
+    def disable_instrumentation(self) -> None:
+        if self.stats is not None:
+            self.stats.detach()
+
+    def send_receive_many(
+        self, messages: Iterable[array | tuple | list], max_in_flight: int | None = None
+    ) -> list[array[int]]:
+        # requests are written back to back and the responses are matched to them in order
+        messages = list(messages)
+        max_in_flight = max(1, self.PIPELINE_DEPTH if max_in_flight is None else max_in_flight)
+        responses = []
+        for start in range(0, len(messages), max_in_flight):
+            window = messages[start : start + max_in_flight]
+            for index, message in enumerate(window, start):
+                if not self.send(message):
+                    error_message = f"Sending request {index} failed"
+                    raise BstProtocolError(error_message)
+            responses.extend(self.receive_responses(len(window), first_index=start))
+        return responses
+
+    def receive_responses(self, count: int, first_index: int = 0) -> list[array[int]]:
+        scanner = FrameScanner()
+        buffer = b""
+        responses = []
+        while len(responses) < count:
+            buffer += bytes(self.receive())
+            for frame in scanner.scan(buffer):
+                if frame[CoinesResponse.DD_RESPONSE_COMMAND_ID_POSITION.value] in self.STREAMING_RESPONSES:
+                    # a streaming packet still in flight is not a response to any request
+                    continue
+                status = frame[CoinesResponse.DD_RESPONSE_STATUS_POSITION.value]
+                if status != ErrorCode.SUCCESS.value:
+                    error_message = f"Request {first_index + len(responses)} failed: {status=}, {bytes(frame)=}"
+                    raise BstProtocolError(error_message)
+                responses.append(Command.to_array(frame))
+            buffer = buffer[scanner.offset :]
+        if len(responses) > count:
+            logger.warning(f"Dropped {len(responses) - count} unexpected responses")
+        return responses[:count]
+
+    @contextlib.contextmanager
+    def pipeline(self, max_in_flight: int | None = None) -> Generator[BstPipeline, None, None]:
+        pipeline = BstPipeline()
+        yield pipeline
+        pipeline.responses = self.send_receive_many(pipeline.messages, max_in_flight)
@@ -0,0 +1,237 @@
+import copy
+import logging
+import time
+from array import array
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Self, TYPE_CHECKING
+
+from umrx_app_v3.mcu_board.bst_protocol_constants import (
+    CoinesResponse,
+    CommandId,
+    CommandType,
+    StreamingDataResponse,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+# request frames: 0xAA, length, command type, command id / channel, ...
+REQUEST_TYPE_POSITION = 2
+REQUEST_ID_POSITION = 3
+FRAME_START = 0xAA
+# bucket `n` holds latencies below 2**n us, the last one everything above ~1 minute
+HISTOGRAM_BUCKETS = 27
+STREAMING_RESPONSES = frozenset(response.value for response in StreamingDataResponse)
+# (command type, command id), the id is None for streaming commands where that byte is a channel or flag
+CommandKey = tuple[int, int | None]
+# streaming packets answer no request, they are keyed by this pseudo type and their response type
+STREAMING_KEY_TYPE = -1
+# bytes of a read that do not start a frame, e.g. the rest of a frame cut by the previous read
+UNFRAMED_KEY: CommandKey = (STREAMING_KEY_TYPE, None)
+# requests whose responses never arrived (timeouts) must not pile up and shift the matching for good
+MAX_PENDING_REQUESTS = 256
+
+
+def command_key(message: array[int] | tuple[int, ...] | list[int] | bytes) -> CommandKey:
+    command_type = message[REQUEST_TYPE_POSITION]
+    if command_type in (CommandType.DD_SET.value, CommandType.DD_GET.value):
+        return command_type, message[REQUEST_ID_POSITION]
+    return command_type, None
+
+
+def streaming_key(response: int) -> CommandKey:
+    return STREAMING_KEY_TYPE, response
+
+
+def enum_name(enum: type[CommandType | CommandId | StreamingDataResponse], value: int) -> str:
+    try:
+        return enum(value).name
+    except ValueError:
+        return f"0x{value:02X}"
+
+
+def command_name(key: CommandKey) -> str:
+    command_type, command_id = key
+    if key == UNFRAMED_KEY:
+        return "UNFRAMED"
+    if command_type == STREAMING_KEY_TYPE:
+        return f"STREAMING_{enum_name(StreamingDataResponse, command_id)}"
+    if command_id is None:
+        return enum_name(CommandType, command_type)
+    return f"{enum_name(CommandType, command_type)}/{enum_name(CommandId, command_id)}"
+
+
+@dataclass
+class LatencyHistogram:
+    buckets: list[int] = field(default_factory=lambda: [0] * HISTOGRAM_BUCKETS)
+    count: int = 0
+    total: float = 0.0
+    min: float = float("inf")
+    max: float = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.buckets[min(int(seconds * 1e6).bit_length(), HISTOGRAM_BUCKETS - 1)] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        # upper edge of the bucket the q-th latency falls in, in seconds
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for idx, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= rank and bucket:
+                return min((1 << idx) * 1e-6, self.max)
+        return self.max
+
+
+@dataclass
+class CommandStats:
+    requests: int = 0
+    responses: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    # request sent until its response arrived: transport and board
+    round_trip: LatencyHistogram = field(default_factory=LatencyHistogram)
+    # response arrived until the host sent the next request: parsing and whatever else the host does
+    host: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+class ProtocolStats:
+    def __init__(self, protocol: Any, *, summary_interval: float | None = None) -> None:
+        self.protocol = protocol
+        # seconds between summaries in the log, `None` logs no summaries
+        self.summary_interval = summary_interval
+        self.commands: dict[CommandKey, CommandStats] = {}
+        self.pending: deque[tuple[CommandKey, float]] = deque(maxlen=MAX_PENDING_REQUESTS)
+        self.last_response: tuple[CommandKey, float] | None = None
+        self.last_summary = time.perf_counter()
+        self.send_uninstrumented: Callable | None = None
+        self.receive_uninstrumented: Callable | None = None
+        self.send_receive_uninstrumented: Callable | None = None
+
+    @property
+    def is_attached(self) -> bool:
+        return self.send_uninstrumented is not None
+
+    def attach(self) -> Self:
+        if self.is_attached:
+            return self
+        self.send_uninstrumented = self.protocol.send
+        self.receive_uninstrumented = self.protocol.receive
+        self.send_receive_uninstrumented = self.protocol.send_receive
+        self.protocol.send = self.send
+        self.protocol.receive = self.receive
+        self.protocol.send_receive = self.send_receive
+        return self
+
+    def detach(self) -> None:
+        if not self.is_attached:
+            return
+        # the instance attributes shadow the class methods, removing them restores the plain protocol
+        del self.protocol.send, self.protocol.receive, self.protocol.send_receive
+        self.send_uninstrumented = self.receive_uninstrumented = self.send_receive_uninstrumented = None
+        self.pending.clear()
+        self.last_response = None
+
+    def reset(self) -> None:
+        self.commands.clear()
+        self.pending.clear()
+        self.last_response = None
+
+    def stats_for(self, key: CommandKey) -> CommandStats:
+        stats = self.commands.get(key)
+        if stats is None:
+            stats = self.commands[key] = CommandStats()
+        return stats
+
+    def record_request(self, message: array[int] | tuple[int, ...] | list[int], now: float) -> CommandKey:
+        key = command_key(message)
+        stats = self.stats_for(key)
+        stats.requests += 1
+        stats.bytes_sent += len(message)
+        if self.last_response is not None:
+            last_key, received_at = self.last_response
+            self.stats_for(last_key).host.add(now - received_at)
+            self.last_response = None
+        return key
+
+    def record_response(self, key: CommandKey, num_bytes: int, sent_at: float, now: float) -> None:
+        stats = self.stats_for(key)
+        stats.responses += 1
+        stats.bytes_received += num_bytes
+        stats.round_trip.add(now - sent_at)
+        self.last_response = key, now
+
+    def record_received(self, data: array[int] | bytes, now: float) -> None:
+        # a read holds any number of frames, each one answers the oldest request in flight or is a streaming packet
+        offset = 0
+        position = CoinesResponse.DD_RESPONSE_COMMAND_ID_POSITION.value
+        while offset + position < len(data) and data[offset] == FRAME_START and data[offset + 1]:
+            frame_length = data[offset + 1]
+            response = data[offset + position]
+            if response in STREAMING_RESPONSES:
+                stats = self.stats_for(streaming_key(response))
+                stats.responses += 1
+                stats.bytes_received += frame_length
+            elif self.pending:
+                key, sent_at = self.pending.popleft()
+                self.record_response(key, frame_length, sent_at, now)
+            offset += frame_length
+        if offset < len(data):
+            self.stats_for(UNFRAMED_KEY).bytes_received += len(data) - offset
+        self.maybe_log_summary(now)
+
+    def send(self, message: array[int] | tuple[int, ...] | list[int]) -> bool:
+        now = time.perf_counter()
+        self.pending.append((self.record_request(message, now), now))
+        return self.send_uninstrumented(message)
+
+    def receive(self) -> array[int] | bytes:
+        data = self.receive_uninstrumented()
+        self.record_received(data, time.perf_counter())
+        return data
+
+    def send_receive(self, message: array[int] | tuple[int, ...] | list[int]) -> array[int] | bytes:
+        sent_at = time.perf_counter()
+        key = self.record_request(message, sent_at)
+        response = self.send_receive_uninstrumented(message)
+        now = time.perf_counter()
+        self.record_response(key, len(response), sent_at, now)
+        self.maybe_log_summary(now)
+        return response
+
+    def snapshot(self) -> dict[str, CommandStats]:
+        return {command_name(key): copy.deepcopy(stats) for key, stats in self.commands.items()}
+
+    def summary(self) -> list[str]:
+        lines = []
+        for name, stats in sorted(self.snapshot().items()):
+            round_trip, host = stats.round_trip, stats.host
+            lines.append(
+                f"{name}: requests={stats.requests} responses={stats.responses} "
+                f"sent={stats.bytes_sent} B received={stats.bytes_received} B "
+                f"round trip mean={round_trip.mean * 1e3:.3f} ms p99<={round_trip.percentile(99) * 1e3:.3f} ms "
+                f"host mean={host.mean * 1e3:.3f} ms"
+            )
+        return lines
+
+    def log_summary(self) -> None:
+        for line in self.summary():
+            logger.info(line)
+
+    def maybe_log_summary(self, now: float) -> None:
+        if self.summary_interval is not None and now - self.last_summary >= self.summary_interval:
+            self.last_summary = now
+            self.log_summary()
@@ -0,0 +1,291 @@
+import enum
+import logging
+import struct
+import time
+from array import array
+from collections.abc import Callable, Generator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from umrx_app_v3.mcu_board.comm.comm import Communication
+from umrx_app_v3.mcu_board.commands.command import Command
+from umrx_app_v3.mcu_board.commands.frame_scanner import FrameScanner
+
+logger = logging.getLogger(__name__)
+
+CAPTURE_MAGIC = b"UMRXCAP"
+CAPTURE_VERSION = 1
+# magic, version, framing
+CAPTURE_HEADER = struct.Struct("<7sBB")
+# direction, nanoseconds since the capture started, length of the data that follows
+RECORD_HEADER = struct.Struct("<BQI")
+
+
+class CaptureError(Exception): ...
+
+
+class ReplayCommunicationError(Exception): ...
+
+
+class ReplayCommunicationTimeoutError(ReplayCommunicationError): ...
+
+
+class Direction(enum.IntEnum):
+    SENT = 0
+    RECEIVED = 1
+
+
+class Framing(enum.IntEnum):
+    # serial and the emulator deliver a byte stream, USB delivers fixed-size packets padded after the message
+    STREAM = 0
+    PACKET = 1
+
+
+@dataclass(frozen=True)
+class CaptureRecord:
+    direction: Direction
+    time_ns: int
+    data: bytes
+
+
+@dataclass(frozen=True)
+class Capture:
+    framing: Framing
+    records: list[CaptureRecord]
+
+    @property
+    def duration(self) -> float:
+        return (self.records[-1].time_ns - self.records[0].time_ns) / 1e9 if self.records else 0.0
+
+    def bytes_received(self) -> int:
+        return sum(len(record.data) for record in self.records if record.direction == Direction.RECEIVED)
+
+
+def read_capture(path: str | Path) -> Capture:
+    content = Path(path).read_bytes()
+    if len(content) < CAPTURE_HEADER.size:
+        error_message = f"{path} is not a capture file"
+        raise CaptureError(error_message)
+    magic, version, framing = CAPTURE_HEADER.unpack_from(content)
+    if magic != CAPTURE_MAGIC or version != CAPTURE_VERSION:
+        error_message = f"{path} is not a capture file of version {CAPTURE_VERSION}"
+        raise CaptureError(error_message)
+    records = []
+    offset = CAPTURE_HEADER.size
+    while offset + RECORD_HEADER.size <= len(content):
+        direction, time_ns, length = RECORD_HEADER.unpack_from(content, offset)
+        start = offset + RECORD_HEADER.size
+        if start + length > len(content):
+            break
+        records.append(CaptureRecord(Direction(direction), time_ns, content[start : start + length]))
+        offset = start + length
+    if offset != len(content):
+        # e.g. the recording process was killed in the middle of a write
+        logger.warning(f"Capture {path} is truncated, {len(content) - offset} trailing bytes ignored")
+    return Capture(Framing(framing), records)
+
+
+class CaptureWriter:
+    def __init__(self, path: str | Path, framing: Framing = Framing.STREAM) -> None:
+        self.path = Path(path)
+        self.file: BinaryIO = self.path.open("wb")
+        self.file.write(CAPTURE_HEADER.pack(CAPTURE_MAGIC, CAPTURE_VERSION, framing.value))
+        self.start_ns = time.monotonic_ns()
+        self.record_count = 0
+
+    def write(self, direction: Direction, data: array[int] | tuple[int, ...] | list[int] | bytes) -> None:
+        data = bytes(data)
+        self.file.write(RECORD_HEADER.pack(direction.value, time.monotonic_ns() - self.start_ns, len(data)))
+        self.file.write(data)
+        self.record_count += 1
+
+    def close(self) -> None:
+        if not self.file.closed:
+            self.file.close()
+
+
+class RecordingCommunication(Communication):
+    # transparent wrapper, logs what actually crosses the wire while the wrapped transport does all the work
+    def __init__(self, communication: Communication, path: str | Path) -> None:
+        self.communication = communication
+        # only the USB transport extracts messages from fixed-size packets
+        framing = Framing.PACKET if hasattr(communication, "extract_message_from") else Framing.STREAM
+        self.writer = CaptureWriter(path, framing)
+        # raw reads are recorded, so the chunking seen by reassembly and USB packet checks is captured as well;
+        # the wrapped transport's own receive paths all go through this method
+        self.read_method = "_receive" if hasattr(communication, "_receive") else "receive"
+        # instance attributes shadowed by the recording methods, `None` where the class method was used
+        self.shadowed: dict[str, Any] = {name: vars(communication).get(name) for name in (self.read_method, "send")}
+        self.record_reads(self.read_method)
+        self.record_sends()
+
+    def record_reads(self, name: str) -> None:
+        read = getattr(self.communication, name)
+
+        def recording_read(*args: Any, **kw: Any) -> Any:
+            data = read(*args, **kw)
+            if len(data):
+                self.writer.write(Direction.RECEIVED, data)
+            return data
+
+        setattr(self.communication, name, recording_read)
+
+    def record_sends(self) -> None:
+        send: Callable[..., bool] = self.communication.send
+
+        def recording_send(message: array[int] | tuple[int, ...] | list[int], *args: Any, **kw: Any) -> bool:
+            self.writer.write(Direction.SENT, message)
+            return send(message, *args, **kw)
+
+        self.communication.send = recording_send
+
+    def __getattr__(self, name: str) -> Any:
+        # transport specific API, e.g. `start_reader` or `receive_multiple_streaming_packets`
+        return getattr(self.communication, name)
+
+    def send(self, message: array[int] | tuple[int, ...] | list[int]) -> bool:
+        return self.communication.send(message)
+
+    def receive(self, *args: Any, **kw: Any) -> array[int] | bytes:
+        return self.communication.receive(*args, **kw)
+
+    def send_receive(self, message: array[int] | tuple[int, ...] | list[int], *args: Any, **kw: Any) -> Any:
+        return self.communication.send_receive(message, *args, **kw)
+
+    def discard_input(self) -> int:
+        return self.communication.discard_input()
+
+    def find_device(self) -> None:
+        return self.communication.find_device()
+
+    def initialize(self) -> None:
+        self.communication.initialize()
+
+    def connect(self) -> None:
+        self.communication.connect()
+
+    def restore(self) -> None:
+        # the wrapped transport stays usable after recording, the writer is closed by then
+        for name, method in self.shadowed.items():
+            if method is None:
+                delattr(self.communication, name)
+            else:
+                setattr(self.communication, name, method)
+        self.shadowed.clear()
+
+    def disconnect(self) -> None:
+        self.restore()
+        self.communication.disconnect()
+        self.writer.close()
+
+
+class ReplayCommunication(Communication):
+    def __init__(self, capture: Capture | str | Path, **kw: Any) -> None:
+        self.capture = capture if isinstance(capture, Capture) else read_capture(capture)
+        # realtime serves the bytes at the recorded pace, otherwise as fast as they are asked for
+        self.realtime: bool = kw.get("realtime", False)
+        # strict raises if the host sends something else than what was recorded, otherwise it is logged
+        self.strict: bool = kw.get("strict", False)
+        self.position = 0
+        self.clock_start: float | None = None
+        self.mismatch_count = 0
+        self.is_connected = False
+        self.reassembly_buffer: bytes = b""
+        self.frame_scanner = FrameScanner()
+
+    @property
+    def is_exhausted(self) -> bool:
+        return self.position >= len(self.capture.records)
+
+    def rewind(self) -> None:
+        self.position = 0
+        self.clock_start = None
+        self.mismatch_count = 0
+        self.reset_reassembly_buffer()
+
+    def pace(self, record: CaptureRecord) -> None:
+        if not self.realtime:
+            return
+        if self.clock_start is None:
+            self.clock_start = time.monotonic() - record.time_ns / 1e9
+        delay = self.clock_start + record.time_ns / 1e9 - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def find_device(self) -> None: ...
+
+    def initialize(self) -> None: ...
+
+    def connect(self) -> None:
+        self.is_connected = True
+
+    def disconnect(self) -> None:
+        self.is_connected = False
+
+    def send(self, message: array[int] | tuple[int, ...] | list[int] | bytes) -> bool:
+        records = self.capture.records
+        skipped = 0
+        # bytes the host did not read in the recorded session, e.g. dropped by `discard_input`, are skipped
+        while not self.is_exhausted and records[self.position].direction != Direction.SENT:
+            self.position += 1
+            skipped += 1
+        if skipped:
+            logger.debug(f"Replay skipped {skipped} received records that were never read")
+        if self.is_exhausted:
+            error_message = "Capture has no more sent records to match"
+            raise ReplayCommunicationError(error_message)
+        record = records[self.position]
+        self.position += 1
+        self.pace(record)
+        if record.data != bytes(message):
+            self.mismatch_count += 1
+            error_message = f"Sent {bytes(message)!r} but the capture recorded {record.data!r}"
+            if self.strict:
+                raise ReplayCommunicationError(error_message)
+            logger.warning(error_message)
+        return True
+
+    def _receive(self) -> bytes:
+        if self.is_exhausted or self.capture.records[self.position].direction != Direction.RECEIVED:
+            return b""
+        record = self.capture.records[self.position]
+        self.position += 1
+        self.pace(record)
+        return record.data
+
+    def receive(self) -> bytes:
+        data = self._receive()
+        if self.capture.framing == Framing.PACKET:
+            # same as the USB transport: skip invalid packets and cut the padding after the message
+            while data and not Command.check_message(data):
+                data = self._receive()
+            data = data[: data[1]] if data else data
+        if len(data) == 0:
+            error_message = "No more recorded responses at this point of the capture"
+            raise ReplayCommunicationTimeoutError(error_message)
+        return data
+
+    def send_receive(self, message: array[int] | tuple[int, ...] | list[int] | bytes) -> bytes:
+        self.send(message)
+        return self.receive()
+
+    def receive_multiple_streaming_packets(self) -> Generator:
+        # same reassembly as the serial transport, the recorded chunks are replayed as they were read
+        buffer = self.reassembly_buffer + self._receive() if self.reassembly_buffer else self._receive()
+        try:
+            yield from self.frame_scanner.scan(buffer)
+        finally:
+            self.reassembly_buffer = bytes(buffer[self.frame_scanner.offset :])
+
+    @property
+    def resync_count(self) -> int:
+        return self.frame_scanner.resync_count
+
+    def reset_reassembly_buffer(self) -> None:
+        self.reassembly_buffer = b""
+
+    def discard_input(self) -> int:
+        discarded = len(self.reassembly_buffer)
+        self.reset_reassembly_buffer()
+        return discarded
@@ -23,3 +23,6 @@ class Communication(abc.ABC):
 
     @abc.abstractmethod
     def disconnect(self) -> None: ...
+
+    def discard_input(self) -> int:
+        return 0
@@ -0,0 +1,375 @@
+import logging
+import struct
+import time
+from array import array
+from collections.abc import Callable, Generator
+from dataclasses import dataclass
+from typing import Any
+
+from umrx_app_v3.mcu_board.bst_protocol_constants import (
+    CommandId,
+    CommandType,
+    ErrorCode,
+    MultiIOPin,
+    PinDirection,
+    PinValue,
+    StreamingDataResponse,
+    StreamingSamplingUnit,
+)
+from umrx_app_v3.mcu_board.comm.comm import Communication
+from umrx_app_v3.mcu_board.commands.command import Command
+from umrx_app_v3.mcu_board.commands.frame_scanner import FrameScanner
+
+logger = logging.getLogger(__name__)
+
+# every response starts with these two bytes after the frame header, the status byte follows them
+RESPONSE_HEADER = 0x01
+RESPONSE_ID = 0x42
+MAX_READ_LENGTH = 0xFF - 13
+TIMESTAMP_TICKS_PER_US = 30
+SPI_READ_BIT = 0x80
+
+
+class EmulatorCommunicationError(Exception): ...
+
+
+class EmulatorCommunicationTimeoutError(EmulatorCommunicationError): ...
+
+
+class RegisterDevice:
+    # a sensor seen from the bus: a register file with auto-incrementing burst access
+    def __init__(
+        self, registers: dict[int, int] | None = None, *, i2c_dummy_bytes: int = 0, spi_dummy_bytes: int = 0
+    ) -> None:
+        self.defaults = bytearray(256)
+        for reg_addr, value in (registers or {}).items():
+            self.defaults[reg_addr] = value
+        self.registers = bytearray(self.defaults)
+        self.i2c_dummy_bytes = i2c_dummy_bytes
+        self.spi_dummy_bytes = spi_dummy_bytes
+
+    def reset(self) -> None:
+        self.registers[:] = self.defaults
+
+    def update(self, now: float) -> None:
+        # called with the emulator clock (seconds) before every access, models refresh their data registers here
+        ...
+
+    def read(self, reg_addr: int, length: int) -> bytes:
+        data = bytes(self.registers[reg_addr : reg_addr + length])
+        return data + bytes(length - len(data))
+
+    def write(self, reg_addr: int, data: bytes) -> None:
+        for offset, value in enumerate(data):
+            if reg_addr + offset < len(self.registers):
+                self.registers[reg_addr + offset] = value
+
+
+@dataclass
+class EmulatedStreamingChannel:
+    id: int
+    i2c_address: int | None
+    cs_pin: int | None
+    register_address: int
+    bytes_to_read: int
+    period: float
+    interrupt_pin: int | None = None
+    includes_timestamp: bool = False
+    next_due: float = 0.0
+    packet_count: int = 0
+
+
+class EmulatorCommunication(Communication):
+    def __init__(self, **kw: Any) -> None:
+        self.shuttle_id: int = kw.get("shuttle_id", 0)
+        self.hardware_id: int = kw.get("hardware_id", 0x11)
+        self.software_id: int = kw.get("software_id", 0x171)
+        self.board_id: int = kw.get("board_id", 0x09)
+        # realtime emits streaming packets at wall-clock pace, otherwise the clock jumps to the next sample
+        self.realtime: bool = kw.get("realtime", False)
+        self.interrupt_odr: float = kw.get("interrupt_odr", 100.0)  # Hz, for pins without own rate
+        self.max_packets_per_receive: int = kw.get("max_packets_per_receive", 64)
+        self.i2c_devices: dict[int, RegisterDevice] = {}
+        self.spi_devices: dict[int, RegisterDevice] = {}
+        self.interrupt_odrs: dict[int, float] = {}
+        self.pins: dict[int, tuple[PinDirection, PinValue]] = {}
+        self.vdd, self.vddio = 0.0, 0.0
+        self.polling_channels: dict[int, EmulatedStreamingChannel] = {}
+        self.interrupt_channels: dict[int, EmulatedStreamingChannel] = {}
+        self.active_channels: list[EmulatedStreamingChannel] = []
+        self.output = bytearray()
+        self.command_scanner = FrameScanner()
+        self.frame_scanner = FrameScanner()
+        self.virtual_time = 0.0
+        self.start_time = time.monotonic()
+        self.timer_start = 0.0
+        self.is_connected = False
+        self.handlers: dict[tuple[int, int], Callable[[memoryview], None]] = {
+            (CommandType.DD_GET.value, CommandId.BOARD_INFORMATION.value): self.handle_board_info,
+            (CommandType.DD_SET.value, CommandId.SHUTTLE_BOARD_VDD_VDDIO_CONFIGURATION.value): self.handle_vdd_vddio,
+            (CommandType.DD_SET.value, CommandId.MULTIO_CONFIGURATION.value): self.handle_set_pin,
+            (CommandType.DD_GET.value, CommandId.MULTIO_CONFIGURATION.value): self.handle_get_pin,
+            (CommandType.DD_GET.value, CommandId.SENSOR_WRITE_AND_READ.value): self.handle_read,
+            (CommandType.DD_SET.value, CommandId.SENSOR_WRITE_AND_READ.value): self.handle_write,
+            (CommandType.DD_SET.value, CommandId.TIMER_CFG_CMD_ID.value): self.handle_timer,
+            (CommandType.DD_GET.value, CommandId.TIMER_CFG_CMD_ID.value): self.handle_timer,
+        }
+        for command_id in (CommandId.INTERFACE, CommandId.I2C_SPEED, CommandId.SPI_SETTINGS, CommandId.APP_SWITCH):
+            self.handlers[CommandType.DD_SET.value, command_id.value] = self.handle_accept
+
+    def attach_i2c(self, i2c_address: int, device: RegisterDevice) -> RegisterDevice:
+        self.i2c_devices[i2c_address] = device
+        return device
+
+    def attach_spi(self, cs_pin: MultiIOPin, device: RegisterDevice) -> RegisterDevice:
+        self.spi_devices[cs_pin.value] = device
+        return device
+
+    def set_interrupt_odr(self, interrupt_pin: MultiIOPin, odr: float) -> None:
+        self.interrupt_odrs[interrupt_pin.value] = odr
+
+    @property
+    def is_powered(self) -> bool:
+        return self.vdd > 0 and self.vddio > 0
+
+    @property
+    def is_streaming(self) -> bool:
+        return bool(self.active_channels)
+
+    def now(self) -> float:
+        return time.monotonic() - self.start_time if self.realtime else self.virtual_time
+
+    def sleep(self, duration: float) -> None:
+        # host side delays, e.g. settling times during bring-up, only move the virtual clock
+        if self.realtime:
+            time.sleep(duration)
+        else:
+            self.virtual_time += duration
+
+    def find_device(self) -> None: ...
+
+    def initialize(self) -> None: ...
+
+    def connect(self) -> None:
+        self.is_connected = True
+
+    def disconnect(self) -> None:
+        self.is_connected = False
+
+    def send(self, message: array[int] | tuple[int, ...] | list[int] | bytes) -> bool:
+        for frame in self.command_scanner.scan(bytes(message)):
+            self.handle(frame)
+        return True
+
+    def receive(self) -> bytes:
+        self.emit_streaming_packets()
+        if not self.output:
+            error_message = "No response from emulated board"
+            raise EmulatorCommunicationTimeoutError(error_message)
+        data = bytes(self.output)
+        self.output.clear()
+        return data
+
+    def send_receive(self, message: array[int] | tuple[int, ...] | list[int] | bytes) -> bytes:
+        self.send(message)
+        return self.receive()
+
+    def receive_multiple_streaming_packets(self) -> Generator:
+        # the emulator never cuts a frame, every read holds complete frames only
+        yield from self.frame_scanner.scan(self.receive())
+
+    def discard_input(self) -> int:
+        discarded = len(self.output)
+        self.output.clear()
+        return discarded
+
+    def respond(self, feature: int, *data: int, status: int = ErrorCode.SUCCESS.value) -> None:
+        payload = (RESPONSE_HEADER, status & 0xFF, RESPONSE_ID, feature, *data)
+        self.output.extend(Command.create_message_from(payload))
+
+    def handle(self, frame: memoryview) -> None:
+        command_type, command_id = frame[2], frame[3] if len(frame) > 5 else 0
+        if command_type == CommandType.DD_STREAMING_SETTINGS.value:
+            self.respond(command_type)
+        elif command_type == CommandType.DD_CONFIG_STREAM_POLLING.value:
+            self.handle_polling_channel(frame)
+        elif command_type == CommandType.DD_CONFIG_STREAM_INTERRUPT.value:
+            self.handle_interrupt_channel(frame)
+        elif command_type == CommandType.DD_START_STOP_STREAMING_POLLING.value:
+            self.handle_start_stop(frame, self.polling_channels, CommandId.START_STOP_POLLING_RESPONSE)
+        elif command_type == CommandType.DD_START_STOP_STREAMING_INTERRUPT.value:
+            self.handle_start_stop(frame, self.interrupt_channels, CommandId.START_STOP_RESPONSE)
+        elif (command_type, command_id) in self.handlers:
+            self.handlers[command_type, command_id](frame)
+        else:
+            logger.warning(f"Emulated board got unknown command {bytes(frame)=}")
+            self.respond(CommandId.UNKNOWN_INSTRUCTION.value, status=ErrorCode.ERROR_NOT_SUPPORTED.value)
+
+    def handle_accept(self, frame: memoryview) -> None:
+        self.respond(frame[3])
+
+    def handle_board_info(self, frame: memoryview) -> None:
+        ids = struct.pack(">HHH", self.shuttle_id, self.hardware_id, self.software_id)
+        self.respond(frame[3], *ids, self.board_id)
+
+    def handle_vdd_vddio(self, frame: memoryview) -> None:
+        was_powered = self.is_powered
+        vdd = (frame[4] << 8 | frame[5]) / 1000 if frame[6] else 0.0
+        vddio = (frame[7] << 8 | frame[8]) / 1000 if frame[9] else 0.0
+        self.vdd, self.vddio = vdd, vddio
+        if self.is_powered and not was_powered:
+            # sensors come out of power-on reset
+            for device in {*self.i2c_devices.values(), *self.spi_devices.values()}:
+                device.reset()
+        self.respond(frame[3])
+
+    def handle_set_pin(self, frame: memoryview) -> None:
+        self.pins[frame[5]] = PinDirection(frame[7]), PinValue(frame[9])
+        self.respond(frame[3])
+
+    def handle_get_pin(self, frame: memoryview) -> None:
+        direction, value = self.pins.get(frame[5], (PinDirection.INPUT, PinValue.LOW))
+        self.respond(frame[3], frame[4], frame[5], 0, direction.value, 0, value.value)
+
+    def handle_timer(self, frame: memoryview) -> None:
+        # time stamps of interrupt streaming count from the last timer (re)configuration
+        self.timer_start = self.now()
+        self.respond(frame[3])
+
+    def select_device(self, interface: int, i2c_address: int) -> tuple[RegisterDevice | None, bool]:
+        # interface byte is the I2C bus (0) or the SPI chip select pin
+        if interface == 0:
+            return self.i2c_devices.get(i2c_address), False
+        return self.spi_devices.get(interface), True
+
+    def read_device(
+        self, interface: int, i2c_address: int, reg_addr: int, bytes_to_read: int, at: float | None = None
+    ) -> tuple[ErrorCode, bytes]:
+        device, is_spi = self.select_device(interface, i2c_address)
+        if is_spi:
+            reg_addr &= ~SPI_READ_BIT
+        if device is None or not self.is_powered:
+            # an absent SPI device leaves MISO floating, an absent I2C device does not acknowledge
+            return (
+                (ErrorCode.SUCCESS, bytes([0xFF] * bytes_to_read)) if is_spi else (ErrorCode.ERROR_COMM_IO_ERROR, b"")
+            )
+        device.update(self.now() if at is None else at)
+        dummy_bytes = device.spi_dummy_bytes if is_spi else device.i2c_dummy_bytes
+        data = bytes(dummy_bytes) + device.read(reg_addr, max(bytes_to_read - dummy_bytes, 0))
+        return ErrorCode.SUCCESS, data[:bytes_to_read]
+
+    def handle_read(self, frame: memoryview) -> None:
+        i2c_address = frame[8] << 8 | frame[9]
+        bytes_to_read = frame[11] << 8 | frame[12]
+        if bytes_to_read > MAX_READ_LENGTH:
+            self.respond(frame[3], status=ErrorCode.ERROR_INVALID_PAYLOAD_LEN.value)
+            return
+        status, data = self.read_device(frame[5], i2c_address, frame[10], bytes_to_read)
+        self.respond(frame[3], frame[4], 0, frame[6], frame[7], 0, *data, status=status.value)
+
+    def handle_write(self, frame: memoryview) -> None:
+        device, is_spi = self.select_device(frame[5], frame[8] << 8 | frame[9])
+        if device is None or not self.is_powered:
+            status = ErrorCode.SUCCESS if is_spi else ErrorCode.ERROR_COMM_IO_ERROR
+            self.respond(frame[3], status=status.value)
+            return
+        device.update(self.now())
+        length = frame[12]
+        device.write(frame[10], bytes(frame[16 : 16 + length]))
+        self.respond(frame[3])
+
+    @staticmethod
+    def sampling_period(sampling_time: int, sampling_unit: int) -> float:
+        scale = 1e-6 if sampling_unit == StreamingSamplingUnit.MICRO_SECOND.value else 1e-3
+        return sampling_time * scale
+
+    def handle_polling_channel(self, frame: memoryview) -> None:
+        interface = frame[5]
+        self.polling_channels[frame[3]] = EmulatedStreamingChannel(
+            id=frame[3],
+            i2c_address=(frame[7] << 8 | frame[8]) if interface == 0 else None,
+            cs_pin=interface if interface else None,
+            register_address=frame[14],
+            bytes_to_read=frame[16],
+            period=self.sampling_period(frame[9] << 8 | frame[10], frame[11]),
+        )
+        self.respond(frame[2])
+
+    def handle_interrupt_channel(self, frame: memoryview) -> None:
+        interface, interrupt_pin = frame[5], frame[6]
+        odr = self.interrupt_odrs.get(interrupt_pin, self.interrupt_odr)
+        self.interrupt_channels[frame[3]] = EmulatedStreamingChannel(
+            id=frame[3],
+            i2c_address=(frame[7] << 8 | frame[8]) if interface == 0 else None,
+            cs_pin=interface if interface else None,
+            register_address=frame[11],
+            bytes_to_read=frame[13],
+            period=1.0 / odr,
+            interrupt_pin=interrupt_pin,
+            includes_timestamp=bool(frame[4]),
+        )
+        self.respond(frame[2])
+
+    def handle_start_stop(
+        self, frame: memoryview, channels: dict[int, EmulatedStreamingChannel], response: CommandId
+    ) -> None:
+        configured = list(channels.values())
+        self.active_channels = [channel for channel in self.active_channels if channel not in configured]
+        if frame[3] == 0:
+            self.respond(response.value)
+            return
+        if not configured:
+            self.respond(response.value, status=ErrorCode.ERROR_STREAM_NOT_CONFIGURED.value)
+            return
+        now = self.now()
+        for channel in configured:
+            channel.next_due = now + channel.period
+            channel.packet_count = 0
+        self.active_channels.extend(configured)
+        self.respond(response.value)
+
+    def wait_for_next_sample(self) -> None:
+        next_due = min(channel.next_due for channel in self.active_channels)
+        if self.realtime:
+            time.sleep(max(next_due - self.now(), 0.0))
+        else:
+            self.virtual_time = max(self.virtual_time, next_due)
+
+    def emit_streaming_packets(self) -> None:
+        if not self.active_channels:
+            return
+        if not self.output:
+            self.wait_for_next_sample()
+        now = self.now()
+        for _ in range(self.max_packets_per_receive):
+            channel = min(self.active_channels, key=lambda channel: channel.next_due)
+            if channel.next_due > now:
+                return
+            self.emit_streaming_packet(channel)
+            channel.next_due += channel.period
+
+    def emit_streaming_packet(self, channel: EmulatedStreamingChannel) -> None:
+        interface = 0 if channel.cs_pin is None else channel.cs_pin
+        # the sensor is read at the sample time, not at the time the batch is produced
+        _, data = self.read_device(
+            interface, channel.i2c_address or 0, channel.register_address, channel.bytes_to_read, at=channel.next_due
+        )
+        data = data or bytes(channel.bytes_to_read)
+        if channel.interrupt_pin is None:
+            payload = (RESPONSE_HEADER, 0, StreamingDataResponse.POLLING.value, *data, *struct.pack(">H", channel.id))
+        else:
+            channel.packet_count += 1
+            time_stamp = b""
+            if channel.includes_timestamp:
+                ticks = int((channel.next_due - self.timer_start) * 1e6) * TIMESTAMP_TICKS_PER_US
+                time_stamp = ticks.to_bytes(8, "big")[-6:]
+            payload = (
+                RESPONSE_HEADER,
+                0,
+                StreamingDataResponse.INTERRUPT.value,
+                channel.id,
+                *struct.pack(">I", channel.packet_count),
+                *data,
+                *time_stamp,
+            )
+        self.output.extend(Command.create_message_from(payload))
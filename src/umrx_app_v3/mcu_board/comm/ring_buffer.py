@@ -0,0 +1,138 @@
+import logging
+import threading
+from enum import Enum
+
+logger = logging.getLogger(__name__)
+
+
+class RingBufferError(Exception): ...
+
+
+class RingBufferOverflowError(RingBufferError): ...
+
+
+class OverflowPolicy(Enum):
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    RAISE = "raise"
+
+
+class ByteRingBuffer:
+    FRAME_START = 0xAA
+
+    def __init__(self, capacity: int = 1 << 20, overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST) -> None:
+        if capacity <= 0:
+            error_message = f"Capacity must be positive, got {capacity}"
+            raise RingBufferError(error_message)
+        self.capacity = capacity
+        self.overflow_policy = overflow_policy
+        self.buffer = bytearray(capacity)
+        self.head: int = 0
+        self.size: int = 0
+        self.is_closed: bool = False
+        self.bytes_written: int = 0
+        self.bytes_dropped: int = 0
+        self.frames_dropped: int = 0
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.size
+
+    @property
+    def free(self) -> int:
+        return self.capacity - self.size
+
+    def close(self) -> None:
+        with self._lock:
+            self.is_closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+    def write(self, data: bytes | bytearray | memoryview) -> None:
+        view = memoryview(data).cast("B")
+        with self._lock:
+            if self.overflow_policy == OverflowPolicy.RAISE and len(view) > self.free:
+                error_message = f"Ring buffer overflow: {len(view)} bytes to write, {self.free} bytes free"
+                raise RingBufferOverflowError(error_message)
+            if self.overflow_policy == OverflowPolicy.DROP_OLDEST and len(view) > self.capacity:
+                num_cut = len(view) - self.capacity
+                self.bytes_dropped += num_cut
+                self.frames_dropped += self._count_frames(view, num_cut)
+                view = view[num_cut:]
+            while len(view) > 0:
+                if self.is_closed:
+                    return
+                if self.free == 0:
+                    if self.overflow_policy == OverflowPolicy.BLOCK:
+                        self._not_full.wait()
+                        continue
+                    self._drop_oldest(len(view))
+                chunk = min(self.free, len(view))
+                self._put(view[:chunk])
+                view = view[chunk:]
+                self._not_empty.notify_all()
+
+    def read(self, max_bytes: int | None = None, timeout: float | None = None) -> bytes:
+        with self._lock:
+            if self.size == 0 and not self.is_closed:
+                self._not_empty.wait_for(lambda: self.size > 0 or self.is_closed, timeout=timeout)
+            num_bytes = self.size if max_bytes is None else min(max_bytes, self.size)
+            data = self._peek(num_bytes)
+            self._advance(num_bytes)
+            self._not_full.notify_all()
+            return data
+
+    def clear(self) -> None:
+        with self._lock:
+            self.head = 0
+            self.size = 0
+            self._not_full.notify_all()
+
+    def _put(self, view: memoryview) -> None:
+        tail = (self.head + self.size) % self.capacity
+        first = min(len(view), self.capacity - tail)
+        self.buffer[tail : tail + first] = view[:first]
+        self.buffer[: len(view) - first] = view[first:]
+        self.size += len(view)
+        self.bytes_written += len(view)
+
+    def _peek(self, num_bytes: int) -> bytes:
+        first = min(num_bytes, self.capacity - self.head)
+        return bytes(self.buffer[self.head : self.head + first]) + bytes(self.buffer[: num_bytes - first])
+
+    def _at(self, offset: int) -> int:
+        return self.buffer[(self.head + offset) % self.capacity]
+
+    def _advance(self, num_bytes: int) -> None:
+        self.head = (self.head + num_bytes) % self.capacity
+        self.size -= num_bytes
+
+    @classmethod
+    def _count_frames(cls, view: memoryview, num_bytes: int) -> int:
+        # frames starting in the first `num_bytes` of `view`, walked by their length byte as in `_drop_oldest`
+        frames = offset = 0
+        while offset < num_bytes:
+            if view[offset] == cls.FRAME_START and offset + 1 < len(view) and view[offset + 1] > 0:
+                frames += 1
+                offset += view[offset + 1]
+            else:
+                offset += 1
+        return frames
+
+    def _drop_oldest(self, bytes_needed: int) -> None:
+        # drop whole frames from the head, so the consumer keeps reading from a frame boundary
+        bytes_to_drop = min(bytes_needed, self.capacity) - self.free
+        while bytes_to_drop > 0 and self.size > 0:
+            if self._at(0) == self.FRAME_START and self.size > 1 and self._at(1) > 0:
+                step = min(self._at(1), self.size)
+                self.frames_dropped += 1
+            else:
+                step = 1
+                while step < self.size and self._at(step) != self.FRAME_START:
+                    step += 1
+            self._advance(step)
+            self.bytes_dropped += step
+            bytes_to_drop -= step
@@ -1,13 +1,17 @@
 import logging
+import threading
+import time
 from array import array
 from collections.abc import Generator
 from typing import Any
 
 import serial
 import serial.tools.list_ports
+from serial.tools.list_ports_common import ListPortInfo
 
 from umrx_app_v3.mcu_board.comm.comm import Communication
-from umrx_app_v3.mcu_board.commands.command import Command
+from umrx_app_v3.mcu_board.comm.ring_buffer import ByteRingBuffer, OverflowPolicy, RingBufferError
+from umrx_app_v3.mcu_board.commands.frame_scanner import FrameScanner
 
 logger = logging.getLogger(__name__)
 
@@ -15,65 +19,145 @@ logger = logging.getLogger(__name__)
 class SerialCommunicationError(Exception): ...
 
 
+class SerialCommunicationTimeoutError(SerialCommunicationError): ...
+
+
 class SerialCommunication(Communication):
     def __init__(self, **kw: Any) -> None:
         self.vid = kw["vid"] if kw.get("vid") else 0x108C  # App Board 3.1
         self.pid = kw["pid"] if kw.get("pid") else 0xAB38
         self.port: serial.Serial | None = None
-        self.port_name: str | None = None
+        self.port_name: str | None = kw.get("port_name")
+        self.serial_number: str | None = kw.get("serial_number")
         self.buffer_size = 125
+        self.timeout: float | None = kw.get("timeout", 2.0)  # seconds, `None` waits forever
         self.is_initialized: bool = False
+        self.ring_buffer: ByteRingBuffer | None = None
+        self.reader_thread: threading.Thread | None = None
+        self.reader_error: Exception | None = None
+        self.reader_poll_interval: float = 0.1
+        self._reader_stop = threading.Event()
+        self.reassembly_buffer: bytes = b""
+        self.frame_scanner = FrameScanner()
 
     def send(self, message: array[int] | list[int] | tuple[int, ...]) -> bool:
         bytes_written = self.port.write(message)
         self.port.flush()
         return bytes_written == len(message)
 
-    def _receive(self) -> array[int] | bytes:
-        ok = False
-        read_from_serial = b""
-        while not ok:
-            # read until we get something in the buffer
-            in_waiting = self.port.in_waiting
-            # logger.info(f"waiting buffer: {in_waiting}")
-            read_from_serial += self.port.read(in_waiting)
-            # logger.info(f"buffer size: {len(read_from_serial)}")
-            ok = len(read_from_serial) > 0
+    def _set_read_timeout(self, timeout: float | None) -> None:
+        # reconfiguring the port is a syscall, do it only when the timeout actually changes
+        if self.port.timeout != timeout:
+            self.port.timeout = timeout
+
+    def _read_port(self, timeout: float | None = None) -> bytes:
+        self._set_read_timeout(self.timeout if timeout is None else timeout)
+        # block in the kernel until the first byte arrives (or timeout expires), then drain what is buffered
+        read_from_serial = self.port.read(1)
+        if read_from_serial:
+            read_from_serial += self.port.read(self.port.in_waiting)
         return read_from_serial
 
-    def receive(self) -> array[int] | bytes:
-        return self._receive()
+    def _receive(self, timeout: float | None = None) -> array[int] | bytes:
+        if self.ring_buffer is None:
+            return self._read_port(timeout)
+        if self.reader_error is not None and len(self.ring_buffer) == 0:
+            raise self.reader_error
+        return self.ring_buffer.read(timeout=self.timeout if timeout is None else timeout)
+
+    @property
+    def is_reader_running(self) -> bool:
+        return self.reader_thread is not None and self.reader_thread.is_alive()
+
+    def start_reader(
+        self, capacity: int = 1 << 20, overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST
+    ) -> ByteRingBuffer:
+        if self.is_reader_running:
+            return self.ring_buffer
+        self.ring_buffer = ByteRingBuffer(capacity=capacity, overflow_policy=overflow_policy)
+        self.reader_error = None
+        self._reader_stop.clear()
+        self.reader_thread = threading.Thread(
+            target=self._reader_loop, name=f"serial-reader-{self.port_name}", daemon=True
+        )
+        self.reader_thread.start()
+        return self.ring_buffer
+
+    def stop_reader(self) -> None:
+        self._reader_stop.set()
+        if self.ring_buffer is not None:
+            self.ring_buffer.close()
+        if self.reader_thread is not None:
+            self.reader_thread.join()
+        self.reader_thread = None
+        self.ring_buffer = None
+
+    def _reader_loop(self) -> None:
+        try:
+            while not self._reader_stop.is_set():
+                data = self._read_port(self.reader_poll_interval)
+                if data:
+                    self.ring_buffer.write(data)
+        except (RingBufferError, serial.SerialException) as e:
+            logger.exception("Serial reader stopped")
+            self.reader_error = e
+            self.ring_buffer.close()
+
+    def receive(self, timeout: float | None = None) -> array[int] | bytes:
+        message = self._receive(timeout)
+        if len(message) == 0:
+            error_message = f"No response from board within {self.timeout if timeout is None else timeout} s"
+            raise SerialCommunicationTimeoutError(error_message)
+        return message
 
     def receive_multiple_streaming_packets(self) -> Generator:
-        message = self._receive()
-        while len(message) > 0:
-            if Command.check_message(message):
-                packet_len = message[1]
-                packet = message[:packet_len]
-                message = message[packet_len:]
-                yield packet
-            else:
-                possible_start_idx = message.find(0x0A)
-                if (
-                    possible_start_idx == -1
-                    or len(message) < possible_start_idx + 2
-                    or len(message) < message[possible_start_idx + 2] + 2
-                ):
-                    break
-                else:
-                    message = message[possible_start_idx + 1 :]
-
-    def send_receive(self, message: array[int] | tuple[int, ...] | list[int]) -> array | bytes:
+        # bytes of a frame cut off at the end of a read are kept and completed by the next read
+        buffer = self.reassembly_buffer + self._receive() if self.reassembly_buffer else self._receive()
+        try:
+            yield from self.frame_scanner.scan(buffer)
+        finally:
+            self.reassembly_buffer = bytes(buffer[self.frame_scanner.offset :])
+
+    @property
+    def resync_count(self) -> int:
+        return self.frame_scanner.resync_count
+
+    def reset_reassembly_buffer(self) -> None:
+        self.reassembly_buffer = b""
+
+    def discard_input(self) -> int:
+        # drops stale bytes, e.g. streaming packets still in flight after streaming was stopped
+        discarded = len(self.reassembly_buffer)
+        self.reset_reassembly_buffer()
+        if self.ring_buffer is not None:
+            discarded += len(self.ring_buffer)
+            self.ring_buffer.clear()
+        elif self.port is not None:
+            discarded += self.port.in_waiting
+            self.port.reset_input_buffer()
+        return discarded
+
+    def send_receive(
+        self, message: array[int] | tuple[int, ...] | list[int], timeout: float | None = None
+    ) -> array | bytes:
+        timeout = self.timeout if timeout is None else timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
         send_ok = self.send(message)
         if not send_ok:
             error_message = "Sending packet failed!"
             raise SerialCommunicationError(error_message)
-        return self.receive()
+        if deadline is None:
+            return self.receive()
+        return self.receive(timeout=max(deadline - time.monotonic(), 0.0))
 
-    def find_device(self) -> bool:
+    @staticmethod
+    def list_devices(vid: int, pid: int) -> list[ListPortInfo]:
         ports = serial.tools.list_ports.comports()
-        for port_info in sorted(ports):
-            if port_info.vid == self.vid and port_info.pid == self.pid:
+        return sorted(port_info for port_info in ports if port_info.vid == vid and port_info.pid == pid)
+
+    def find_device(self) -> bool:
+        for port_info in self.list_devices(self.vid, self.pid):
+            if self.serial_number is None or port_info.serial_number == self.serial_number:
                 self.port_name = port_info.device
                 logger.debug(f"Found board: port={self.port_name}")
                 return True
@@ -85,7 +169,7 @@ class SerialCommunication(Communication):
             if not found:
                 error_msg = "Board is not found! Is it connected and turned ON?"
                 raise SerialCommunicationError(error_msg)
-        self.port = serial.Serial(port=self.port_name)
+        self.port = serial.Serial(port=self.port_name, timeout=self.timeout)
         self.port.port = self.port_name
         self.port.baudrate = 115200
         if not self.port.is_open:
@@ -96,4 +180,9 @@ class SerialCommunication(Communication):
             self.initialize()
 
     def disconnect(self) -> None:
-        pass
+        self.stop_reader()
+        # the next `initialize` opens the port again
+        if self.port is not None:
+            self.port.close()
+            self.port = None
+        self.is_initialized = False
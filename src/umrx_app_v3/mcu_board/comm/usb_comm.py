@@ -21,6 +21,9 @@ class UsbCommunication(Communication):
         self.vid_v3_rev0, self.pid_v3_rev0 = 0x152A, 0x80C0  # default VID/PID for 3.0 HW
         self.vid = kwargs["vid"] if kwargs.get("vid") else self.vid_v3_rev0
         self.pid = kwargs["pid"] if kwargs.get("pid") else self.pid_v3_rev0
+        self.serial_number: str | None = kwargs.get("serial_number")
+        # "bus:address" of the device, identifies a board whose serial number cannot be read
+        self.port: str | None = kwargs.get("port")
         self.usb_device: usb.core.Device | None = None
         self.configuration: usb.core.Configuration | None = None
         self.interface: usb.core.Interface | None = None
@@ -29,8 +32,36 @@ class UsbCommunication(Communication):
         self.is_initialized = False
         # self.initialize()
 
+    @staticmethod
+    def list_devices(vid: int, pid: int) -> list[usb.core.Device]:
+        return list(usb.core.find(find_all=True, idVendor=vid, idProduct=pid))
+
+    @staticmethod
+    def read_serial_number(device: usb.core.Device) -> str | None:
+        # reading string descriptors needs access rights to the device, which are not always granted
+        try:
+            return device.serial_number
+        except (ValueError, usb.core.USBError):
+            logger.warning(f"Cannot read serial number of USB device {device.bus}:{device.address}")
+            return None
+
+    @staticmethod
+    def device_port(device: usb.core.Device) -> str:
+        return f"{device.bus}:{device.address}"
+
     def find_device(self) -> None:
-        self.usb_device = usb.core.find(idVendor=self.vid, idProduct=self.pid)
+        if self.serial_number is not None:
+            self.usb_device = usb.core.find(
+                idVendor=self.vid,
+                idProduct=self.pid,
+                custom_match=lambda device: self.read_serial_number(device) == self.serial_number,
+            )
+        elif self.port is not None:
+            self.usb_device = usb.core.find(
+                idVendor=self.vid, idProduct=self.pid, custom_match=lambda device: self.device_port(device) == self.port
+            )
+        else:
+            self.usb_device = usb.core.find(idVendor=self.vid, idProduct=self.pid)
         if self.usb_device is None:
             error_message = f"Board with VID={self.vid:04X}, PID={self.pid:04X} not found! Is it connected and ON?"
             raise UsbCommunicationError(error_message)
@@ -122,6 +153,16 @@ class UsbCommunication(Communication):
             is_valid_packet_received = Command.check_message(packet)
         return self.extract_message_from(packet)
 
+    def discard_input(self) -> int:
+        discarded = 0
+        if self.endpoint_bulk_in is None:
+            return discarded
+        try:
+            while True:
+                discarded += len(self.endpoint_bulk_in.read(self.bulk_in_packet_size, timeout=1))
+        except usb.core.USBTimeoutError:
+            return discarded
+
     def send_receive(self, message: array | tuple | list) -> array:
         self.send(message)
         return self.receive()
@@ -39,17 +39,21 @@ class Command(abc.ABC):
         return message
 
     @staticmethod
-    def check_message(packet: array[int] | tuple[int, ...] | list[int]) -> bool:
+    def check_message(packet: array[int] | tuple[int, ...] | list[int] | bytes | memoryview) -> bool:
         if len(packet) < 2:
             return False
-        packet_start = 0xAA
-        is_packet_start_found = packet[0] == packet_start
         packet_size = packet[1]
-        if len(packet) < packet_size:
+        if len(packet) < packet_size or packet_size < 2:
             return False
-        packet_end = 0x0D, 0x0A
-        is_packet_end_found = tuple(packet[packet_size - 2 : packet_size]) == packet_end
-        return is_packet_start_found and is_packet_end_found
+        return packet[0] == 0xAA and packet[packet_size - 2] == 0x0D and packet[packet_size - 1] == 0x0A
+
+    @staticmethod
+    def to_array(payload: array[int] | tuple[int, ...] | list[int] | bytes | memoryview) -> array[int]:
+        if isinstance(payload, tuple | list):
+            return array("B", payload)
+        payload_array = array("B")
+        payload_array.frombytes(payload)
+        return payload_array
 
     @staticmethod
     def check_message_length(*, expected: int = 0, not_less_then: int = 0) -> Callable:
@@ -94,7 +98,7 @@ class Command(abc.ABC):
             payload_len = message_len - CoinesResponse.DD_RESPONSE_OVERHEAD_BYTES.value
 
         payload_start = CoinesResponse.DD_RESPONSE_OVERHEAD_BYTES.value - 2
-        return array("B", (int(el) for el in message[payload_start : payload_start + payload_len]))
+        return Command.to_array(message[payload_start : payload_start + payload_len])
 
     @staticmethod
     def check_for_max_payload(data_to_write: array[int]) -> tuple[bool, str]:
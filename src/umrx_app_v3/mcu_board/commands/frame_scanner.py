@@ -0,0 +1,54 @@
+import logging
+from collections.abc import Generator
+
+logger = logging.getLogger(__name__)
+
+
+class FrameScanner:
+    FRAME_START = 0xAA
+    FRAME_END = 0x0D, 0x0A
+    MIN_FRAME_LENGTH = 4
+
+    def __init__(self) -> None:
+        self.offset: int = 0
+        self.resync_count: int = 0
+
+    def scan(self, buffer: bytes | bytearray | memoryview, offset: int = 0) -> Generator[memoryview, None, None]:
+        # yields views of complete frames, nothing is copied
+        view = memoryview(buffer).cast("B")
+        for frame_start, frame_end in self.scan_offsets(buffer, offset):
+            yield view[frame_start:frame_end]
+
+    def scan_offsets(
+        self, buffer: bytes | bytearray | memoryview, offset: int = 0
+    ) -> Generator[tuple[int, int], None, None]:
+        # walks the buffer by offsets and yields (start, end) of complete frames;
+        # `self.offset` points after the last consumed byte, i.e. to the start of an incomplete frame
+        view = memoryview(buffer).cast("B")
+        buffer_len = len(view)
+        cr, lf = self.FRAME_END
+        self.offset = offset
+        while buffer_len - offset >= 2:
+            frame_len = view[offset + 1]
+            if view[offset] == self.FRAME_START and frame_len >= self.MIN_FRAME_LENGTH:
+                if buffer_len - offset < frame_len:
+                    return
+                frame_end = offset + frame_len
+                if view[frame_end - 2] == cr and view[frame_end - 1] == lf:
+                    self.offset = frame_end
+                    yield offset, frame_end
+                    offset = frame_end
+                    continue
+            offset = self.find_frame_start(buffer, offset + 1)
+            self.offset = offset
+            self.resync_count += 1
+            logger.debug(f"Resynchronising frames, skipped bytes before {offset=}")
+
+    def find_frame_start(self, buffer: bytes | bytearray | memoryview, offset: int) -> int:
+        if isinstance(buffer, bytes | bytearray):
+            idx = buffer.find(self.FRAME_START, offset)
+            return len(buffer) if idx == -1 else idx
+        view = memoryview(buffer).cast("B")
+        while offset < len(view) and view[offset] != self.FRAME_START:
+            offset += 1
+        return offset
@@ -18,6 +18,7 @@ logger = logging.getLogger(__name__)
 
 
 class I2CCmd(Command):
+    # module-wide default, used when a board does not pass its own bus
     DefaultI2CBus = I2CBus.BUS_I2C_0
 
     @staticmethod
@@ -27,9 +28,9 @@ class I2CCmd(Command):
 
 class I2CConfigureCmd(I2CCmd):
     @staticmethod
-    def assemble(speed: I2CMode = I2CMode.STANDARD_MODE) -> Generator:
+    def assemble(speed: I2CMode = I2CMode.STANDARD_MODE, bus: I2CBus | None = None) -> Generator:
         yield I2CConfigureCmd.config()
-        yield I2CConfigureCmd.set_speed(speed)
+        yield I2CConfigureCmd.set_speed(speed, bus)
 
     @staticmethod
     def config() -> array[int]:
@@ -42,11 +43,12 @@ class I2CConfigureCmd(I2CCmd):
         return Command.create_message_from(payload)
 
     @staticmethod
-    def set_speed(speed: I2CMode) -> array[int]:
+    def set_speed(speed: I2CMode, bus: I2CBus | None = None) -> array[int]:
+        bus = I2CCmd.DefaultI2CBus if bus is None else bus
         payload = (
             CommandType.DD_SET.value,
             CommandId.I2C_SPEED.value,
-            I2CConfigureCmd.DefaultI2CBus.value,
+            bus.value,
             speed.value,
         )
         return Command.create_message_from(payload)
@@ -21,6 +21,7 @@ logger = logging.getLogger(__name__)
 
 
 class SPICmd(Command):
+    # module-wide defaults, used when a board does not pass its own bus and mode
     DefaultSPIBus = SPIBus.BUS_0
     DefaultSPIMode = SPIMode.MODE_3
 
@@ -35,9 +36,9 @@ class SPICmd(Command):
 
 class SPIConfigureCmd(SPICmd):
     @staticmethod
-    def assemble(speed: SPISpeed = SPISpeed.MHz_5) -> Generator:
+    def assemble(speed: SPISpeed = SPISpeed.MHz_5, bus: SPIBus | None = None, mode: SPIMode | None = None) -> Generator:
         yield SPIConfigureCmd.config()
-        yield SPIConfigureCmd.set_speed(speed)
+        yield SPIConfigureCmd.set_speed(speed, bus, mode)
 
     @staticmethod
     def config() -> array[int]:
@@ -50,12 +51,14 @@ class SPIConfigureCmd(SPICmd):
         return Command.create_message_from(payload)
 
     @staticmethod
-    def set_speed(speed: SPISpeed) -> array[int]:
+    def set_speed(speed: SPISpeed, bus: SPIBus | None = None, mode: SPIMode | None = None) -> array[int]:
+        bus = SPICmd.DefaultSPIBus if bus is None else bus
+        mode = SPICmd.DefaultSPIMode if mode is None else mode
         payload = (
             CommandType.DD_SET.value,
             CommandId.SPI_SETTINGS.value,
-            SPICmd.DefaultSPIBus.value,
-            SPICmd.DefaultSPIMode.value,
+            bus.value,
+            mode.value,
             SPITransfer.SPI_8BIT.value,
             speed.value,
         )
@@ -0,0 +1,90 @@
+import logging
+from array import array
+from collections.abc import Callable, Iterable
+
+import numpy as np
+
+from umrx_app_v3.mcu_board.bst_protocol_constants import CoinesResponse, ErrorCode
+from umrx_app_v3.mcu_board.commands.command import CommandError
+from umrx_app_v3.mcu_board.commands.frame_scanner import FrameScanner
+
+logger = logging.getLogger(__name__)
+
+StreamingFrames = bytes | bytearray | memoryview | array | Iterable[bytes | memoryview | array]
+GroupDecoder = Callable[[np.ndarray, int], tuple[np.ndarray, np.ndarray, np.ndarray | int, np.ndarray]]
+
+
+def streaming_packet_dtype(payload_size: int) -> np.dtype:
+    return np.dtype(
+        [
+            ("channel_id", np.uint16),
+            ("packet_count", np.uint32),
+            ("mcu_timestamp_us", np.int64),
+            ("payload_length", np.uint16),
+            ("payload", np.uint8, (payload_size,)),
+        ]
+    )
+
+
+def as_buffer(frames: StreamingFrames) -> bytes | bytearray | memoryview | array:
+    if isinstance(frames, bytes | bytearray | memoryview | array):
+        return frames
+    return b"".join(frames)
+
+
+def frame_offsets(buffer: bytes | bytearray | memoryview | array, raw: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    if raw.size < 2:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+    frame_len = int(raw[1])
+    if frame_len >= FrameScanner.MIN_FRAME_LENGTH and raw.size % frame_len == 0:
+        # common case: all frames have the same length and are back to back, the check is vectorized
+        frames = raw.reshape(-1, frame_len)
+        if (
+            np.all(frames[:, 0] == FrameScanner.FRAME_START)
+            and np.all(frames[:, 1] == frame_len)
+            and np.all(frames[:, -2] == FrameScanner.FRAME_END[0])
+            and np.all(frames[:, -1] == FrameScanner.FRAME_END[1])
+        ):
+            offsets = np.arange(0, raw.size, frame_len, dtype=np.intp)
+            return offsets, np.full(offsets.size, frame_len, dtype=np.intp)
+    spans = np.array(list(FrameScanner().scan_offsets(buffer)), dtype=np.intp).reshape(-1, 2)
+    return spans[:, 0], spans[:, 1] - spans[:, 0]
+
+
+def big_endian(columns: np.ndarray) -> np.ndarray:
+    value = np.zeros(columns.shape[0], dtype=np.uint64)
+    for idx in range(columns.shape[1]):
+        value = (value << np.uint64(8)) | columns[:, idx].astype(np.uint64)
+    return value
+
+
+def decode_frames(frames: StreamingFrames, expected_feature: int, group_decoder: GroupDecoder) -> np.ndarray:
+    buffer = as_buffer(frames)
+    raw = np.frombuffer(buffer, dtype=np.uint8)
+    offsets, lengths = frame_offsets(buffer, raw)
+    decoded_groups = []
+    for frame_len in np.unique(lengths).tolist():
+        group_idx = np.flatnonzero(lengths == frame_len)
+        # a strided (n, frame_len) view when frames are contiguous, one gather otherwise
+        if group_idx.size * frame_len == raw.size:
+            group = raw.reshape(-1, frame_len)
+        else:
+            group = raw[offsets[group_idx, None] + np.arange(frame_len)]
+        status = group[:, CoinesResponse.DD_RESPONSE_STATUS_POSITION.value]
+        feature = group[:, CoinesResponse.DD_RESPONSE_COMMAND_ID_POSITION.value]
+        invalid = (status != ErrorCode.SUCCESS.value) | (feature != expected_feature)
+        if np.any(invalid):
+            bad_offset = int(offsets[group_idx[np.argmax(invalid)]])
+            error_message = f"Error in streaming frame: {bytes(raw[bad_offset : bad_offset + frame_len])}"
+            raise CommandError(error_message)
+        decoded_groups.append((group_idx, *group_decoder(group, frame_len)))
+
+    payload_size = max((payload.shape[1] for *_, payload in decoded_groups), default=0)
+    result = np.zeros(offsets.size, dtype=streaming_packet_dtype(payload_size))
+    for group_idx, channel_id, packet_count, timestamp, payload in decoded_groups:
+        result["channel_id"][group_idx] = channel_id
+        result["packet_count"][group_idx] = packet_count
+        result["mcu_timestamp_us"][group_idx] = timestamp
+        result["payload_length"][group_idx] = payload.shape[1]
+        result["payload"][group_idx, : payload.shape[1]] = payload
+    return result
@@ -3,7 +3,9 @@ import struct
 from array import array
 from collections.abc import Generator
 from dataclasses import dataclass, field
-from typing import Literal
+from typing import Any, Literal
+
+import numpy as np
 
 from umrx_app_v3.mcu_board.bst_protocol_constants import (
     CoinesInterruptStreamResponse,
@@ -14,9 +16,23 @@ from umrx_app_v3.mcu_board.bst_protocol_constants import (
     StreamingDataResponse,
 )
 from umrx_app_v3.mcu_board.commands.command import Command, CommandError
+from umrx_app_v3.mcu_board.commands.frame_scanner import FrameScanner
+from umrx_app_v3.mcu_board.commands.streaming_batch import big_endian, decode_frames, StreamingFrames
 
 logger = logging.getLogger(__name__)
 
+# enum lookups are hoisted out of the per-packet streaming path
+_STATUS_IDX = CoinesResponse.DD_RESPONSE_STATUS_POSITION.value
+_FEATURE_IDX = CoinesResponse.DD_RESPONSE_COMMAND_ID_POSITION.value
+_INTERRUPT_FEATURE = StreamingDataResponse.INTERRUPT.value
+_SUCCESS = ErrorCode.SUCCESS.value
+_CHANNEL_ID_IDX = CoinesInterruptStreamResponse.CHANNEL_ID_IDX.value
+_PACKET_COUNT_START = CoinesInterruptStreamResponse.PACKET_COUNT_IDX.value
+_PACKET_COUNT_END = _PACKET_COUNT_START + CoinesInterruptStreamResponse.PACKET_COUNT_LENGTH.value
+_PAYLOAD_START_IDX = CoinesInterruptStreamResponse.PAYLOAD_START_IDX.value
+_TIME_STAMP_IDX = CoinesInterruptStreamResponse.TIME_STAMP_IDX.value
+_PACKET_FOOTER_IDX = CoinesInterruptStreamResponse.PACKET_FOOTER.value
+
 
 @dataclass
 class StreamingInterruptSpiChannelConfig:
@@ -46,15 +62,22 @@ class StreamingInterruptI2cConfig:
     channel_configs: list[StreamingInterruptI2cChannelConfig] = field(default_factory=list)
 
 
+StreamingInterruptConfig = StreamingInterruptSpiConfig | StreamingInterruptI2cConfig
+
+
 class StreamingInterruptCmd(Command):
-    streaming_interrupt_config: StreamingInterruptSpiConfig | StreamingInterruptI2cConfig | None = None
+    # module-wide default, used when a method is not given the streaming config of a particular board
+    streaming_interrupt_config: StreamingInterruptConfig | None = None
 
     @staticmethod
-    def assemble(sensor_interface: Literal["spi", "i2c"]) -> Generator:
+    def assemble(
+        sensor_interface: Literal["spi", "i2c"],
+        streaming_config: StreamingInterruptConfig | None = None,
+    ) -> Generator:
         if sensor_interface == "spi":
-            return StreamingInterruptCmd.configure_spi()
+            return StreamingInterruptCmd.configure_spi(streaming_config)
         if sensor_interface == "i2c":
-            return StreamingInterruptCmd.configure_i2c()
+            return StreamingInterruptCmd.configure_i2c(streaming_config)
         error_message = f"Unknown interface {sensor_interface}"
         raise CommandError(error_message)
 
@@ -91,13 +114,23 @@ class StreamingInterruptCmd(Command):
         return Command.create_message_from(payload)
 
     @staticmethod
-    def configure_spi() -> Generator:
-        for config in StreamingInterruptCmd.streaming_interrupt_config.channel_configs:
+    def configure_spi(
+        streaming_config: StreamingInterruptConfig | None = None,
+    ) -> Generator:
+        streaming_config = (
+            StreamingInterruptCmd.streaming_interrupt_config if streaming_config is None else streaming_config
+        )
+        for config in streaming_config.channel_configs:
             yield StreamingInterruptCmd.assemble_spi_channel_config(config)
 
     @staticmethod
-    def configure_i2c() -> Generator:
-        for config in StreamingInterruptCmd.streaming_interrupt_config.channel_configs:
+    def configure_i2c(
+        streaming_config: StreamingInterruptConfig | None = None,
+    ) -> Generator:
+        streaming_config = (
+            StreamingInterruptCmd.streaming_interrupt_config if streaming_config is None else streaming_config
+        )
+        for config in streaming_config.channel_configs:
             yield StreamingInterruptCmd.assemble_i2c_channel_config(config)
 
     @staticmethod
@@ -106,10 +139,13 @@ class StreamingInterruptCmd(Command):
         cs_pin: MultiIOPin,
         register_address: int,
         bytes_to_read: int,
+        streaming_config: StreamingInterruptConfig | None = None,
     ) -> None:
-        if StreamingInterruptCmd.streaming_interrupt_config is None:
-            StreamingInterruptCmd.set_spi_config()
-        channel_id = len(StreamingInterruptCmd.streaming_interrupt_config.channel_configs) + 1
+        if streaming_config is None:
+            if StreamingInterruptCmd.streaming_interrupt_config is None:
+                StreamingInterruptCmd.set_spi_config()
+            streaming_config = StreamingInterruptCmd.streaming_interrupt_config
+        channel_id = len(streaming_config.channel_configs) + 1
         config = StreamingInterruptSpiChannelConfig(
             id=channel_id,
             interrupt_pin=interrupt_pin,
@@ -117,7 +153,7 @@ class StreamingInterruptCmd(Command):
             register_address=register_address,
             bytes_to_read=bytes_to_read,
         )
-        StreamingInterruptCmd.streaming_interrupt_config.channel_configs.append(config)
+        streaming_config.channel_configs.append(config)
 
     @staticmethod
     def assemble_spi_channel_config(channel_config: StreamingInterruptSpiChannelConfig) -> array[int]:
@@ -152,10 +188,13 @@ class StreamingInterruptCmd(Command):
         i2c_address: int,
         register_address: int,
         bytes_to_read: int,
+        streaming_config: StreamingInterruptConfig | None = None,
     ) -> None:
-        if StreamingInterruptCmd.streaming_interrupt_config is None:
-            StreamingInterruptCmd.set_i2c_config()
-        channel_id = len(StreamingInterruptCmd.streaming_interrupt_config.channel_configs) + 1
+        if streaming_config is None:
+            if StreamingInterruptCmd.streaming_interrupt_config is None:
+                StreamingInterruptCmd.set_i2c_config()
+            streaming_config = StreamingInterruptCmd.streaming_interrupt_config
+        channel_id = len(streaming_config.channel_configs) + 1
         config = StreamingInterruptI2cChannelConfig(
             id=channel_id,
             interrupt_pin=interrupt_pin,
@@ -163,7 +202,7 @@ class StreamingInterruptCmd(Command):
             register_address=register_address,
             bytes_to_read=bytes_to_read,
         )
-        StreamingInterruptCmd.streaming_interrupt_config.channel_configs.append(config)
+        streaming_config.channel_configs.append(config)
 
     @staticmethod
     def assemble_i2c_channel_config(channel_config: StreamingInterruptI2cChannelConfig) -> array[int]:
@@ -194,36 +233,58 @@ class StreamingInterruptCmd(Command):
         return Command.create_message_from(payload)
 
     @staticmethod
-    def parse_streaming_packet(
-        message: array[int], *, includes_mcu_timestamp: bool = False
-    ) -> tuple[int, int, int, array[int]]:
+    def check_streaming_packet(message: array[int] | bytes | memoryview) -> None:
         if not Command.check_message(message):
             error_message = f"Cannot parse invalid message {message}"
             raise CommandError(error_message)
-        message_status = message[CoinesResponse.DD_RESPONSE_STATUS_POSITION.value]
-        message_feature = message[CoinesResponse.DD_RESPONSE_COMMAND_ID_POSITION.value]
-        feature_correct = message_feature == StreamingDataResponse.INTERRUPT.value
-        status_ok = message_status == ErrorCode.SUCCESS.value
+        feature_correct = message[_FEATURE_IDX] == _INTERRUPT_FEATURE
+        status_ok = message[_STATUS_IDX] == _SUCCESS
         if not (feature_correct and status_ok):
             error_message = f"Error in message: {feature_correct=}, {status_ok=}, {message=}"
             raise CommandError(error_message)
 
-        message_channel_id = message[CoinesInterruptStreamResponse.CHANNEL_ID_IDX.value]
-        packet_count_start = CoinesInterruptStreamResponse.PACKET_COUNT_IDX.value
-        packet_count_end = CoinesInterruptStreamResponse.PACKET_COUNT_LENGTH.value + packet_count_start
-        packet_count_raw = message[packet_count_start:packet_count_end]
-        (packet_count,) = struct.unpack(">I", packet_count_raw)
-        time_stamp = -1
+    @staticmethod
+    def decode_streaming_packet(
+        message: array[int] | bytes | memoryview, *, includes_mcu_timestamp: bool = False
+    ) -> tuple[int, int, int, memoryview]:
+        StreamingInterruptCmd.check_streaming_packet(message)
+        message_channel_id = message[_CHANNEL_ID_IDX]
+        packet_count = int.from_bytes(message[_PACKET_COUNT_START:_PACKET_COUNT_END], "big")
         if includes_mcu_timestamp:
-            payload_end = CoinesInterruptStreamResponse.TIME_STAMP_IDX.value
-            time_stamp_start = CoinesInterruptStreamResponse.TIME_STAMP_IDX.value
-            time_stamp_end = CoinesInterruptStreamResponse.PACKET_FOOTER.value
-            time_stamp_raw = message[time_stamp_start:time_stamp_end]
-            time_stamp = array("B", (0, 0)) + array("B", time_stamp_raw)
-            (time_stamp,) = struct.unpack(">Q", time_stamp)
+            time_stamp = int.from_bytes(message[_TIME_STAMP_IDX:_PACKET_FOOTER_IDX], "big")
             time_stamp = time_stamp // 30  # time stamp in micro-seconds
-        else:
-            payload_end = CoinesInterruptStreamResponse.PACKET_FOOTER.value
-        payload = message[CoinesInterruptStreamResponse.PAYLOAD_START_IDX.value : payload_end]
-        payload_array = array("B", (int(el) for el in payload))
-        return message_channel_id, packet_count, time_stamp, payload_array
+            return message_channel_id, packet_count, time_stamp, message[_PAYLOAD_START_IDX:_TIME_STAMP_IDX]
+        return message_channel_id, packet_count, -1, message[_PAYLOAD_START_IDX:_PACKET_FOOTER_IDX]
+
+    @staticmethod
+    def parse_streaming_packet(
+        message: array[int], *, includes_mcu_timestamp: bool = False
+    ) -> tuple[int, int, int, array[int]]:
+        message_channel_id, packet_count, time_stamp, payload = StreamingInterruptCmd.decode_streaming_packet(
+            message, includes_mcu_timestamp=includes_mcu_timestamp
+        )
+        return message_channel_id, packet_count, time_stamp, Command.to_array(payload)
+
+    @staticmethod
+    def scan_streaming_packets(
+        buffer: bytes | bytearray | memoryview,
+        scanner: FrameScanner | None = None,
+        *,
+        includes_mcu_timestamp: bool = False,
+    ) -> Generator[tuple[int, int, int, memoryview], None, None]:
+        scanner = FrameScanner() if scanner is None else scanner
+        for frame in scanner.scan(buffer):
+            yield StreamingInterruptCmd.decode_streaming_packet(frame, includes_mcu_timestamp=includes_mcu_timestamp)
+
+    @staticmethod
+    def decode_streaming_batch(frames: StreamingFrames, *, includes_mcu_timestamp: bool = False) -> np.ndarray:
+        def decode_frame_group(frames: np.ndarray, frame_len: int) -> tuple[np.ndarray, np.ndarray, Any, np.ndarray]:
+            channel_id = frames[:, _CHANNEL_ID_IDX]
+            packet_count = big_endian(frames[:, _PACKET_COUNT_START:_PACKET_COUNT_END])
+            if includes_mcu_timestamp:
+                time_stamp_start = frame_len + _TIME_STAMP_IDX
+                time_stamp = big_endian(frames[:, time_stamp_start : frame_len + _PACKET_FOOTER_IDX]) // 30
+                return channel_id, packet_count, time_stamp, frames[:, _PAYLOAD_START_IDX:time_stamp_start]
+            return channel_id, packet_count, -1, frames[:, _PAYLOAD_START_IDX : frame_len + _PACKET_FOOTER_IDX]
+
+        return decode_frames(frames, _INTERRUPT_FEATURE, decode_frame_group)
@@ -6,6 +6,8 @@ from collections.abc import Generator
 from dataclasses import dataclass, field
 from typing import Literal
 
+import numpy as np
+
 from umrx_app_v3.mcu_board.bst_protocol_constants import (
     CoinesPollingStreamResponse,
     CoinesResponse,
@@ -16,9 +18,20 @@ from umrx_app_v3.mcu_board.bst_protocol_constants import (
     StreamingSamplingUnit,
 )
 from umrx_app_v3.mcu_board.commands.command import Command, CommandError
+from umrx_app_v3.mcu_board.commands.frame_scanner import FrameScanner
+from umrx_app_v3.mcu_board.commands.streaming_batch import decode_frames, StreamingFrames
 
 logger = logging.getLogger(__name__)
 
+# enum lookups are hoisted out of the per-packet streaming path
+_STATUS_IDX = CoinesResponse.DD_RESPONSE_STATUS_POSITION.value
+_FEATURE_IDX = CoinesResponse.DD_RESPONSE_COMMAND_ID_POSITION.value
+_POLLING_FEATURE = StreamingDataResponse.POLLING.value
+_SUCCESS = ErrorCode.SUCCESS.value
+_SENSOR_ID_MSB_IDX = CoinesPollingStreamResponse.SENSOR_ID_MSB.value
+_SENSOR_ID_LSB_IDX = CoinesPollingStreamResponse.SENSOR_ID_LSB.value
+_DATA_START_IDX = CoinesPollingStreamResponse.DATA_START_POSITION.value
+
 
 @dataclass
 class PollingStreamingSpiChannelConfig:
@@ -50,15 +63,22 @@ class PollingStreamingI2cConfig:
     channel_configs: list[PollingStreamingI2cChannelConfig] = field(default_factory=list)
 
 
+PollingStreamingConfig = PollingStreamingSpiConfig | PollingStreamingI2cConfig
+
+
 class StreamingPollingCmd(Command):
-    polling_streaming_config: PollingStreamingSpiConfig | PollingStreamingI2cConfig | None = None
+    # module-wide default, used when a method is not given the streaming config of a particular board
+    polling_streaming_config: PollingStreamingConfig | None = None
 
     @staticmethod
-    def assemble(sensor_interface: Literal["spi", "i2c"]) -> Generator:
+    def assemble(
+        sensor_interface: Literal["spi", "i2c"],
+        streaming_config: PollingStreamingConfig | None = None,
+    ) -> Generator:
         if sensor_interface == "spi":
-            return StreamingPollingCmd.configure_spi()
+            return StreamingPollingCmd.configure_spi(streaming_config)
         if sensor_interface == "i2c":
-            return StreamingPollingCmd.configure_i2c()
+            return StreamingPollingCmd.configure_i2c(streaming_config)
         error_message = f"Unknown interface {sensor_interface}"
         raise CommandError(error_message)
 
@@ -95,15 +115,25 @@ class StreamingPollingCmd(Command):
         return Command.create_message_from(payload)
 
     @staticmethod
-    def configure_spi() -> Generator:
-        yield StreamingPollingCmd.set_sampling_time()
-        for config in StreamingPollingCmd.polling_streaming_config.channel_configs:
+    def configure_spi(
+        streaming_config: PollingStreamingConfig | None = None,
+    ) -> Generator:
+        streaming_config = (
+            StreamingPollingCmd.polling_streaming_config if streaming_config is None else streaming_config
+        )
+        yield StreamingPollingCmd.set_sampling_time(streaming_config)
+        for config in streaming_config.channel_configs:
             yield StreamingPollingCmd.assemble_spi_channel_config(config)
 
     @staticmethod
-    def configure_i2c() -> Generator:
-        yield StreamingPollingCmd.set_sampling_time()
-        for config in StreamingPollingCmd.polling_streaming_config.channel_configs:
+    def configure_i2c(
+        streaming_config: PollingStreamingConfig | None = None,
+    ) -> Generator:
+        streaming_config = (
+            StreamingPollingCmd.polling_streaming_config if streaming_config is None else streaming_config
+        )
+        yield StreamingPollingCmd.set_sampling_time(streaming_config)
+        for config in streaming_config.channel_configs:
             yield StreamingPollingCmd.assemble_i2c_channel_config(config)
 
     @staticmethod
@@ -123,18 +153,23 @@ class StreamingPollingCmd(Command):
         return Command.create_message_from(payload)
 
     @staticmethod
-    def set_sampling_time() -> array[int]:
-        number_of_sensors = len(StreamingPollingCmd.polling_streaming_config.channel_configs)
+    def set_sampling_time(
+        streaming_config: PollingStreamingConfig | None = None,
+    ) -> array[int]:
+        streaming_config = (
+            StreamingPollingCmd.polling_streaming_config if streaming_config is None else streaming_config
+        )
+        number_of_sensors = len(streaming_config.channel_configs)
         if number_of_sensors > 2:
             message = f"Exceeds max supported number of sensors = 2, attempted: {number_of_sensors}"
             raise CommandError(message)
 
         if number_of_sensors == 2:
-            streaming_time_1 = StreamingPollingCmd.polling_streaming_config.channel_configs[0].sampling_time
-            streaming_unit_1 = StreamingPollingCmd.polling_streaming_config.channel_configs[0].sampling_unit
+            streaming_time_1 = streaming_config.channel_configs[0].sampling_time
+            streaming_unit_1 = streaming_config.channel_configs[0].sampling_unit
 
-            streaming_time_2 = StreamingPollingCmd.polling_streaming_config.channel_configs[1].sampling_time
-            streaming_unit_2 = StreamingPollingCmd.polling_streaming_config.channel_configs[1].sampling_unit
+            streaming_time_2 = streaming_config.channel_configs[1].sampling_time
+            streaming_unit_2 = streaming_config.channel_configs[1].sampling_unit
 
             if streaming_unit_1 != StreamingSamplingUnit.MICRO_SECOND:
                 streaming_time_1 = streaming_time_1 * 1000
@@ -147,8 +182,8 @@ class StreamingPollingCmd(Command):
                 sampling_time //= 1000
                 sampling_unit = StreamingSamplingUnit.MILLI_SECOND
         elif number_of_sensors == 1:
-            sampling_time = StreamingPollingCmd.polling_streaming_config.channel_configs[0].sampling_time
-            sampling_unit = StreamingPollingCmd.polling_streaming_config.channel_configs[0].sampling_unit
+            sampling_time = streaming_config.channel_configs[0].sampling_time
+            sampling_unit = streaming_config.channel_configs[0].sampling_unit
         else:
             error_msg = "Specify streaming configuration first, call set_streaming_channel_[i2c|spi] before!"
             raise CommandError(error_msg)
@@ -157,16 +192,19 @@ class StreamingPollingCmd(Command):
         )
 
     @staticmethod
-    def set_streaming_channel_spi(
+    def set_streaming_channel_spi(  # noqa: PLR0913
         cs_pin: MultiIOPin,
         sampling_time: int,
         sampling_unit: StreamingSamplingUnit,
         register_address: int,
         bytes_to_read: int,
+        streaming_config: PollingStreamingConfig | None = None,
     ) -> None:
-        if StreamingPollingCmd.polling_streaming_config is None:
-            StreamingPollingCmd.set_spi_config()
-        channel_id = len(StreamingPollingCmd.polling_streaming_config.channel_configs) + 1
+        if streaming_config is None:
+            if StreamingPollingCmd.polling_streaming_config is None:
+                StreamingPollingCmd.set_spi_config()
+            streaming_config = StreamingPollingCmd.polling_streaming_config
+        channel_id = len(streaming_config.channel_configs) + 1
         config = PollingStreamingSpiChannelConfig(
             id=channel_id,
             cs_pin=cs_pin,
@@ -175,7 +213,7 @@ class StreamingPollingCmd(Command):
             register_address=register_address,
             bytes_to_read=bytes_to_read,
         )
-        StreamingPollingCmd.polling_streaming_config.channel_configs.append(config)
+        streaming_config.channel_configs.append(config)
 
     @staticmethod
     def assemble_spi_channel_config(channel_config: PollingStreamingSpiChannelConfig) -> array[int]:
@@ -204,16 +242,19 @@ class StreamingPollingCmd(Command):
         return Command.create_message_from(payload)
 
     @staticmethod
-    def set_streaming_channel_i2c(
+    def set_streaming_channel_i2c(  # noqa: PLR0913
         i2c_address: int,
         sampling_time: int,
         sampling_unit: StreamingSamplingUnit,
         register_address: int,
         bytes_to_read: int,
+        streaming_config: PollingStreamingConfig | None = None,
     ) -> None:
-        if StreamingPollingCmd.polling_streaming_config is None:
-            StreamingPollingCmd.set_i2c_config()
-        channel_id = len(StreamingPollingCmd.polling_streaming_config.channel_configs) + 1
+        if streaming_config is None:
+            if StreamingPollingCmd.polling_streaming_config is None:
+                StreamingPollingCmd.set_i2c_config()
+            streaming_config = StreamingPollingCmd.polling_streaming_config
+        channel_id = len(streaming_config.channel_configs) + 1
         config = PollingStreamingI2cChannelConfig(
             id=channel_id,
             i2c_address=i2c_address,
@@ -222,7 +263,7 @@ class StreamingPollingCmd(Command):
             register_address=register_address,
             bytes_to_read=bytes_to_read,
         )
-        StreamingPollingCmd.polling_streaming_config.channel_configs.append(config)
+        streaming_config.channel_configs.append(config)
 
     @staticmethod
     def assemble_i2c_channel_config(channel_config: PollingStreamingI2cChannelConfig) -> array[int]:
@@ -252,22 +293,42 @@ class StreamingPollingCmd(Command):
         return Command.create_message_from(payload)
 
     @staticmethod
-    def parse_streaming_packet(message: array[int]) -> tuple[int, array[int]]:
+    def check_streaming_packet(message: array[int] | bytes | memoryview) -> None:
         if not Command.check_message(message):
             error_message = f"Cannot parse invalid message {message}"
             raise CommandError(error_message)
-        message_status = message[CoinesResponse.DD_RESPONSE_STATUS_POSITION.value]
-        message_feature = message[CoinesResponse.DD_RESPONSE_COMMAND_ID_POSITION.value]
-        feature_correct = message_feature == StreamingDataResponse.POLLING.value
-        status_ok = message_status == ErrorCode.SUCCESS.value
+        feature_correct = message[_FEATURE_IDX] == _POLLING_FEATURE
+        status_ok = message[_STATUS_IDX] == _SUCCESS
         if not (feature_correct and status_ok):
             error_message = f"Error in message: {feature_correct=}, {status_ok=}, {message=}"
             raise CommandError(error_message)
-        message_channel_msb = message[CoinesPollingStreamResponse.SENSOR_ID_MSB.value]
-        message_channel_lsb = message[CoinesPollingStreamResponse.SENSOR_ID_LSB.value]
-        message_channel_id = (message_channel_msb << 8) | message_channel_lsb
-        payload_start = CoinesPollingStreamResponse.DATA_START_POSITION.value
-        payload_end = CoinesPollingStreamResponse.SENSOR_ID_MSB.value
-        payload = message[payload_start:payload_end]
-        payload_array = array("B", (int(el) for el in payload))
-        return message_channel_id, payload_array
+
+    @staticmethod
+    def decode_streaming_packet(message: array[int] | bytes | memoryview) -> tuple[int, memoryview]:
+        StreamingPollingCmd.check_streaming_packet(message)
+        message_channel_id = (message[_SENSOR_ID_MSB_IDX] << 8) | message[_SENSOR_ID_LSB_IDX]
+        return message_channel_id, message[_DATA_START_IDX:_SENSOR_ID_MSB_IDX]
+
+    @staticmethod
+    def parse_streaming_packet(message: array[int]) -> tuple[int, array[int]]:
+        message_channel_id, payload = StreamingPollingCmd.decode_streaming_packet(message)
+        return message_channel_id, Command.to_array(payload)
+
+    @staticmethod
+    def scan_streaming_packets(
+        buffer: bytes | bytearray | memoryview, scanner: FrameScanner | None = None
+    ) -> Generator[tuple[int, memoryview], None, None]:
+        scanner = FrameScanner() if scanner is None else scanner
+        for frame in scanner.scan(buffer):
+            yield StreamingPollingCmd.decode_streaming_packet(frame)
+
+    @staticmethod
+    def decode_streaming_batch(frames: StreamingFrames) -> np.ndarray:
+        return decode_frames(frames, _POLLING_FEATURE, StreamingPollingCmd._decode_frame_group)
+
+    @staticmethod
+    def _decode_frame_group(frames: np.ndarray, frame_len: int) -> tuple[np.ndarray, int, int, np.ndarray]:
+        sensor_id_msb = frame_len + _SENSOR_ID_MSB_IDX
+        channel_id = (frames[:, sensor_id_msb].astype(np.uint16) << 8) | frames[:, sensor_id_msb + 1]
+        no_packet_count, no_time_stamp = 0, -1
+        return channel_id, no_packet_count, no_time_stamp, frames[:, _DATA_START_IDX:sensor_id_msb]
@@ -2,6 +2,9 @@ import struct
 from collections.abc import Callable
 from enum import Enum
 
+from umrx_app_v3.sensors.register_batch import RegisterBatch
+from umrx_app_v3.sensors.register_cache import RegisterCache
+
 
 class BMA400Addr(Enum):
     chip_id = 0x00
@@ -91,13 +94,61 @@ class BMA400Addr(Enum):
 
 
 class BMA400:
+    VOLATILE_REGISTERS = frozenset(
+        {
+            BMA400Addr.err_reg,
+            BMA400Addr.status,
+            BMA400Addr.acc_x_lsb,
+            BMA400Addr.acc_x_msb,
+            BMA400Addr.acc_y_lsb,
+            BMA400Addr.acc_y_msb,
+            BMA400Addr.acc_z_lsb,
+            BMA400Addr.acc_z_msb,
+            BMA400Addr.sensor_time_0,
+            BMA400Addr.sensor_time_1,
+            BMA400Addr.sensor_time_2,
+            BMA400Addr.event,
+            BMA400Addr.int_stat_0,
+            BMA400Addr.int_stat_1,
+            BMA400Addr.int_stat_2,
+            BMA400Addr.temp_data,
+            BMA400Addr.fifo_length_0,
+            BMA400Addr.fifo_length_1,
+            BMA400Addr.fifo_data,
+            BMA400Addr.step_cnt_0,
+            BMA400Addr.step_cnt_1,
+            BMA400Addr.step_cnt_2,
+            BMA400Addr.step_stat,
+        }
+    )
+    RESET_REGISTERS = frozenset({BMA400Addr.cmd})
+
     def __init__(self) -> None:
         self.read: Callable | None = None
         self.write: Callable | None = None
+        self.write_many: Callable | None = None
+        self.cache: RegisterCache | None = None
 
-    def assign_callbacks(self, read_callback: Callable, write_callback: Callable) -> None:
+    def assign_callbacks(
+        self, read_callback: Callable, write_callback: Callable, write_many_callback: Callable | None = None
+    ) -> None:
         self.read = read_callback
         self.write = write_callback
+        self.write_many = write_many_callback
+        if self.cache is not None and self.cache.is_attached:
+            self.cache.rebind()
+
+    def batch(self, *, verify: bool = False) -> RegisterBatch:
+        return RegisterBatch(self, verify=verify)
+
+    def enable_cache(self) -> RegisterCache:
+        if self.cache is None:
+            self.cache = RegisterCache(self, volatile=self.VOLATILE_REGISTERS, resets=self.RESET_REGISTERS)
+        return self.cache.attach()
+
+    def disable_cache(self) -> None:
+        if self.cache is not None:
+            self.cache.detach()
 
     @staticmethod
     def sign_convert_accel(a_x: int, a_y: int, a_z: int) -> tuple[int, int, int]:
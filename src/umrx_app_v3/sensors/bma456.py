@@ -2,6 +2,9 @@ import struct
 from collections.abc import Callable
 from enum import Enum
 
+from umrx_app_v3.sensors.register_batch import RegisterBatch
+from umrx_app_v3.sensors.register_cache import RegisterCache
+
 
 class BMA456Addr(Enum):
     chip_id = 0x00
@@ -74,13 +77,72 @@ class BMA456Addr(Enum):
 
 
 class BMA456:
+    VOLATILE_REGISTERS = frozenset(
+        {
+            BMA456Addr.err_reg,
+            BMA456Addr.status,
+            BMA456Addr.aux_x_lsb,
+            BMA456Addr.aux_x_msb,
+            BMA456Addr.aux_y_lsb,
+            BMA456Addr.aux_y_msb,
+            BMA456Addr.aux_z_lsb,
+            BMA456Addr.aux_z_msb,
+            BMA456Addr.aux_r_lsb,
+            BMA456Addr.aux_r_msb,
+            BMA456Addr.acc_x_lsb,
+            BMA456Addr.acc_x_msb,
+            BMA456Addr.acc_y_lsb,
+            BMA456Addr.acc_y_msb,
+            BMA456Addr.acc_z_lsb,
+            BMA456Addr.acc_z_msb,
+            BMA456Addr.sensor_time_0,
+            BMA456Addr.sensor_time_1,
+            BMA456Addr.sensor_time_2,
+            BMA456Addr.event,
+            BMA456Addr.int_status_0,
+            BMA456Addr.int_status_1,
+            BMA456Addr.step_counter_0,
+            BMA456Addr.step_counter_1,
+            BMA456Addr.step_counter_2,
+            BMA456Addr.step_counter_3,
+            BMA456Addr.temperature,
+            BMA456Addr.fifo_length_0,
+            BMA456Addr.fifo_length_1,
+            BMA456Addr.fifo_data,
+            BMA456Addr.activity_type,
+            BMA456Addr.internal_status,
+            BMA456Addr.features_in,
+            BMA456Addr.internal_error,
+        }
+    )
+    RESET_REGISTERS = frozenset({BMA456Addr.cmd})
+
     def __init__(self) -> None:
         self.read: Callable | None = None
         self.write: Callable | None = None
+        self.write_many: Callable | None = None
+        self.cache: RegisterCache | None = None
 
-    def assign_callbacks(self, read_callback: Callable, write_callback: Callable) -> None:
+    def assign_callbacks(
+        self, read_callback: Callable, write_callback: Callable, write_many_callback: Callable | None = None
+    ) -> None:
         self.read = read_callback
         self.write = write_callback
+        self.write_many = write_many_callback
+        if self.cache is not None and self.cache.is_attached:
+            self.cache.rebind()
+
+    def batch(self, *, verify: bool = False) -> RegisterBatch:
+        return RegisterBatch(self, verify=verify)
+
+    def enable_cache(self) -> RegisterCache:
+        if self.cache is None:
+            self.cache = RegisterCache(self, volatile=self.VOLATILE_REGISTERS, resets=self.RESET_REGISTERS)
+        return self.cache.attach()
+
+    def disable_cache(self) -> None:
+        if self.cache is not None:
+            self.cache.detach()
 
     @property
     def chip_id(self) -> int:
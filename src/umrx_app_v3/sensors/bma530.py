@@ -3,6 +3,9 @@ from array import array
 from collections.abc import Callable
 from enum import Enum
 
+from umrx_app_v3.sensors.register_batch import RegisterBatch
+from umrx_app_v3.sensors.register_cache import RegisterCache
+
 
 class BMA530Addr(Enum):
     chip_id = 0x00
@@ -106,13 +109,71 @@ class BMA530ExtendedAddr(Enum):
 
 
 class BMA530:
+    VOLATILE_REGISTERS = frozenset(
+        {
+            BMA530Addr.health_status,
+            BMA530Addr.config_status,
+            BMA530Addr.sensor_status,
+            BMA530Addr.int_status_int1_0,
+            BMA530Addr.int_status_int1_1,
+            BMA530Addr.int_status_int2_0,
+            BMA530Addr.int_status_int2_1,
+            BMA530Addr.int_status_i3c_0,
+            BMA530Addr.int_status_i3c_1,
+            BMA530Addr.acc_data_0,
+            BMA530Addr.acc_data_1,
+            BMA530Addr.acc_data_2,
+            BMA530Addr.acc_data_3,
+            BMA530Addr.acc_data_4,
+            BMA530Addr.acc_data_5,
+            BMA530Addr.temp_data,
+            BMA530Addr.sensor_time_0,
+            BMA530Addr.sensor_time_1,
+            BMA530Addr.sensor_time_2,
+            BMA530Addr.fifo_level_0,
+            BMA530Addr.fifo_level_1,
+            BMA530Addr.fifo_data_out,
+            BMA530Addr.feat_eng_status,
+            BMA530Addr.feat_eng_gp_flags,
+            BMA530Addr.feat_eng_gpr_ctrl,
+            BMA530Addr.feat_eng_gpr_0,
+            BMA530Addr.feat_eng_gpr_1,
+            BMA530Addr.feat_eng_gpr_2,
+            BMA530Addr.feat_eng_gpr_3,
+            BMA530Addr.feat_eng_gpr_4,
+            BMA530Addr.feat_eng_gpr_5,
+            BMA530Addr.feature_data_addr,
+            BMA530Addr.feature_data_tx,
+        }
+    )
+    RESET_REGISTERS = frozenset({BMA530Addr.cmd})
+
     def __init__(self) -> None:
         self.read: Callable | None = None
         self.write: Callable | None = None
+        self.write_many: Callable | None = None
+        self.cache: RegisterCache | None = None
 
-    def assign_callbacks(self, read_callback: Callable, write_callback: Callable) -> None:
+    def assign_callbacks(
+        self, read_callback: Callable, write_callback: Callable, write_many_callback: Callable | None = None
+    ) -> None:
         self.read = read_callback
         self.write = write_callback
+        self.write_many = write_many_callback
+        if self.cache is not None and self.cache.is_attached:
+            self.cache.rebind()
+
+    def batch(self, *, verify: bool = False) -> RegisterBatch:
+        return RegisterBatch(self, verify=verify)
+
+    def enable_cache(self) -> RegisterCache:
+        if self.cache is None:
+            self.cache = RegisterCache(self, volatile=self.VOLATILE_REGISTERS, resets=self.RESET_REGISTERS)
+        return self.cache.attach()
+
+    def disable_cache(self) -> None:
+        if self.cache is not None:
+            self.cache.detach()
 
     @property
     def chip_id(self) -> int:
@@ -3,6 +3,9 @@ from array import array
 from collections.abc import Callable
 from enum import Enum
 
+from umrx_app_v3.sensors.register_batch import RegisterBatch
+from umrx_app_v3.sensors.register_cache import RegisterCache
+
 
 class BMA580Addr(Enum):
     chip_id = 0x00
@@ -104,13 +107,70 @@ class BMA580ExtendedAddr(Enum):
 
 
 class BMA580:
+    VOLATILE_REGISTERS = frozenset(
+        {
+            BMA580Addr.health_status,
+            BMA580Addr.config_status,
+            BMA580Addr.sensor_status,
+            BMA580Addr.int_status_int1_0,
+            BMA580Addr.int_status_int1_1,
+            BMA580Addr.int_status_int2_0,
+            BMA580Addr.int_status_int2_1,
+            BMA580Addr.int_status_i3c_0,
+            BMA580Addr.int_status_i3c_1,
+            BMA580Addr.acc_data_0,
+            BMA580Addr.acc_data_1,
+            BMA580Addr.acc_data_2,
+            BMA580Addr.acc_data_3,
+            BMA580Addr.acc_data_4,
+            BMA580Addr.acc_data_5,
+            BMA580Addr.temp_data,
+            BMA580Addr.sensor_time_0,
+            BMA580Addr.sensor_time_1,
+            BMA580Addr.sensor_time_2,
+            BMA580Addr.fifo_level_0,
+            BMA580Addr.fifo_level_1,
+            BMA580Addr.fifo_data_out,
+            BMA580Addr.aux_data_0,
+            BMA580Addr.aux_data_1,
+            BMA580Addr.feat_eng_status,
+            BMA580Addr.feat_eng_gp_flags,
+            BMA580Addr.feat_eng_gpr_ctrl,
+            BMA580Addr.feat_eng_gpr_0,
+            BMA580Addr.feat_eng_gpr_1,
+            BMA580Addr.feat_eng_gpr_2,
+            BMA580Addr.feature_data_addr,
+            BMA580Addr.feature_data_tx,
+        }
+    )
+    RESET_REGISTERS = frozenset({BMA580Addr.cmd})
+
     def __init__(self) -> None:
         self.read: Callable | None = None
         self.write: Callable | None = None
+        self.write_many: Callable | None = None
+        self.cache: RegisterCache | None = None
 
-    def assign_callbacks(self, read_callback: Callable, write_callback: Callable) -> None:
+    def assign_callbacks(
+        self, read_callback: Callable, write_callback: Callable, write_many_callback: Callable | None = None
+    ) -> None:
         self.read = read_callback
         self.write = write_callback
+        self.write_many = write_many_callback
+        if self.cache is not None and self.cache.is_attached:
+            self.cache.rebind()
+
+    def batch(self, *, verify: bool = False) -> RegisterBatch:
+        return RegisterBatch(self, verify=verify)
+
+    def enable_cache(self) -> RegisterCache:
+        if self.cache is None:
+            self.cache = RegisterCache(self, volatile=self.VOLATILE_REGISTERS, resets=self.RESET_REGISTERS)
+        return self.cache.attach()
+
+    def disable_cache(self) -> None:
+        if self.cache is not None:
+            self.cache.detach()
 
     @property
     def chip_id(self) -> int:
@@ -3,6 +3,11 @@ from collections.abc import Callable
 from enum import Enum
 from functools import cached_property
 
+import numpy as np
+
+from umrx_app_v3.sensors.register_batch import RegisterBatch
+from umrx_app_v3.sensors.register_cache import RegisterCache
+
 
 class BME280Addr(Enum):
     chip_id = 0xD0
@@ -43,13 +48,52 @@ class BME280NVMAddr(Enum):
 
 
 class BME280:
+    NVM_BLOCK_1_FORMAT = "<HhhHhhhhhhhhxB"
+    NVM_BLOCK_2_FORMAT = "<hBBBBb"
+
+    # the mode register is volatile too, forced mode falls back to sleep by itself
+    VOLATILE_REGISTERS = frozenset(
+        {
+            BME280Addr.ctrl_meas,
+            BME280Addr.status,
+            BME280Addr.press_msb,
+            BME280Addr.press_lsb,
+            BME280Addr.press_xlsb,
+            BME280Addr.temp_msb,
+            BME280Addr.temp_lsb,
+            BME280Addr.temp_xlsb,
+            BME280Addr.hum_msb,
+            BME280Addr.hum_lsb,
+        }
+    )
+    RESET_REGISTERS = frozenset({BME280Addr.reset})
+
     def __init__(self) -> None:
         self.read: Callable | None = None
         self.write: Callable | None = None
+        self.write_many: Callable | None = None
+        self.cache: RegisterCache | None = None
 
-    def assign_callbacks(self, read_callback: Callable, write_callback: Callable) -> None:
+    def assign_callbacks(
+        self, read_callback: Callable, write_callback: Callable, write_many_callback: Callable | None = None
+    ) -> None:
         self.read = read_callback
         self.write = write_callback
+        self.write_many = write_many_callback
+        if self.cache is not None and self.cache.is_attached:
+            self.cache.rebind()
+
+    def batch(self, *, verify: bool = False) -> RegisterBatch:
+        return RegisterBatch(self, verify=verify)
+
+    def enable_cache(self) -> RegisterCache:
+        if self.cache is None:
+            self.cache = RegisterCache(self, volatile=self.VOLATILE_REGISTERS, resets=self.RESET_REGISTERS)
+        return self.cache.attach()
+
+    def disable_cache(self) -> None:
+        if self.cache is not None:
+            self.cache.detach()
 
     @property
     def chip_id(self) -> int:
@@ -103,6 +147,34 @@ class BME280:
         msb, lsb = self.read(BME280Addr.hum_msb, 2)
         return (msb << 8) | lsb
 
+    def read_nvm(self) -> dict[str, int]:
+        # two calibration blocks in two bursts instead of a read per coefficient
+        block_1 = self.read(BME280NVMAddr.dig_t1, struct.calcsize(BME280.NVM_BLOCK_1_FORMAT))
+        block_2 = self.read(BME280NVMAddr.dig_h2, struct.calcsize(BME280.NVM_BLOCK_2_FORMAT))
+        *dig_t_p, dig_h1 = struct.unpack(BME280.NVM_BLOCK_1_FORMAT, block_1)
+        dig_h2, dig_h3, e4, e5, e6, dig_h6 = struct.unpack(BME280.NVM_BLOCK_2_FORMAT, block_2)
+        names = [f"dig_t{idx}" for idx in range(1, 4)] + [f"dig_p{idx}" for idx in range(1, 10)]
+        coefficients = dict(zip(names, dig_t_p, strict=True))
+        coefficients.update(
+            dig_h1=dig_h1,
+            dig_h2=dig_h2,
+            dig_h3=dig_h3,
+            dig_h4=BME280.sign_convert_12_bit((e4 << 4) | (e5 & 0x0F)),
+            dig_h5=BME280.sign_convert_12_bit((e6 << 4) | (e5 >> 4)),
+            dig_h6=dig_h6,
+        )
+        self.load_nvm(coefficients)
+        return coefficients
+
+    def load_nvm(self, coefficients: dict[str, int]) -> None:
+        self.__dict__.update(coefficients)
+
+    @staticmethod
+    def sign_convert_12_bit(value: int) -> int:
+        if value > 2**11 - 1:
+            value -= 2**12
+        return value
+
     @cached_property
     def dig_t1(self) -> int:
         payload = self.read(BME280NVMAddr.dig_t1, 2)
@@ -261,3 +333,36 @@ class BME280:
         humidity = var6 * (1.0 - self.dig_h1 * var6 / 524288.0)
         humidity = max(humidity, humidity_min)
         return min(humidity, humidity_max)
+
+    def compensate_batch(
+        self, raw_pressure: np.ndarray, raw_temperature: np.ndarray, raw_humidity: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # t_fine is shared by temperature, pressure and humidity of the same sample
+        t_fine = self.compute_t_fine(np.asarray(raw_temperature, dtype=np.float64))
+        temperature = np.clip(t_fine / 5120.0, -40.0, 85.0)
+        return (
+            temperature,
+            self._compensate_pressure_batch(raw_pressure, t_fine),
+            self._compensate_humidity_batch(raw_humidity, t_fine),
+        )
+
+    def _compensate_pressure_batch(self, raw_pressure: np.ndarray, t_fine: np.ndarray) -> np.ndarray:
+        pressure_min, pressure_max = 30000.0, 110000.0
+        var_1 = (t_fine / 2.0) - 64000.0
+        var_2 = (var_1 * self.dig_p6 / 32768.0 + self.dig_p5 * 2.0) * var_1 / 4.0 + self.dig_p4 * 65536.0
+        scale = (1.0 + (self.dig_p3 * var_1 / 524288.0 + self.dig_p2) * var_1 / 524288.0 / 32768.0) * self.dig_p1
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pressure = (1048576.0 - np.asarray(raw_pressure, dtype=np.float64) - var_2 / 4096.0) * 6250.0 / scale
+        pressure = (
+            pressure + ((self.dig_p9 * pressure / 2147483648.0 + self.dig_p8 / 32768.0) * pressure + self.dig_p7) / 16.0
+        )
+        # invalid case
+        return np.where(scale == 0, pressure_min, np.clip(pressure, pressure_min, pressure_max))
+
+    def _compensate_humidity_batch(self, raw_humidity: np.ndarray, t_fine: np.ndarray) -> np.ndarray:
+        var1 = t_fine - 76800.0
+        var3 = np.asarray(raw_humidity, dtype=np.float64) - (self.dig_h4 * 64.0 + (self.dig_h5 / 16384.0) * var1)
+        var5 = 1.0 + self.dig_h3 / 67108864.0 * var1
+        var6 = var3 * (self.dig_h2 / 65536.0) * var5 * (1.0 + self.dig_h6 / 67108864.0 * var1 * var5)
+        humidity = var6 * (1.0 - self.dig_h1 * var6 / 524288.0)
+        return np.clip(humidity, 0.0, 100.0)
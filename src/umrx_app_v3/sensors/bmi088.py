@@ -2,6 +2,9 @@ import struct
 from collections.abc import Callable
 from enum import Enum
 
+from umrx_app_v3.sensors.register_batch import RegisterBatch
+from umrx_app_v3.sensors.register_cache import RegisterCache
+
 
 class BMI088GyroAddr(Enum):
     gyro_chip_id = 0x00
@@ -64,19 +67,103 @@ class BMI088AccelAddr(Enum):
 
 
 class BMI088:
+    GYRO_VOLATILE_REGISTERS = frozenset(
+        {
+            BMI088GyroAddr.gyro_rate_x_lsb,
+            BMI088GyroAddr.gyro_rate_x_msb,
+            BMI088GyroAddr.gyro_rate_y_lsb,
+            BMI088GyroAddr.gyro_rate_y_msb,
+            BMI088GyroAddr.gyro_rate_z_lsb,
+            BMI088GyroAddr.gyro_rate_z_msb,
+            BMI088GyroAddr.gyro_int_stat_1,
+            BMI088GyroAddr.gyro_fifo_status,
+            BMI088GyroAddr.gyro_self_test,
+            BMI088GyroAddr.gyro_fifo_data,
+        }
+    )
+    GYRO_RESET_REGISTERS = frozenset({BMI088GyroAddr.gyro_soft_reset})
+    ACCEL_VOLATILE_REGISTERS = frozenset(
+        {
+            BMI088AccelAddr.acc_err_reg,
+            BMI088AccelAddr.acc_status,
+            BMI088AccelAddr.acc_x_lsb,
+            BMI088AccelAddr.acc_x_msb,
+            BMI088AccelAddr.acc_y_lsb,
+            BMI088AccelAddr.acc_y_msb,
+            BMI088AccelAddr.acc_z_lsb,
+            BMI088AccelAddr.acc_z_msb,
+            BMI088AccelAddr.acc_sensor_time_0,
+            BMI088AccelAddr.acc_sensor_time_1,
+            BMI088AccelAddr.acc_sensor_time_2,
+            BMI088AccelAddr.acc_int_stat_1,
+            BMI088AccelAddr.acc_temp_msb,
+            BMI088AccelAddr.acc_temp_lsb,
+            BMI088AccelAddr.acc_fifo_length_0,
+            BMI088AccelAddr.acc_fifo_length_1,
+            BMI088AccelAddr.acc_fifo_data,
+        }
+    )
+    ACCEL_RESET_REGISTERS = frozenset({BMI088AccelAddr.acc_soft_reset})
+
     def __init__(self) -> None:
         self.read_gyro: Callable | None = None
         self.write_gyro: Callable | None = None
+        self.write_gyro_many: Callable | None = None
         self.read_accel: Callable | None = None
         self.write_accel: Callable | None = None
+        self.write_accel_many: Callable | None = None
+        self.gyro_cache: RegisterCache | None = None
+        self.accel_cache: RegisterCache | None = None
 
-    def assign_gyro_callbacks(self, read_callback: Callable, write_callback: Callable) -> None:
+    def assign_gyro_callbacks(
+        self, read_callback: Callable, write_callback: Callable, write_many_callback: Callable | None = None
+    ) -> None:
         self.read_gyro = read_callback
         self.write_gyro = write_callback
+        self.write_gyro_many = write_many_callback
+        if self.gyro_cache is not None and self.gyro_cache.is_attached:
+            self.gyro_cache.rebind()
 
-    def assign_accel_callbacks(self, read_callback: Callable, write_callback: Callable) -> None:
+    def assign_accel_callbacks(
+        self, read_callback: Callable, write_callback: Callable, write_many_callback: Callable | None = None
+    ) -> None:
         self.read_accel = read_callback
         self.write_accel = write_callback
+        self.write_accel_many = write_many_callback
+        if self.accel_cache is not None and self.accel_cache.is_attached:
+            self.accel_cache.rebind()
+
+    def batch(self, *, verify: bool = False) -> RegisterBatch:
+        return RegisterBatch(
+            self,
+            verify=verify,
+            callbacks=(
+                ("read_gyro", "write_gyro", "write_gyro_many"),
+                ("read_accel", "write_accel", "write_accel_many"),
+            ),
+        )
+
+    def enable_cache(self) -> tuple[RegisterCache, RegisterCache]:
+        if self.gyro_cache is None:
+            self.gyro_cache = RegisterCache(
+                self,
+                volatile=self.GYRO_VOLATILE_REGISTERS,
+                resets=self.GYRO_RESET_REGISTERS,
+                callbacks=("read_gyro", "write_gyro", "write_gyro_many"),
+            )
+        if self.accel_cache is None:
+            self.accel_cache = RegisterCache(
+                self,
+                volatile=self.ACCEL_VOLATILE_REGISTERS,
+                resets=self.ACCEL_RESET_REGISTERS,
+                callbacks=("read_accel", "write_accel", "write_accel_many"),
+            )
+        return self.gyro_cache.attach(), self.accel_cache.attach()
+
+    def disable_cache(self) -> None:
+        for cache in (self.gyro_cache, self.accel_cache):
+            if cache is not None:
+                cache.detach()
 
     @property
     def gyro_chip_id(self) -> int:
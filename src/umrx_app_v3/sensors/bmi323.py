@@ -2,6 +2,9 @@ import struct
 from collections.abc import Callable
 from enum import Enum
 
+from umrx_app_v3.sensors.register_batch import RegisterBatch
+from umrx_app_v3.sensors.register_cache import RegisterCache
+
 
 class BMI323Addr(Enum):
     chip_id = 0x00
@@ -71,13 +74,68 @@ class BMI323Addr(Enum):
 
 
 class BMI323:
+    VOLATILE_REGISTERS = frozenset(
+        {
+            BMI323Addr.err_reg,
+            BMI323Addr.status,
+            BMI323Addr.acc_data_x,
+            BMI323Addr.acc_data_y,
+            BMI323Addr.acc_data_z,
+            BMI323Addr.gyr_data_x,
+            BMI323Addr.gyr_data_y,
+            BMI323Addr.gyr_data_z,
+            BMI323Addr.temp_data,
+            BMI323Addr.sensor_time_0,
+            BMI323Addr.sensor_time_1,
+            BMI323Addr.sat_flags,
+            BMI323Addr.int_status_int1,
+            BMI323Addr.int_status_int2,
+            BMI323Addr.int_status_ibi,
+            BMI323Addr.feature_io0,
+            BMI323Addr.feature_io1,
+            BMI323Addr.feature_io2,
+            BMI323Addr.feature_io3,
+            BMI323Addr.feature_io_status,
+            BMI323Addr.fifo_fill_level,
+            BMI323Addr.fifo_data,
+            BMI323Addr.fifo_ctrl,
+            BMI323Addr.alt_status,
+            BMI323Addr.feature_data_addr,
+            BMI323Addr.feature_data_tx,
+            BMI323Addr.feature_data_status,
+            BMI323Addr.feature_engine_status,
+            BMI323Addr.feature_event_ext,
+            BMI323Addr.cfg_res,
+        }
+    )
+    RESET_REGISTERS = frozenset({BMI323Addr.cmd})
+
     def __init__(self) -> None:
         self.read: Callable | None = None
         self.write: Callable | None = None
+        self.write_many: Callable | None = None
+        self.cache: RegisterCache | None = None
 
-    def assign_callbacks(self, read_callback: Callable, write_callback: Callable) -> None:
+    def assign_callbacks(
+        self, read_callback: Callable, write_callback: Callable, write_many_callback: Callable | None = None
+    ) -> None:
         self.read = read_callback
         self.write = write_callback
+        self.write_many = write_many_callback
+        if self.cache is not None and self.cache.is_attached:
+            self.cache.rebind()
+
+    def batch(self, *, verify: bool = False) -> RegisterBatch:
+        return RegisterBatch(self, verify=verify)
+
+    def enable_cache(self) -> RegisterCache:
+        if self.cache is None:
+            self.cache = RegisterCache(self, volatile=self.VOLATILE_REGISTERS, resets=self.RESET_REGISTERS)
+        return self.cache.attach()
+
+    def disable_cache(self) -> None:
+        if self.cache is not None:
+            self.cache.detach()
 
     @property
     def chip_id(self) -> int:
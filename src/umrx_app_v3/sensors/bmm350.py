@@ -3,6 +3,11 @@ from collections.abc import Callable
 from enum import Enum
 from functools import cached_property
 
+import numpy as np
+
+from umrx_app_v3.sensors.register_batch import RegisterBatch
+from umrx_app_v3.sensors.register_cache import RegisterCache
+
 
 class BMM350Addr(Enum):
     chip_id = 0x00
@@ -69,13 +74,65 @@ class BMM350Error(Exception): ...
 
 
 class BMM350:
+    VOLATILE_REGISTERS = frozenset(
+        {
+            BMM350Addr.err_reg,
+            BMM350Addr.pmu_cmd,
+            BMM350Addr.pmu_cmd_status_0,
+            BMM350Addr.pmu_cmd_status_1,
+            BMM350Addr.i3c_err,
+            BMM350Addr.int_status,
+            BMM350Addr.mag_x_xlsb,
+            BMM350Addr.mag_x_lsb,
+            BMM350Addr.mag_x_msb,
+            BMM350Addr.mag_y_xlsb,
+            BMM350Addr.mag_y_lsb,
+            BMM350Addr.mag_y_msb,
+            BMM350Addr.mag_z_xlsb,
+            BMM350Addr.mag_z_lsb,
+            BMM350Addr.mag_z_msb,
+            BMM350Addr.temp_xlsb,
+            BMM350Addr.temp_lsb,
+            BMM350Addr.temp_msb,
+            BMM350Addr.sensor_time_xlsb,
+            BMM350Addr.sensor_time_lsb,
+            BMM350Addr.sensor_time_msb,
+            BMM350Addr.sensor_time_2,
+            BMM350Addr.otp_cmd_reg,
+            BMM350Addr.otp_data_msb_reg,
+            BMM350Addr.otp_data_lsb_reg,
+            BMM350Addr.otp_status_reg,
+            BMM350Addr.tmr_selftest_user,
+        }
+    )
+    RESET_REGISTERS = frozenset({BMM350Addr.cmd})
+
     def __init__(self) -> None:
         self.read: Callable | None = None
         self.write: Callable | None = None
+        self.write_many: Callable | None = None
+        self.cache: RegisterCache | None = None
 
-    def assign_callbacks(self, read_callback: Callable, write_callback: Callable) -> None:
+    def assign_callbacks(
+        self, read_callback: Callable, write_callback: Callable, write_many_callback: Callable | None = None
+    ) -> None:
         self.read = read_callback
         self.write = write_callback
+        self.write_many = write_many_callback
+        if self.cache is not None and self.cache.is_attached:
+            self.cache.rebind()
+
+    def batch(self, *, verify: bool = False) -> RegisterBatch:
+        return RegisterBatch(self, verify=verify)
+
+    def enable_cache(self) -> RegisterCache:
+        if self.cache is None:
+            self.cache = RegisterCache(self, volatile=self.VOLATILE_REGISTERS, resets=self.RESET_REGISTERS)
+        return self.cache.attach()
+
+    def disable_cache(self) -> None:
+        if self.cache is not None:
+            self.cache.detach()
 
     @staticmethod
     def sign_convert_8_bit(value: int) -> int:
@@ -280,6 +337,40 @@ class BMM350:
         lsb = self.otp_data_lsb_reg
         return (msb << 8) | lsb
 
+    def read_otp_word_burst(self, addr: int) -> int:
+        # data and status registers are read in one transaction
+        self.otp_cmd_reg = 0x20 | (addr & 0x1F)
+        msb, lsb, _, status = self.read(BMM350Addr.otp_data_msb_reg, 4)
+        if (status & 0xE0) != 0:
+            error_msg = f"BMM350 OTP status is not OK: got {status}"
+            raise BMM350Error(error_msg)
+        return (msb << 8) | lsb
+
+    def read_otp(self) -> dict[str, int]:
+        # several coefficients share an OTP word, each word is read once
+        words_by_addr = {}
+        words = {}
+        for name, addr in BMM350OtpAddr.__members__.items():
+            if addr.value not in words_by_addr:
+                words_by_addr[addr.value] = self.read_otp_word_burst(addr.value)
+            words[f"otp_{name}"] = words_by_addr[addr.value]
+        self.load_otp(words)
+        return words
+
+    def load_otp(self, words: dict[str, int]) -> None:
+        for name, value in BMM350.__dict__.items():
+            if isinstance(value, cached_property) and not name.startswith("otp_"):
+                self.__dict__.pop(name, None)
+        self.__dict__.update(words)
+
+    def chip_identity(self) -> tuple[int, ...]:
+        # chip id and per-part trim words, tell apart sensors of the same type
+        return (
+            self.chip_id,
+            self.read_otp_word_burst(BMM350OtpAddr.temp_off_sens.value),
+            self.read_otp_word_burst(BMM350OtpAddr.mag_dut_t_0.value),
+        )
+
     @cached_property
     def otp_temp_off_sens(self) -> int:
         return self.read_otp_word(BMM350OtpAddr.temp_off_sens)
@@ -508,3 +599,40 @@ class BMM350:
         ) / (1 - self.cross_y_x * self.cross_x_y)
 
         return cross_m_x, cross_m_y, cross_m_z, compensated_temperature
+
+    @cached_property
+    def batch_compensation_coefficients(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        # OTP terms of `compensate_magnetometer_and_temperature` folded into per-axis vectors
+        conversion = np.array(BMM350.conversion_coefficients()[:3])
+        gain = conversion * (1 + np.array((self.sens_x, self.sens_y, self.sens_z)))
+        offset = np.array((self.offset_x, self.offset_y, self.offset_z), dtype=np.float64)
+        tco = np.array((self.tco_x, self.tco_y, self.tco_z))
+        tcs = np.array((self.tcs_x, self.tcs_y, self.tcs_z))
+        det = 1 - self.cross_y_x * self.cross_x_y
+        cross = np.array(
+            (
+                (1 / det, -self.cross_x_y / det, 0.0),
+                (-self.cross_y_x / det, 1 / det, 0.0),
+                (
+                    (self.cross_y_x * self.cross_z_y - self.cross_z_x) / det,
+                    -(self.cross_z_y - self.cross_x_y * self.cross_z_x) / det,
+                    1.0,
+                ),
+            )
+        )
+        return gain[:, None], offset[:, None], tco[:, None], tcs[:, None], cross
+
+    def compensate_batch(
+        self, m_x_raw: np.ndarray, m_y_raw: np.ndarray, m_z_raw: np.ndarray, temp_raw: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        gain, offset, tco, tcs, cross = self.batch_compensation_coefficients
+        _, _, _, temperature_coefficient = BMM350.conversion_coefficients()
+        temperature_weighted = np.asarray(temp_raw, dtype=np.float64) * temperature_coefficient
+        temp = temperature_weighted - np.sign(temperature_weighted) * 25.49
+        compensated_temperature = (1 + self.t_sens) * temp + self.t_offs
+
+        delta_t = compensated_temperature - self.dut_t0
+        m_raw = np.stack((m_x_raw, m_y_raw, m_z_raw)).astype(np.float64)
+        comp_m = (m_raw * gain + offset + tco * delta_t) / (1 + tcs * delta_t)
+        cross_m_x, cross_m_y, cross_m_z = cross @ comp_m
+        return cross_m_x, cross_m_y, cross_m_z, compensated_temperature
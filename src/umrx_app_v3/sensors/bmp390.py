@@ -3,6 +3,11 @@ from collections.abc import Callable
 from enum import Enum
 from functools import cached_property
 
+import numpy as np
+
+from umrx_app_v3.sensors.register_batch import RegisterBatch
+from umrx_app_v3.sensors.register_cache import RegisterCache
+
 
 class BMP390Addr(Enum):
     chip_id = 0x00
@@ -54,13 +59,58 @@ class BMP390NVMAddr(Enum):
 
 
 class BMP390:
+    NVM_FORMAT = "<HHbhhbbHHbbhbb"
+
+    # the mode register is volatile too, forced mode falls back to sleep by itself
+    VOLATILE_REGISTERS = frozenset(
+        {
+            BMP390Addr.pwr_ctrl,
+            BMP390Addr.err_reg,
+            BMP390Addr.status,
+            BMP390Addr.data_0,
+            BMP390Addr.data_1,
+            BMP390Addr.data_2,
+            BMP390Addr.data_3,
+            BMP390Addr.data_4,
+            BMP390Addr.data_5,
+            BMP390Addr.sensor_time_0,
+            BMP390Addr.sensor_time_1,
+            BMP390Addr.sensor_time_2,
+            BMP390Addr.event,
+            BMP390Addr.int_status,
+            BMP390Addr.fifo_length_0,
+            BMP390Addr.fifo_length_1,
+            BMP390Addr.fifo_data,
+        }
+    )
+    RESET_REGISTERS = frozenset({BMP390Addr.cmd})
+
     def __init__(self) -> None:
         self.read: Callable | None = None
         self.write: Callable | None = None
+        self.write_many: Callable | None = None
+        self.cache: RegisterCache | None = None
 
-    def assign_callbacks(self, read_callback: Callable, write_callback: Callable) -> None:
+    def assign_callbacks(
+        self, read_callback: Callable, write_callback: Callable, write_many_callback: Callable | None = None
+    ) -> None:
         self.read = read_callback
         self.write = write_callback
+        self.write_many = write_many_callback
+        if self.cache is not None and self.cache.is_attached:
+            self.cache.rebind()
+
+    def batch(self, *, verify: bool = False) -> RegisterBatch:
+        return RegisterBatch(self, verify=verify)
+
+    def enable_cache(self) -> RegisterCache:
+        if self.cache is None:
+            self.cache = RegisterCache(self, volatile=self.VOLATILE_REGISTERS, resets=self.RESET_REGISTERS)
+        return self.cache.attach()
+
+    def disable_cache(self) -> None:
+        if self.cache is not None:
+            self.cache.detach()
 
     @property
     def chip_id(self) -> int:
@@ -198,6 +248,19 @@ class BMP390:
     def cmd(self, value: int) -> None:
         self.write(BMP390Addr.cmd, value)
 
+    def read_nvm(self) -> dict[str, int]:
+        # whole calibration block in one burst instead of a read per coefficient
+        payload = self.read(BMP390NVMAddr.nvm_par_t1, struct.calcsize(BMP390.NVM_FORMAT))
+        names = (addr.name for addr in BMP390NVMAddr)
+        coefficients = dict(zip(names, struct.unpack(BMP390.NVM_FORMAT, payload), strict=True))
+        self.load_nvm(coefficients)
+        return coefficients
+
+    def load_nvm(self, coefficients: dict[str, int]) -> None:
+        for key in [key for key in self.__dict__ if key.startswith("par_")]:
+            del self.__dict__[key]
+        self.__dict__.update(coefficients)
+
     @cached_property
     def nvm_par_t1(self) -> int:
         payload = self.read(BMP390NVMAddr.nvm_par_t1, 2)
@@ -363,3 +426,15 @@ class BMP390:
         )
 
         return p_out1 + p_out2 + p_data4
+
+    def compensate_batch(self, raw_pressure: np.ndarray, raw_temperature: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        raw_pressure = np.asarray(raw_pressure, dtype=np.float64)
+        p_data1 = np.asarray(raw_temperature, dtype=np.float64) - self.par_t1
+        temperature = (p_data1 * self.par_t3 + self.par_t2) * p_data1
+        # polynomials of `compensate_pressure` in Horner form
+        p_out1 = self.par_p5 + temperature * (self.par_p6 + temperature * (self.par_p7 + temperature * self.par_p8))
+        p_out2 = raw_pressure * (
+            self.par_p1 + temperature * (self.par_p2 + temperature * (self.par_p3 + temperature * self.par_p4))
+        )
+        p_data4 = raw_pressure**2 * (self.par_p9 + self.par_p10 * temperature + self.par_p11 * raw_pressure)
+        return temperature, p_out1 + p_out2 + p_data4
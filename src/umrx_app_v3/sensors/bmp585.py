@@ -2,6 +2,9 @@ import struct
 from collections.abc import Callable
 from enum import Enum
 
+from umrx_app_v3.sensors.register_batch import RegisterBatch
+from umrx_app_v3.sensors.register_cache import RegisterCache
+
 
 class BMP585Addr(Enum):
     chip_id = 0x01
@@ -38,13 +41,54 @@ class BMP585Addr(Enum):
 
 
 class BMP585:
+    # the mode register is volatile too, forced mode falls back to sleep by itself
+    VOLATILE_REGISTERS = frozenset(
+        {
+            BMP585Addr.odr_config,
+            BMP585Addr.chip_status,
+            BMP585Addr.int_status,
+            BMP585Addr.status,
+            BMP585Addr.fifo_count,
+            BMP585Addr.fifo_data,
+            BMP585Addr.temp_data_xlsb,
+            BMP585Addr.temp_data_lsb,
+            BMP585Addr.temp_data_msb,
+            BMP585Addr.press_data_xlsb,
+            BMP585Addr.press_data_lsb,
+            BMP585Addr.press_data_msb,
+            BMP585Addr.nvm_data_lsb,
+            BMP585Addr.nvm_data_msb,
+            BMP585Addr.osr_eff,
+        }
+    )
+    RESET_REGISTERS = frozenset({BMP585Addr.cmd})
+
     def __init__(self) -> None:
         self.read: Callable | None = None
         self.write: Callable | None = None
+        self.write_many: Callable | None = None
+        self.cache: RegisterCache | None = None
 
-    def assign_callbacks(self, read_callback: Callable, write_callback: Callable) -> None:
+    def assign_callbacks(
+        self, read_callback: Callable, write_callback: Callable, write_many_callback: Callable | None = None
+    ) -> None:
         self.read = read_callback
         self.write = write_callback
+        self.write_many = write_many_callback
+        if self.cache is not None and self.cache.is_attached:
+            self.cache.rebind()
+
+    def batch(self, *, verify: bool = False) -> RegisterBatch:
+        return RegisterBatch(self, verify=verify)
+
+    def enable_cache(self) -> RegisterCache:
+        if self.cache is None:
+            self.cache = RegisterCache(self, volatile=self.VOLATILE_REGISTERS, resets=self.RESET_REGISTERS)
+        return self.cache.attach()
+
+    def disable_cache(self) -> None:
+        if self.cache is not None:
+            self.cache.detach()
 
     @property
     def chip_id(self) -> int:
@@ -0,0 +1,100 @@
+import logging
+from array import array
+from collections.abc import Sequence
+from enum import Enum
+from types import TracebackType
+from typing import Any, Self
+
+from umrx_app_v3.sensors.register_cache import RegisterCache, RegisterCallbacks
+
+logger = logging.getLogger(__name__)
+
+RegisterValue = int | array | Sequence[int]
+
+
+class RegisterBatchError(Exception): ...
+
+
+class PendingWrites:
+    def __init__(self) -> None:
+        self.writes: list[tuple[int, RegisterValue]] = []
+
+    def __call__(self, reg_addr: int | Enum, value: RegisterValue) -> None:
+        self.writes.append((reg_addr.value if isinstance(reg_addr, Enum) else reg_addr, value))
+
+
+class RegisterBatch:
+    def __init__(
+        self,
+        sensor: Any,
+        *,
+        verify: bool = False,
+        callbacks: Sequence[RegisterCallbacks] = (("read", "write", "write_many"),),
+    ) -> None:
+        self.sensor = sensor
+        self.verify = verify
+        self.callbacks = tuple(callbacks)
+        self.pending: dict[str, PendingWrites] = {}
+        self.original_writes: dict[str, Any] = {}
+
+    def __enter__(self) -> Self:
+        # register writes are collected instead of being sent, reads still go to the device
+        for _, write, _ in self.callbacks:
+            self.original_writes[write] = getattr(self.sensor, write)
+            self.pending[write] = PendingWrites()
+            setattr(self.sensor, write, self.pending[write])
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        for _, write, _ in self.callbacks:
+            setattr(self.sensor, write, self.original_writes[write])
+        if exc_type is not None:
+            # nothing is written when the block fails
+            num_discarded = sum(len(pending.writes) for pending in self.pending.values())
+            logger.warning(f"Discarded {num_discarded} register writes after {exc_type.__name__}")
+            return
+        self.flush()
+
+    def flush(self) -> None:
+        for read, write, write_many in self.callbacks:
+            writes = self.pending[write].writes
+            if not writes:
+                continue
+            original_write = self.original_writes[write]
+            if isinstance(original_write, PendingWrites):
+                # nested batch, the outer one flushes
+                original_write.writes.extend(writes)
+                continue
+            write_many_callback = getattr(self.sensor, write_many)
+            if write_many_callback is None:
+                for reg_addr, value in writes:
+                    original_write(reg_addr, value)
+            else:
+                write_many_callback(writes)
+            logger.debug(f"Flushed {len(writes)} register writes through `{write}`")
+            if self.verify:
+                read_callback = getattr(self.sensor, read)
+                cache = getattr(read_callback, "__self__", None)
+                if isinstance(cache, RegisterCache):
+                    # the readback has to come from the device, not from the values just recorded
+                    read_callback = cache.read_uncached
+                self.verify_writes(read_callback, writes)
+
+    @staticmethod
+    def verify_writes(read: Any, writes: list[tuple[int, RegisterValue]]) -> None:
+        # registers written more than once are expected to hold the last value
+        expected = dict(writes)
+        mismatches = []
+        for reg_addr, value in expected.items():
+            if isinstance(value, int):
+                written, read_back = value, read(reg_addr)
+            else:
+                written = list(value)
+                read_back = list(read(reg_addr, len(written)))
+            if read_back != written:
+                mismatches.append(f"0x{reg_addr:02X}: wrote {written}, read {read_back}")
+        if mismatches:
+            error_message = f"Register readback failed: {'; '.join(mismatches)}"
+            raise RegisterBatchError(error_message)
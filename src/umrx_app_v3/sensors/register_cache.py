@@ -0,0 +1,129 @@
+import logging
+from array import array
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Self
+
+logger = logging.getLogger(__name__)
+
+# names of the (read, write, write_many) callback attributes of one register file of a sensor
+RegisterCallbacks = tuple[str, str, str]
+RegisterAddress = int | Enum
+
+
+def register_value(reg_addr: RegisterAddress) -> int:
+    return reg_addr.value if isinstance(reg_addr, Enum) else reg_addr
+
+
+@dataclass
+class RegisterCacheStats:
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        reads = self.hits + self.misses
+        return self.hits / reads if reads else 0.0
+
+
+class RegisterCache:
+    def __init__(
+        self,
+        sensor: Any,
+        *,
+        volatile: Iterable[RegisterAddress] = (),
+        resets: Iterable[RegisterAddress] = (),
+        callbacks: RegisterCallbacks = ("read", "write", "write_many"),
+    ) -> None:
+        self.sensor = sensor
+        # volatile registers (data, status, FIFO, ...) always go to the device
+        self.volatile = frozenset(register_value(reg_addr) for reg_addr in volatile)
+        # a write to one of these resets the device, all cached values become stale
+        self.resets = frozenset(register_value(reg_addr) for reg_addr in resets)
+        self.callbacks = callbacks
+        self.registers: dict[int, int] = {}
+        self.stats = RegisterCacheStats()
+        self.read_uncached: Callable | None = None
+        self.write_uncached: Callable | None = None
+        self.write_many_uncached: Callable | None = None
+
+    @property
+    def is_attached(self) -> bool:
+        return self.read_uncached is not None
+
+    def attach(self) -> Self:
+        if self.is_attached:
+            return self
+        read, write, write_many = self.callbacks
+        self.read_uncached = getattr(self.sensor, read)
+        self.write_uncached = getattr(self.sensor, write)
+        self.write_many_uncached = getattr(self.sensor, write_many)
+        setattr(self.sensor, read, self.read)
+        setattr(self.sensor, write, self.write)
+        setattr(self.sensor, write_many, None if self.write_many_uncached is None else self.write_many)
+        return self
+
+    def rebind(self) -> None:
+        # the sensor got new callbacks, e.g. after the shuttle was initialized again
+        self.read_uncached = self.write_uncached = self.write_many_uncached = None
+        self.invalidate()
+        self.attach()
+
+    def detach(self) -> None:
+        if not self.is_attached:
+            return
+        read, write, write_many = self.callbacks
+        setattr(self.sensor, read, self.read_uncached)
+        setattr(self.sensor, write, self.write_uncached)
+        setattr(self.sensor, write_many, self.write_many_uncached)
+        self.read_uncached = self.write_uncached = self.write_many_uncached = None
+        self.invalidate()
+
+    def is_cacheable(self, reg_addr: int) -> bool:
+        return reg_addr not in self.volatile and reg_addr not in self.resets
+
+    def read(self, reg_addr: RegisterAddress, *args: Any) -> Any:
+        address = register_value(reg_addr)
+        # only single register reads are served from the cache, bursts always go to the device
+        if args or not self.is_cacheable(address):
+            return self.read_uncached(reg_addr, *args)
+        if address in self.registers:
+            self.stats.hits += 1
+            return self.registers[address]
+        self.stats.misses += 1
+        value = self.read_uncached(reg_addr)
+        self.registers[address] = value
+        return value
+
+    def write(self, reg_addr: RegisterAddress, value: int | array | Sequence[int]) -> None:
+        self.write_uncached(reg_addr, value)
+        self.record(register_value(reg_addr), value)
+
+    def write_many(self, writes: Iterable[tuple[int, int | array | Sequence[int]]]) -> None:
+        writes = list(writes)
+        self.write_many_uncached(writes)
+        for reg_addr, value in writes:
+            self.record(register_value(reg_addr), value)
+
+    def record(self, reg_addr: int, value: int | array | Sequence[int]) -> None:
+        self.stats.writes += 1
+        if reg_addr in self.resets:
+            logger.debug(f"Write to reset register 0x{reg_addr:02X}, dropping {len(self.registers)} cached values")
+            self.invalidate()
+        elif not isinstance(value, int):
+            # multi-register writes are not cached, the covered registers are re-read on next access
+            self.invalidate(*range(reg_addr, reg_addr + len(value)))
+        elif self.is_cacheable(reg_addr):
+            self.registers[reg_addr] = value
+
+    def invalidate(self, *reg_addrs: RegisterAddress) -> None:
+        if not reg_addrs:
+            self.stats.invalidations += len(self.registers)
+            self.registers.clear()
+            return
+        for reg_addr in reg_addrs:
+            if self.registers.pop(register_value(reg_addr), None) is not None:
+                self.stats.invalidations += 1
@@ -0,0 +1,20 @@
+from umrx_app_v3.lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "BMA400Shuttle": "bma400.bma400_shuttle",
+        "BMA456Shuttle": "bma456.bma456_shuttle",
+        "BMA530Shuttle": "bma530.bma530_shuttle",
+        "BMA580Shuttle": "bma580.bma580_shuttle",
+        "BME280Shuttle": "bme280.bme280_shuttle",
+        "BMI088Shuttle": "bmi088.bmi088_shuttle",
+        "BMI323Shuttle": "bmi323.bmi323_shuttle",
+        "BMM350Shuttle": "bmm350.bmm350_shuttle",
+        "BMP390Shuttle": "bmp390.bmp390_shuttle",
+        "BMP585Shuttle": "bmp585.bmp585_shuttle",
+        "CalibrationCache": "calibration_cache",
+        "PayloadField": "payload_layout",
+        "PayloadLayout": "payload_layout",
+    },
+)
@@ -0,0 +1,52 @@
+from typing import Any
+
+from umrx_app_v3.mcu_board.comm.emulator_comm import EmulatorCommunication
+from umrx_app_v3.sensors.bma400 import BMA400Addr
+from umrx_app_v3.shuttle_board.bma400.bma400_shuttle import BMA400Shuttle
+from umrx_app_v3.shuttle_board.virtual_shuttle import VirtualSensor, VirtualShuttle, wave
+
+POWER_MODE_MASK = 0b11
+SLEEP_MODE = 0x00
+
+
+class VirtualBMA400(VirtualSensor):
+    CHIP_ID = 0x90
+    RESET_REGISTER = BMA400Addr.cmd.value
+    ODR = 800.0  # the rate the shuttle configures
+    LSB_PER_G = 512  # 12 bit, +/-4 g after reset
+
+    def __init__(self) -> None:
+        super().__init__({BMA400Addr.acc_config_1.value: 0x49}, spi_dummy_bytes=1)
+
+    @property
+    def is_measuring(self) -> bool:
+        return self.registers[BMA400Addr.acc_config_0.value] & POWER_MODE_MASK != SLEEP_MODE
+
+    def sample(self, now: float) -> None:
+        self.put(
+            BMA400Addr.acc_x_lsb.value,
+            "<hhh",
+            wave(now, 0.05 * self.LSB_PER_G, 1.5),
+            wave(now, 0.05 * self.LSB_PER_G, 1.5, phase=1.0),
+            wave(now, 0.05 * self.LSB_PER_G, 1.5, offset=self.LSB_PER_G),
+        )
+        self.put_int24(BMA400Addr.sensor_time_0.value, self.sensor_time(now))
+        # drdy
+        self.registers[BMA400Addr.status.value] = 0x80
+
+
+class VirtualBMA400Shuttle(VirtualShuttle):
+    SHUTTLE = BMA400Shuttle
+
+    def __init__(self, **kw: Any) -> None:
+        self.sensor = VirtualBMA400()
+        super().__init__(**kw)
+
+    def attach(self, emulator: EmulatorCommunication) -> None:
+        self.connect(
+            emulator,
+            self.sensor,
+            i2c_address=BMA400Shuttle.I2C_DEFAULT_ADDRESS,
+            cs_pin=BMA400Shuttle.CS,
+            interrupt_pins=(BMA400Shuttle.INT1,),
+        )
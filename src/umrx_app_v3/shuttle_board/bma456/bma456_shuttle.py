@@ -1,11 +1,16 @@
+import functools
 import logging
-import time
 from array import array
+from collections.abc import Iterable
+from importlib import resources
 from typing import Any, Self
 
+import numpy as np
+
 from umrx_app_v3.mcu_board.app_board_v3_rev0 import ApplicationBoardV3Rev0
 from umrx_app_v3.mcu_board.app_board_v3_rev1 import ApplicationBoardV3Rev1
 from umrx_app_v3.mcu_board.bst_app_board import ApplicationBoard
+from umrx_app_v3.mcu_board.bst_protocol import BstProtocolError
 from umrx_app_v3.mcu_board.bst_protocol_constants import (
     I2CMode,
     MultiIOPin,
@@ -14,13 +19,11 @@ from umrx_app_v3.mcu_board.bst_protocol_constants import (
     SPIBus,
     StreamingSamplingUnit,
 )
-from umrx_app_v3.mcu_board.commands.spi import SPIConfigureCmd
+from umrx_app_v3.mcu_board.commands.i2c import I2CWriteCmd
+from umrx_app_v3.mcu_board.commands.spi import SPIWriteCmd
 from umrx_app_v3.sensors.bma456 import BMA456, BMA456Addr
-from umrx_app_v3.shuttle_board.bma456.config_files.bma456_an import CONFIG_FILE as BMA456_AN_CONFIG_FILE
-from umrx_app_v3.shuttle_board.bma456.config_files.bma456_h import CONFIG_FILE as BMA456_H_CONFIG_FILE
-from umrx_app_v3.shuttle_board.bma456.config_files.bma456_mm import CONFIG_FILE as BMA456_MM_CONFIG_FILE
-from umrx_app_v3.shuttle_board.bma456.config_files.bma456_tablet import CONFIG_FILE as BMA456_TABLET_CONFIG_FILE
-from umrx_app_v3.shuttle_board.bma456.config_files.bma456_w import CONFIG_FILE as BMA456_W_CONFIG_FILE
+from umrx_app_v3.shuttle_board.bma456 import config_files
+from umrx_app_v3.shuttle_board.payload_layout import PayloadField, PayloadLayout, Payloads
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +43,21 @@ class BMA456Shuttle:
     I2C_DEFAULT_ADDRESS = 0x18
     I2C_ALTERNATIVE_ADDRESS = 0x19
 
+    # Streaming payload
+    I2C_PAYLOAD_LAYOUT = PayloadLayout(
+        (
+            PayloadField("acc_x", 0, 2, signed=True),
+            PayloadField("acc_y", 2, 2, signed=True),
+            PayloadField("acc_z", 4, 2, signed=True),
+            PayloadField("sensor_time", 6, 3),
+        )
+    )
+    SPI_PAYLOAD_LAYOUT = I2C_PAYLOAD_LAYOUT.with_dummy_bytes(1)
+
+    # Config file upload: the largest even payload a single write command accepts
+    CONFIG_FILE_CHUNK_SIZE = 46
+    CONFIG_FILES = ("an", "h", "mm", "tablet", "w")
+
     def __init__(self, **kw: Any) -> None:
         self.board: ApplicationBoard | None = kw["board"] if kw.get("board") else None
         self.sensor: BMA456 = BMA456()
@@ -72,32 +90,34 @@ class BMA456Shuttle:
             raise BMA456ShuttleError(error_message)
 
     def assign_sensor_callbacks(self) -> None:
-        self.sensor.assign_callbacks(read_callback=self.read_register, write_callback=self.write_register)
+        self.sensor.assign_callbacks(
+            read_callback=self.read_register,
+            write_callback=self.write_register,
+            write_many_callback=self.write_registers,
+        )
 
     def configure_i2c(self) -> None:
-        self.board.set_vdd_vddio(0.0, 0.0)
-        time.sleep(0.1)
+        self.board.power_off()
         self.board.set_pin_config(self.SDO, PinDirection.OUTPUT, PinValue.LOW)
         self.board.set_pin_config(self.CS, PinDirection.OUTPUT, PinValue.HIGH)
         self.board.set_vdd_vddio(3.3, 3.3)
-        time.sleep(0.01)
         self.board.configure_i2c(I2CMode.FAST_MODE)
         self.assign_sensor_callbacks()
         self.is_i2c_configured = True
         self.is_spi_configured = False
+        self.board.wait_for_chip_id(lambda: self.sensor.chip_id, "BMA456 chip id")
 
     def configure_spi(self) -> None:
-        self.board.set_vdd_vddio(0.0, 0.0)
-        time.sleep(0.1)
+        self.board.power_off()
         self.board.set_pin_config(self.CS, PinDirection.OUTPUT, PinValue.HIGH)
         self.board.set_vdd_vddio(3.3, 3.3)
-        time.sleep(0.2)
         if isinstance(self.board, ApplicationBoardV3Rev1):
-            SPIConfigureCmd.set_bus(SPIBus.BUS_1)
+            self.board.spi_bus = SPIBus.BUS_1
         self.board.configure_spi()
         self.assign_sensor_callbacks()
         self.is_spi_configured = True
         self.is_i2c_configured = False
+        self.board.wait_for_chip_id(lambda: self.sensor.chip_id, "BMA456 chip id")
 
     def read_register(self, reg_addr: int, bytes_to_read: int = 1) -> array[int] | int:
         if isinstance(reg_addr, BMA456Addr):
@@ -133,6 +153,15 @@ class BMA456Shuttle:
         error_message = "Configure I2C or SPI protocol prior to reading registers"
         raise BMA456ShuttleError(error_message)
 
+    def write_registers(self, writes: Iterable[tuple[int, int]]) -> None:
+        requests = [(reg_addr, array("B", (value,))) for reg_addr, value in writes]
+        if self.is_i2c_configured:
+            return self.board.write_many(requests, i2c_address=self.I2C_DEFAULT_ADDRESS)
+        if self.is_spi_configured:
+            return self.board.write_many(requests, cs_pin=self.CS)
+        error_message = "Configure I2C or SPI protocol prior to writing registers"
+        raise BMA456ShuttleError(error_message)
+
     def _configure_i2c_polling_streaming(
         self,
         sampling_time: int,
@@ -206,7 +235,7 @@ class BMA456Shuttle:
         self.switch_on_accel()
         self.sensor.int_map_data = 1 << 2
         self.sensor.int1_io_ctrl = (1 << 1) | (1 << 3)
-        time.sleep(0.02)
+        self.board.pause(0.02, "interrupt configuration")
         if self.is_i2c_configured:
             return self._configure_i2c_interrupt_streaming()
         if self.is_spi_configured:
@@ -223,37 +252,74 @@ class BMA456Shuttle:
         raise BMA456ShuttleError(error_message)
 
     def stop_streaming(self) -> None:
-        self.board.stop_polling_streaming()
-        time.sleep(0.15)
-        self.board.stop_interrupt_streaming()
-
-    def write_config_file(self, config_file: tuple[int]) -> None:
-        transaction_length = 8
-        for i in range(0, len(config_file), transaction_length):
-            chunk_data = config_file[i : i + transaction_length]
-            self.sensor.features_offset_lsb = (i // 2) & 0x0F
-            self.sensor.features_offset_msb = (i // 2) >> 4
-            # logger.info(f"writing chunk of {len(chunk_data)} bytes")
-            chunk = array("B", chunk_data)
-            if self.is_i2c_configured:
-                self.board.write_i2c(self.I2C_DEFAULT_ADDRESS, BMA456Addr.features_in.value, chunk)
-            if self.is_spi_configured:
-                self.board.write_spi(self.CS, BMA456Addr.features_in.value, chunk)
-        if not (self.is_spi_configured or self.is_i2c_configured):
-            error_message = "Configure I2C or SPI protocol prior to writing configuration file"
+        self.board.stop_streaming()
+
+    def _write_message(self, reg_addr: int, data: array[int]) -> array[int]:
+        if self.is_i2c_configured:
+            return I2CWriteCmd.assemble(
+                i2c_address=self.I2C_DEFAULT_ADDRESS, start_register_address=reg_addr, data_to_write=data
+            )
+        if self.is_spi_configured:
+            return SPIWriteCmd.assemble(cs_pin=self.CS, start_register_address=reg_addr, data_to_write=data)
+        error_message = "Configure I2C or SPI protocol prior to writing configuration file"
+        raise BMA456ShuttleError(error_message)
+
+    def config_file_messages(
+        self, config_file: bytes | memoryview | tuple[int, ...], chunk_size: int
+    ) -> list[array[int]]:
+        if chunk_size <= 0 or chunk_size % 2 or chunk_size > self.CONFIG_FILE_CHUNK_SIZE:
+            error_message = f"Chunk size must be even and in (0, {self.CONFIG_FILE_CHUNK_SIZE}], got {chunk_size}"
             raise BMA456ShuttleError(error_message)
+        messages = []
+        for i in range(0, len(config_file), chunk_size):
+            # the offset counts 16-bit words: 4 bits in the lsb register, the rest in the adjacent msb register
+            word_offset = i // 2
+            offset = array("B", (word_offset & 0x0F, word_offset >> 4))
+            messages.append(self._write_message(BMA456Addr.features_offset_lsb.value, offset))
+            chunk = array("B", config_file[i : i + chunk_size])
+            messages.append(self._write_message(BMA456Addr.features_in.value, chunk))
+        return messages
+
+    def write_config_file(
+        self,
+        config_file: bytes | memoryview | tuple[int, ...],
+        chunk_size: int = CONFIG_FILE_CHUNK_SIZE,
+        pipeline_depth: int = 1,
+    ) -> None:
+        messages = self.config_file_messages(config_file, chunk_size)
+        # a depth of 1 waits for each response before the next request, the status check is the same
+        try:
+            self.board.protocol.send_receive_many(messages, max_in_flight=pipeline_depth)
+        except BstProtocolError as e:
+            error_message = f"Writing configuration file failed: {e}"
+            raise BMA456ShuttleError(error_message) from e
+
+    @staticmethod
+    @functools.cache
+    def load_config_file(name: str) -> bytes:
+        if name not in BMA456Shuttle.CONFIG_FILES:
+            error_message = f"Unknown config file {name}, expect one of {BMA456Shuttle.CONFIG_FILES}"
+            raise BMA456ShuttleError(error_message)
+        return resources.files(config_files).joinpath(f"bma456_{name}.bin").read_bytes()
 
     def write_an_config_file(self) -> None:
-        self.write_config_file(BMA456_AN_CONFIG_FILE)
+        self.write_config_file(self.load_config_file("an"))
 
     def write_h_config_file(self) -> None:
-        self.write_config_file(BMA456_H_CONFIG_FILE)
+        self.write_config_file(self.load_config_file("h"))
 
     def write_mm_config_file(self) -> None:
-        self.write_config_file(BMA456_MM_CONFIG_FILE)
+        self.write_config_file(self.load_config_file("mm"))
 
     def write_tablet_config_file(self) -> None:
-        self.write_config_file(BMA456_TABLET_CONFIG_FILE)
+        self.write_config_file(self.load_config_file("tablet"))
 
     def write_w_config_file(self) -> None:
-        self.write_config_file(BMA456_W_CONFIG_FILE)
+        self.write_config_file(self.load_config_file("w"))
+
+    @property
+    def payload_layout(self) -> PayloadLayout:
+        return self.SPI_PAYLOAD_LAYOUT if self.is_spi_configured else self.I2C_PAYLOAD_LAYOUT
+
+    def decode_batch(self, frames: Payloads) -> np.ndarray:
+        return self.payload_layout.decode(frames)
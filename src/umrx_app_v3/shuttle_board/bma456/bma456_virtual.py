@@ -0,0 +1,90 @@
+from typing import Any
+
+from umrx_app_v3.mcu_board.comm.emulator_comm import EmulatorCommunication
+from umrx_app_v3.sensors.bma456 import BMA456Addr
+from umrx_app_v3.shuttle_board.bma456.bma456_shuttle import BMA456Shuttle
+from umrx_app_v3.shuttle_board.virtual_shuttle import VirtualSensor, VirtualShuttle, wave
+
+FEATURE_MEMORY_SIZE = 8192
+ACC_EN = 1 << 2
+INIT_OK = 0x01
+INIT_ERR = 0x02
+
+
+class VirtualBMA456(VirtualSensor):
+    CHIP_ID = 0x16
+    RESET_REGISTER = BMA456Addr.cmd.value
+    ODR = 50.0  # the rate the shuttle configures
+    LSB_PER_G = 16384  # +/-2 g after reset
+
+    def __init__(self) -> None:
+        super().__init__(
+            {BMA456Addr.acc_conf.value: 0xA8, BMA456Addr.pwr_conf.value: 0x03},
+            spi_dummy_bytes=1,
+        )
+        self.feature_memory = bytearray(FEATURE_MEMORY_SIZE)
+        self.feature_bytes_written = 0
+
+    def reset(self) -> None:
+        super().reset()
+        self.feature_memory = bytearray(FEATURE_MEMORY_SIZE)
+        self.feature_bytes_written = 0
+
+    @property
+    def feature_offset(self) -> int:
+        # in 16-bit words, 4 bits in the lsb register and the rest in the msb register
+        return (
+            self.registers[BMA456Addr.features_offset_msb.value] << 4
+            | self.registers[BMA456Addr.features_offset_lsb.value] & 0x0F
+        )
+
+    def config_file(self, length: int) -> bytes:
+        return bytes(self.feature_memory[:length])
+
+    def write(self, reg_addr: int, data: bytes) -> None:
+        if reg_addr != BMA456Addr.features_in.value:
+            super().write(reg_addr, data)
+            return
+        # features_in does not auto-increment, a burst goes to the feature memory at the current offset
+        start = 2 * self.feature_offset
+        self.feature_memory[start : start + len(data)] = data
+        self.feature_bytes_written += len(data)
+
+    def write_register(self, reg_addr: int, value: int) -> None:
+        super().write_register(reg_addr, value)
+        if reg_addr == BMA456Addr.init_ctrl.value:
+            status = (INIT_OK if self.feature_bytes_written else INIT_ERR) if value == 0x01 else 0x00
+            self.registers[BMA456Addr.internal_status.value] = status
+
+    @property
+    def is_measuring(self) -> bool:
+        return bool(self.registers[BMA456Addr.pwr_ctrl.value] & ACC_EN)
+
+    def sample(self, now: float) -> None:
+        self.put(
+            BMA456Addr.acc_x_lsb.value,
+            "<hhh",
+            wave(now, 0.02 * self.LSB_PER_G, 1.5),
+            wave(now, 0.02 * self.LSB_PER_G, 1.5, phase=1.0),
+            wave(now, 0.02 * self.LSB_PER_G, 1.5, offset=self.LSB_PER_G),
+        )
+        self.put_int24(BMA456Addr.sensor_time_0.value, self.sensor_time(now))
+        # drdy_acc
+        self.registers[BMA456Addr.status.value] = 0x80
+
+
+class VirtualBMA456Shuttle(VirtualShuttle):
+    SHUTTLE = BMA456Shuttle
+
+    def __init__(self, **kw: Any) -> None:
+        self.sensor = VirtualBMA456()
+        super().__init__(**kw)
+
+    def attach(self, emulator: EmulatorCommunication) -> None:
+        self.connect(
+            emulator,
+            self.sensor,
+            i2c_address=BMA456Shuttle.I2C_DEFAULT_ADDRESS,
+            cs_pin=BMA456Shuttle.CS,
+            interrupt_pins=(BMA456Shuttle.INT1,),
+        )
@@ -1,1202 +0,0 @@
-CONFIG_FILE = (
-    0xC8,
-    0x2E,
-    0x00,
-    0x2E,
-    0xC8,
-    0x2E,
-    0x00,
-    0x2E,
-    0xC8,
-    0x2E,
-    0x00,
-    0x2E,
-    0xC8,
-    0x2E,
-    0x00,
-    0x2E,
-    0xC8,
-    0x2E,
-    0x00,
-    0x2E,
-    0xC8,
-    0x2E,
-    0x00,
-    0x2E,
-    0xC8,
-    0x2E,
-    0x00,
-    0x2E,
-    0x80,
-    0x2E,
-    0x58,
-    0x01,
-    0x80,
-    0x2E,
-    0x42,
-    0x02,
-    0xB0,
-    0xF0,
-    0x10,
-    0x30,
-    0x21,
-    0x2E,
-    0x16,
-    0xF0,
-    0x80,
-    0x2E,
-    0xF0,
-    0x00,
-    0x1F,
-    0x50,
-    0x1D,
-    0x52,
-    0x01,
-    0x42,
-    0x3B,
-    0x80,
-    0x41,
-    0x30,
-    0x01,
-    0x42,
-    0x3C,
-    0x80,
-    0x00,
-    0x2E,
-    0x01,
-    0x40,
-    0x01,
-    0x42,
-    0x21,
-    0x2E,
-    0xFF,
-    0xAF,
-    0xB8,
-    0x2E,
-    0x2C,
-    0x82,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0xFD,
-    0x2D,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x01,
-    0x2E,
-    0x55,
-    0xF0,
-    0xC0,
-    0x2E,
-    0x21,
-    0x2E,
-    0x55,
-    0xF0,
-    0x44,
-    0x47,
-    0xAA,
-    0x00,
-    0x05,
-    0x00,
-    0xAA,
-    0x00,
-    0x05,
-    0x00,
-    0x42,
-    0x58,
-    0x88,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x19,
-    0x52,
-    0x0B,
-    0x50,
-    0x60,
-    0x42,
-    0x00,
-    0x3F,
-    0x0D,
-    0x54,
-    0x42,
-    0x42,
-    0x69,
-    0x82,
-    0x0F,
-    0x54,
-    0x42,
-    0x42,
-    0x42,
-    0x82,
-    0x4B,
-    0x30,
-    0x42,
-    0x40,
-    0x10,
-    0x08,
-    0x50,
-    0x42,
-    0x7E,
-    0x80,
-    0x4B,
-    0x42,
-    0x61,
-    0x30,
-    0x01,
-    0x42,
-    0x10,
-    0x50,
-    0x03,
-    0x2E,
-    0x40,
-    0xF0,
-    0x56,
-    0xB2,
-    0x08,
-    0x80,
-    0x31,
-    0x30,
-    0xF0,
-    0x7F,
-    0x03,
-    0x2F,
-    0x01,
-    0x2E,
-    0x40,
-    0xF0,
-    0x1A,
-    0x90,
-    0x21,
-    0x2F,
-    0x98,
-    0x2E,
-    0x1E,
-    0xB0,
-    0x03,
-    0x30,
-    0x13,
-    0x50,
-    0x17,
-    0x52,
-    0x11,
-    0x54,
-    0x54,
-    0x33,
-    0x06,
-    0x30,
-    0x55,
-    0x32,
-    0x1D,
-    0x1A,
-    0xE3,
-    0x22,
-    0x18,
-    0x1A,
-    0x15,
-    0x58,
-    0xE3,
-    0x22,
-    0x04,
-    0x30,
-    0xD5,
-    0x40,
-    0xB5,
-    0x0D,
-    0xE1,
-    0xBE,
-    0x6F,
-    0xBB,
-    0x80,
-    0x91,
-    0xA9,
-    0x0D,
-    0x01,
-    0x89,
-    0xB5,
-    0x23,
-    0x10,
-    0xA1,
-    0xF7,
-    0x2F,
-    0xDA,
-    0x0E,
-    0x54,
-    0x33,
-    0xEB,
-    0x2F,
-    0x01,
-    0x2E,
-    0x25,
-    0x00,
-    0x70,
-    0x1A,
-    0x00,
-    0x30,
-    0x21,
-    0x30,
-    0x48,
-    0x22,
-    0x40,
-    0xB2,
-    0x06,
-    0x2F,
-    0x23,
-    0x2E,
-    0x59,
-    0xF0,
-    0x98,
-    0x2E,
-    0x3A,
-    0x00,
-    0x00,
-    0x2E,
-    0x00,
-    0x2E,
-    0xD0,
-    0x2E,
-    0xF0,
-    0x6F,
-    0x01,
-    0x31,
-    0x20,
-    0x26,
-    0x01,
-    0x42,
-    0x10,
-    0x30,
-    0x21,
-    0x2E,
-    0x59,
-    0xF0,
-    0x98,
-    0x2E,
-    0x3A,
-    0x00,
-    0x01,
-    0x50,
-    0x03,
-    0x52,
-    0x98,
-    0x2E,
-    0x7F,
-    0x01,
-    0x01,
-    0x50,
-    0x05,
-    0x84,
-    0x13,
-    0x30,
-    0x05,
-    0x50,
-    0x64,
-    0x30,
-    0x07,
-    0x52,
-    0x93,
-    0x42,
-    0x84,
-    0x42,
-    0x98,
-    0x2E,
-    0x7F,
-    0x01,
-    0x05,
-    0x50,
-    0x06,
-    0x80,
-    0x71,
-    0x30,
-    0x01,
-    0x42,
-    0x00,
-    0x2E,
-    0x00,
-    0x2E,
-    0xD0,
-    0x2E,
-    0x98,
-    0x2E,
-    0xD6,
-    0x00,
-    0x01,
-    0x2E,
-    0x36,
-    0x00,
-    0x00,
-    0xB2,
-    0x0D,
-    0x2F,
-    0x00,
-    0x30,
-    0x21,
-    0x2E,
-    0x36,
-    0x00,
-    0x09,
-    0x50,
-    0x98,
-    0x2E,
-    0x18,
-    0x01,
-    0x09,
-    0x50,
-    0x01,
-    0x52,
-    0x98,
-    0x2E,
-    0x90,
-    0x01,
-    0x09,
-    0x50,
-    0x05,
-    0x52,
-    0x98,
-    0x2E,
-    0x90,
-    0x01,
-    0x98,
-    0x2E,
-    0x3A,
-    0x00,
-    0xE6,
-    0x2D,
-    0x07,
-    0x2E,
-    0x00,
-    0xF0,
-    0x03,
-    0x2E,
-    0x00,
-    0xF0,
-    0x21,
-    0x50,
-    0x9C,
-    0xBE,
-    0x02,
-    0x40,
-    0x1D,
-    0x52,
-    0xF4,
-    0x33,
-    0xDC,
-    0xBA,
-    0xD9,
-    0x0F,
-    0x94,
-    0x08,
-    0x06,
-    0x2F,
-    0x49,
-    0xAF,
-    0x04,
-    0x2F,
-    0x51,
-    0x0A,
-    0x02,
-    0x34,
-    0x47,
-    0xA3,
-    0x8A,
-    0x0A,
-    0x91,
-    0x22,
-    0x3C,
-    0x80,
-    0x25,
-    0x2E,
-    0x59,
-    0xF0,
-    0x01,
-    0x40,
-    0x01,
-    0x42,
-    0xB8,
-    0x2E,
-    0x1A,
-    0x24,
-    0x26,
-    0x00,
-    0x80,
-    0x2E,
-    0x58,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x46,
-    0x00,
-    0x40,
-    0x00,
-    0x4F,
-    0x00,
-    0x42,
-    0x00,
-    0x37,
-    0x00,
-    0xAF,
-    0x00,
-    0xFF,
-    0x00,
-    0xEC,
-    0x00,
-    0xFF,
-    0xB7,
-    0x00,
-    0x02,
-    0x00,
-    0xB0,
-    0x05,
-    0x80,
-    0xC9,
-    0xF0,
-    0x88,
-    0x00,
-    0x80,
-    0x00,
-    0x5E,
-    0xF0,
-    0x59,
-    0xF0,
-    0x89,
-    0xF0,
-    0x3A,
-    0x00,
-    0x80,
-    0x2E,
-    0x00,
-    0xAE,
-    0x44,
-    0x47,
-    0xFD,
-    0x2D,
-    0x00,
-    0x0C,
-    0x60,
-    0x50,
-    0x03,
-    0x2E,
-    0x45,
-    0x00,
-    0xE0,
-    0x7F,
-    0xF1,
-    0x7F,
-    0xDB,
-    0x7F,
-    0x30,
-    0x30,
-    0x1B,
-    0x54,
-    0x0A,
-    0x1A,
-    0x28,
-    0x2F,
-    0x1A,
-    0x25,
-    0x7A,
-    0x82,
-    0x00,
-    0x30,
-    0x43,
-    0x30,
-    0x32,
-    0x30,
-    0x05,
-    0x30,
-    0x04,
-    0x30,
-    0xF6,
-    0x6F,
-    0xF2,
-    0x09,
-    0xFC,
-    0x13,
-    0xC2,
-    0xAB,
-    0xB3,
-    0x09,
-    0xEF,
-    0x23,
-    0x80,
-    0xB3,
-    0xE6,
-    0x6F,
-    0xB7,
-    0x01,
-    0x00,
-    0x2E,
-    0x8B,
-    0x41,
-    0x4B,
-    0x42,
-    0x03,
-    0x2F,
-    0x46,
-    0x40,
-    0x86,
-    0x17,
-    0x81,
-    0x8D,
-    0x46,
-    0x42,
-    0x41,
-    0x8B,
-    0x23,
-    0xBD,
-    0xB3,
-    0xBD,
-    0x03,
-    0x89,
-    0x41,
-    0x82,
-    0x07,
-    0x0C,
-    0x43,
-    0xA3,
-    0xE6,
-    0x2F,
-    0xE1,
-    0x6F,
-    0xA2,
-    0x6F,
-    0x52,
-    0x42,
-    0x00,
-    0x2E,
-    0xB2,
-    0x6F,
-    0x52,
-    0x42,
-    0x00,
-    0x2E,
-    0xC2,
-    0x6F,
-    0x42,
-    0x42,
-    0x03,
-    0xB2,
-    0x03,
-    0x2E,
-    0x59,
-    0xF0,
-    0xF3,
-    0x3D,
-    0x02,
-    0x32,
-    0x0B,
-    0x08,
-    0x8A,
-    0x0A,
-    0xDB,
-    0x6F,
-    0x02,
-    0x22,
-    0xA0,
-    0x5F,
-    0x21,
-    0x2E,
-    0x59,
-    0xF0,
-    0xB8,
-    0x2E,
-    0x60,
-    0x50,
-    0xC3,
-    0x7F,
-    0xD4,
-    0x7F,
-    0xE7,
-    0x7F,
-    0xF6,
-    0x7F,
-    0xB2,
-    0x7F,
-    0xA5,
-    0x7F,
-    0x36,
-    0x30,
-    0x07,
-    0x2E,
-    0x01,
-    0xF0,
-    0xBE,
-    0xBD,
-    0xBE,
-    0xBB,
-    0x23,
-    0x58,
-    0x77,
-    0x05,
-    0x09,
-    0x56,
-    0x25,
-    0x54,
-    0x27,
-    0x41,
-    0x06,
-    0x41,
-    0xF8,
-    0xBF,
-    0xBE,
-    0x0B,
-    0xB5,
-    0x11,
-    0xD6,
-    0x42,
-    0x03,
-    0x89,
-    0x5A,
-    0x0E,
-    0xF6,
-    0x2F,
-    0x12,
-    0x30,
-    0x25,
-    0x2E,
-    0x36,
-    0x00,
-    0x02,
-    0x31,
-    0x25,
-    0x2E,
-    0xB8,
-    0xF0,
-    0xD4,
-    0x6F,
-    0xC3,
-    0x6F,
-    0xE7,
-    0x6F,
-    0xB2,
-    0x6F,
-    0xA5,
-    0x6F,
-    0xF6,
-    0x6F,
-    0xA0,
-    0x5F,
-    0xC8,
-    0x2E,
-    0x09,
-    0x86,
-    0x02,
-    0x30,
-    0x12,
-    0x42,
-    0x43,
-    0x0E,
-    0xFC,
-    0x2F,
-    0x37,
-    0x80,
-    0x13,
-    0x30,
-    0x13,
-    0x42,
-    0x12,
-    0x42,
-    0x12,
-    0x42,
-    0x12,
-    0x42,
-    0x02,
-    0x42,
-    0x03,
-    0x80,
-    0x41,
-    0x84,
-    0x11,
-    0x42,
-    0x02,
-    0x42,
-    0xB8,
-    0x2E,
-    0x46,
-    0x84,
-    0x80,
-    0x50,
-    0xA3,
-    0x40,
-    0x83,
-    0x88,
-    0x82,
-    0x40,
-    0x04,
-    0x41,
-    0xC3,
-    0x7F,
-    0x42,
-    0x8A,
-    0x06,
-    0x41,
-    0x6D,
-    0xBB,
-    0xF6,
-    0x7F,
-    0x80,
-    0xB3,
-    0xD5,
-    0x7F,
-    0xE0,
-    0x7F,
-    0x59,
-    0x2F,
-    0x31,
-    0x25,
-    0x55,
-    0x40,
-    0x41,
-    0x91,
-    0xB1,
-    0x7F,
-    0x0F,
-    0x2F,
-    0x01,
-    0x30,
-    0xC1,
-    0x42,
-    0x00,
-    0x2E,
-    0xD2,
-    0x6F,
-    0x13,
-    0x40,
-    0x93,
-    0x42,
-    0x00,
-    0x2E,
-    0x13,
-    0x40,
-    0x93,
-    0x42,
-    0x00,
-    0x2E,
-    0x00,
-    0x40,
-    0x80,
-    0x42,
-    0xBD,
-    0x80,
-    0xC0,
-    0x2E,
-    0x01,
-    0x42,
-    0x80,
-    0x5F,
-    0xC7,
-    0x86,
-    0x01,
-    0x30,
-    0xC5,
-    0x40,
-    0xFB,
-    0x86,
-    0x45,
-    0x41,
-    0x04,
-    0x41,
-    0x43,
-    0xBE,
-    0xD5,
-    0xBE,
-    0x43,
-    0xBA,
-    0xD5,
-    0xBA,
-    0x84,
-    0x7F,
-    0x95,
-    0x7F,
-    0xA1,
-    0x7F,
-    0x14,
-    0x30,
-    0x61,
-    0x15,
-    0xF5,
-    0x09,
-    0x15,
-    0x40,
-    0xC0,
-    0xB3,
-    0x0B,
-    0x2F,
-    0xC6,
-    0x40,
-    0xAE,
-    0x05,
-    0x07,
-    0x30,
-    0xFE,
-    0x05,
-    0x80,
-    0xA9,
-    0xB7,
-    0x23,
-    0x97,
-    0x6F,
-    0x77,
-    0x0F,
-    0xA6,
-    0x6F,
-    0xE6,
-    0x23,
-    0xF6,
-    0x6F,
-    0xA7,
-    0x7F,
-    0x80,
-    0x90,
-    0x00,
-    0x2F,
-    0xC5,
-    0x42,
-    0x41,
-    0x82,
-    0xC1,
-    0x86,
-    0x43,
-    0xA2,
-    0xE7,
-    0x2F,
-    0xA1,
-    0x6F,
-    0xB0,
-    0x6F,
-    0x0A,
-    0x1A,
-    0x02,
-    0x2F,
-    0x01,
-    0x30,
-    0x1B,
-    0x2C,
-    0x01,
-    0x42,
-    0x01,
-    0x40,
-    0x4C,
-    0x28,
-    0x82,
-    0x6F,
-    0x01,
-    0x42,
-    0x4A,
-    0x0E,
-    0x13,
-    0x2F,
-    0xC0,
-    0x6F,
-    0x00,
-    0xB2,
-    0x03,
-    0x2F,
-    0x3F,
-    0x80,
-    0x20,
-    0x14,
-    0x21,
-    0x2E,
-    0x5E,
-    0xF0,
-    0xE1,
-    0x6F,
-    0xD0,
-    0x6F,
-    0x52,
-    0x40,
-    0x12,
-    0x42,
-    0x00,
-    0x2E,
-    0x52,
-    0x40,
-    0x12,
-    0x42,
-    0x00,
-    0x2E,
-    0x41,
-    0x40,
-    0x03,
-    0x2C,
-    0x01,
-    0x42,
-    0x10,
-    0x30,
-    0x40,
-    0x42,
-    0x80,
-    0x5F,
-    0xB8,
-    0x2E,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0xFD,
-    0x2D,
-    0x30,
-    0x50,
-    0x2A,
-    0x25,
-    0xBD,
-    0x84,
-    0xFB,
-    0x7F,
-    0x8B,
-    0x31,
-    0x27,
-    0x56,
-    0x83,
-    0x42,
-    0xEB,
-    0x7F,
-    0x06,
-    0x30,
-    0x14,
-    0x30,
-    0x05,
-    0x30,
-    0x0D,
-    0x2C,
-    0x13,
-    0x56,
-    0x43,
-    0x1A,
-    0x02,
-    0x2F,
-    0x4E,
-    0x04,
-    0x06,
-    0x30,
-    0x15,
-    0x50,
-    0xEC,
-    0x09,
-    0xD7,
-    0x01,
-    0x41,
-    0x8B,
-    0xCB,
-    0x41,
-    0xC6,
-    0x01,
-    0x81,
-    0x8D,
-    0xCB,
-    0x43,
-    0x31,
-    0x0E,
-    0xF1,
-    0x2F,
-    0xFB,
-    0x6F,
-    0xD0,
-    0x5F,
-    0xB8,
-    0x2E,
-    0x10,
-    0x50,
-    0x01,
-    0x2E,
-    0x35,
-    0x00,
-    0x00,
-    0xB2,
-    0xFB,
-    0x7F,
-    0x19,
-    0x2F,
-    0x29,
-    0x56,
-    0x2F,
-    0x52,
-    0x13,
-    0x54,
-    0xC3,
-    0x00,
-    0x48,
-    0x04,
-    0xC2,
-    0x0F,
-    0x18,
-    0x22,
-    0x41,
-    0xB2,
-    0x0E,
-    0x2F,
-    0x12,
-    0x30,
-    0x8A,
-    0x08,
-    0x80,
-    0xB2,
-    0x06,
-    0x2F,
-    0x7F,
-    0x82,
-    0x98,
-    0x2E,
-    0x00,
-    0xB0,
-    0x2D,
-    0x52,
-    0x23,
-    0x2E,
-    0xFF,
-    0xB9,
-    0x06,
-    0x2D,
-    0xFB,
-    0x6F,
-    0xF0,
-    0x5F,
-    0x80,
-    0x2E,
-    0x00,
-    0xB0,
-    0x2B,
-    0x52,
-    0x01,
-    0x42,
-    0x00,
-    0x2E,
-    0xFB,
-    0x6F,
-    0xF0,
-    0x5F,
-    0xB8,
-    0x2E,
-    0x10,
-    0x24,
-    0x58,
-    0x02,
-    0x11,
-    0x24,
-    0x00,
-    0x0C,
-    0x12,
-    0x24,
-    0x80,
-    0x2E,
-    0x13,
-    0x24,
-    0x18,
-    0x00,
-    0x12,
-    0x42,
-    0x13,
-    0x42,
-    0x41,
-    0x1A,
-    0xFB,
-    0x2F,
-    0x10,
-    0x24,
-    0x50,
-    0x39,
-    0x11,
-    0x24,
-    0x21,
-    0x2E,
-    0x21,
-    0x2E,
-    0x10,
-    0x00,
-    0x23,
-    0x2E,
-    0x11,
-    0x00,
-    0x80,
-    0x2E,
-    0x10,
-    0x00,
-)
@@ -1,6146 +0,0 @@
-CONFIG_FILE = (
-    0xC8,
-    0x2E,
-    0x00,
-    0x2E,
-    0xC8,
-    0x2E,
-    0x00,
-    0x2E,
-    0xC8,
-    0x2E,
-    0x00,
-    0x2E,
-    0xC8,
-    0x2E,
-    0x00,
-    0x2E,
-    0x80,
-    0x2E,
-    0x99,
-    0x00,
-    0xC8,
-    0x2E,
-    0x00,
-    0x2E,
-    0xC8,
-    0x2E,
-    0x00,
-    0x2E,
-    0x80,
-    0x2E,
-    0x56,
-    0x01,
-    0x50,
-    0x39,
-    0x21,
-    0x2E,
-    0xB0,
-    0xF0,
-    0x10,
-    0x30,
-    0x21,
-    0x2E,
-    0x16,
-    0xF0,
-    0x80,
-    0x2E,
-    0xFB,
-    0x00,
-    0x81,
-    0x50,
-    0x75,
-    0x52,
-    0x01,
-    0x42,
-    0x3B,
-    0x80,
-    0x41,
-    0x30,
-    0x01,
-    0x42,
-    0x3C,
-    0x80,
-    0x00,
-    0x2E,
-    0x01,
-    0x40,
-    0x01,
-    0x42,
-    0x21,
-    0x2E,
-    0xFF,
-    0xAF,
-    0xB8,
-    0x2E,
-    0x9F,
-    0xAB,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0xFD,
-    0x2D,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x04,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x01,
-    0x00,
-    0x02,
-    0x00,
-    0x04,
-    0x00,
-    0x01,
-    0x00,
-    0x02,
-    0x00,
-    0x00,
-    0x00,
-    0x01,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x9A,
-    0x01,
-    0x34,
-    0x03,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x09,
-    0x01,
-    0x01,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x08,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x70,
-    0x50,
-    0xF1,
-    0x7F,
-    0xE0,
-    0x7F,
-    0xD2,
-    0x7F,
-    0xCB,
-    0x7F,
-    0x98,
-    0x2E,
-    0xC8,
-    0x00,
-    0x00,
-    0xB2,
-    0x75,
-    0x50,
-    0x1B,
-    0x30,
-    0x05,
-    0x2F,
-    0x03,
-    0x2E,
-    0x03,
-    0xF0,
-    0x9D,
-    0xBC,
-    0x9F,
-    0xB8,
-    0x40,
-    0x90,
-    0x07,
-    0x2F,
-    0x37,
-    0x2E,
-    0x65,
-    0x00,
-    0x0B,
-    0x30,
-    0x37,
-    0x2E,
-    0x6D,
-    0x00,
-    0x21,
-    0x2E,
-    0xBC,
-    0xF0,
-    0x0E,
-    0x2D,
-    0x51,
-    0x52,
-    0x77,
-    0x50,
-    0xB5,
-    0x7F,
-    0xA4,
-    0x7F,
-    0x93,
-    0x7F,
-    0x98,
-    0x2E,
-    0xE5,
-    0x00,
-    0x10,
-    0x30,
-    0x21,
-    0x2E,
-    0x4C,
-    0x00,
-    0x93,
-    0x6F,
-    0xA4,
-    0x6F,
-    0xB5,
-    0x6F,
-    0x75,
-    0x50,
-    0x21,
-    0x2E,
-    0xB8,
-    0xF0,
-    0xF1,
-    0x6F,
-    0xD2,
-    0x6F,
-    0xE0,
-    0x6F,
-    0xCB,
-    0x6F,
-    0x90,
-    0x5F,
-    0xC8,
-    0x2E,
-    0x01,
-    0x2E,
-    0x09,
-    0x01,
-    0x0F,
-    0xBD,
-    0x8E,
-    0xBC,
-    0x2F,
-    0xB9,
-    0x9F,
-    0xB8,
-    0x51,
-    0x0A,
-    0x0D,
-    0xBC,
-    0x0F,
-    0xB8,
-    0x05,
-    0x2E,
-    0x18,
-    0x01,
-    0x2F,
-    0xB9,
-    0x08,
-    0x0A,
-    0x02,
-    0x0A,
-    0x00,
-    0xB2,
-    0x10,
-    0x30,
-    0x03,
-    0x2F,
-    0x03,
-    0x2E,
-    0x4D,
-    0x00,
-    0x44,
-    0xB2,
-    0x01,
-    0x2F,
-    0x00,
-    0x30,
-    0xB8,
-    0x2E,
-    0xB8,
-    0x2E,
-    0x01,
-    0x2E,
-    0x09,
-    0x01,
-    0xC0,
-    0x2E,
-    0x0C,
-    0xBC,
-    0x0F,
-    0xB8,
-    0x05,
-    0x2E,
-    0x01,
-    0xF0,
-    0x2E,
-    0xBD,
-    0xAE,
-    0xB9,
-    0x34,
-    0x30,
-    0x43,
-    0x84,
-    0xE3,
-    0x04,
-    0x25,
-    0x40,
-    0x04,
-    0x40,
-    0xD8,
-    0xBE,
-    0x2C,
-    0x0B,
-    0x23,
-    0x11,
-    0x54,
-    0x42,
-    0x03,
-    0x80,
-    0x4A,
-    0x0E,
-    0xF6,
-    0x2F,
-    0xB8,
-    0x2E,
-    0x01,
-    0x2E,
-    0x55,
-    0xF0,
-    0xC0,
-    0x2E,
-    0x21,
-    0x2E,
-    0x55,
-    0xF0,
-    0x1A,
-    0x24,
-    0x26,
-    0x00,
-    0x80,
-    0x2E,
-    0x00,
-    0xB0,
-    0x44,
-    0x47,
-    0xCC,
-    0x00,
-    0x05,
-    0x00,
-    0xCC,
-    0x00,
-    0x64,
-    0x00,
-    0x30,
-    0x0A,
-    0x80,
-    0x00,
-    0x00,
-    0x02,
-    0x00,
-    0x01,
-    0x00,
-    0x30,
-    0x00,
-    0x00,
-    0x06,
-    0x00,
-    0x09,
-    0x00,
-    0x82,
-    0x00,
-    0x06,
-    0x00,
-    0x06,
-    0x00,
-    0x08,
-    0x00,
-    0x50,
-    0x00,
-    0x00,
-    0x00,
-    0x4C,
-    0x04,
-    0x02,
-    0x00,
-    0x03,
-    0x00,
-    0x00,
-    0x00,
-    0x91,
-    0x41,
-    0x00,
-    0x0C,
-    0x00,
-    0x71,
-    0x04,
-    0x00,
-    0x33,
-    0x01,
-    0x96,
-    0x00,
-    0x32,
-    0x00,
-    0x40,
-    0x5C,
-    0x88,
-    0x00,
-    0x77,
-    0x00,
-    0x00,
-    0x01,
-    0x81,
-    0x00,
-    0x02,
-    0x01,
-    0x06,
-    0x01,
-    0x17,
-    0x01,
-    0x52,
-    0x00,
-    0x75,
-    0x00,
-    0x45,
-    0x00,
-    0x48,
-    0x00,
-    0xAF,
-    0x00,
-    0xFF,
-    0x00,
-    0xEC,
-    0x00,
-    0xFF,
-    0xB7,
-    0x00,
-    0x02,
-    0x00,
-    0xB0,
-    0x05,
-    0x80,
-    0xFC,
-    0x0F,
-    0x00,
-    0xE0,
-    0xFF,
-    0x1F,
-    0xFF,
-    0xDF,
-    0xFF,
-    0xBF,
-    0xFF,
-    0x7F,
-    0xC9,
-    0xF0,
-    0x59,
-    0xF0,
-    0x01,
-    0x01,
-    0x03,
-    0x01,
-    0x80,
-    0x00,
-    0x39,
-    0xF0,
-    0x89,
-    0xF0,
-    0x00,
-    0x40,
-    0x00,
-    0x80,
-    0x88,
-    0x00,
-    0x5E,
-    0xF0,
-    0x00,
-    0x20,
-    0x00,
-    0x10,
-    0x00,
-    0x08,
-    0x53,
-    0x00,
-    0x5A,
-    0x00,
-    0x9A,
-    0x01,
-    0x60,
-    0x00,
-    0x00,
-    0x0C,
-    0x8C,
-    0x00,
-    0x00,
-    0xF8,
-    0xA0,
-    0x00,
-    0xE8,
-    0x03,
-    0x01,
-    0x80,
-    0xB8,
-    0x7E,
-    0xE1,
-    0x7A,
-    0x1A,
-    0x01,
-    0x66,
-    0x00,
-    0xF0,
-    0x00,
-    0x6E,
-    0x00,
-    0x71,
-    0x00,
-    0x71,
-    0x00,
-    0x80,
-    0x50,
-    0xF1,
-    0x7F,
-    0xD0,
-    0x7F,
-    0xE2,
-    0x7F,
-    0xCB,
-    0x7F,
-    0x00,
-    0x2E,
-    0x03,
-    0x2E,
-    0x01,
-    0x01,
-    0x01,
-    0x2E,
-    0x03,
-    0x01,
-    0x05,
-    0x2E,
-    0x04,
-    0x01,
-    0x9D,
-    0xB8,
-    0x0D,
-    0xB8,
-    0x2F,
-    0xBD,
-    0x08,
-    0x0A,
-    0x2F,
-    0xB9,
-    0x02,
-    0x0A,
-    0x05,
-    0x2E,
-    0x1B,
-    0x01,
-    0x03,
-    0x2E,
-    0x07,
-    0x01,
-    0x26,
-    0xBD,
-    0x2F,
-    0xB9,
-    0x93,
-    0xBC,
-    0x9F,
-    0xB8,
-    0x02,
-    0x0A,
-    0x81,
-    0x0A,
-    0x80,
-    0xB2,
-    0x10,
-    0x2F,
-    0xB7,
-    0x7F,
-    0x83,
-    0x7F,
-    0x94,
-    0x7F,
-    0xA5,
-    0x7F,
-    0x72,
-    0x25,
-    0x79,
-    0x50,
-    0x4F,
-    0x52,
-    0x98,
-    0x2E,
-    0xE5,
-    0x00,
-    0x10,
-    0x30,
-    0x27,
-    0x25,
-    0x21,
-    0x2E,
-    0x76,
-    0x00,
-    0x83,
-    0x6F,
-    0x94,
-    0x6F,
-    0xA5,
-    0x6F,
-    0xB7,
-    0x6F,
-    0x01,
-    0x2E,
-    0x76,
-    0x00,
-    0x02,
-    0x0A,
-    0x00,
-    0xB2,
-    0x07,
-    0x2F,
-    0x1B,
-    0x30,
-    0x80,
-    0x90,
-    0x37,
-    0x2E,
-    0x4B,
-    0x00,
-    0x00,
-    0x30,
-    0x01,
-    0x2F,
-    0x21,
-    0x2E,
-    0x76,
-    0x00,
-    0x98,
-    0x2E,
-    0xC8,
-    0x00,
-    0x00,
-    0xB2,
-    0x02,
-    0x2F,
-    0x75,
-    0x50,
-    0x21,
-    0x2E,
-    0xBA,
-    0xF0,
-    0x00,
-    0x31,
-    0x21,
-    0x2E,
-    0xB8,
-    0xF0,
-    0xF1,
-    0x6F,
-    0xD0,
-    0x6F,
-    0xE2,
-    0x6F,
-    0xCB,
-    0x6F,
-    0x80,
-    0x5F,
-    0xC8,
-    0x2E,
-    0x30,
-    0x50,
-    0x00,
-    0x30,
-    0x7B,
-    0x56,
-    0x05,
-    0x30,
-    0x05,
-    0x2C,
-    0xFB,
-    0x7F,
-    0x3E,
-    0xBE,
-    0xD2,
-    0xBA,
-    0xB2,
-    0xB9,
-    0x6C,
-    0x0B,
-    0x53,
-    0x0E,
-    0xF9,
-    0x2F,
-    0x53,
-    0x1A,
-    0x01,
-    0x2F,
-    0x4D,
-    0x0E,
-    0xF5,
-    0x2F,
-    0xD2,
-    0x7F,
-    0x04,
-    0x30,
-    0x1F,
-    0x2C,
-    0xE1,
-    0x7F,
-    0xC5,
-    0x01,
-    0xA3,
-    0x03,
-    0x72,
-    0x0E,
-    0x03,
-    0x2F,
-    0x72,
-    0x1A,
-    0x0F,
-    0x2F,
-    0x79,
-    0x0F,
-    0x0D,
-    0x2F,
-    0xE1,
-    0x6F,
-    0x4F,
-    0x04,
-    0x5F,
-    0xB9,
-    0xB1,
-    0xBF,
-    0xFA,
-    0x0B,
-    0xD2,
-    0x6F,
-    0x96,
-    0x06,
-    0xB1,
-    0x25,
-    0x51,
-    0xBF,
-    0xEB,
-    0x7F,
-    0x06,
-    0x00,
-    0xB2,
-    0x25,
-    0x27,
-    0x03,
-    0xDB,
-    0x7F,
-    0xCF,
-    0xBF,
-    0x3E,
-    0xBF,
-    0x01,
-    0xB8,
-    0xD2,
-    0xBA,
-    0x41,
-    0xBA,
-    0xB2,
-    0xB9,
-    0x07,
-    0x0A,
-    0x6E,
-    0x0B,
-    0xC0,
-    0x90,
-    0xDF,
-    0x2F,
-    0x40,
-    0x91,
-    0xDD,
-    0x2F,
-    0xFB,
-    0x6F,
-    0xD0,
-    0x5F,
-    0xB8,
-    0x2E,
-    0x10,
-    0x50,
-    0xFB,
-    0x7F,
-    0x21,
-    0x25,
-    0x98,
-    0x2E,
-    0xEE,
-    0xB1,
-    0xFB,
-    0x6F,
-    0x21,
-    0x25,
-    0xF0,
-    0x5F,
-    0x10,
-    0x25,
-    0x80,
-    0x2E,
-    0xA2,
-    0x01,
-    0x03,
-    0x30,
-    0x15,
-    0x40,
-    0xD9,
-    0x04,
-    0x2B,
-    0x0E,
-    0x1D,
-    0x23,
-    0x29,
-    0x0F,
-    0x15,
-    0x40,
-    0x0C,
-    0x23,
-    0x2B,
-    0x0E,
-    0x9D,
-    0x23,
-    0x29,
-    0x0F,
-    0x4E,
-    0x23,
-    0x00,
-    0x40,
-    0x03,
-    0x0E,
-    0xD8,
-    0x22,
-    0x01,
-    0x0F,
-    0x94,
-    0x42,
-    0x4B,
-    0x22,
-    0x95,
-    0x42,
-    0x81,
-    0x42,
-    0xB8,
-    0x2E,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0xFD,
-    0x2D,
-    0x6D,
-    0x52,
-    0x53,
-    0x50,
-    0x60,
-    0x42,
-    0x00,
-    0x3F,
-    0x55,
-    0x54,
-    0x42,
-    0x42,
-    0x69,
-    0x82,
-    0x57,
-    0x54,
-    0x42,
-    0x42,
-    0x42,
-    0x82,
-    0x0B,
-    0x31,
-    0x42,
-    0x40,
-    0x10,
-    0x08,
-    0x50,
-    0x42,
-    0x7E,
-    0x80,
-    0x4B,
-    0x42,
-    0xF1,
-    0x31,
-    0x01,
-    0x42,
-    0x10,
-    0x50,
-    0x08,
-    0x80,
-    0xF0,
-    0x7F,
-    0x30,
-    0x30,
-    0x03,
-    0x2E,
-    0x40,
-    0xF0,
-    0x56,
-    0x90,
-    0x1F,
-    0x2F,
-    0x03,
-    0x30,
-    0x5F,
-    0x52,
-    0x59,
-    0x54,
-    0x54,
-    0x34,
-    0x06,
-    0x30,
-    0x5B,
-    0x50,
-    0x55,
-    0x32,
-    0x1D,
-    0x1A,
-    0xE3,
-    0x22,
-    0x18,
-    0x1A,
-    0x5D,
-    0x58,
-    0xE3,
-    0x22,
-    0x04,
-    0x30,
-    0xD5,
-    0x40,
-    0xB5,
-    0x0D,
-    0xE1,
-    0xBE,
-    0x6F,
-    0xBB,
-    0x80,
-    0x91,
-    0xA9,
-    0x0D,
-    0x01,
-    0x89,
-    0xB5,
-    0x23,
-    0x10,
-    0xA1,
-    0xF7,
-    0x2F,
-    0xDA,
-    0x0E,
-    0x54,
-    0x34,
-    0xEB,
-    0x2F,
-    0x01,
-    0x2E,
-    0x25,
-    0x00,
-    0x70,
-    0x1A,
-    0x00,
-    0x30,
-    0x21,
-    0x30,
-    0x08,
-    0x22,
-    0x00,
-    0xB2,
-    0x06,
-    0x2F,
-    0x21,
-    0x2E,
-    0x59,
-    0xF0,
-    0x98,
-    0x2E,
-    0xF6,
-    0x00,
-    0x00,
-    0x2E,
-    0x00,
-    0x2E,
-    0xD0,
-    0x2E,
-    0xF0,
-    0x6F,
-    0x01,
-    0x31,
-    0x20,
-    0x26,
-    0x01,
-    0x42,
-    0x10,
-    0x30,
-    0x21,
-    0x2E,
-    0x59,
-    0xF0,
-    0x98,
-    0x2E,
-    0xF6,
-    0x00,
-    0x3F,
-    0x50,
-    0x41,
-    0x52,
-    0x98,
-    0x2E,
-    0xFA,
-    0xB2,
-    0x3F,
-    0x50,
-    0x05,
-    0x84,
-    0x14,
-    0x30,
-    0x43,
-    0x50,
-    0x63,
-    0x30,
-    0x45,
-    0x52,
-    0x94,
-    0x42,
-    0x83,
-    0x42,
-    0x98,
-    0x2E,
-    0xFA,
-    0xB2,
-    0x43,
-    0x50,
-    0x73,
-    0x30,
-    0x06,
-    0x80,
-    0x49,
-    0x54,
-    0x47,
-    0x52,
-    0x03,
-    0x42,
-    0x25,
-    0x2E,
-    0x98,
-    0x00,
-    0x6F,
-    0x50,
-    0x23,
-    0x2E,
-    0x8B,
-    0x00,
-    0xF0,
-    0x7F,
-    0x00,
-    0x2E,
-    0x00,
-    0x2E,
-    0xD0,
-    0x2E,
-    0x01,
-    0x2E,
-    0x16,
-    0x01,
-    0x83,
-    0xBC,
-    0x9F,
-    0xB8,
-    0x01,
-    0xBC,
-    0x23,
-    0x2E,
-    0x74,
-    0x00,
-    0x8E,
-    0xB8,
-    0x01,
-    0x2E,
-    0x74,
-    0x00,
-    0x23,
-    0x2E,
-    0x4E,
-    0x00,
-    0x00,
-    0x90,
-    0x02,
-    0x2F,
-    0x40,
-    0x30,
-    0x21,
-    0x2E,
-    0x4D,
-    0x00,
-    0x98,
-    0x2E,
-    0x4D,
-    0xB2,
-    0x01,
-    0x2E,
-    0x4B,
-    0x00,
-    0x00,
-    0xB2,
-    0x90,
-    0x2E,
-    0x64,
-    0xB1,
-    0x01,
-    0x2E,
-    0x4D,
-    0x00,
-    0x03,
-    0xA0,
-    0x7B,
-    0x2F,
-    0x03,
-    0xB2,
-    0x06,
-    0x2F,
-    0x71,
-    0x52,
-    0x73,
-    0x50,
-    0x21,
-    0x2E,
-    0x8A,
-    0x00,
-    0x23,
-    0x2E,
-    0x80,
-    0x00,
-    0x5B,
-    0x2D,
-    0x07,
-    0x2E,
-    0x01,
-    0x01,
-    0xB2,
-    0xBC,
-    0x9F,
-    0xB8,
-    0x10,
-    0x30,
-    0x88,
-    0x08,
-    0x09,
-    0x2E,
-    0x52,
-    0x00,
-    0x67,
-    0x52,
-    0x21,
-    0x09,
-    0x2D,
-    0xBD,
-    0x22,
-    0x0B,
-    0x31,
-    0xBD,
-    0x2F,
-    0xB9,
-    0x29,
-    0x2E,
-    0x52,
-    0x00,
-    0x50,
-    0x09,
-    0x09,
-    0x2E,
-    0x52,
-    0x00,
-    0x69,
-    0x54,
-    0xDE,
-    0xBE,
-    0x22,
-    0x09,
-    0x25,
-    0x0B,
-    0x29,
-    0x2E,
-    0x52,
-    0x00,
-    0xBF,
-    0xBA,
-    0x07,
-    0x2E,
-    0x52,
-    0x00,
-    0x6B,
-    0x58,
-    0x68,
-    0x09,
-    0x1C,
-    0x09,
-    0xDF,
-    0xBE,
-    0x25,
-    0x0B,
-    0x07,
-    0x2E,
-    0x03,
-    0x01,
-    0xB2,
-    0xBE,
-    0xDF,
-    0xBA,
-    0x29,
-    0x2E,
-    0x52,
-    0x00,
-    0x28,
-    0x09,
-    0x0B,
-    0x2E,
-    0x4E,
-    0x00,
-    0x56,
-    0x30,
-    0x75,
-    0x05,
-    0x33,
-    0xBF,
-    0x63,
-    0xBB,
-    0x75,
-    0x13,
-    0x40,
-    0xB3,
-    0x45,
-    0x23,
-    0x65,
-    0x5C,
-    0x6E,
-    0x09,
-    0x0D,
-    0x2E,
-    0x75,
-    0x00,
-    0x63,
-    0x5E,
-    0xB7,
-    0x09,
-    0x75,
-    0x0B,
-    0x2B,
-    0x2E,
-    0x75,
-    0x00,
-    0x0B,
-    0x2E,
-    0x75,
-    0x00,
-    0x4D,
-    0xBE,
-    0x69,
-    0x08,
-    0x0C,
-    0x0B,
-    0xB1,
-    0xBC,
-    0x9F,
-    0xB8,
-    0x29,
-    0x2E,
-    0x75,
-    0x00,
-    0x08,
-    0x09,
-    0x03,
-    0x2E,
-    0x75,
-    0x00,
-    0x4E,
-    0xBE,
-    0x4A,
-    0x08,
-    0x4C,
-    0x0A,
-    0x23,
-    0x2E,
-    0x75,
-    0x00,
-    0xBF,
-    0xB8,
-    0x88,
-    0x08,
-    0x01,
-    0x2E,
-    0x75,
-    0x00,
-    0x6B,
-    0x52,
-    0x01,
-    0x08,
-    0x2F,
-    0xBD,
-    0x02,
-    0x0A,
-    0x4B,
-    0x54,
-    0x4D,
-    0x52,
-    0x21,
-    0x2E,
-    0x75,
-    0x00,
-    0x25,
-    0x2E,
-    0x80,
-    0x00,
-    0x23,
-    0x2E,
-    0x8A,
-    0x00,
-    0x4F,
-    0x50,
-    0x98,
-    0x2E,
-    0x0D,
-    0xB2,
-    0x4F,
-    0x50,
-    0x3F,
-    0x52,
-    0x98,
-    0x2E,
-    0x0B,
-    0xB3,
-    0x4F,
-    0x50,
-    0x43,
-    0x52,
-    0x98,
-    0x2E,
-    0x0B,
-    0xB3,
-    0x01,
-    0x2E,
-    0x4D,
-    0x00,
-    0x04,
-    0x90,
-    0x08,
-    0x2F,
-    0x4F,
-    0x50,
-    0x98,
-    0x2E,
-    0x85,
-    0xB6,
-    0x4F,
-    0x50,
-    0x98,
-    0x2E,
-    0xE9,
-    0xB4,
-    0x4F,
-    0x50,
-    0x98,
-    0x2E,
-    0x8A,
-    0xB3,
-    0x05,
-    0x2E,
-    0x4D,
-    0x00,
-    0x82,
-    0xB2,
-    0x51,
-    0x2F,
-    0x80,
-    0xB2,
-    0x4F,
-    0x2F,
-    0x81,
-    0xB2,
-    0x61,
-    0x50,
-    0x41,
-    0x2F,
-    0x83,
-    0xB2,
-    0x03,
-    0x2E,
-    0x7E,
-    0x00,
-    0x2F,
-    0x2F,
-    0x84,
-    0x90,
-    0x53,
-    0x2F,
-    0x05,
-    0x2E,
-    0x74,
-    0x00,
-    0x80,
-    0x90,
-    0x03,
-    0x2F,
-    0x00,
-    0x30,
-    0x21,
-    0x2E,
-    0x50,
-    0x00,
-    0x4C,
-    0x2D,
-    0x07,
-    0x2E,
-    0x88,
-    0x00,
-    0x05,
-    0x2E,
-    0x16,
-    0x01,
-    0xC0,
-    0xB2,
-    0x06,
-    0x2F,
-    0x13,
-    0x30,
-    0xD3,
-    0x08,
-    0xC0,
-    0xB2,
-    0x02,
-    0x2F,
-    0x03,
-    0x30,
-    0x27,
-    0x2E,
-    0x4D,
-    0x00,
-    0x07,
-    0x2E,
-    0x78,
-    0x00,
-    0x59,
-    0x0A,
-    0x40,
-    0xB2,
-    0x02,
-    0x2F,
-    0x01,
-    0x30,
-    0x23,
-    0x2E,
-    0x50,
-    0x00,
-    0x21,
-    0x30,
-    0x51,
-    0x08,
-    0x40,
-    0xB2,
-    0x32,
-    0x2F,
-    0x03,
-    0x2E,
-    0x50,
-    0x00,
-    0x10,
-    0x08,
-    0x41,
-    0x82,
-    0x02,
-    0xB8,
-    0x23,
-    0x2E,
-    0x50,
-    0x00,
-    0x48,
-    0x0E,
-    0x29,
-    0x2F,
-    0x00,
-    0x30,
-    0x21,
-    0x2E,
-    0x4D,
-    0x00,
-    0x26,
-    0x2D,
-    0x40,
-    0xB2,
-    0x23,
-    0x2F,
-    0x11,
-    0x30,
-    0x40,
-    0x30,
-    0x02,
-    0x30,
-    0x23,
-    0x2E,
-    0x77,
-    0x00,
-    0x23,
-    0x2E,
-    0x81,
-    0x00,
-    0x21,
-    0x2E,
-    0x4D,
-    0x00,
-    0x25,
-    0x2E,
-    0x50,
-    0x00,
-    0x18,
-    0x2D,
-    0x01,
-    0x2E,
-    0x51,
-    0x00,
-    0x3F,
-    0x80,
-    0x21,
-    0x2E,
-    0x51,
-    0x00,
-    0x00,
-    0xAA,
-    0x10,
-    0x2F,
-    0x30,
-    0x30,
-    0x21,
-    0x2E,
-    0x4D,
-    0x00,
-    0x0D,
-    0x2D,
-    0x03,
-    0x2E,
-    0x4E,
-    0x00,
-    0x02,
-    0x32,
-    0x10,
-    0x30,
-    0x51,
-    0x10,
-    0x21,
-    0x2E,
-    0x77,
-    0x00,
-    0x21,
-    0x2E,
-    0x81,
-    0x00,
-    0x21,
-    0x2E,
-    0x4D,
-    0x00,
-    0x23,
-    0x2E,
-    0x51,
-    0x00,
-    0x03,
-    0x30,
-    0x27,
-    0x2E,
-    0x4B,
-    0x00,
-    0x01,
-    0x2E,
-    0x00,
-    0xF0,
-    0x09,
-    0x2E,
-    0x16,
-    0x01,
-    0x05,
-    0x2E,
-    0x74,
-    0x00,
-    0x4F,
-    0xBA,
-    0x80,
-    0x90,
-    0x03,
-    0x2E,
-    0x4F,
-    0x00,
-    0x06,
-    0x2F,
-    0x40,
-    0xB2,
-    0x00,
-    0x30,
-    0x29,
-    0x2F,
-    0x27,
-    0x2E,
-    0x4F,
-    0x00,
-    0x27,
-    0x2C,
-    0x01,
-    0x25,
-    0x40,
-    0x90,
-    0x01,
-    0x2F,
-    0x21,
-    0x2E,
-    0x4F,
-    0x00,
-    0x03,
-    0x2E,
-    0x4D,
-    0x00,
-    0x40,
-    0xB2,
-    0x12,
-    0x2F,
-    0x44,
-    0x90,
-    0x00,
-    0x30,
-    0x1A,
-    0x2F,
-    0x00,
-    0xB3,
-    0x01,
-    0x2E,
-    0x4F,
-    0x00,
-    0x16,
-    0x2F,
-    0x98,
-    0x2E,
-    0xC8,
-    0x00,
-    0x00,
-    0xB2,
-    0x70,
-    0x32,
-    0x11,
-    0x2F,
-    0x91,
-    0x31,
-    0x98,
-    0x2E,
-    0xE0,
-    0x00,
-    0x00,
-    0x90,
-    0x90,
-    0x30,
-    0x0C,
-    0x2C,
-    0x08,
-    0x22,
-    0x00,
-    0x91,
-    0x01,
-    0x2F,
-    0x21,
-    0x2E,
-    0x4F,
-    0x00,
-    0x21,
-    0x33,
-    0x22,
-    0x30,
-    0x01,
-    0x2E,
-    0x4E,
-    0x00,
-    0x01,
-    0x00,
-    0x25,
-    0x2E,
-    0x4D,
-    0x00,
-    0x00,
-    0xB2,
-    0x01,
-    0x2F,
-    0x21,
-    0x2E,
-    0x00,
-    0xF0,
-    0x01,
-    0x2E,
-    0x4C,
-    0x00,
-    0x00,
-    0x90,
-    0x03,
-    0x2F,
-    0x01,
-    0x2E,
-    0x65,
-    0x00,
-    0x00,
-    0xB2,
-    0x09,
-    0x2F,
-    0x51,
-    0x50,
-    0x98,
-    0x2E,
-    0x0D,
-    0xB2,
-    0x51,
-    0x50,
-    0x98,
-    0x2E,
-    0x30,
-    0xB5,
-    0x51,
-    0x50,
-    0x98,
-    0x2E,
-    0x4B,
-    0xB7,
-    0x03,
-    0x30,
-    0x27,
-    0x2E,
-    0x4C,
-    0x00,
-    0x98,
-    0x2E,
-    0xF6,
-    0x00,
-    0xF0,
-    0x6F,
-    0xF3,
-    0x3E,
-    0x02,
-    0x40,
-    0x03,
-    0x2E,
-    0x4D,
-    0x00,
-    0xD3,
-    0x08,
-    0x04,
-    0x31,
-    0x94,
-    0x0A,
-    0x43,
-    0x90,
-    0x5A,
-    0x22,
-    0x01,
-    0x42,
-    0x3C,
-    0x80,
-    0x00,
-    0x2E,
-    0x01,
-    0x40,
-    0x01,
-    0x42,
-    0x04,
-    0x80,
-    0x80,
-    0x2E,
-    0x65,
-    0xB0,
-    0x94,
-    0x01,
-    0xDD,
-    0x03,
-    0xC0,
-    0xAD,
-    0x0B,
-    0x2F,
-    0xC0,
-    0xA8,
-    0x03,
-    0x2F,
-    0xC0,
-    0x90,
-    0x07,
-    0x2F,
-    0x80,
-    0xA6,
-    0x05,
-    0x2F,
-    0x40,
-    0xA9,
-    0x12,
-    0x2F,
-    0x40,
-    0x91,
-    0x01,
-    0x2F,
-    0x00,
-    0xAB,
-    0x0E,
-    0x2F,
-    0xC0,
-    0xAC,
-    0x00,
-    0x30,
-    0x7D,
-    0x52,
-    0x07,
-    0x2F,
-    0xC0,
-    0xA9,
-    0x03,
-    0x2F,
-    0xC0,
-    0x91,
-    0x03,
-    0x2F,
-    0x80,
-    0xA7,
-    0x01,
-    0x2F,
-    0x40,
-    0xA1,
-    0x05,
-    0x2F,
-    0xC0,
-    0x2E,
-    0x17,
-    0x25,
-    0x06,
-    0x25,
-    0xC0,
-    0x2E,
-    0xF0,
-    0x3F,
-    0x6B,
-    0x52,
-    0xB8,
-    0x2E,
-    0x83,
-    0x86,
-    0x01,
-    0x30,
-    0x00,
-    0x30,
-    0x94,
-    0x40,
-    0x24,
-    0x18,
-    0x06,
-    0x00,
-    0x53,
-    0x0E,
-    0x4F,
-    0x02,
-    0xF9,
-    0x2F,
-    0xB8,
-    0x2E,
-    0x80,
-    0xA8,
-    0x03,
-    0x25,
-    0x10,
-    0x2F,
-    0x80,
-    0x90,
-    0x01,
-    0x2F,
-    0x41,
-    0x0E,
-    0x0C,
-    0x2F,
-    0xF3,
-    0x3F,
-    0x18,
-    0x05,
-    0x05,
-    0x30,
-    0x5D,
-    0x07,
-    0x15,
-    0x0E,
-    0x03,
-    0x2F,
-    0x55,
-    0x1A,
-    0x02,
-    0x2F,
-    0xCC,
-    0x0F,
-    0x00,
-    0x2F,
-    0x58,
-    0x04,
-    0x01,
-    0x25,
-    0xB8,
-    0x2E,
-    0xB8,
-    0x2E,
-    0x60,
-    0x50,
-    0x03,
-    0x2E,
-    0x1E,
-    0x01,
-    0xE0,
-    0x7F,
-    0xF1,
-    0x7F,
-    0xDB,
-    0x7F,
-    0x30,
-    0x30,
-    0x7F,
-    0x54,
-    0x0A,
-    0x1A,
-    0x28,
-    0x2F,
-    0x1A,
-    0x25,
-    0x7A,
-    0x82,
-    0x00,
-    0x30,
-    0x43,
-    0x30,
-    0x32,
-    0x30,
-    0x05,
-    0x30,
-    0x04,
-    0x30,
-    0xF6,
-    0x6F,
-    0xF2,
-    0x09,
-    0xFC,
-    0x13,
-    0xC2,
-    0xAB,
-    0xB3,
-    0x09,
-    0xEF,
-    0x23,
-    0x80,
-    0xB3,
-    0xE6,
-    0x6F,
-    0xB7,
-    0x01,
-    0x00,
-    0x2E,
-    0x8B,
-    0x41,
-    0x4B,
-    0x42,
-    0x03,
-    0x2F,
-    0x46,
-    0x40,
-    0x86,
-    0x17,
-    0x81,
-    0x8D,
-    0x46,
-    0x42,
-    0x41,
-    0x8B,
-    0x23,
-    0xBD,
-    0xB3,
-    0xBD,
-    0x03,
-    0x89,
-    0x41,
-    0x82,
-    0x07,
-    0x0C,
-    0x43,
-    0xA3,
-    0xE6,
-    0x2F,
-    0xE1,
-    0x6F,
-    0xA2,
-    0x6F,
-    0x52,
-    0x42,
-    0x00,
-    0x2E,
-    0xB2,
-    0x6F,
-    0x52,
-    0x42,
-    0x00,
-    0x2E,
-    0xC2,
-    0x6F,
-    0x42,
-    0x42,
-    0x03,
-    0xB2,
-    0x03,
-    0x2E,
-    0x59,
-    0xF0,
-    0xF3,
-    0x3D,
-    0x02,
-    0x32,
-    0x0B,
-    0x08,
-    0x8A,
-    0x0A,
-    0xDB,
-    0x6F,
-    0x02,
-    0x22,
-    0xA0,
-    0x5F,
-    0x21,
-    0x2E,
-    0x59,
-    0xF0,
-    0xB8,
-    0x2E,
-    0x03,
-    0x2E,
-    0x00,
-    0xF0,
-    0x07,
-    0x2E,
-    0x00,
-    0xF0,
-    0xBC,
-    0xBE,
-    0x05,
-    0x2E,
-    0x16,
-    0x01,
-    0x6F,
-    0x50,
-    0xAF,
-    0xB9,
-    0x02,
-    0x40,
-    0xF4,
-    0x33,
-    0xDC,
-    0xBA,
-    0xC1,
-    0xB2,
-    0x94,
-    0x08,
-    0x0E,
-    0x2F,
-    0x07,
-    0x2E,
-    0x4D,
-    0x00,
-    0xC4,
-    0x90,
-    0x0A,
-    0x2F,
-    0x75,
-    0x56,
-    0xCB,
-    0x0F,
-    0x07,
-    0x2F,
-    0x49,
-    0xAF,
-    0x05,
-    0x2F,
-    0x75,
-    0x52,
-    0x51,
-    0x0A,
-    0x02,
-    0x34,
-    0x47,
-    0xA3,
-    0x8A,
-    0x0A,
-    0x91,
-    0x22,
-    0x3C,
-    0x80,
-    0x25,
-    0x2E,
-    0x59,
-    0xF0,
-    0x01,
-    0x40,
-    0x01,
-    0x42,
-    0xB8,
-    0x2E,
-    0x70,
-    0x50,
-    0x42,
-    0x8E,
-    0xD4,
-    0x7F,
-    0xF6,
-    0x7F,
-    0x47,
-    0x25,
-    0x1A,
-    0x18,
-    0x83,
-    0x52,
-    0xF1,
-    0x00,
-    0x64,
-    0x25,
-    0x01,
-    0x30,
-    0x39,
-    0x02,
-    0x94,
-    0x41,
-    0x81,
-    0x41,
-    0xE2,
-    0x7F,
-    0xBE,
-    0xBB,
-    0xBD,
-    0x8D,
-    0x02,
-    0xBD,
-    0xB5,
-    0x7F,
-    0x8E,
-    0xB5,
-    0xBA,
-    0x0A,
-    0xC6,
-    0x7F,
-    0xAB,
-    0x7F,
-    0x51,
-    0x25,
-    0x98,
-    0x2E,
-    0xCB,
-    0xB1,
-    0xD5,
-    0x6F,
-    0xE2,
-    0x6F,
-    0x2A,
-    0x18,
-    0x83,
-    0x54,
-    0xB2,
-    0x01,
-    0x02,
-    0x30,
-    0xC4,
-    0x6F,
-    0x7A,
-    0x03,
-    0x12,
-    0x41,
-    0x74,
-    0x25,
-    0xD0,
-    0x7F,
-    0x52,
-    0xBC,
-    0xD3,
-    0x41,
-    0x6E,
-    0xBA,
-    0xDE,
-    0xB6,
-    0x20,
-    0x0B,
-    0xC7,
-    0x7F,
-    0x91,
-    0x7F,
-    0x98,
-    0x2E,
-    0xCB,
-    0xB1,
-    0xF2,
-    0x6F,
-    0xD5,
-    0x6F,
-    0xCA,
-    0x16,
-    0x55,
-    0x18,
-    0xDD,
-    0x18,
-    0x95,
-    0x6F,
-    0xEA,
-    0x18,
-    0x83,
-    0x5A,
-    0x31,
-    0x25,
-    0x75,
-    0x01,
-    0x01,
-    0x30,
-    0x20,
-    0x25,
-    0x39,
-    0x02,
-    0x5E,
-    0xBA,
-    0x82,
-    0xBC,
-    0x8E,
-    0xB6,
-    0x21,
-    0x0B,
-    0x98,
-    0x2E,
-    0xCB,
-    0xB1,
-    0xE2,
-    0x6F,
-    0xB5,
-    0x6F,
-    0x2A,
-    0x18,
-    0xE0,
-    0x7F,
-    0xF1,
-    0x7F,
-    0x04,
-    0x30,
-    0x83,
-    0x54,
-    0xF2,
-    0x00,
-    0x7C,
-    0x02,
-    0x85,
-    0x6F,
-    0xD0,
-    0x6F,
-    0x0D,
-    0x17,
-    0x68,
-    0x18,
-    0xE0,
-    0x18,
-    0x90,
-    0x6F,
-    0xC4,
-    0x6F,
-    0xC5,
-    0x18,
-    0xEB,
-    0x6F,
-    0xB2,
-    0x01,
-    0x1B,
-    0x43,
-    0x02,
-    0x30,
-    0x7A,
-    0x03,
-    0xFB,
-    0x6F,
-    0x3D,
-    0x8F,
-    0x0B,
-    0x43,
-    0x3E,
-    0xBA,
-    0x12,
-    0xBD,
-    0x52,
-    0xBC,
-    0x6E,
-    0xBB,
-    0xA2,
-    0x0A,
-    0x9E,
-    0xB5,
-    0xDE,
-    0xB6,
-    0x30,
-    0x0B,
-    0xF7,
-    0x7F,
-    0x98,
-    0x2E,
-    0xCB,
-    0xB1,
-    0xF5,
-    0x6F,
-    0x31,
-    0x25,
-    0xD1,
-    0x6F,
-    0x92,
-    0x6F,
-    0xAB,
-    0x6F,
-    0x50,
-    0x43,
-    0x43,
-    0x43,
-    0x90,
-    0x5F,
-    0x6B,
-    0x56,
-    0x80,
-    0x2E,
-    0xF8,
-    0xB1,
-    0x10,
-    0x50,
-    0x03,
-    0x40,
-    0x19,
-    0x18,
-    0x7D,
-    0x56,
-    0x19,
-    0x05,
-    0x36,
-    0x25,
-    0xF7,
-    0x7F,
-    0x4A,
-    0x17,
-    0x54,
-    0x18,
-    0xEC,
-    0x18,
-    0x09,
-    0x17,
-    0x01,
-    0x30,
-    0x0C,
-    0x07,
-    0xE2,
-    0x18,
-    0xDE,
-    0x00,
-    0xF2,
-    0x6F,
-    0x97,
-    0x02,
-    0x7B,
-    0x58,
-    0xDC,
-    0x00,
-    0x91,
-    0x02,
-    0xBF,
-    0xB8,
-    0x21,
-    0xBD,
-    0x8A,
-    0x0A,
-    0xC0,
-    0x2E,
-    0x02,
-    0x42,
-    0xF0,
-    0x5F,
-    0x0A,
-    0x86,
-    0x02,
-    0x30,
-    0x12,
-    0x42,
-    0x43,
-    0x0E,
-    0xFC,
-    0x2F,
-    0x36,
-    0x80,
-    0x13,
-    0x30,
-    0x13,
-    0x42,
-    0x12,
-    0x42,
-    0x12,
-    0x42,
-    0x12,
-    0x42,
-    0x02,
-    0x42,
-    0x04,
-    0x80,
-    0x41,
-    0x84,
-    0x11,
-    0x42,
-    0x02,
-    0x42,
-    0xB8,
-    0x2E,
-    0x46,
-    0x86,
-    0x80,
-    0x50,
-    0xE4,
-    0x40,
-    0xC4,
-    0x84,
-    0xBE,
-    0x8E,
-    0x85,
-    0x40,
-    0xF4,
-    0x7F,
-    0x42,
-    0x88,
-    0x42,
-    0x41,
-    0x2D,
-    0xBB,
-    0x02,
-    0x30,
-    0xC2,
-    0x43,
-    0x80,
-    0xB3,
-    0xC3,
-    0x40,
-    0xE6,
-    0x7F,
-    0xD0,
-    0x7F,
-    0xC4,
-    0x7F,
-    0x68,
-    0x2F,
-    0x41,
-    0x25,
-    0x57,
-    0x40,
-    0xB1,
-    0x7F,
-    0xC1,
-    0x91,
-    0x0E,
-    0x2F,
-    0x02,
-    0x43,
-    0x00,
-    0x2E,
-    0xC1,
-    0x6F,
-    0x13,
-    0x40,
-    0x53,
-    0x42,
-    0x00,
-    0x2E,
-    0x13,
-    0x40,
-    0x53,
-    0x42,
-    0x00,
-    0x2E,
-    0x00,
-    0x40,
-    0x40,
-    0x42,
-    0x7D,
-    0x80,
-    0xC0,
-    0x2E,
-    0x02,
-    0x42,
-    0x80,
-    0x5F,
-    0x08,
-    0x89,
-    0x11,
-    0x30,
-    0x07,
-    0x41,
-    0xA7,
-    0x7F,
-    0x3A,
-    0x89,
-    0xC7,
-    0x41,
-    0x45,
-    0x41,
-    0xD3,
-    0xBE,
-    0xF5,
-    0xBF,
-    0xD3,
-    0xBA,
-    0xF5,
-    0xBB,
-    0x85,
-    0x7F,
-    0x97,
-    0x7F,
-    0x05,
-    0x30,
-    0xCA,
-    0x15,
-    0xF7,
-    0x09,
-    0xC0,
-    0xB3,
-    0x0A,
-    0x2F,
-    0x06,
-    0x40,
-    0x07,
-    0x41,
-    0xB7,
-    0x05,
-    0x07,
-    0x30,
-    0x80,
-    0xA9,
-    0xFE,
-    0x05,
-    0xB7,
-    0x23,
-    0x97,
-    0x6F,
-    0x77,
-    0x0F,
-    0x4D,
-    0x23,
-    0xE6,
-    0x6F,
-    0xC0,
-    0xB2,
-    0x06,
-    0x2F,
-    0xA7,
-    0x6F,
-    0x85,
-    0x5C,
-    0xC7,
-    0x41,
-    0xBE,
-    0x09,
-    0x80,
-    0xB3,
-    0xE6,
-    0x6F,
-    0x01,
-    0x2F,
-    0x07,
-    0x40,
-    0x07,
-    0x43,
-    0x81,
-    0x84,
-    0x01,
-    0x80,
-    0x01,
-    0x89,
-    0x83,
-    0xA2,
-    0xE0,
-    0x2F,
-    0xB0,
-    0x6F,
-    0x2B,
-    0x1A,
-    0x02,
-    0x2F,
-    0x01,
-    0x30,
-    0x25,
-    0x2C,
-    0x01,
-    0x42,
-    0x02,
-    0x40,
-    0x91,
-    0x28,
-    0x83,
-    0x6F,
-    0x02,
-    0x42,
-    0x53,
-    0x0E,
-    0x1D,
-    0x2F,
-    0xF2,
-    0x6F,
-    0x80,
-    0xB2,
-    0x03,
-    0x2F,
-    0xBF,
-    0x84,
-    0x8A,
-    0x14,
-    0x25,
-    0x2E,
-    0x5E,
-    0xF0,
-    0xD4,
-    0x6F,
-    0xC3,
-    0x6F,
-    0x12,
-    0x41,
-    0xD2,
-    0x42,
-    0x02,
-    0x30,
-    0x15,
-    0x41,
-    0xD5,
-    0x42,
-    0x00,
-    0x2E,
-    0x04,
-    0x41,
-    0xC4,
-    0x42,
-    0xC3,
-    0x86,
-    0xA5,
-    0x6F,
-    0x87,
-    0x58,
-    0x45,
-    0x41,
-    0x2C,
-    0x09,
-    0xC1,
-    0x42,
-    0x00,
-    0xB3,
-    0x04,
-    0x2F,
-    0x00,
-    0x2E,
-    0x03,
-    0x2C,
-    0x02,
-    0x42,
-    0x10,
-    0x30,
-    0x40,
-    0x42,
-    0x80,
-    0x5F,
-    0xB8,
-    0x2E,
-    0x03,
-    0x2E,
-    0x04,
-    0x01,
-    0x1F,
-    0xBD,
-    0xE0,
-    0x50,
-    0x2F,
-    0xB9,
-    0xF0,
-    0x7F,
-    0x80,
-    0xB2,
-    0xEB,
-    0x7F,
-    0x90,
-    0x2E,
-    0x64,
-    0xB4,
-    0x13,
-    0x40,
-    0x14,
-    0xBD,
-    0xD0,
-    0x7F,
-    0x2A,
-    0xBA,
-    0x05,
-    0x30,
-    0x12,
-    0x40,
-    0xC4,
-    0x7F,
-    0xC0,
-    0xA8,
-    0xEB,
-    0x05,
-    0x3E,
-    0x88,
-    0xDF,
-    0x22,
-    0xB4,
-    0x7F,
-    0x80,
-    0xA8,
-    0x2A,
-    0x05,
-    0x94,
-    0x22,
-    0x9C,
-    0xBF,
-    0x04,
-    0x40,
-    0xFE,
-    0xBB,
-    0x89,
-    0x5C,
-    0x00,
-    0xA9,
-    0x01,
-    0x2E,
-    0x05,
-    0x01,
-    0x6C,
-    0x05,
-    0xF7,
-    0x01,
-    0x05,
-    0xBC,
-    0x25,
-    0x23,
-    0x05,
-    0xB8,
-    0xC5,
-    0x41,
-    0xD8,
-    0x05,
-    0x2F,
-    0x2A,
-    0x9A,
-    0xBF,
-    0xB7,
-    0x25,
-    0x9E,
-    0xBF,
-    0x61,
-    0xB7,
-    0x1B,
-    0x25,
-    0xFF,
-    0xBB,
-    0x9E,
-    0xB8,
-    0x96,
-    0x0F,
-    0x07,
-    0x2F,
-    0xA3,
-    0x7F,
-    0x00,
-    0x2E,
-    0xF3,
-    0x6F,
-    0x00,
-    0x2E,
-    0xC3,
-    0x40,
-    0xC0,
-    0xAC,
-    0xA3,
-    0x6F,
-    0x26,
-    0x2F,
-    0x96,
-    0x0F,
-    0x04,
-    0x2F,
-    0xF6,
-    0x6F,
-    0x00,
-    0x2E,
-    0x86,
-    0x41,
-    0x80,
-    0xA1,
-    0x1B,
-    0x2F,
-    0xB7,
-    0x25,
-    0x2B,
-    0x2A,
-    0xE1,
-    0xB5,
-    0x18,
-    0x28,
-    0x90,
-    0x0E,
-    0x5B,
-    0x25,
-    0x04,
-    0x2F,
-    0xD3,
-    0x6F,
-    0x00,
-    0x2E,
-    0xC3,
-    0x40,
-    0xC0,
-    0xA0,
-    0x0A,
-    0x2F,
-    0x90,
-    0x0E,
-    0x0B,
-    0x2F,
-    0xD0,
-    0x6F,
-    0x00,
-    0x2E,
-    0x00,
-    0x40,
-    0x00,
-    0xA0,
-    0x06,
-    0x2F,
-    0x00,
-    0x30,
-    0x21,
-    0x2E,
-    0x58,
-    0x00,
-    0x03,
-    0x2D,
-    0x20,
-    0x30,
-    0x21,
-    0x2E,
-    0x58,
-    0x00,
-    0x08,
-    0x2C,
-    0x75,
-    0x25,
-    0x30,
-    0x30,
-    0x21,
-    0x2E,
-    0x58,
-    0x00,
-    0x03,
-    0x2D,
-    0x10,
-    0x30,
-    0x21,
-    0x2E,
-    0x58,
-    0x00,
-    0xC0,
-    0x91,
-    0xF2,
-    0x6F,
-    0x01,
-    0x2E,
-    0x57,
-    0x00,
-    0x03,
-    0x2F,
-    0x03,
-    0x30,
-    0x27,
-    0x2E,
-    0x59,
-    0x00,
-    0x12,
-    0x2D,
-    0x8D,
-    0x56,
-    0x63,
-    0x0F,
-    0x03,
-    0x2F,
-    0x82,
-    0xB9,
-    0x27,
-    0x2E,
-    0x59,
-    0x00,
-    0x0B,
-    0x2D,
-    0x82,
-    0x88,
-    0x13,
-    0x30,
-    0x04,
-    0x41,
-    0x00,
-    0xAD,
-    0x02,
-    0x2F,
-    0x27,
-    0x2E,
-    0x59,
-    0x00,
-    0x03,
-    0x2D,
-    0x03,
-    0x30,
-    0x27,
-    0x2E,
-    0x59,
-    0x00,
-    0x35,
-    0x30,
-    0x07,
-    0x2E,
-    0x58,
-    0x00,
-    0x09,
-    0x2E,
-    0x59,
-    0x00,
-    0xDD,
-    0x08,
-    0x42,
-    0xBE,
-    0xDC,
-    0x0A,
-    0x03,
-    0x1A,
-    0xD3,
-    0x7F,
-    0x00,
-    0x30,
-    0x2F,
-    0x2F,
-    0x40,
-    0xA4,
-    0x2D,
-    0x2F,
-    0x43,
-    0x90,
-    0x03,
-    0x30,
-    0x10,
-    0x2F,
-    0x09,
-    0x2E,
-    0x5F,
-    0x00,
-    0x10,
-    0x30,
-    0x60,
-    0x29,
-    0x09,
-    0x2E,
-    0x5D,
-    0x00,
-    0xD7,
-    0x6F,
-    0x27,
-    0x1A,
-    0x2B,
-    0x2E,
-    0x5F,
-    0x00,
-    0x01,
-    0x2F,
-    0x27,
-    0x2E,
-    0x5F,
-    0x00,
-    0x09,
-    0x2E,
-    0x5F,
-    0x00,
-    0x05,
-    0xA3,
-    0x03,
-    0x22,
-    0x00,
-    0x90,
-    0x04,
-    0x2F,
-    0x8B,
-    0x56,
-    0x98,
-    0x2E,
-    0xA2,
-    0xB4,
-    0xF2,
-    0x6F,
-    0x03,
-    0x30,
-    0x00,
-    0x90,
-    0x10,
-    0x2F,
-    0x01,
-    0x2E,
-    0x5E,
-    0x00,
-    0x62,
-    0x7F,
-    0x1A,
-    0x25,
-    0xC2,
-    0x6F,
-    0x72,
-    0x7F,
-    0x83,
-    0x7F,
-    0x76,
-    0x82,
-    0x90,
-    0x7F,
-    0x98,
-    0x2E,
-    0x67,
-    0xB4,
-    0x01,
-    0xB2,
-    0x21,
-    0x2E,
-    0x5E,
-    0x00,
-    0x11,
-    0x30,
-    0x00,
-    0x30,
-    0x08,
-    0x22,
-    0x01,
-    0xB2,
-    0xD1,
-    0x6F,
-    0x01,
-    0x2E,
-    0x57,
-    0x00,
-    0x23,
-    0x2E,
-    0x5D,
-    0x00,
-    0x41,
-    0x22,
-    0x23,
-    0x2E,
-    0x52,
-    0xF0,
-    0xF1,
-    0x7F,
-    0x98,
-    0x2E,
-    0xF6,
-    0x00,
-    0x01,
-    0x2E,
-    0x57,
-    0x00,
-    0xF1,
-    0x6F,
-    0x08,
-    0x1A,
-    0x20,
-    0x30,
-    0x01,
-    0x2F,
-    0x21,
-    0x2E,
-    0x5E,
-    0xF0,
-    0xB2,
-    0x6F,
-    0x8B,
-    0x50,
-    0x93,
-    0x40,
-    0x13,
-    0x42,
-    0x00,
-    0x2E,
-    0x93,
-    0x40,
-    0x13,
-    0x42,
-    0x00,
-    0x2E,
-    0x82,
-    0x40,
-    0x02,
-    0x42,
-    0x23,
-    0x2E,
-    0x57,
-    0x00,
-    0xEB,
-    0x6F,
-    0x20,
-    0x5F,
-    0xB8,
-    0x2E,
-    0x60,
-    0x50,
-    0x2A,
-    0x25,
-    0xBA,
-    0x84,
-    0x00,
-    0x30,
-    0x80,
-    0x42,
-    0xB0,
-    0x7F,
-    0xC0,
-    0x7F,
-    0xF1,
-    0x7F,
-    0x42,
-    0x86,
-    0x40,
-    0x40,
-    0x85,
-    0x52,
-    0xE3,
-    0x7F,
-    0xDB,
-    0x7F,
-    0x98,
-    0x2E,
-    0xE6,
-    0x01,
-    0xB1,
-    0x6F,
-    0x09,
-    0x18,
-    0xA1,
-    0x6F,
-    0x56,
-    0x25,
-    0x47,
-    0x25,
-    0x09,
-    0x18,
-    0x75,
-    0x00,
-    0xE0,
-    0x6F,
-    0xFC,
-    0x02,
-    0xC2,
-    0x6F,
-    0x12,
-    0x18,
-    0x25,
-    0x40,
-    0x00,
-    0x40,
-    0x47,
-    0x25,
-    0x1A,
-    0xB9,
-    0x46,
-    0x18,
-    0xB6,
-    0xBD,
-    0xE0,
-    0x18,
-    0xD4,
-    0xBE,
-    0x9A,
-    0x0A,
-    0x15,
-    0x00,
-    0x96,
-    0xBC,
-    0x47,
-    0x0E,
-    0x0F,
-    0x2F,
-    0x47,
-    0x1A,
-    0x01,
-    0x2F,
-    0x4E,
-    0x0E,
-    0x0B,
-    0x2F,
-    0xFD,
-    0x00,
-    0x5A,
-    0x0E,
-    0x00,
-    0x30,
-    0x08,
-    0x2F,
-    0x5A,
-    0x1A,
-    0x01,
-    0x2F,
-    0x71,
-    0x0E,
-    0x04,
-    0x2F,
-    0xF1,
-    0x6F,
-    0x43,
-    0x82,
-    0x02,
-    0x2C,
-    0x40,
-    0x40,
-    0x10,
-    0x30,
-    0xDB,
-    0x6F,
-    0xA0,
-    0x5F,
-    0xB8,
-    0x2E,
-    0x81,
-    0x8A,
-    0x82,
-    0x88,
-    0x41,
-    0xB2,
-    0x01,
-    0x2F,
-    0x00,
-    0x2E,
-    0x02,
-    0x2D,
-    0x24,
-    0x2C,
-    0x00,
-    0x30,
-    0x42,
-    0xB2,
-    0x01,
-    0x2F,
-    0x43,
-    0x90,
-    0x37,
-    0x2F,
-    0x80,
-    0x40,
-    0xC6,
-    0x40,
-    0x86,
-    0x05,
-    0x7E,
-    0x80,
-    0x8F,
-    0x52,
-    0xC8,
-    0x01,
-    0x00,
-    0x30,
-    0x80,
-    0xA9,
-    0x46,
-    0x04,
-    0xC7,
-    0x41,
-    0x71,
-    0x22,
-    0x4F,
-    0x0F,
-    0x28,
-    0x2F,
-    0xC1,
-    0x8C,
-    0x41,
-    0x41,
-    0x86,
-    0x41,
-    0x4E,
-    0x04,
-    0x40,
-    0xA8,
-    0x81,
-    0x05,
-    0x4E,
-    0x22,
-    0x4F,
-    0x0F,
-    0x1F,
-    0x2F,
-    0xC2,
-    0x82,
-    0x03,
-    0x41,
-    0x41,
-    0x40,
-    0xD9,
-    0x04,
-    0xC0,
-    0xA8,
-    0x43,
-    0x04,
-    0xD9,
-    0x22,
-    0x5F,
-    0x0F,
-    0x16,
-    0x2F,
-    0x82,
-    0x40,
-    0x80,
-    0xA8,
-    0xC2,
-    0x04,
-    0x93,
-    0x22,
-    0x91,
-    0x56,
-    0x53,
-    0x0F,
-    0x0D,
-    0x2F,
-    0x42,
-    0x41,
-    0x80,
-    0xA8,
-    0xC2,
-    0x04,
-    0x93,
-    0x22,
-    0x91,
-    0x56,
-    0x53,
-    0x0F,
-    0x06,
-    0x2F,
-    0x02,
-    0x41,
-    0x80,
-    0xA8,
-    0xC2,
-    0x04,
-    0x93,
-    0x22,
-    0x91,
-    0x56,
-    0xD3,
-    0x0E,
-    0x05,
-    0x2F,
-    0x10,
-    0x30,
-    0xB8,
-    0x2E,
-    0x10,
-    0x30,
-    0xB8,
-    0x2E,
-    0x00,
-    0x30,
-    0xB8,
-    0x2E,
-    0xB8,
-    0x2E,
-    0x05,
-    0x2E,
-    0x8B,
-    0x00,
-    0x81,
-    0x82,
-    0x40,
-    0x50,
-    0x41,
-    0x40,
-    0x93,
-    0xBD,
-    0xBF,
-    0xB9,
-    0xFB,
-    0x7F,
-    0xC0,
-    0xB2,
-    0x0B,
-    0x30,
-    0x36,
-    0x2F,
-    0x07,
-    0x2E,
-    0x62,
-    0x00,
-    0xC0,
-    0x90,
-    0x04,
-    0x2F,
-    0xC1,
-    0x86,
-    0x27,
-    0x2E,
-    0x62,
-    0x00,
-    0x37,
-    0x2E,
-    0x63,
-    0x00,
-    0x82,
-    0x86,
-    0x82,
-    0x40,
-    0x94,
-    0xBC,
-    0xC3,
-    0x40,
-    0x94,
-    0xB8,
-    0x21,
-    0xBD,
-    0xB4,
-    0xBD,
-    0x21,
-    0xB9,
-    0xB4,
-    0xB9,
-    0xC1,
-    0x7F,
-    0xE3,
-    0x7F,
-    0xD2,
-    0x7F,
-    0x10,
-    0x25,
-    0x98,
-    0x2E,
-    0xDB,
-    0x01,
-    0xC2,
-    0x6F,
-    0xD1,
-    0x6F,
-    0x8A,
-    0x28,
-    0x42,
-    0x0F,
-    0x0D,
-    0x2F,
-    0xC1,
-    0x0E,
-    0x05,
-    0x2E,
-    0x63,
-    0x00,
-    0x13,
-    0x30,
-    0x13,
-    0x28,
-    0x04,
-    0x2F,
-    0x80,
-    0xA6,
-    0x08,
-    0x2F,
-    0x21,
-    0x2E,
-    0x63,
-    0x00,
-    0x06,
-    0x2D,
-    0x21,
-    0x2E,
-    0x63,
-    0x00,
-    0x03,
-    0x2D,
-    0x00,
-    0x30,
-    0x21,
-    0x2E,
-    0x63,
-    0x00,
-    0x03,
-    0x2E,
-    0x63,
-    0x00,
-    0xE0,
-    0x6F,
-    0xC8,
-    0x0E,
-    0x40,
-    0x30,
-    0x04,
-    0x2F,
-    0x21,
-    0x2E,
-    0x5E,
-    0xF0,
-    0x02,
-    0x2D,
-    0x37,
-    0x2E,
-    0x62,
-    0x00,
-    0xFB,
-    0x6F,
-    0xC0,
-    0x5F,
-    0xB8,
-    0x2E,
-    0x03,
-    0x2E,
-    0x09,
-    0x01,
-    0x72,
-    0x30,
-    0x30,
-    0x50,
-    0xCA,
-    0x08,
-    0xC0,
-    0x90,
-    0xFB,
-    0x7F,
-    0x0B,
-    0x2F,
-    0x01,
-    0x30,
-    0x23,
-    0x2E,
-    0x54,
-    0xF0,
-    0xE0,
-    0x7F,
-    0xD3,
-    0x7F,
-    0x98,
-    0x2E,
-    0xF6,
-    0x00,
-    0x10,
-    0x30,
-    0x21,
-    0x2E,
-    0x65,
-    0x00,
-    0xE0,
-    0x6F,
-    0xD3,
-    0x6F,
-    0x03,
-    0x2E,
-    0x65,
-    0x00,
-    0x40,
-    0x90,
-    0x93,
-    0x52,
-    0x15,
-    0x2F,
-    0x05,
-    0x2E,
-    0x64,
-    0x00,
-    0x8C,
-    0x88,
-    0x00,
-    0x2E,
-    0x03,
-    0x43,
-    0x30,
-    0x25,
-    0x98,
-    0x2E,
-    0xA3,
-    0xB5,
-    0x00,
-    0xB2,
-    0x05,
-    0x2F,
-    0x21,
-    0x2E,
-    0x54,
-    0xF0,
-    0xE0,
-    0x7F,
-    0x98,
-    0x2E,
-    0xF6,
-    0x00,
-    0xE0,
-    0x6F,
-    0x00,
-    0xA6,
-    0x10,
-    0x30,
-    0x08,
-    0x2F,
-    0x21,
-    0x2E,
-    0x5E,
-    0xF0,
-    0x06,
-    0x2D,
-    0x03,
-    0x30,
-    0x93,
-    0x50,
-    0x98,
-    0x2E,
-    0x68,
-    0xB5,
-    0x27,
-    0x2E,
-    0x65,
-    0x00,
-    0xFB,
-    0x6F,
-    0xD0,
-    0x5F,
-    0xB8,
-    0x2E,
-    0x0C,
-    0x82,
-    0x02,
-    0x30,
-    0x12,
-    0x42,
-    0x41,
-    0x0E,
-    0xFC,
-    0x2F,
-    0x35,
-    0x80,
-    0x87,
-    0x52,
-    0x11,
-    0x42,
-    0x00,
-    0x2E,
-    0x95,
-    0x52,
-    0x01,
-    0x42,
-    0xB8,
-    0x2E,
-    0x07,
-    0x88,
-    0x47,
-    0x8E,
-    0x06,
-    0x41,
-    0x3C,
-    0x8B,
-    0x32,
-    0x1A,
-    0x42,
-    0x41,
-    0xC7,
-    0x41,
-    0x16,
-    0x2F,
-    0x80,
-    0x91,
-    0x23,
-    0x2F,
-    0x57,
-    0x0F,
-    0x16,
-    0x30,
-    0x0C,
-    0x2F,
-    0x06,
-    0x80,
-    0x00,
-    0x2E,
-    0x00,
-    0x40,
-    0x00,
-    0xB2,
-    0x04,
-    0x2F,
-    0x46,
-    0x82,
-    0x00,
-    0x2E,
-    0x41,
-    0x40,
-    0xD1,
-    0x0F,
-    0x02,
-    0x2F,
-    0x06,
-    0x30,
-    0x06,
-    0x43,
-    0x46,
-    0x43,
-    0x80,
-    0xB3,
-    0x11,
-    0x2F,
-    0x03,
-    0x43,
-    0x47,
-    0x43,
-    0xB8,
-    0x2E,
-    0xD7,
-    0x0E,
-    0x0C,
-    0x2F,
-    0x44,
-    0x82,
-    0x17,
-    0x04,
-    0x41,
-    0x40,
-    0x41,
-    0x0F,
-    0x07,
-    0x2F,
-    0x03,
-    0x43,
-    0x42,
-    0x83,
-    0x47,
-    0x43,
-    0x00,
-    0x2E,
-    0x43,
-    0x40,
-    0xC1,
-    0x86,
-    0x43,
-    0x42,
-    0xB8,
-    0x2E,
-    0xB8,
-    0x2E,
-    0x89,
-    0x88,
-    0xC0,
-    0x50,
-    0x39,
-    0x8D,
-    0x88,
-    0x81,
-    0xE2,
-    0x7F,
-    0x02,
-    0x30,
-    0x05,
-    0x40,
-    0xF2,
-    0x7F,
-    0x41,
-    0xAB,
-    0x22,
-    0x30,
-    0x95,
-    0x22,
-    0x86,
-    0x41,
-    0x97,
-    0x5E,
-    0x9A,
-    0x00,
-    0x04,
-    0x41,
-    0x37,
-    0x18,
-    0x66,
-    0x01,
-    0x99,
-    0x56,
-    0xEB,
-    0x00,
-    0xC1,
-    0x7F,
-    0xB3,
-    0x7F,
-    0xD5,
-    0x7F,
-    0x48,
-    0x82,
-    0x39,
-    0x80,
-    0x82,
-    0x40,
-    0xA0,
-    0x7F,
-    0x91,
-    0x7F,
-    0x8B,
-    0x7F,
-    0x06,
-    0x30,
-    0x7B,
-    0x5A,
-    0x9B,
-    0x58,
-    0x7B,
-    0x56,
-    0x98,
-    0x2E,
-    0x71,
-    0xB2,
-    0x91,
-    0x6F,
-    0x7B,
-    0x82,
-    0xC6,
-    0x6F,
-    0x42,
-    0x40,
-    0x81,
-    0x84,
-    0x42,
-    0x42,
-    0x43,
-    0x82,
-    0x83,
-    0x8B,
-    0x42,
-    0x40,
-    0x86,
-    0x89,
-    0x7B,
-    0x82,
-    0x84,
-    0x87,
-    0x71,
-    0x7F,
-    0x80,
-    0xB2,
-    0x95,
-    0x7F,
-    0x64,
-    0x7F,
-    0x50,
-    0x7F,
-    0x02,
-    0x2F,
-    0xC5,
-    0x40,
-    0x41,
-    0x8B,
-    0xC5,
-    0x42,
-    0x87,
-    0x89,
-    0x67,
-    0x40,
-    0x07,
-    0x0F,
-    0x85,
-    0x8B,
-    0x41,
-    0x7F,
-    0x82,
-    0x8D,
-    0x47,
-    0x40,
-    0x3D,
-    0x2F,
-    0x81,
-    0x41,
-    0x01,
-    0x0E,
-    0xE1,
-    0x6F,
-    0x2E,
-    0x2F,
-    0x47,
-    0x8C,
-    0x90,
-    0x6F,
-    0x86,
-    0x41,
-    0x07,
-    0x40,
-    0xFE,
-    0x0E,
-    0x02,
-    0x2F,
-    0x04,
-    0x41,
-    0x00,
-    0xB3,
-    0x22,
-    0x2F,
-    0x45,
-    0x82,
-    0x04,
-    0x30,
-    0x41,
-    0x40,
-    0x71,
-    0x00,
-    0xF9,
-    0x0E,
-    0x37,
-    0x2F,
-    0x46,
-    0x41,
-    0x80,
-    0xA7,
-    0x01,
-    0x30,
-    0x04,
-    0x30,
-    0x0E,
-    0x2F,
-    0xE4,
-    0x6F,
-    0x01,
-    0x89,
-    0x00,
-    0x2E,
-    0x04,
-    0x41,
-    0x74,
-    0x0F,
-    0x04,
-    0x30,
-    0x07,
-    0x2F,
-    0x80,
-    0x90,
-    0x00,
-    0x2F,
-    0xC1,
-    0x42,
-    0x03,
-    0x86,
-    0x81,
-    0x84,
-    0xC2,
-    0x42,
-    0x01,
-    0x42,
-    0x14,
-    0x30,
-    0x42,
-    0x85,
-    0x41,
-    0x43,
-    0xA1,
-    0x42,
-    0x00,
-    0x2E,
-    0x82,
-    0x40,
-    0x80,
-    0x90,
-    0x1C,
-    0x2F,
-    0x01,
-    0x42,
-    0x1B,
-    0x2D,
-    0x06,
-    0x42,
-    0x19,
-    0x2C,
-    0x04,
-    0x30,
-    0xB2,
-    0x6F,
-    0xBA,
-    0x04,
-    0x02,
-    0x1E,
-    0x80,
-    0x43,
-    0x12,
-    0x30,
-    0xC0,
-    0x6F,
-    0x23,
-    0x30,
-    0x98,
-    0x2E,
-    0x74,
-    0xB5,
-    0x0E,
-    0x2C,
-    0x04,
-    0x30,
-    0xB2,
-    0x6F,
-    0xC0,
-    0x6F,
-    0xBA,
-    0x00,
-    0x51,
-    0x6F,
-    0x01,
-    0x86,
-    0x4A,
-    0x1C,
-    0xC1,
-    0x42,
-    0x22,
-    0x30,
-    0xE1,
-    0x6F,
-    0x13,
-    0x30,
-    0x98,
-    0x2E,
-    0x74,
-    0xB5,
-    0x04,
-    0x30,
-    0x52,
-    0x6F,
-    0x9D,
-    0x52,
-    0x40,
-    0x6F,
-    0xC4,
-    0x7F,
-    0x98,
-    0x2E,
-    0xE0,
-    0xB2,
-    0x41,
-    0x6F,
-    0x70,
-    0x6F,
-    0x42,
-    0x40,
-    0x9F,
-    0x52,
-    0x98,
-    0x2E,
-    0xE0,
-    0xB2,
-    0x41,
-    0x6F,
-    0x70,
-    0x6F,
-    0x42,
-    0x40,
-    0x01,
-    0x40,
-    0xD3,
-    0x6F,
-    0xD3,
-    0x00,
-    0xCB,
-    0x1E,
-    0x9F,
-    0x52,
-    0x13,
-    0x42,
-    0xB0,
-    0x7F,
-    0x98,
-    0x2E,
-    0xE0,
-    0xB2,
-    0xB0,
-    0x6F,
-    0x3E,
-    0x84,
-    0xD1,
-    0x6F,
-    0x82,
-    0x40,
-    0x03,
-    0x40,
-    0x51,
-    0x04,
-    0x59,
-    0x1C,
-    0x01,
-    0x42,
-    0x02,
-    0x82,
-    0xA0,
-    0x6F,
-    0x42,
-    0x40,
-    0x03,
-    0x40,
-    0xD3,
-    0x0F,
-    0x00,
-    0x30,
-    0x14,
-    0x30,
-    0x60,
-    0x22,
-    0xC5,
-    0x6F,
-    0x40,
-    0x91,
-    0x01,
-    0x2F,
-    0x53,
-    0x0E,
-    0x26,
-    0x2F,
-    0xE5,
-    0x6F,
-    0x48,
-    0x85,
-    0x00,
-    0x2E,
-    0x83,
-    0x40,
-    0x59,
-    0x0F,
-    0x20,
-    0x2F,
-    0x62,
-    0x6F,
-    0x4B,
-    0x8F,
-    0x85,
-    0x40,
-    0xC7,
-    0x41,
-    0x7F,
-    0x8D,
-    0x6F,
-    0x0F,
-    0xA6,
-    0x15,
-    0x17,
-    0x30,
-    0x04,
-    0x30,
-    0x0F,
-    0x2F,
-    0xE0,
-    0x6F,
-    0x0C,
-    0x80,
-    0x00,
-    0x2E,
-    0x07,
-    0x40,
-    0x3E,
-    0x08,
-    0x00,
-    0xB2,
-    0x00,
-    0x30,
-    0x06,
-    0x2F,
-    0x59,
-    0x1A,
-    0x04,
-    0x2F,
-    0xFD,
-    0x12,
-    0xC0,
-    0x90,
-    0x13,
-    0x30,
-    0x4B,
-    0x22,
-    0x06,
-    0x25,
-    0x71,
-    0x25,
-    0xC0,
-    0xB3,
-    0x04,
-    0x2F,
-    0xA4,
-    0x42,
-    0xA4,
-    0x42,
-    0x83,
-    0x82,
-    0x84,
-    0x42,
-    0x44,
-    0x42,
-    0x00,
-    0x2E,
-    0x8B,
-    0x6F,
-    0x40,
-    0x5F,
-    0xB8,
-    0x2E,
-    0x07,
-    0x2E,
-    0x1B,
-    0x01,
-    0x36,
-    0xBD,
-    0x30,
-    0x50,
-    0x2F,
-    0xB9,
-    0x03,
-    0x2E,
-    0x6A,
-    0x00,
-    0x09,
-    0x2E,
-    0x69,
-    0x00,
-    0x80,
-    0xB2,
-    0xF0,
-    0x7F,
-    0x90,
-    0x2E,
-    0x19,
-    0xB7,
-    0xA1,
-    0x54,
-    0x82,
-    0x80,
-    0xB7,
-    0xBE,
-    0x06,
-    0x40,
-    0xE9,
-    0xBF,
-    0x82,
-    0x40,
-    0x01,
-    0x2E,
-    0x6B,
-    0x00,
-    0x07,
-    0x2E,
-    0x00,
-    0xF0,
-    0x21,
-    0xBD,
-    0xF6,
-    0x30,
-    0xD7,
-    0xBA,
-    0x9E,
-    0x09,
-    0x00,
-    0xB2,
-    0x21,
-    0xB9,
-    0xF9,
-    0xBB,
-    0xEB,
-    0x7F,
-    0x51,
-    0x2F,
-    0x09,
-    0x2E,
-    0x6C,
-    0x00,
-    0x01,
-    0xB2,
-    0x3F,
-    0x89,
-    0x21,
-    0x2F,
-    0x02,
-    0x90,
-    0x1D,
-    0x2F,
-    0x29,
-    0x2E,
-    0x6C,
-    0x00,
-    0xF1,
-    0x6F,
-    0x98,
-    0x2E,
-    0x26,
-    0xB7,
-    0x00,
-    0x90,
-    0x00,
-    0x30,
-    0x06,
-    0x2F,
-    0x05,
-    0x2E,
-    0x6C,
-    0x00,
-    0x80,
-    0x90,
-    0x07,
-    0x2F,
-    0x21,
-    0x2E,
-    0x6B,
-    0x00,
-    0x05,
-    0x2D,
-    0x02,
-    0x31,
-    0x25,
-    0x2E,
-    0x5E,
-    0xF0,
-    0x21,
-    0x2E,
-    0x6B,
-    0x00,
-    0xF2,
-    0x6F,
-    0xA3,
-    0x50,
-    0x91,
-    0x40,
-    0x11,
-    0x42,
-    0x00,
-    0x2E,
-    0x91,
-    0x40,
-    0x11,
-    0x42,
-    0x00,
-    0x2E,
-    0x82,
-    0x40,
-    0x02,
-    0x42,
-    0x59,
-    0x2C,
-    0xEB,
-    0x6F,
-    0x00,
-    0xB3,
-    0x29,
-    0x2E,
-    0x6C,
-    0x00,
-    0x16,
-    0x2F,
-    0x08,
-    0x91,
-    0x51,
-    0x2F,
-    0x75,
-    0x50,
-    0xD8,
-    0x0F,
-    0x4E,
-    0x2F,
-    0x40,
-    0x90,
-    0x4C,
-    0x2F,
-    0x01,
-    0x2E,
-    0x00,
-    0xF0,
-    0x0C,
-    0xBC,
-    0x0C,
-    0xB8,
-    0x05,
-    0xA2,
-    0x46,
-    0x2F,
-    0x97,
-    0x50,
-    0x30,
-    0x0A,
-    0x12,
-    0x30,
-    0x27,
-    0x2E,
-    0x69,
-    0x00,
-    0x21,
-    0x2E,
-    0x00,
-    0xF0,
-    0x25,
-    0x2E,
-    0x6A,
-    0x00,
-    0x3D,
-    0x2D,
-    0x20,
-    0x30,
-    0x21,
-    0x2E,
-    0x6B,
-    0x00,
-    0x2F,
-    0x2E,
-    0x6C,
-    0x00,
-    0xF2,
-    0x6F,
-    0xA3,
-    0x50,
-    0x91,
-    0x40,
-    0x11,
-    0x42,
-    0x00,
-    0x2E,
-    0x91,
-    0x40,
-    0x11,
-    0x42,
-    0x00,
-    0x2E,
-    0x82,
-    0x40,
-    0x2E,
-    0x2C,
-    0x02,
-    0x42,
-    0x41,
-    0x90,
-    0xD5,
-    0x7F,
-    0x07,
-    0x2F,
-    0xA5,
-    0x50,
-    0x20,
-    0x08,
-    0x06,
-    0x0A,
-    0x0B,
-    0x30,
-    0x21,
-    0x2E,
-    0x00,
-    0xF0,
-    0x37,
-    0x2E,
-    0x6A,
-    0x00,
-    0xF1,
-    0x6F,
-    0x98,
-    0x2E,
-    0x26,
-    0xB7,
-    0x00,
-    0xB2,
-    0x05,
-    0x2F,
-    0xD2,
-    0x6F,
-    0x10,
-    0x30,
-    0x25,
-    0x2E,
-    0x6C,
-    0x00,
-    0x21,
-    0x2E,
-    0x6B,
-    0x00,
-    0xF2,
-    0x6F,
-    0xA3,
-    0x50,
-    0x91,
-    0x40,
-    0x11,
-    0x42,
-    0x00,
-    0x2E,
-    0x91,
-    0x40,
-    0x11,
-    0x42,
-    0x00,
-    0x2E,
-    0x82,
-    0x40,
-    0xEB,
-    0x6F,
-    0x0C,
-    0x2C,
-    0x02,
-    0x42,
-    0x41,
-    0x90,
-    0x00,
-    0x30,
-    0x03,
-    0x2F,
-    0x29,
-    0x2E,
-    0x00,
-    0xF0,
-    0x21,
-    0x2E,
-    0x6A,
-    0x00,
-    0x21,
-    0x2E,
-    0x6B,
-    0x00,
-    0x21,
-    0x2E,
-    0x6C,
-    0x00,
-    0xD0,
-    0x5F,
-    0xB8,
-    0x2E,
-    0xA3,
-    0x58,
-    0x00,
-    0x30,
-    0x15,
-    0x41,
-    0x56,
-    0x40,
-    0xC6,
-    0x05,
-    0x13,
-    0x41,
-    0x56,
-    0x40,
-    0x04,
-    0x41,
-    0x6F,
-    0x29,
-    0x41,
-    0x40,
-    0xC6,
-    0x05,
-    0x41,
-    0x04,
-    0x61,
-    0x28,
-    0x85,
-    0x05,
-    0x40,
-    0xA9,
-    0x30,
-    0x50,
-    0xDF,
-    0x28,
-    0x2E,
-    0x23,
-    0xE3,
-    0x7F,
-    0xF1,
-    0x7F,
-    0x62,
-    0x0F,
-    0x0B,
-    0x2F,
-    0xE1,
-    0x6F,
-    0x40,
-    0xA8,
-    0xC1,
-    0x04,
-    0x4B,
-    0x22,
-    0x4A,
-    0x0F,
-    0x05,
-    0x2F,
-    0xF1,
-    0x6F,
-    0x40,
-    0xA8,
-    0xC1,
-    0x04,
-    0x4B,
-    0x22,
-    0xCA,
-    0x0E,
-    0x00,
-    0x2F,
-    0x10,
-    0x30,
-    0xD0,
-    0x5F,
-    0xB8,
-    0x2E,
-    0x05,
-    0x2E,
-    0x98,
-    0x00,
-    0x81,
-    0x82,
-    0xA0,
-    0x50,
-    0x41,
-    0x40,
-    0x3A,
-    0x25,
-    0xF6,
-    0x86,
-    0x13,
-    0xBE,
-    0x4F,
-    0xBA,
-    0x92,
-    0xBE,
-    0xC4,
-    0x42,
-    0xDF,
-    0xBA,
-    0x11,
-    0xBF,
-    0xF3,
-    0x7F,
-    0xEF,
-    0xB9,
-    0x1F,
-    0xBA,
-    0x75,
-    0x7F,
-    0x00,
-    0xB3,
-    0x83,
-    0x7F,
-    0xEB,
-    0x7F,
-    0x08,
-    0x2F,
-    0x63,
-    0x6F,
-    0xC0,
-    0x90,
-    0x08,
-    0x2F,
-    0x73,
-    0x6F,
-    0xC0,
-    0x90,
-    0x05,
-    0x2F,
-    0x83,
-    0x6F,
-    0xC0,
-    0x90,
-    0x02,
-    0x2F,
-    0x03,
-    0x30,
-    0x27,
-    0x2E,
-    0x6D,
-    0x00,
-    0x09,
-    0x2E,
-    0x6D,
-    0x00,
-    0x00,
-    0x91,
-    0x03,
-    0x30,
-    0xA7,
-    0x5A,
-    0xAB,
-    0x5C,
-    0x07,
-    0x2F,
-    0xA7,
-    0x5E,
-    0x00,
-    0x2E,
-    0xD3,
-    0x43,
-    0x7E,
-    0x0E,
-    0xFC,
-    0x2F,
-    0x01,
-    0x89,
-    0x29,
-    0x2E,
-    0x6D,
-    0x00,
-    0x84,
-    0x40,
-    0x82,
-    0x84,
-    0x41,
-    0xBF,
-    0x84,
-    0x40,
-    0x61,
-    0xB9,
-    0x94,
-    0xBC,
-    0x14,
-    0xBB,
-    0xC4,
-    0xBC,
-    0xB2,
-    0x7F,
-    0xA3,
-    0x7F,
-    0xC3,
-    0x7F,
-    0xD3,
-    0x7F,
-    0x94,
-    0xB8,
-    0x96,
-    0x04,
-    0xA9,
-    0x58,
-    0x13,
-    0x30,
-    0xF6,
-    0x6F,
-    0x90,
-    0x7F,
-    0x00,
-    0x2E,
-    0x97,
-    0x41,
-    0xC0,
-    0x91,
-    0x07,
-    0x30,
-    0xF6,
-    0x7F,
-    0x02,
-    0x2F,
-    0x00,
-    0x2E,
-    0x3B,
-    0x2C,
-    0x47,
-    0x43,
-    0x06,
-    0x40,
-    0x80,
-    0xA9,
-    0xFE,
-    0x05,
-    0xF7,
-    0x23,
-    0x40,
-    0x41,
-    0x00,
-    0xB2,
-    0x28,
-    0x2F,
-    0x0B,
-    0x41,
-    0xFA,
-    0x0E,
-    0x05,
-    0x2F,
-    0x80,
-    0xA1,
-    0x06,
-    0x30,
-    0x9E,
-    0x23,
-    0x7B,
-    0x25,
-    0x3E,
-    0x1A,
-    0x02,
-    0x2F,
-    0x00,
-    0x30,
-    0x28,
-    0x2C,
-    0x40,
-    0x43,
-    0x03,
-    0x28,
-    0x40,
-    0x43,
-    0xC1,
-    0x0E,
-    0x22,
-    0x2F,
-    0xC0,
-    0x6F,
-    0x00,
-    0x90,
-    0x1F,
-    0x2F,
-    0xA5,
-    0x7F,
-    0x5B,
-    0x25,
-    0xD6,
-    0x6F,
-    0x1E,
-    0x14,
-    0xD3,
-    0xBE,
-    0xC0,
-    0x7F,
-    0x28,
-    0x0A,
-    0xA7,
-    0x5A,
-    0xAE,
-    0x01,
-    0xAB,
-    0x5E,
-    0x0B,
-    0x30,
-    0x2E,
-    0x1A,
-    0x00,
-    0x2F,
-    0x4B,
-    0x43,
-    0x41,
-    0x8B,
-    0x21,
-    0x2E,
-    0x53,
-    0xF0,
-    0x6F,
-    0x0E,
-    0xF7,
-    0x2F,
-    0xA5,
-    0x6F,
-    0x0B,
-    0x2C,
-    0xA3,
-    0x7F,
-    0xB0,
-    0x6F,
-    0xF8,
-    0x0E,
-    0x06,
-    0x2F,
-    0x96,
-    0x6F,
-    0x43,
-    0x43,
-    0x00,
-    0x30,
-    0x86,
-    0x41,
-    0x80,
-    0xA1,
-    0x18,
-    0x22,
-    0x00,
-    0x43,
-    0x41,
-    0x8B,
-    0xD0,
-    0x6F,
-    0x01,
-    0x8C,
-    0x90,
-    0x6F,
-    0x01,
-    0x80,
-    0x01,
-    0x89,
-    0x83,
-    0xA3,
-    0xD6,
-    0x7F,
-    0xB1,
-    0x2F,
-    0xA0,
-    0x6F,
-    0x00,
-    0xB2,
-    0x02,
-    0x2F,
-    0x80,
-    0x30,
-    0x21,
-    0x2E,
-    0x5E,
-    0xF0,
-    0xEB,
-    0x6F,
-    0x60,
-    0x5F,
-    0xB8,
-    0x2E,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-)
@@ -1,3874 +0,0 @@
-CONFIG_FILE = (
-    0xC8,
-    0x2E,
-    0x00,
-    0x2E,
-    0xC8,
-    0x2E,
-    0x00,
-    0x2E,
-    0xC8,
-    0x2E,
-    0x00,
-    0x2E,
-    0xC8,
-    0x2E,
-    0x00,
-    0x2E,
-    0x80,
-    0x2E,
-    0x9C,
-    0xB0,
-    0xC8,
-    0x2E,
-    0x00,
-    0x2E,
-    0xC8,
-    0x2E,
-    0x00,
-    0x2E,
-    0x80,
-    0x2E,
-    0xCC,
-    0xB0,
-    0x80,
-    0x2E,
-    0x7A,
-    0x07,
-    0xB0,
-    0xF0,
-    0x10,
-    0x30,
-    0x21,
-    0x2E,
-    0x16,
-    0xF0,
-    0x80,
-    0x2E,
-    0xF7,
-    0x01,
-    0x5B,
-    0x50,
-    0x4F,
-    0x52,
-    0x01,
-    0x42,
-    0x3B,
-    0x80,
-    0x41,
-    0x30,
-    0x01,
-    0x42,
-    0x3C,
-    0x80,
-    0x00,
-    0x2E,
-    0x01,
-    0x40,
-    0x01,
-    0x42,
-    0x21,
-    0x2E,
-    0xFF,
-    0xAF,
-    0xB8,
-    0x2E,
-    0x86,
-    0x52,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x02,
-    0x00,
-    0x04,
-    0x00,
-    0x01,
-    0x00,
-    0x02,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x14,
-    0x01,
-    0x01,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x07,
-    0x01,
-    0x01,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x00,
-    0x01,
-    0x2E,
-    0x55,
-    0xF0,
-    0xC0,
-    0x2E,
-    0x21,
-    0x2E,
-    0x55,
-    0xF0,
-    0x30,
-    0x50,
-    0x00,
-    0x30,
-    0x53,
-    0x56,
-    0x05,
-    0x30,
-    0x05,
-    0x2C,
-    0xFB,
-    0x7F,
-    0x3E,
-    0xBE,
-    0xD2,
-    0xBA,
-    0xB2,
-    0xB9,
-    0x6C,
-    0x0B,
-    0x53,
-    0x0E,
-    0xF9,
-    0x2F,
-    0x53,
-    0x1A,
-    0x01,
-    0x2F,
-    0x4D,
-    0x0E,
-    0xF5,
-    0x2F,
-    0xD2,
-    0x7F,
-    0x04,
-    0x30,
-    0x1F,
-    0x2C,
-    0xE1,
-    0x7F,
-    0xC5,
-    0x01,
-    0xA3,
-    0x03,
-    0x72,
-    0x0E,
-    0x03,
-    0x2F,
-    0x72,
-    0x1A,
-    0x0F,
-    0x2F,
-    0x79,
-    0x0F,
-    0x0D,
-    0x2F,
-    0xE1,
-    0x6F,
-    0x4F,
-    0x04,
-    0x5F,
-    0xB9,
-    0xB1,
-    0xBF,
-    0xFA,
-    0x0B,
-    0xD2,
-    0x6F,
-    0x96,
-    0x06,
-    0xB1,
-    0x25,
-    0x51,
-    0xBF,
-    0xEB,
-    0x7F,
-    0x06,
-    0x00,
-    0xB2,
-    0x25,
-    0x27,
-    0x03,
-    0xDB,
-    0x7F,
-    0xCF,
-    0xBF,
-    0x3E,
-    0xBF,
-    0x01,
-    0xB8,
-    0xD2,
-    0xBA,
-    0x41,
-    0xBA,
-    0xB2,
-    0xB9,
-    0x07,
-    0x0A,
-    0x6E,
-    0x0B,
-    0xC0,
-    0x90,
-    0xDF,
-    0x2F,
-    0x40,
-    0x91,
-    0xDD,
-    0x2F,
-    0xFB,
-    0x6F,
-    0xD0,
-    0x5F,
-    0xB8,
-    0x2E,
-    0x10,
-    0x50,
-    0xFB,
-    0x7F,
-    0x21,
-    0x25,
-    0x98,
-    0x2E,
-    0xDE,
-    0x00,
-    0xFB,
-    0x6F,
-    0x21,
-    0x25,
-    0xF0,
-    0x5F,
-    0x10,
-    0x25,
-    0x80,
-    0x2E,
-    0x9A,
-    0x00,
-    0x83,
-    0x86,
-    0x01,
-    0x30,
-    0x00,
-    0x30,
-    0x94,
-    0x40,
-    0x24,
-    0x18,
-    0x06,
-    0x00,
-    0x53,
-    0x0E,
-    0x4F,
-    0x02,
-    0xF9,
-    0x2F,
-    0xB8,
-    0x2E,
-    0x80,
-    0xA8,
-    0x03,
-    0x25,
-    0x10,
-    0x2F,
-    0x80,
-    0x90,
-    0x01,
-    0x2F,
-    0x41,
-    0x0E,
-    0x0C,
-    0x2F,
-    0xF3,
-    0x3F,
-    0x18,
-    0x05,
-    0x05,
-    0x30,
-    0x5D,
-    0x07,
-    0x15,
-    0x0E,
-    0x03,
-    0x2F,
-    0x55,
-    0x1A,
-    0x02,
-    0x2F,
-    0xCC,
-    0x0F,
-    0x00,
-    0x2F,
-    0x58,
-    0x04,
-    0x01,
-    0x25,
-    0xB8,
-    0x2E,
-    0xB8,
-    0x2E,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0xFD,
-    0x2D,
-    0xAA,
-    0x00,
-    0x05,
-    0x00,
-    0xAA,
-    0x00,
-    0x05,
-    0x00,
-    0x00,
-    0x02,
-    0x00,
-    0x01,
-    0x00,
-    0x20,
-    0x00,
-    0x00,
-    0x06,
-    0x00,
-    0x09,
-    0x00,
-    0x82,
-    0x00,
-    0x06,
-    0x00,
-    0x06,
-    0x00,
-    0x08,
-    0x00,
-    0x50,
-    0x00,
-    0x00,
-    0x00,
-    0x4C,
-    0x04,
-    0x02,
-    0x00,
-    0x03,
-    0x00,
-    0x00,
-    0x00,
-    0x70,
-    0x01,
-    0xCD,
-    0x20,
-    0x27,
-    0x00,
-    0x40,
-    0x74,
-    0x88,
-    0x00,
-    0x63,
-    0x00,
-    0x00,
-    0x01,
-    0x6C,
-    0x00,
-    0x02,
-    0x01,
-    0x04,
-    0x01,
-    0x57,
-    0x00,
-    0x54,
-    0x00,
-    0xAF,
-    0x00,
-    0xFF,
-    0x00,
-    0xEC,
-    0x00,
-    0xFF,
-    0xB7,
-    0x00,
-    0x02,
-    0x00,
-    0xB0,
-    0x05,
-    0x80,
-    0x80,
-    0x00,
-    0xC9,
-    0xF0,
-    0x00,
-    0x40,
-    0xFF,
-    0x7F,
-    0x00,
-    0x80,
-    0x88,
-    0x00,
-    0x5E,
-    0xF0,
-    0x59,
-    0xF0,
-    0xC0,
-    0x00,
-    0x39,
-    0xF0,
-    0x5A,
-    0x00,
-    0x89,
-    0xF0,
-    0x57,
-    0x00,
-    0x00,
-    0x20,
-    0x75,
-    0x00,
-    0x7A,
-    0x00,
-    0x85,
-    0x00,
-    0x52,
-    0xF0,
-    0x50,
-    0x00,
-    0x9A,
-    0x01,
-    0x00,
-    0x0C,
-    0x89,
-    0x00,
-    0x00,
-    0x08,
-    0x00,
-    0xF8,
-    0xA0,
-    0x00,
-    0xE8,
-    0x03,
-    0x01,
-    0x80,
-    0xB8,
-    0x7E,
-    0xE1,
-    0x7A,
-    0x51,
-    0x52,
-    0x41,
-    0x50,
-    0x60,
-    0x42,
-    0x00,
-    0x3F,
-    0x43,
-    0x54,
-    0x42,
-    0x42,
-    0x69,
-    0x82,
-    0x45,
-    0x54,
-    0x42,
-    0x42,
-    0x42,
-    0x82,
-    0x0B,
-    0x31,
-    0x42,
-    0x40,
-    0x10,
-    0x08,
-    0x50,
-    0x42,
-    0x7E,
-    0x80,
-    0x4B,
-    0x42,
-    0x91,
-    0x31,
-    0x01,
-    0x42,
-    0x10,
-    0x50,
-    0x03,
-    0x2E,
-    0x40,
-    0xF0,
-    0x56,
-    0x90,
-    0x08,
-    0x80,
-    0xF0,
-    0x7F,
-    0x31,
-    0x30,
-    0x1F,
-    0x2F,
-    0x03,
-    0x30,
-    0x4D,
-    0x52,
-    0x47,
-    0x54,
-    0x04,
-    0x35,
-    0x06,
-    0x30,
-    0x49,
-    0x50,
-    0x55,
-    0x32,
-    0x1D,
-    0x1A,
-    0xE3,
-    0x22,
-    0x18,
-    0x1A,
-    0x4B,
-    0x58,
-    0xE3,
-    0x22,
-    0x04,
-    0x30,
-    0xD5,
-    0x40,
-    0xB5,
-    0x0D,
-    0xE1,
-    0xBE,
-    0x6F,
-    0xBB,
-    0x80,
-    0x91,
-    0xA9,
-    0x0D,
-    0x01,
-    0x89,
-    0xB5,
-    0x23,
-    0x10,
-    0xA1,
-    0xF7,
-    0x2F,
-    0xDA,
-    0x0E,
-    0x04,
-    0x35,
-    0xEB,
-    0x2F,
-    0x01,
-    0x2E,
-    0x25,
-    0x00,
-    0x70,
-    0x1A,
-    0x00,
-    0x30,
-    0x21,
-    0x30,
-    0x48,
-    0x22,
-    0x40,
-    0xB2,
-    0x06,
-    0x2F,
-    0x23,
-    0x2E,
-    0x59,
-    0xF0,
-    0x98,
-    0x2E,
-    0x95,
-    0x00,
-    0x00,
-    0x2E,
-    0x00,
-    0x2E,
-    0xD0,
-    0x2E,
-    0xF0,
-    0x6F,
-    0x01,
-    0x31,
-    0x20,
-    0x26,
-    0x01,
-    0x42,
-    0x98,
-    0x2E,
-    0x7D,
-    0xB0,
-    0x10,
-    0x30,
-    0x21,
-    0x2E,
-    0x59,
-    0xF0,
-    0x98,
-    0x2E,
-    0x95,
-    0x00,
-    0x33,
-    0x50,
-    0x35,
-    0x52,
-    0x98,
-    0x2E,
-    0x7C,
-    0xB1,
-    0x33,
-    0x50,
-    0x05,
-    0x84,
-    0x14,
-    0x30,
-    0x37,
-    0x50,
-    0x63,
-    0x30,
-    0x39,
-    0x52,
-    0x94,
-    0x42,
-    0x83,
-    0x42,
-    0x98,
-    0x2E,
-    0x7C,
-    0xB1,
-    0x37,
-    0x50,
-    0x06,
-    0x80,
-    0x71,
-    0x30,
-    0x3B,
-    0x54,
-    0x01,
-    0x42,
-    0x25,
-    0x2E,
-    0x88,
-    0x00,
-    0x00,
-    0x2E,
-    0x00,
-    0x2E,
-    0xD0,
-    0x2E,
-    0x98,
-    0x2E,
-    0x63,
-    0xB0,
-    0x01,
-    0x2E,
-    0x5B,
-    0x00,
-    0x00,
-    0xB2,
-    0x17,
-    0x2F,
-    0x00,
-    0x30,
-    0x21,
-    0x2E,
-    0x5B,
-    0x00,
-    0x3D,
-    0x50,
-    0x98,
-    0x2E,
-    0x23,
-    0xB0,
-    0x3D,
-    0x50,
-    0x98,
-    0x2E,
-    0x24,
-    0xB4,
-    0x01,
-    0x2E,
-    0x03,
-    0xF0,
-    0x0D,
-    0xBC,
-    0x0F,
-    0xB8,
-    0x00,
-    0x90,
-    0x08,
-    0x2F,
-    0x4F,
-    0x50,
-    0x21,
-    0x2E,
-    0xBC,
-    0xF0,
-    0x00,
-    0x30,
-    0x11,
-    0x30,
-    0x21,
-    0x2E,
-    0x54,
-    0xF0,
-    0x23,
-    0x2E,
-    0x62,
-    0x00,
-    0x01,
-    0x2E,
-    0x5A,
-    0x00,
-    0x00,
-    0xB2,
-    0x27,
-    0x2F,
-    0x00,
-    0x30,
-    0x21,
-    0x2E,
-    0x5A,
-    0x00,
-    0x3F,
-    0x50,
-    0x98,
-    0x2E,
-    0x23,
-    0xB0,
-    0x3F,
-    0x50,
-    0x33,
-    0x52,
-    0x98,
-    0x2E,
-    0x8D,
-    0xB1,
-    0x3F,
-    0x50,
-    0x37,
-    0x52,
-    0x98,
-    0x2E,
-    0x8D,
-    0xB1,
-    0x3F,
-    0x50,
-    0x98,
-    0x2E,
-    0xDD,
-    0xB3,
-    0x3F,
-    0x50,
-    0x98,
-    0x2E,
-    0x49,
-    0xB2,
-    0x01,
-    0x2E,
-    0x07,
-    0x01,
-    0x8F,
-    0xBC,
-    0x9F,
-    0xB8,
-    0x40,
-    0x90,
-    0x4F,
-    0x52,
-    0x0A,
-    0x2F,
-    0x0E,
-    0xBD,
-    0x2F,
-    0xB9,
-    0x80,
-    0x90,
-    0x06,
-    0x2F,
-    0x0D,
-    0xBC,
-    0x0F,
-    0xB8,
-    0x00,
-    0x90,
-    0x02,
-    0x2F,
-    0x23,
-    0x2E,
-    0xBC,
-    0xF0,
-    0x02,
-    0x2D,
-    0x23,
-    0x2E,
-    0xBA,
-    0xF0,
-    0x98,
-    0x2E,
-    0x95,
-    0x00,
-    0xB0,
-    0x2D,
-    0x1A,
-    0x24,
-    0x26,
-    0x00,
-    0x80,
-    0x2E,
-    0x44,
-    0x01,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0x80,
-    0x2E,
-    0x18,
-    0x00,
-    0xFD,
-    0x2D,
-    0x94,
-    0x01,
-    0xDD,
-    0x03,
-    0xC0,
-    0xAD,
-    0x0B,
-    0x2F,
-    0xC0,
-    0xA8,
-    0x03,
-    0x2F,
-    0xC0,
-    0x90,
-    0x07,
-    0x2F,
-    0x80,
-    0xA6,
-    0x05,
-    0x2F,
-    0x40,
-    0xA9,
-    0x12,
-    0x2F,
-    0x40,
-    0x91,
-    0x01,
-    0x2F,
-    0x00,
-    0xAB,
-    0x0E,
-    0x2F,
-    0xC0,
-    0xAC,
-    0x00,
-    0x30,
-    0x57,
-    0x52,
-    0x07,
-    0x2F,
-    0xC0,
-    0xA9,
-    0x03,
-    0x2F,
-    0xC0,
-    0x91,
-    0x03,
-    0x2F,
-    0x80,
-    0xA7,
-    0x01,
-    0x2F,
-    0x40,
-    0xA1,
-    0x05,
-    0x2F,
-    0xC0,
-    0x2E,
-    0x17,
-    0x25,
-    0x06,
-    0x25,
-    0xC0,
-    0x2E,
-    0xF0,
-    0x3F,
-    0x55,
-    0x52,
-    0xB8,
-    0x2E,
-    0x60,
-    0x50,
-    0x03,
-    0x2E,
-    0x18,
-    0x01,
-    0xE0,
-    0x7F,
-    0xF1,
-    0x7F,
-    0xDB,
-    0x7F,
-    0x30,
-    0x30,
-    0x59,
-    0x54,
-    0x0A,
-    0x1A,
-    0x28,
-    0x2F,
-    0x1A,
-    0x25,
-    0x7A,
-    0x82,
-    0x00,
-    0x30,
-    0x43,
-    0x30,
-    0x32,
-    0x30,
-    0x05,
-    0x30,
-    0x04,
-    0x30,
-    0xF6,
-    0x6F,
-    0xF2,
-    0x09,
-    0xFC,
-    0x13,
-    0xC2,
-    0xAB,
-    0xB3,
-    0x09,
-    0xEF,
-    0x23,
-    0x80,
-    0xB3,
-    0xE6,
-    0x6F,
-    0xB7,
-    0x01,
-    0x00,
-    0x2E,
-    0x8B,
-    0x41,
-    0x4B,
-    0x42,
-    0x03,
-    0x2F,
-    0x46,
-    0x40,
-    0x86,
-    0x17,
-    0x81,
-    0x8D,
-    0x46,
-    0x42,
-    0x41,
-    0x8B,
-    0x23,
-    0xBD,
-    0xB3,
-    0xBD,
-    0x03,
-    0x89,
-    0x41,
-    0x82,
-    0x07,
-    0x0C,
-    0x43,
-    0xA3,
-    0xE6,
-    0x2F,
-    0xE1,
-    0x6F,
-    0xA2,
-    0x6F,
-    0x52,
-    0x42,
-    0x00,
-    0x2E,
-    0xB2,
-    0x6F,
-    0x52,
-    0x42,
-    0x00,
-    0x2E,
-    0xC2,
-    0x6F,
-    0x42,
-    0x42,
-    0x03,
-    0xB2,
-    0x03,
-    0x2E,
-    0x59,
-    0xF0,
-    0xF3,
-    0x3D,
-    0x02,
-    0x32,
-    0x0B,
-    0x08,
-    0x8A,
-    0x0A,
-    0xDB,
-    0x6F,
-    0x02,
-    0x22,
-    0xA0,
-    0x5F,
-    0x21,
-    0x2E,
-    0x59,
-    0xF0,
-    0xB8,
-    0x2E,
-    0x07,
-    0x2E,
-    0x00,
-    0xF0,
-    0x03,
-    0x2E,
-    0x00,
-    0xF0,
-    0x5D,
-    0x50,
-    0x9C,
-    0xBE,
-    0x02,
-    0x40,
-    0x4F,
-    0x52,
-    0xF4,
-    0x33,
-    0xDC,
-    0xBA,
-    0xD9,
-    0x0F,
-    0x94,
-    0x08,
-    0x06,
-    0x2F,
-    0x49,
-    0xAF,
-    0x04,
-    0x2F,
-    0x51,
-    0x0A,
-    0x02,
-    0x34,
-    0x47,
-    0xA3,
-    0x8A,
-    0x0A,
-    0x91,
-    0x22,
-    0x3C,
-    0x80,
-    0x25,
-    0x2E,
-    0x59,
-    0xF0,
-    0x01,
-    0x40,
-    0x01,
-    0x42,
-    0xB8,
-    0x2E,
-    0x01,
-    0x2E,
-    0xB1,
-    0xF0,
-    0x5F,
-    0x52,
-    0x01,
-    0x0A,
-    0x05,
-    0x2E,
-    0x07,
-    0x01,
-    0x2F,
-    0xBD,
-    0x21,
-    0x2E,
-    0xB1,
-    0xF0,
-    0xAF,
-    0xB8,
-    0x40,
-    0x90,
-    0x4F,
-    0x50,
-    0x0E,
-    0x2F,
-    0x03,
-    0x2E,
-    0x07,
-    0x01,
-    0x9E,
-    0xBC,
-    0x9F,
-    0xB8,
-    0x40,
-    0x90,
-    0x08,
-    0x2F,
-    0x03,
-    0x2E,
-    0x07,
-    0x01,
-    0x9D,
-    0xBC,
-    0x9F,
-    0xB8,
-    0x40,
-    0x90,
-    0x02,
-    0x2F,
-    0xC0,
-    0x2E,
-    0x21,
-    0x2E,
-    0xBC,
-    0xF0,
-    0xC0,
-    0x2E,
-    0x21,
-    0x2E,
-    0xBA,
-    0xF0,
-    0x70,
-    0x50,
-    0xF7,
-    0x7F,
-    0x00,
-    0x2E,
-    0x0F,
-    0x2E,
-    0xB8,
-    0xF0,
-    0xF8,
-    0xBF,
-    0xFF,
-    0xBB,
-    0xC0,
-    0xB3,
-    0x23,
-    0x2F,
-    0xB2,
-    0x7F,
-    0x94,
-    0x7F,
-    0xC6,
-    0x7F,
-    0xE5,
-    0x7F,
-    0xD3,
-    0x7F,
-    0xA1,
-    0x7F,
-    0x35,
-    0x30,
-    0x05,
-    0x2E,
-    0x01,
-    0xF0,
-    0x2E,
-    0xBD,
-    0x2E,
-    0xBB,
-    0x61,
-    0x58,
-    0x6E,
-    0x05,
-    0x3D,
-    0x56,
-    0x63,
-    0x54,
-    0x11,
-    0x30,
-    0x27,
-    0x41,
-    0x06,
-    0x41,
-    0xF8,
-    0xBF,
-    0xBE,
-    0x0B,
-    0xB5,
-    0x11,
-    0xD6,
-    0x42,
-    0x03,
-    0x89,
-    0x5A,
-    0x0E,
-    0xF6,
-    0x2F,
-    0x23,
-    0x2E,
-    0x5B,
-    0x00,
-    0x4F,
-    0x52,
-    0x23,
-    0x2E,
-    0xB8,
-    0xF0,
-    0xB2,
-    0x6F,
-    0xE5,
-    0x6F,
-    0xD3,
-    0x6F,
-    0xA1,
-    0x6F,
-    0x94,
-    0x6F,
-    0xC6,
-    0x6F,
-    0xF7,
-    0x6F,
-    0x90,
-    0x5F,
-    0xC8,
-    0x2E,
-    0x60,
-    0x50,
-    0xC3,
-    0x7F,
-    0xD4,
-    0x7F,
-    0xE7,
-    0x7F,
-    0xF6,
-    0x7F,
-    0xB2,
-    0x7F,
-    0xA5,
-    0x7F,
-    0x36,
-    0x30,
-    0x07,
-    0x2E,
-    0x01,
-    0xF0,
-    0xBE,
-    0xBD,
-    0xBE,
-    0xBB,
-    0x65,
-    0x58,
-    0x77,
-    0x05,
-    0x3F,
-    0x56,
-    0x67,
-    0x54,
-    0x27,
-    0x41,
-    0x06,
-    0x41,
-    0xF8,
-    0xBF,
-    0xBE,
-    0x0B,
-    0xB5,
-    0x11,
-    0xD6,
-    0x42,
-    0x03,
-    0x89,
-    0x5A,
-    0x0E,
-    0xF6,
-    0x2F,
-    0x12,
-    0x30,
-    0x25,
-    0x2E,
-    0x5A,
-    0x00,
-    0x02,
-    0x31,
-    0x25,
-    0x2E,
-    0xB8,
-    0xF0,
-    0xD4,
-    0x6F,
-    0xC3,
-    0x6F,
-    0xE7,
-    0x6F,
-    0xB2,
-    0x6F,
-    0xA5,
-    0x6F,
-    0xF6,
-    0x6F,
-    0xA0,
-    0x5F,
-    0xC8,
-    0x2E,
-    0x70,
-    0x50,
-    0x42,
-    0x8E,
-    0xD4,
-    0x7F,
-    0xF6,
-    0x7F,
-    0x47,
-    0x25,
-    0x1A,
-    0x18,
-    0x69,
-    0x52,
-    0xF1,
-    0x00,
-    0x64,
-    0x25,
-    0x01,
-    0x30,
-    0x39,
-    0x02,
-    0x94,
-    0x41,
-    0x81,
-    0x41,
-    0xE2,
-    0x7F,
-    0xBE,
-    0xBB,
-    0xBD,
-    0x8D,
-    0x02,
-    0xBD,
-    0xB5,
-    0x7F,
-    0x8E,
-    0xB5,
-    0xBA,
-    0x0A,
-    0xC6,
-    0x7F,
-    0xAB,
-    0x7F,
-    0x51,
-    0x25,
-    0x98,
-    0x2E,
-    0x00,
-    0xB0,
-    0xD5,
-    0x6F,
-    0xE2,
-    0x6F,
-    0x2A,
-    0x18,
-    0x69,
-    0x54,
-    0xB2,
-    0x01,
-    0x02,
-    0x30,
-    0xC4,
-    0x6F,
-    0x7A,
-    0x03,
-    0x12,
-    0x41,
-    0x74,
-    0x25,
-    0xD0,
-    0x7F,
-    0x52,
-    0xBC,
-    0xD3,
-    0x41,
-    0x6E,
-    0xBA,
-    0xDE,
-    0xB6,
-    0x20,
-    0x0B,
-    0xC7,
-    0x7F,
-    0x91,
-    0x7F,
-    0x98,
-    0x2E,
-    0x00,
-    0xB0,
-    0xF2,
-    0x6F,
-    0xD5,
-    0x6F,
-    0xCA,
-    0x16,
-    0x55,
-    0x18,
-    0xDD,
-    0x18,
-    0x95,
-    0x6F,
-    0xEA,
-    0x18,
-    0x69,
-    0x5A,
-    0x31,
-    0x25,
-    0x75,
-    0x01,
-    0x01,
-    0x30,
-    0x20,
-    0x25,
-    0x39,
-    0x02,
-    0x5E,
-    0xBA,
-    0x82,
-    0xBC,
-    0x8E,
-    0xB6,
-    0x21,
-    0x0B,
-    0x98,
-    0x2E,
-    0x00,
-    0xB0,
-    0xE2,
-    0x6F,
-    0xB5,
-    0x6F,
-    0x2A,
-    0x18,
-    0xE0,
-    0x7F,
-    0xF1,
-    0x7F,
-    0x04,
-    0x30,
-    0x69,
-    0x54,
-    0xF2,
-    0x00,
-    0x7C,
-    0x02,
-    0x85,
-    0x6F,
-    0xD0,
-    0x6F,
-    0x0D,
-    0x17,
-    0x68,
-    0x18,
-    0xE0,
-    0x18,
-    0x90,
-    0x6F,
-    0xC4,
-    0x6F,
-    0xC5,
-    0x18,
-    0xEB,
-    0x6F,
-    0xB2,
-    0x01,
-    0x1B,
-    0x43,
-    0x02,
-    0x30,
-    0x7A,
-    0x03,
-    0xFB,
-    0x6F,
-    0x3D,
-    0x8F,
-    0x0B,
-    0x43,
-    0x3E,
-    0xBA,
-    0x12,
-    0xBD,
-    0x52,
-    0xBC,
-    0x6E,
-    0xBB,
-    0xA2,
-    0x0A,
-    0x9E,
-    0xB5,
-    0xDE,
-    0xB6,
-    0x30,
-    0x0B,
-    0xF7,
-    0x7F,
-    0x98,
-    0x2E,
-    0x00,
-    0xB0,
-    0xF5,
-    0x6F,
-    0x31,
-    0x25,
-    0xD1,
-    0x6F,
-    0x92,
-    0x6F,
-    0xAB,
-    0x6F,
-    0x50,
-    0x43,
-    0x43,
-    0x43,
-    0x90,
-    0x5F,
-    0x55,
-    0x56,
-    0x80,
-    0x2E,
-    0xE8,
-    0x00,
-    0x10,
-    0x50,
-    0x03,
-    0x40,
-    0x19,
-    0x18,
-    0x57,
-    0x56,
-    0x19,
-    0x05,
-    0x36,
-    0x25,
-    0xF7,
-    0x7F,
-    0x4A,
-    0x17,
-    0x54,
-    0x18,
-    0xEC,
-    0x18,
-    0x09,
-    0x17,
-    0x01,
-    0x30,
-    0x0C,
-    0x07,
-    0xE2,
-    0x18,
-    0xDE,
-    0x00,
-    0xF2,
-    0x6F,
-    0x97,
-    0x02,
-    0x53,
-    0x58,
-    0xDC,
-    0x00,
-    0x91,
-    0x02,
-    0xBF,
-    0xB8,
-    0x21,
-    0xBD,
-    0x8A,
-    0x0A,
-    0xC0,
-    0x2E,
-    0x02,
-    0x42,
-    0xF0,
-    0x5F,
-    0x09,
-    0x86,
-    0x02,
-    0x30,
-    0x12,
-    0x42,
-    0x43,
-    0x0E,
-    0xFC,
-    0x2F,
-    0x37,
-    0x80,
-    0x13,
-    0x30,
-    0x13,
-    0x42,
-    0x12,
-    0x42,
-    0x12,
-    0x42,
-    0x12,
-    0x42,
-    0x02,
-    0x42,
-    0x03,
-    0x80,
-    0x41,
-    0x84,
-    0x11,
-    0x42,
-    0x02,
-    0x42,
-    0xB8,
-    0x2E,
-    0x46,
-    0x84,
-    0x80,
-    0x50,
-    0xA3,
-    0x40,
-    0x83,
-    0x88,
-    0x82,
-    0x40,
-    0x04,
-    0x41,
-    0xC3,
-    0x7F,
-    0x42,
-    0x8A,
-    0x06,
-    0x41,
-    0x6D,
-    0xBB,
-    0xF6,
-    0x7F,
-    0x80,
-    0xB3,
-    0xD5,
-    0x7F,
-    0xE0,
-    0x7F,
-    0x59,
-    0x2F,
-    0x31,
-    0x25,
-    0x55,
-    0x40,
-    0x41,
-    0x91,
-    0xB1,
-    0x7F,
-    0x0F,
-    0x2F,
-    0x01,
-    0x30,
-    0xC1,
-    0x42,
-    0x00,
-    0x2E,
-    0xD2,
-    0x6F,
-    0x13,
-    0x40,
-    0x93,
-    0x42,
-    0x00,
-    0x2E,
-    0x13,
-    0x40,
-    0x93,
-    0x42,
-    0x00,
-    0x2E,
-    0x00,
-    0x40,
-    0x80,
-    0x42,
-    0xBD,
-    0x80,
-    0xC0,
-    0x2E,
-    0x01,
-    0x42,
-    0x80,
-    0x5F,
-    0xC7,
-    0x86,
-    0x01,
-    0x30,
-    0xC5,
-    0x40,
-    0xFB,
-    0x86,
-    0x45,
-    0x41,
-    0x04,
-    0x41,
-    0x43,
-    0xBE,
-    0xD5,
-    0xBE,
-    0x43,
-    0xBA,
-    0xD5,
-    0xBA,
-    0x84,
-    0x7F,
-    0x95,
-    0x7F,
-    0xA1,
-    0x7F,
-    0x14,
-    0x30,
-    0x61,
-    0x15,
-    0xF5,
-    0x09,
-    0x15,
-    0x40,
-    0xC0,
-    0xB3,
-    0x0B,
-    0x2F,
-    0xC6,
-    0x40,
-    0xAE,
-    0x05,
-    0x07,
-    0x30,
-    0xFE,
-    0x05,
-    0x80,
-    0xA9,
-    0xB7,
-    0x23,
-    0x97,
-    0x6F,
-    0x77,
-    0x0F,
-    0xA6,
-    0x6F,
-    0xE6,
-    0x23,
-    0xF6,
-    0x6F,
-    0xA7,
-    0x7F,
-    0x80,
-    0x90,
-    0x00,
-    0x2F,
-    0xC5,
-    0x42,
-    0x41,
-    0x82,
-    0xC1,
-    0x86,
-    0x43,
-    0xA2,
-    0xE7,
-    0x2F,
-    0xA1,
-    0x6F,
-    0xB0,
-    0x6F,
-    0x0A,
-    0x1A,
-    0x02,
-    0x2F,
-    0x01,
-    0x30,
-    0x1B,
-    0x2C,
-    0x01,
-    0x42,
-    0x01,
-    0x40,
-    0x4C,
-    0x28,
-    0x82,
-    0x6F,
-    0x01,
-    0x42,
-    0x4A,
-    0x0E,
-    0x13,
-    0x2F,
-    0xC0,
-    0x6F,
-    0x00,
-    0xB2,
-    0x03,
-    0x2F,
-    0x3F,
-    0x80,
-    0x20,
-    0x14,
-    0x21,
-    0x2E,
-    0x5E,
-    0xF0,
-    0xE1,
-    0x6F,
-    0xD0,
-    0x6F,
-    0x52,
-    0x40,
-    0x12,
-    0x42,
-    0x00,
-    0x2E,
-    0x52,
-    0x40,
-    0x12,
-    0x42,
-    0x00,
-    0x2E,
-    0x41,
-    0x40,
-    0x03,
-    0x2C,
-    0x01,
-    0x42,
-    0x10,
-    0x30,
-    0x40,
-    0x42,
-    0x80,
-    0x5F,
-    0xB8,
-    0x2E,
-    0x57,
-    0x50,
-    0x50,
-    0x1A,
-    0x04,
-    0x2F,
-    0x55,
-    0x56,
-    0x41,
-    0x80,
-    0x4B,
-    0x1A,
-    0x81,
-    0x84,
-    0x41,
-    0x22,
-    0x00,
-    0x30,
-    0xC0,
-    0x2E,
-    0x82,
-    0x04,
-    0x0A,
-    0x28,
-    0xFF,
-    0x80,
-    0x14,
-    0x30,
-    0x20,
-    0x14,
-    0x0A,
-    0x18,
-    0x08,
-    0x17,
-    0x30,
-    0x00,
-    0xC0,
-    0xB2,
-    0x3C,
-    0x03,
-    0x0B,
-    0x2F,
-    0xD0,
-    0xA0,
-    0x03,
-    0x2F,
-    0xF0,
-    0x80,
-    0x20,
-    0x10,
-    0x07,
-    0x2C,
-    0x08,
-    0x17,
-    0x05,
-    0x31,
-    0x6B,
-    0x05,
-    0x65,
-    0x15,
-    0x03,
-    0x12,
-    0x23,
-    0x11,
-    0x05,
-    0x0A,
-    0xC8,
-    0x16,
-    0x23,
-    0x1A,
-    0x04,
-    0x2F,
-    0x4A,
-    0x0C,
-    0x55,
-    0x54,
-    0xC0,
-    0x2E,
-    0x9F,
-    0xB8,
-    0x0A,
-    0x00,
-    0xB8,
-    0x2E,
-    0x40,
-    0x50,
-    0x03,
-    0x40,
-    0xC3,
-    0x82,
-    0x05,
-    0x84,
-    0xF1,
-    0x7F,
-    0xEB,
-    0x7F,
-    0x00,
-    0x30,
-    0xD1,
-    0x40,
-    0x40,
-    0xA8,
-    0x01,
-    0x04,
-    0x08,
-    0x22,
-    0x80,
-    0x42,
-    0xBC,
-    0x84,
-    0x87,
-    0x80,
-    0x82,
-    0x40,
-    0xD0,
-    0x7F,
-    0xC3,
-    0x7F,
-    0x98,
-    0x2E,
-    0xFA,
-    0xB1,
-    0xD1,
-    0x6F,
-    0x7E,
-    0x84,
-    0x40,
-    0x42,
-    0x00,
-    0x30,
-    0xC3,
-    0x6F,
-    0xF1,
-    0x6F,
-    0x59,
-    0x0E,
-    0xEB,
-    0x2F,
-    0xFD,
-    0x82,
-    0xF2,
-    0x7F,
-    0x98,
-    0x2E,
-    0xD3,
-    0x00,
-    0xF1,
-    0x6F,
-    0x7C,
-    0x82,
-    0xEB,
-    0x6F,
-    0xC0,
-    0x2E,
-    0x40,
-    0x42,
-    0xC0,
-    0x5F,
-    0x05,
-    0x2E,
-    0x14,
-    0x01,
-    0x2F,
-    0xBD,
-    0x30,
-    0x50,
-    0x2F,
-    0xB9,
-    0x80,
-    0xB2,
-    0xF0,
-    0x7F,
-    0xEB,
-    0x7F,
-    0x3E,
-    0x2F,
-    0x01,
-    0x2E,
-    0x5D,
-    0x00,
-    0x00,
-    0xB2,
-    0x6B,
-    0x50,
-    0x04,
-    0x2F,
-    0x98,
-    0x2E,
-    0x61,
-    0xB3,
-    0x00,
-    0x30,
-    0x21,
-    0x2E,
-    0x5D,
-    0x00,
-    0xF0,
-    0x6F,
-    0x6D,
-    0x54,
-    0x14,
-    0x40,
-    0x11,
-    0x40,
-    0x03,
-    0x40,
-    0x6F,
-    0x5A,
-    0x95,
-    0x42,
-    0x54,
-    0x43,
-    0x51,
-    0x43,
-    0x7E,
-    0x83,
-    0x6D,
-    0x50,
-    0xD2,
-    0x7F,
-    0xF1,
-    0x7F,
-    0x43,
-    0x43,
-    0x98,
-    0x2E,
-    0x24,
-    0xB2,
-    0x05,
-    0x2E,
-    0x5C,
-    0x00,
-    0x6B,
-    0x52,
-    0x6D,
-    0x56,
-    0x98,
-    0x2E,
-    0x9C,
-    0xB2,
-    0xF1,
-    0x6F,
-    0xD2,
-    0x6F,
-    0x53,
-    0x40,
-    0x93,
-    0x42,
-    0x73,
-    0x30,
-    0x54,
-    0x40,
-    0x94,
-    0x42,
-    0x03,
-    0x08,
-    0x41,
-    0x40,
-    0x81,
-    0x42,
-    0xF0,
-    0x7F,
-    0x00,
-    0x2E,
-    0x05,
-    0x2E,
-    0x5E,
-    0x00,
-    0x10,
-    0x1A,
-    0x09,
-    0x2F,
-    0x71,
-    0x54,
-    0x8C,
-    0x84,
-    0x21,
-    0x2E,
-    0x52,
-    0xF0,
-    0xD2,
-    0x7F,
-    0x98,
-    0x2E,
-    0x95,
-    0x00,
-    0xD0,
-    0x6F,
-    0x22,
-    0x30,
-    0x02,
-    0x42,
-    0x00,
-    0x2E,
-    0xF0,
-    0x6F,
-    0x21,
-    0x2E,
-    0x5E,
-    0x00,
-    0x08,
-    0x2D,
-    0x00,
-    0x30,
-    0x21,
-    0x2E,
-    0x52,
-    0xF0,
-    0x98,
-    0x2E,
-    0x95,
-    0x00,
-    0x10,
-    0x30,
-    0x21,
-    0x2E,
-    0x5D,
-    0x00,
-    0xEB,
-    0x6F,
-    0xD0,
-    0x5F,
-    0xB8,
-    0x2E,
-    0x90,
-    0x51,
-    0x94,
-    0x40,
-    0xC6,
-    0x80,
-    0x95,
-    0x40,
-    0xE0,
-    0x7F,
-    0xFB,
-    0x7F,
-    0xC1,
-    0x7F,
-    0x42,
-    0x82,
-    0x2B,
-    0x40,
-    0x9B,
-    0x7F,
-    0xB1,
-    0x7F,
-    0xA3,
-    0x7F,
-    0xCE,
-    0xBF,
-    0xCB,
-    0x40,
-    0x63,
-    0x40,
-    0x82,
-    0x40,
-    0x71,
-    0x7F,
-    0x28,
-    0xBD,
-    0x31,
-    0x30,
-    0xD9,
-    0x08,
-    0xFF,
-    0xBB,
-    0x28,
-    0xB9,
-    0xD7,
-    0x7F,
-    0x62,
-    0x7F,
-    0xCC,
-    0xBF,
-    0x45,
-    0xBD,
-    0x58,
-    0xBB,
-    0xFE,
-    0xBB,
-    0x73,
-    0x52,
-    0x2B,
-    0xB9,
-    0x53,
-    0x7F,
-    0x4F,
-    0x00,
-    0xD8,
-    0xBE,
-    0x80,
-    0xB2,
-    0x13,
-    0x30,
-    0x62,
-    0xBF,
-    0x80,
-    0x7F,
-    0x4A,
-    0xBE,
-    0xD8,
-    0xBA,
-    0x9A,
-    0x22,
-    0x41,
-    0x40,
-    0x4E,
-    0xBA,
-    0x00,
-    0x40,
-    0xD2,
-    0xBE,
-    0x91,
-    0xBC,
-    0xF2,
-    0x7E,
-    0x86,
-    0x04,
-    0x01,
-    0x7F,
-    0x15,
-    0x7F,
-    0x46,
-    0x7F,
-    0x24,
-    0x7F,
-    0x3B,
-    0x7F,
-    0x98,
-    0x2E,
-    0x06,
-    0xB2,
-    0x48,
-    0x16,
-    0x13,
-    0x30,
-    0x4B,
-    0x08,
-    0x01,
-    0x00,
-    0x01,
-    0xB4,
-    0x91,
-    0x6F,
-    0x08,
-    0x0E,
-    0x1A,
-    0x2F,
-    0x81,
-    0x6F,
-    0xE0,
-    0x6F,
-    0x42,
-    0x40,
-    0x00,
-    0x40,
-    0x01,
-    0x6F,
-    0xE0,
-    0x7F,
-    0x98,
-    0x2E,
-    0x06,
-    0xB2,
-    0x48,
-    0x16,
-    0x13,
-    0x30,
-    0x4B,
-    0x08,
-    0x01,
-    0x00,
-    0x01,
-    0xB4,
-    0x41,
-    0x6F,
-    0x01,
-    0x28,
-    0xE1,
-    0x6F,
-    0x88,
-    0x0E,
-    0x0E,
-    0x2F,
-    0x30,
-    0x6F,
-    0x01,
-    0x82,
-    0x20,
-    0x30,
-    0x41,
-    0x40,
-    0x40,
-    0xA0,
-    0x01,
-    0x30,
-    0x01,
-    0x22,
-    0x07,
-    0x2C,
-    0x50,
-    0x7F,
-    0x31,
-    0x6F,
-    0x30,
-    0x30,
-    0x41,
-    0x40,
-    0x40,
-    0xAC,
-    0x18,
-    0x22,
-    0x50,
-    0x7F,
-    0x00,
-    0x30,
-    0xD4,
-    0x6F,
-    0x71,
-    0x6F,
-    0x00,
-    0xB3,
-    0x42,
-    0x40,
-    0x04,
-    0x30,
-    0x0E,
-    0x2F,
-    0xA4,
-    0x6F,
-    0x07,
-    0x8B,
-    0x75,
-    0x58,
-    0x45,
-    0x41,
-    0x6C,
-    0x0F,
-    0x34,
-    0x6F,
-    0x02,
-    0x2F,
-    0x00,
-    0x2E,
-    0x06,
-    0x2C,
-    0x22,
-    0xBA,
-    0x02,
-    0x89,
-    0x00,
-    0x2E,
-    0x04,
-    0x41,
-    0x00,
-    0xAD,
-    0x03,
-    0x23,
-    0x42,
-    0xBE,
-    0x55,
-    0x6F,
-    0x2C,
-    0x0B,
-    0x54,
-    0x1A,
-    0xD8,
-    0x22,
-    0x14,
-    0x1A,
-    0x3A,
-    0x2F,
-    0x20,
-    0x6F,
-    0x00,
-    0xA4,
-    0x00,
-    0x30,
-    0x36,
-    0x2F,
-    0x21,
-    0x6F,
-    0xD3,
-    0x7F,
-    0xE4,
-    0x7F,
-    0x43,
-    0x90,
-    0x00,
-    0x30,
-    0x12,
-    0x2F,
-    0xC3,
-    0x6F,
-    0xC4,
-    0x86,
-    0xFE,
-    0x80,
-    0xC2,
-    0x40,
-    0x00,
-    0x40,
-    0x81,
-    0x84,
-    0xE4,
-    0x6F,
-    0xC2,
-    0x42,
-    0x04,
-    0x1A,
-    0x01,
-    0x2F,
-    0x00,
-    0x30,
-    0xC0,
-    0x42,
-    0x00,
-    0x2E,
-    0xF0,
-    0x6E,
-    0xC3,
-    0x40,
-    0x58,
-    0x0E,
-    0x13,
-    0x30,
-    0x00,
-    0x30,
-    0x18,
-    0x22,
-    0x00,
-    0x90,
-    0xA2,
-    0x6F,
-    0x02,
-    0x2F,
-    0x13,
-    0x6F,
-    0x98,
-    0x2E,
-    0xA5,
-    0xB3,
-    0x00,
-    0x90,
-    0xC1,
-    0x6F,
-    0x03,
-    0x30,
-    0x0F,
-    0x2F,
-    0x43,
-    0x80,
-    0x90,
-    0x7F,
-    0x1A,
-    0x25,
-    0x00,
-    0x40,
-    0xA2,
-    0x6F,
-    0xB2,
-    0x7E,
-    0x6B,
-    0x82,
-    0x62,
-    0x6F,
-    0xC2,
-    0x7E,
-    0xD3,
-    0x7E,
-    0xE0,
-    0x7E,
-    0x98,
-    0x2E,
-    0x6C,
-    0xB3,
-    0x93,
-    0x6F,
-    0x00,
-    0x2E,
-    0xC0,
-    0x42,
-    0x00,
-    0x2E,
-    0x71,
-    0x6F,
-    0xE4,
-    0x6F,
-    0xD3,
-    0x6F,
-    0xB2,
-    0x6F,
-    0x01,
-    0x90,
-    0x84,
-    0x42,
-    0x03,
-    0x2F,
-    0xC3,
-    0x6F,
-    0xC1,
-    0x80,
-    0x03,
-    0x30,
-    0x04,
-    0x40,
-    0xFB,
-    0x6F,
-    0x44,
-    0x42,
-    0xBF,
-    0xBD,
-    0xC0,
-    0x2E,
-    0x23,
-    0x0A,
-    0x70,
-    0x5E,
-    0x01,
-    0x80,
-    0x01,
-    0x30,
-    0x11,
-    0x42,
-    0x11,
-    0x42,
-    0x11,
-    0x42,
-    0x01,
-    0x42,
-    0x3C,
-    0x80,
-    0x31,
-    0x30,
-    0xC0,
-    0x2E,
-    0x01,
-    0x42,
-    0x00,
-    0x2E,
-    0x50,
-    0x50,
-    0x40,
-    0x40,
-    0x42,
-    0x84,
-    0x00,
-    0x40,
-    0xE0,
-    0x7F,
-    0x02,
-    0x86,
-    0xDB,
-    0x7F,
-    0xF1,
-    0x7F,
-    0x00,
-    0x2E,
-    0xA0,
-    0x40,
-    0x8B,
-    0x40,
-    0xC2,
-    0x40,
-    0xCB,
-    0x7F,
-    0xB0,
-    0x7F,
-    0xB3,
-    0x30,
-    0x12,
-    0x25,
-    0x98,
-    0x2E,
-    0x06,
-    0xB2,
-    0xC1,
-    0x6F,
-    0x63,
-    0x30,
-    0x20,
-    0x25,
-    0x98,
-    0x2E,
-    0x06,
-    0xB2,
-    0xE1,
-    0x6F,
-    0xE0,
-    0x7F,
-    0xB3,
-    0x30,
-    0x52,
-    0x40,
-    0xC1,
-    0x7F,
-    0x12,
-    0x25,
-    0x98,
-    0x2E,
-    0x06,
-    0xB2,
-    0xC2,
-    0x6F,
-    0xC0,
-    0x7F,
-    0xB3,
-    0x30,
-    0x82,
-    0x40,
-    0x12,
-    0x25,
-    0x98,
-    0x2E,
-    0x06,
-    0xB2,
-    0xC2,
-    0x6F,
-    0x90,
-    0x28,
-    0xB0,
-    0x6F,
-    0x50,
-    0x28,
-    0xE3,
-    0x6F,
-    0x99,
-    0x0F,
-    0x07,
-    0x2F,
-    0xF1,
-    0x6F,
-    0x18,
-    0x28,
-    0x43,
-    0x82,
-    0x82,
-    0x0F,
-    0x42,
-    0x40,
-    0x00,
-    0x30,
-    0x02,
-    0x2C,
-    0x10,
-    0x22,
-    0x10,
-    0x30,
-    0xDB,
-    0x6F,
-    0xB0,
-    0x5F,
-    0xB8,
-    0x2E,
-    0x41,
-    0xB2,
-    0x01,
-    0x2F,
-    0x00,
-    0x2E,
-    0x02,
-    0x2D,
-    0x20,
-    0x2C,
-    0x00,
-    0x30,
-    0x43,
-    0xB2,
-    0x00,
-    0x30,
-    0x01,
-    0x2F,
-    0x42,
-    0x90,
-    0x2B,
-    0x2F,
-    0x88,
-    0x8A,
-    0x34,
-    0x30,
-    0x61,
-    0x04,
-    0x45,
-    0x41,
-    0xD9,
-    0x12,
-    0x40,
-    0xA9,
-    0x05,
-    0x05,
-    0x6C,
-    0x22,
-    0x4B,
-    0x0F,
-    0x20,
-    0x2F,
-    0x89,
-    0x82,
-    0x00,
-    0x2E,
-    0x41,
-    0x40,
-    0x40,
-    0xA8,
-    0x01,
-    0x05,
-    0x4C,
-    0x22,
-    0x4B,
-    0x0F,
-    0x18,
-    0x2F,
-    0x8A,
-    0x82,
-    0x00,
-    0x2E,
-    0x41,
-    0x40,
-    0x40,
-    0xA8,
-    0x01,
-    0x05,
-    0x4C,
-    0x22,
-    0x4B,
-    0x0F,
-    0x10,
-    0x2F,
-    0x85,
-    0x82,
-    0x77,
-    0x56,
-    0x41,
-    0x40,
-    0x4B,
-    0x0F,
-    0x09,
-    0x2F,
-    0x86,
-    0x82,
-    0x77,
-    0x56,
-    0x41,
-    0x40,
-    0x4B,
-    0x0F,
-    0x04,
-    0x2F,
-    0x87,
-    0x86,
-    0x77,
-    0x54,
-    0xC3,
-    0x40,
-    0xDA,
-    0x0E,
-    0x02,
-    0x2F,
-    0x10,
-    0x30,
-    0xB8,
-    0x2E,
-    0x10,
-    0x30,
-    0xB8,
-    0x2E,
-    0x05,
-    0x2E,
-    0x88,
-    0x00,
-    0x81,
-    0x82,
-    0x40,
-    0x50,
-    0x41,
-    0x40,
-    0x93,
-    0xBD,
-    0xBF,
-    0xB9,
-    0xFB,
-    0x7F,
-    0xC0,
-    0xB2,
-    0x0B,
-    0x30,
-    0x36,
-    0x2F,
-    0x07,
-    0x2E,
-    0x5F,
-    0x00,
-    0xC0,
-    0x90,
-    0x04,
-    0x2F,
-    0xC1,
-    0x86,
-    0x27,
-    0x2E,
-    0x5F,
-    0x00,
-    0x37,
-    0x2E,
-    0x60,
-    0x00,
-    0x82,
-    0x86,
-    0x82,
-    0x40,
-    0x94,
-    0xBC,
-    0xC3,
-    0x40,
-    0x94,
-    0xB8,
-    0x21,
-    0xBD,
-    0xB4,
-    0xBD,
-    0x21,
-    0xB9,
-    0xB4,
-    0xB9,
-    0xC1,
-    0x7F,
-    0xE3,
-    0x7F,
-    0xD2,
-    0x7F,
-    0x10,
-    0x25,
-    0x98,
-    0x2E,
-    0xD3,
-    0x00,
-    0xC2,
-    0x6F,
-    0xD1,
-    0x6F,
-    0x8A,
-    0x28,
-    0x42,
-    0x0F,
-    0x0D,
-    0x2F,
-    0xC1,
-    0x0E,
-    0x05,
-    0x2E,
-    0x60,
-    0x00,
-    0x13,
-    0x30,
-    0x13,
-    0x28,
-    0x04,
-    0x2F,
-    0x80,
-    0xA6,
-    0x08,
-    0x2F,
-    0x21,
-    0x2E,
-    0x60,
-    0x00,
-    0x06,
-    0x2D,
-    0x21,
-    0x2E,
-    0x60,
-    0x00,
-    0x03,
-    0x2D,
-    0x00,
-    0x30,
-    0x21,
-    0x2E,
-    0x60,
-    0x00,
-    0x03,
-    0x2E,
-    0x60,
-    0x00,
-    0xE0,
-    0x6F,
-    0xC8,
-    0x0E,
-    0x40,
-    0x30,
-    0x04,
-    0x2F,
-    0x21,
-    0x2E,
-    0x5E,
-    0xF0,
-    0x02,
-    0x2D,
-    0x37,
-    0x2E,
-    0x5F,
-    0x00,
-    0xFB,
-    0x6F,
-    0xC0,
-    0x5F,
-    0xB8,
-    0x2E,
-    0x03,
-    0x2E,
-    0x07,
-    0x01,
-    0x72,
-    0x30,
-    0x30,
-    0x50,
-    0xCA,
-    0x08,
-    0xC0,
-    0x90,
-    0xFB,
-    0x7F,
-    0x0B,
-    0x2F,
-    0x01,
-    0x30,
-    0x23,
-    0x2E,
-    0x54,
-    0xF0,
-    0xE0,
-    0x7F,
-    0xD3,
-    0x7F,
-    0x98,
-    0x2E,
-    0x95,
-    0x00,
-    0x10,
-    0x30,
-    0x21,
-    0x2E,
-    0x62,
-    0x00,
-    0xE0,
-    0x6F,
-    0xD3,
-    0x6F,
-    0x03,
-    0x2E,
-    0x62,
-    0x00,
-    0x40,
-    0x90,
-    0x79,
-    0x52,
-    0x15,
-    0x2F,
-    0x05,
-    0x2E,
-    0x61,
-    0x00,
-    0x8C,
-    0x88,
-    0x00,
-    0x2E,
-    0x03,
-    0x43,
-    0x30,
-    0x25,
-    0x98,
-    0x2E,
-    0x97,
-    0xB4,
-    0x00,
-    0xB2,
-    0x05,
-    0x2F,
-    0x21,
-    0x2E,
-    0x54,
-    0xF0,
-    0xE0,
-    0x7F,
-    0x98,
-    0x2E,
-    0x95,
-    0x00,
-    0xE0,
-    0x6F,
-    0x00,
-    0xA6,
-    0x10,
-    0x30,
-    0x08,
-    0x2F,
-    0x21,
-    0x2E,
-    0x5E,
-    0xF0,
-    0x06,
-    0x2D,
-    0x03,
-    0x30,
-    0x79,
-    0x50,
-    0x98,
-    0x2E,
-    0x5C,
-    0xB4,
-    0x27,
-    0x2E,
-    0x62,
-    0x00,
-    0xFB,
-    0x6F,
-    0xD0,
-    0x5F,
-    0xB8,
-    0x2E,
-    0x0C,
-    0x82,
-    0x02,
-    0x30,
-    0x12,
-    0x42,
-    0x41,
-    0x0E,
-    0xFC,
-    0x2F,
-    0x35,
-    0x80,
-    0x7B,
-    0x52,
-    0x11,
-    0x42,
-    0x00,
-    0x2E,
-    0x7D,
-    0x52,
-    0x01,
-    0x42,
-    0xB8,
-    0x2E,
-    0x07,
-    0x88,
-    0x47,
-    0x8E,
-    0x06,
-    0x41,
-    0x3C,
-    0x8B,
-    0x32,
-    0x1A,
-    0x42,
-    0x41,
-    0xC7,
-    0x41,
-    0x16,
-    0x2F,
-    0x80,
-    0x91,
-    0x23,
-    0x2F,
-    0x57,
-    0x0F,
-    0x16,
-    0x30,
-    0x0C,
-    0x2F,
-    0x06,
-    0x80,
-    0x00,
-    0x2E,
-    0x00,
-    0x40,
-    0x00,
-    0xB2,
-    0x04,
-    0x2F,
-    0x46,
-    0x82,
-    0x00,
-    0x2E,
-    0x41,
-    0x40,
-    0xD1,
-    0x0F,
-    0x02,
-    0x2F,
-    0x06,
-    0x30,
-    0x06,
-    0x43,
-    0x46,
-    0x43,
-    0x80,
-    0xB3,
-    0x11,
-    0x2F,
-    0x03,
-    0x43,
-    0x47,
-    0x43,
-    0xB8,
-    0x2E,
-    0xD7,
-    0x0E,
-    0x0C,
-    0x2F,
-    0x44,
-    0x82,
-    0x17,
-    0x04,
-    0x41,
-    0x40,
-    0x41,
-    0x0F,
-    0x07,
-    0x2F,
-    0x03,
-    0x43,
-    0x42,
-    0x83,
-    0x47,
-    0x43,
-    0x00,
-    0x2E,
-    0x43,
-    0x40,
-    0xC1,
-    0x86,
-    0x43,
-    0x42,
-    0xB8,
-    0x2E,
-    0xB8,
-    0x2E,
-    0x89,
-    0x88,
-    0xC0,
-    0x50,
-    0x39,
-    0x8D,
-    0x88,
-    0x81,
-    0xE2,
-    0x7F,
-    0x02,
-    0x30,
-    0x05,
-    0x40,
-    0xF2,
-    0x7F,
-    0x41,
-    0xAB,
-    0x22,
-    0x30,
-    0x95,
-    0x22,
-    0x86,
-    0x41,
-    0x7F,
-    0x5E,
-    0x9A,
-    0x00,
-    0x04,
-    0x41,
-    0x37,
-    0x18,
-    0x66,
-    0x01,
-    0x81,
-    0x56,
-    0xEB,
-    0x00,
-    0xC1,
-    0x7F,
-    0xB3,
-    0x7F,
-    0xD5,
-    0x7F,
-    0x48,
-    0x82,
-    0x39,
-    0x80,
-    0x82,
-    0x40,
-    0xA0,
-    0x7F,
-    0x91,
-    0x7F,
-    0x8B,
-    0x7F,
-    0x06,
-    0x30,
-    0x53,
-    0x5A,
-    0x83,
-    0x58,
-    0x53,
-    0x56,
-    0x98,
-    0x2E,
-    0xF3,
-    0xB0,
-    0x91,
-    0x6F,
-    0x7B,
-    0x82,
-    0xC6,
-    0x6F,
-    0x42,
-    0x40,
-    0x81,
-    0x84,
-    0x42,
-    0x42,
-    0x43,
-    0x82,
-    0x83,
-    0x8B,
-    0x42,
-    0x40,
-    0x86,
-    0x89,
-    0x7B,
-    0x82,
-    0x84,
-    0x87,
-    0x71,
-    0x7F,
-    0x80,
-    0xB2,
-    0x95,
-    0x7F,
-    0x64,
-    0x7F,
-    0x50,
-    0x7F,
-    0x02,
-    0x2F,
-    0xC5,
-    0x40,
-    0x41,
-    0x8B,
-    0xC5,
-    0x42,
-    0x87,
-    0x89,
-    0x67,
-    0x40,
-    0x07,
-    0x0F,
-    0x85,
-    0x8B,
-    0x41,
-    0x7F,
-    0x82,
-    0x8D,
-    0x47,
-    0x40,
-    0x3D,
-    0x2F,
-    0x81,
-    0x41,
-    0x01,
-    0x0E,
-    0xE1,
-    0x6F,
-    0x2E,
-    0x2F,
-    0x47,
-    0x8C,
-    0x90,
-    0x6F,
-    0x86,
-    0x41,
-    0x07,
-    0x40,
-    0xFE,
-    0x0E,
-    0x02,
-    0x2F,
-    0x04,
-    0x41,
-    0x00,
-    0xB3,
-    0x22,
-    0x2F,
-    0x45,
-    0x82,
-    0x04,
-    0x30,
-    0x41,
-    0x40,
-    0x71,
-    0x00,
-    0xF9,
-    0x0E,
-    0x37,
-    0x2F,
-    0x46,
-    0x41,
-    0x80,
-    0xA7,
-    0x01,
-    0x30,
-    0x04,
-    0x30,
-    0x0E,
-    0x2F,
-    0xE4,
-    0x6F,
-    0x01,
-    0x89,
-    0x00,
-    0x2E,
-    0x04,
-    0x41,
-    0x74,
-    0x0F,
-    0x04,
-    0x30,
-    0x07,
-    0x2F,
-    0x80,
-    0x90,
-    0x00,
-    0x2F,
-    0xC1,
-    0x42,
-    0x03,
-    0x86,
-    0x81,
-    0x84,
-    0xC2,
-    0x42,
-    0x01,
-    0x42,
-    0x14,
-    0x30,
-    0x42,
-    0x85,
-    0x41,
-    0x43,
-    0xA1,
-    0x42,
-    0x00,
-    0x2E,
-    0x82,
-    0x40,
-    0x80,
-    0x90,
-    0x1C,
-    0x2F,
-    0x01,
-    0x42,
-    0x1B,
-    0x2D,
-    0x06,
-    0x42,
-    0x19,
-    0x2C,
-    0x04,
-    0x30,
-    0xB2,
-    0x6F,
-    0xBA,
-    0x04,
-    0x02,
-    0x1E,
-    0x80,
-    0x43,
-    0x12,
-    0x30,
-    0xC0,
-    0x6F,
-    0x23,
-    0x30,
-    0x98,
-    0x2E,
-    0x68,
-    0xB4,
-    0x0E,
-    0x2C,
-    0x04,
-    0x30,
-    0xB2,
-    0x6F,
-    0xC0,
-    0x6F,
-    0xBA,
-    0x00,
-    0x51,
-    0x6F,
-    0x01,
-    0x86,
-    0x4A,
-    0x1C,
-    0xC1,
-    0x42,
-    0x22,
-    0x30,
-    0xE1,
-    0x6F,
-    0x13,
-    0x30,
-    0x98,
-    0x2E,
-    0x68,
-    0xB4,
-    0x04,
-    0x30,
-    0x52,
-    0x6F,
-    0x85,
-    0x52,
-    0x40,
-    0x6F,
-    0xC4,
-    0x7F,
-    0x98,
-    0x2E,
-    0x62,
-    0xB1,
-    0x41,
-    0x6F,
-    0x70,
-    0x6F,
-    0x42,
-    0x40,
-    0x87,
-    0x52,
-    0x98,
-    0x2E,
-    0x62,
-    0xB1,
-    0x41,
-    0x6F,
-    0x70,
-    0x6F,
-    0x42,
-    0x40,
-    0x01,
-    0x40,
-    0xD3,
-    0x6F,
-    0xD3,
-    0x00,
-    0xCB,
-    0x1E,
-    0x87,
-    0x52,
-    0x13,
-    0x42,
-    0xB0,
-    0x7F,
-    0x98,
-    0x2E,
-    0x62,
-    0xB1,
-    0xB0,
-    0x6F,
-    0x3E,
-    0x84,
-    0xD1,
-    0x6F,
-    0x82,
-    0x40,
-    0x03,
-    0x40,
-    0x51,
-    0x04,
-    0x59,
-    0x1C,
-    0x01,
-    0x42,
-    0x02,
-    0x82,
-    0xA0,
-    0x6F,
-    0x42,
-    0x40,
-    0x03,
-    0x40,
-    0xD3,
-    0x0F,
-    0x00,
-    0x30,
-    0x14,
-    0x30,
-    0x60,
-    0x22,
-    0xC5,
-    0x6F,
-    0x40,
-    0x91,
-    0x01,
-    0x2F,
-    0x53,
-    0x0E,
-    0x26,
-    0x2F,
-    0xE5,
-    0x6F,
-    0x48,
-    0x85,
-    0x00,
-    0x2E,
-    0x83,
-    0x40,
-    0x59,
-    0x0F,
-    0x20,
-    0x2F,
-    0x62,
-    0x6F,
-    0x4B,
-    0x8F,
-    0x85,
-    0x40,
-    0xC7,
-    0x41,
-    0x7F,
-    0x8D,
-    0x6F,
-    0x0F,
-    0xA6,
-    0x15,
-    0x17,
-    0x30,
-    0x04,
-    0x30,
-    0x0F,
-    0x2F,
-    0xE0,
-    0x6F,
-    0x0C,
-    0x80,
-    0x00,
-    0x2E,
-    0x07,
-    0x40,
-    0x3E,
-    0x08,
-    0x00,
-    0xB2,
-    0x00,
-    0x30,
-    0x06,
-    0x2F,
-    0x59,
-    0x1A,
-    0x04,
-    0x2F,
-    0xFD,
-    0x12,
-    0xC0,
-    0x90,
-    0x13,
-    0x30,
-    0x4B,
-    0x22,
-    0x06,
-    0x25,
-    0x71,
-    0x25,
-    0xC0,
-    0xB3,
-    0x04,
-    0x2F,
-    0xA4,
-    0x42,
-    0xA4,
-    0x42,
-    0x83,
-    0x82,
-    0x84,
-    0x42,
-    0x44,
-    0x42,
-    0x00,
-    0x2E,
-    0x8B,
-    0x6F,
-    0x40,
-    0x5F,
-    0xB8,
-    0x2E,
-    0x00,
-    0x2E,
-    0x10,
-    0x24,
-    0x90,
-    0x07,
-    0x11,
-    0x24,
-    0x00,
-    0x0C,
-    0x12,
-    0x24,
-    0x80,
-    0x2E,
-    0x13,
-    0x24,
-    0x18,
-    0x00,
-    0x12,
-    0x42,
-    0x13,
-    0x42,
-    0x41,
-    0x1A,
-    0xFB,
-    0x2F,
-    0x10,
-    0x24,
-    0x50,
-    0x39,
-    0x11,
-    0x24,
-    0x21,
-    0x2E,
-    0x21,
-    0x2E,
-    0x10,
-    0x00,
-    0x23,
-    0x2E,
-    0x11,
-    0x00,
-    0x80,
-    0x2E,
-    0x10,
-    0x00,
-)
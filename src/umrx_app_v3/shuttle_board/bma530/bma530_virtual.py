@@ -0,0 +1,90 @@
+from typing import Any
+
+from umrx_app_v3.mcu_board.comm.emulator_comm import EmulatorCommunication
+from umrx_app_v3.sensors.bma530 import BMA530Addr
+from umrx_app_v3.shuttle_board.bma530.bma530_shuttle import BMA530Shuttle
+from umrx_app_v3.shuttle_board.virtual_shuttle import VirtualSensor, VirtualShuttle, wave
+
+EXTENDED_MEMORY_WORDS = 256
+# feature_data_tx reads start with two dummy bytes, on top of the SPI dummy byte
+FEATURE_DATA_DUMMY_BYTES = 2
+
+
+class VirtualBMA530(VirtualSensor):
+    CHIP_ID = 0xC2
+    RESET_REGISTER = BMA530Addr.cmd.value
+    ODR = 100.0
+    SENSOR_TIME_RESOLUTION = 312.5e-6
+    LSB_PER_G = 4096  # +/-8 g after reset
+
+    def __init__(self, extended_registers: dict[int, int] | None = None) -> None:
+        self.extended_defaults = extended_registers or {}
+        super().__init__({BMA530Addr.cmd_suspend.value: 0x01}, spi_dummy_bytes=1)
+        self.extended_registers = self.default_extended_registers()
+
+    def default_extended_registers(self) -> list[int]:
+        return [self.extended_defaults.get(addr, 0) for addr in range(EXTENDED_MEMORY_WORDS)]
+
+    def reset(self) -> None:
+        super().reset()
+        self.extended_registers = self.default_extended_registers()
+
+    @property
+    def feature_data_addr(self) -> int:
+        return self.registers[BMA530Addr.feature_data_addr.value]
+
+    def read(self, reg_addr: int, length: int) -> bytes:
+        if reg_addr != BMA530Addr.feature_data_tx.value:
+            return super().read(reg_addr, length)
+        # words of the feature engine memory from feature_data_addr on, the address auto-increments
+        num_words = -(-max(length - FEATURE_DATA_DUMMY_BYTES, 0) // 2)
+        data = bytearray(FEATURE_DATA_DUMMY_BYTES)
+        for idx in range(num_words):
+            data += self.extended_registers[(self.feature_data_addr + idx) % EXTENDED_MEMORY_WORDS].to_bytes(
+                2, "little"
+            )
+        return bytes(data[:length])
+
+    def write(self, reg_addr: int, data: bytes) -> None:
+        if reg_addr != BMA530Addr.feature_data_tx.value:
+            super().write(reg_addr, data)
+            return
+        for idx in range(len(data) // 2):
+            word = int.from_bytes(data[2 * idx : 2 * idx + 2], "little")
+            self.extended_registers[(self.feature_data_addr + idx) % EXTENDED_MEMORY_WORDS] = word
+
+    @property
+    def is_measuring(self) -> bool:
+        return self.registers[BMA530Addr.cmd_suspend.value] == 0x00
+
+    def sample(self, now: float) -> None:
+        self.put(
+            BMA530Addr.acc_data_0.value,
+            "<hhhb",
+            wave(now, 0.02 * self.LSB_PER_G, 1.5),
+            wave(now, 0.02 * self.LSB_PER_G, 1.5, phase=1.0),
+            wave(now, 0.02 * self.LSB_PER_G, 1.5, offset=self.LSB_PER_G),
+            # 0 LSB is 23 degC
+            wave(now, 1.0, 0.01, offset=2.0),
+        )
+        self.put_int24(BMA530Addr.sensor_time_0.value, self.sensor_time(now))
+        # acc_drdy
+        self.registers[BMA530Addr.sensor_status.value] = 0x01
+
+
+class VirtualBMA530Shuttle(VirtualShuttle):
+    SHUTTLE = BMA530Shuttle
+    SENSOR = VirtualBMA530
+
+    def __init__(self, **kw: Any) -> None:
+        self.sensor = self.SENSOR(kw.get("extended_registers"))
+        super().__init__(**kw)
+
+    def attach(self, emulator: EmulatorCommunication) -> None:
+        self.connect(
+            emulator,
+            self.sensor,
+            i2c_address=self.SHUTTLE.I2C_DEFAULT_ADDRESS,
+            cs_pin=self.SHUTTLE.CS,
+            interrupt_pins=(self.SHUTTLE.INT1,),
+        )
@@ -1,8 +1,10 @@
 import logging
-import time
 from array import array
+from collections.abc import Iterable
 from typing import Any, Self
 
+import numpy as np
+
 from umrx_app_v3.mcu_board.app_board_v3_rev0 import ApplicationBoardV3Rev0
 from umrx_app_v3.mcu_board.app_board_v3_rev1 import ApplicationBoardV3Rev1
 from umrx_app_v3.mcu_board.bst_app_board import ApplicationBoard
@@ -14,8 +16,8 @@ from umrx_app_v3.mcu_board.bst_protocol_constants import (
     SPIBus,
     StreamingSamplingUnit,
 )
-from umrx_app_v3.mcu_board.commands.spi import SPIConfigureCmd
 from umrx_app_v3.sensors.bma580 import BMA580, BMA580Addr, BMA580ExtendedAddr
+from umrx_app_v3.shuttle_board.payload_layout import PayloadField, PayloadLayout, Payloads
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +36,18 @@ class BMA580Shuttle:
     # I2C addresses
     I2C_DEFAULT_ADDRESS = 0x18
 
+    # Streaming payload
+    I2C_PAYLOAD_LAYOUT = PayloadLayout(
+        (
+            PayloadField("acc_x", 0, 2, signed=True),
+            PayloadField("acc_y", 2, 2, signed=True),
+            PayloadField("acc_z", 4, 2, signed=True),
+            PayloadField("temperature", 6, 1, signed=True),
+            PayloadField("sensor_time", 7, 3),
+        )
+    )
+    SPI_PAYLOAD_LAYOUT = I2C_PAYLOAD_LAYOUT.with_dummy_bytes(1)
+
     def __init__(self, **kw: Any) -> None:
         self.board: ApplicationBoard | None = kw["board"] if kw.get("board") else None
         self.sensor: BMA580 = BMA580()
@@ -66,32 +80,34 @@ class BMA580Shuttle:
             raise BMA580ShuttleError(error_message)
 
     def assign_sensor_callbacks(self) -> None:
-        self.sensor.assign_callbacks(read_callback=self.read_register, write_callback=self.write_register)
+        self.sensor.assign_callbacks(
+            read_callback=self.read_register,
+            write_callback=self.write_register,
+            write_many_callback=self.write_registers,
+        )
 
     def configure_i2c(self) -> None:
-        self.board.set_vdd_vddio(0.0, 0.0)
-        time.sleep(0.1)
+        self.board.power_off()
         self.board.set_pin_config(self.SDO, PinDirection.OUTPUT, PinValue.LOW)
         self.board.set_pin_config(self.CS, PinDirection.OUTPUT, PinValue.HIGH)
         self.board.set_vdd_vddio(1.8, 1.8)
-        time.sleep(0.1)
         self.board.configure_i2c(I2CMode.FAST_MODE)
         self.assign_sensor_callbacks()
         self.is_i2c_configured = True
         self.is_spi_configured = False
+        self.board.wait_for_chip_id(lambda: self.sensor.chip_id, "BMA580 chip id")
 
     def configure_spi(self) -> None:
-        self.board.set_vdd_vddio(0.0, 0.0)
-        time.sleep(0.1)
+        self.board.power_off()
         self.board.set_pin_config(self.CS, PinDirection.OUTPUT, PinValue.HIGH)
         self.board.set_vdd_vddio(1.8, 1.8)
-        time.sleep(0.2)
         if isinstance(self.board, ApplicationBoardV3Rev1):
-            SPIConfigureCmd.set_bus(SPIBus.BUS_1)
+            self.board.spi_bus = SPIBus.BUS_1
         self.board.configure_spi()
         self.assign_sensor_callbacks()
         self.is_spi_configured = True
         self.is_i2c_configured = False
+        self.board.wait_for_chip_id(lambda: self.sensor.chip_id, "BMA580 chip id")
 
     def read_register(self, reg_addr: int, bytes_to_read: int = 1) -> array[int] | int:
         if isinstance(reg_addr, BMA580Addr | BMA580ExtendedAddr):
@@ -131,6 +147,17 @@ class BMA580Shuttle:
         error_message = "Configure I2C or SPI protocol prior to reading registers"
         raise BMA580ShuttleError(error_message)
 
+    def write_registers(self, writes: Iterable[tuple[int, int | array]]) -> None:
+        requests = [
+            (reg_addr, value if isinstance(value, array) else array("B", (value,))) for reg_addr, value in writes
+        ]
+        if self.is_i2c_configured:
+            return self.board.write_many(requests, i2c_address=self.I2C_DEFAULT_ADDRESS)
+        if self.is_spi_configured:
+            return self.board.write_many(requests, cs_pin=self.CS)
+        error_message = "Configure I2C or SPI protocol prior to writing registers"
+        raise BMA580ShuttleError(error_message)
+
     def _configure_i2c_polling_streaming(
         self,
         sampling_time: int,
@@ -192,7 +219,7 @@ class BMA580Shuttle:
         self.sensor.int1_conf = (0b10 << 0) | (0b1 << 3)
         self.sensor.int_map_0 = 0b01 << 0
         self.sensor.int2_conf = 0x01
-        time.sleep(0.02)
+        self.board.pause(0.02, "interrupt configuration")
         if self.is_i2c_configured:
             return self._configure_i2c_interrupt_streaming()
         error_message = "Configure I2C protocol first. SPI interrupt streaming is not supported for this shuttle."
@@ -207,6 +234,11 @@ class BMA580Shuttle:
         raise BMA580ShuttleError(error_message)
 
     def stop_streaming(self) -> None:
-        self.board.stop_polling_streaming()
-        time.sleep(0.15)
-        self.board.stop_interrupt_streaming()
+        self.board.stop_streaming()
+
+    @property
+    def payload_layout(self) -> PayloadLayout:
+        return self.SPI_PAYLOAD_LAYOUT if self.is_spi_configured else self.I2C_PAYLOAD_LAYOUT
+
+    def decode_batch(self, frames: Payloads) -> np.ndarray:
+        return self.payload_layout.decode(frames)
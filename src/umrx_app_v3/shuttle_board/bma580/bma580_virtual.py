@@ -0,0 +1,12 @@
+from umrx_app_v3.shuttle_board.bma530.bma530_virtual import VirtualBMA530, VirtualBMA530Shuttle
+from umrx_app_v3.shuttle_board.bma580.bma580_shuttle import BMA580Shuttle
+
+
+class VirtualBMA580(VirtualBMA530):
+    # same register map and feature engine interface as the BMA530
+    CHIP_ID = 0xC4
+
+
+class VirtualBMA580Shuttle(VirtualBMA530Shuttle):
+    SHUTTLE = BMA580Shuttle
+    SENSOR = VirtualBMA580
@@ -1,8 +1,10 @@
 import logging
-import time
 from array import array
+from collections.abc import Iterable
 from typing import Any, Self
 
+import numpy as np
+
 from umrx_app_v3.mcu_board.app_board_v3_rev0 import ApplicationBoardV3Rev0
 from umrx_app_v3.mcu_board.app_board_v3_rev1 import ApplicationBoardV3Rev1
 from umrx_app_v3.mcu_board.bst_app_board import ApplicationBoard
@@ -14,8 +16,8 @@ from umrx_app_v3.mcu_board.bst_protocol_constants import (
     SPIBus,
     StreamingSamplingUnit,
 )
-from umrx_app_v3.mcu_board.commands.spi import SPIConfigureCmd
 from umrx_app_v3.sensors.bme280 import BME280, BME280Addr, BME280NVMAddr
+from umrx_app_v3.shuttle_board.payload_layout import PayloadField, PayloadLayout, Payloads
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +35,16 @@ class BME280Shuttle:
     I2C_DEFAULT_ADDRESS = 0x76  # when SDO -> GND
     I2C_ALTERNATIVE_ADDRESS = 0x77  # when SDO -> VDDIO
 
+    # Streaming payload
+    I2C_PAYLOAD_LAYOUT = PayloadLayout(
+        (
+            PayloadField("pressure", 0, 3, byteorder="big", shift=4),
+            PayloadField("temperature", 3, 3, byteorder="big", shift=4),
+            PayloadField("humidity", 6, 2, byteorder="big"),
+        )
+    )
+    SPI_PAYLOAD_LAYOUT = I2C_PAYLOAD_LAYOUT
+
     def __init__(self, **kw: Any) -> None:
         self.board: ApplicationBoard | None = kw["board"] if kw.get("board") else None
         self.sensor: BME280 = BME280()
@@ -65,28 +77,32 @@ class BME280Shuttle:
             raise BME280ShuttleError(error_message)
 
     def assign_sensor_callbacks(self) -> None:
-        self.sensor.assign_callbacks(read_callback=self.read_register, write_callback=self.write_register)
+        self.sensor.assign_callbacks(
+            read_callback=self.read_register,
+            write_callback=self.write_register,
+            write_many_callback=self.write_registers,
+        )
 
     def configure_i2c(self) -> None:
         self.board.set_pin_config(self.SDO, PinDirection.OUTPUT, PinValue.LOW)
         self.board.set_pin_config(self.CS, PinDirection.OUTPUT, PinValue.HIGH)
         self.board.set_vdd_vddio(3.3, 3.3)
-        time.sleep(0.01)
         self.board.configure_i2c(I2CMode.FAST_MODE)
         self.assign_sensor_callbacks()
         self.is_i2c_configured = True
         self.is_spi_configured = False
+        self.board.wait_for_chip_id(lambda: self.sensor.chip_id, "BME280 chip id")
 
     def configure_spi(self) -> None:
         self.board.set_pin_config(self.CS, PinDirection.OUTPUT, PinValue.LOW)
         self.board.set_vdd_vddio(1.8, 1.8)
-        time.sleep(0.2)
         if isinstance(self.board, ApplicationBoardV3Rev1):
-            SPIConfigureCmd.set_bus(SPIBus.BUS_1)
+            self.board.spi_bus = SPIBus.BUS_1
         self.board.configure_spi()
         self.assign_sensor_callbacks()
         self.is_spi_configured = True
         self.is_i2c_configured = False
+        self.board.wait_for_chip_id(lambda: self.sensor.chip_id, "BME280 chip id")
 
     def read_register(self, reg_addr: int, bytes_to_read: int = 1) -> array[int] | int:
         if isinstance(reg_addr, (BME280Addr | BME280NVMAddr)):
@@ -121,6 +137,15 @@ class BME280Shuttle:
         error_message = "Configure I2C or SPI protocol prior to reading registers"
         raise BME280ShuttleError(error_message)
 
+    def write_registers(self, writes: Iterable[tuple[int, int]]) -> None:
+        requests = [(reg_addr, array("B", (value,))) for reg_addr, value in writes]
+        if self.is_i2c_configured:
+            return self.board.write_many(requests, i2c_address=self.I2C_DEFAULT_ADDRESS)
+        if self.is_spi_configured:
+            return self.board.write_many(requests, cs_pin=self.CS)
+        error_message = "Configure I2C or SPI protocol prior to writing registers"
+        raise BME280ShuttleError(error_message)
+
     def _configure_i2c_polling_streaming(
         self,
         sampling_time: int,
@@ -154,7 +179,7 @@ class BME280Shuttle:
     def start_measurement(self) -> None:
         self.sensor.ctrl_hum = 0b001
         self.sensor.ctrl_meas = (0b001 << 5) | (0b001 << 2) | 0b11
-        time.sleep(0.1)
+        self.board.pause(0.1, "first measurement")
 
     def configure_polling_streaming(
         self,
@@ -176,6 +201,11 @@ class BME280Shuttle:
         raise BME280ShuttleError(error_message)
 
     def stop_streaming(self) -> None:
-        self.board.stop_polling_streaming()
-        time.sleep(0.15)
-        self.board.stop_interrupt_streaming()
+        self.board.stop_streaming()
+
+    @property
+    def payload_layout(self) -> PayloadLayout:
+        return self.SPI_PAYLOAD_LAYOUT if self.is_spi_configured else self.I2C_PAYLOAD_LAYOUT
+
+    def decode_batch(self, frames: Payloads) -> np.ndarray:
+        return self.payload_layout.decode(frames)
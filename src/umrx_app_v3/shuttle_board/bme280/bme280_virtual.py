@@ -0,0 +1,102 @@
+import struct
+from typing import Any
+
+from umrx_app_v3.mcu_board.comm.emulator_comm import EmulatorCommunication
+from umrx_app_v3.sensors.bme280 import BME280, BME280Addr, BME280NVMAddr
+from umrx_app_v3.shuttle_board.bme280.bme280_shuttle import BME280Shuttle
+from umrx_app_v3.shuttle_board.virtual_shuttle import invert, VirtualSensor, VirtualShuttle, wave
+
+# temperature and pressure trimming of the datasheet compensation example, typical humidity trimming
+BME280_NVM = {
+    "dig_t1": 27504,
+    "dig_t2": 26435,
+    "dig_t3": -1000,
+    "dig_p1": 36477,
+    "dig_p2": -10685,
+    "dig_p3": 3024,
+    "dig_p4": 2855,
+    "dig_p5": 140,
+    "dig_p6": -7,
+    "dig_p7": 15500,
+    "dig_p8": -14600,
+    "dig_p9": 6000,
+    "dig_h1": 75,
+    "dig_h2": 362,
+    "dig_h3": 0,
+    "dig_h4": 313,
+    "dig_h5": 50,
+    "dig_h6": 30,
+}
+NORMAL_MODE = 0b11
+RAW_20_BIT_MAX = (1 << 20) - 1
+# the register address has 7 bits on SPI, the MSB is the read/write bit
+SPI_ADDRESS_BIT = 0x80
+
+
+class VirtualBME280(VirtualSensor):
+    CHIP_ID_REGISTER = BME280Addr.chip_id.value
+    CHIP_ID = 0x60
+    RESET_REGISTER = BME280Addr.reset.value
+    ODR = 100.0
+
+    def __init__(self, nvm: dict[str, int] = BME280_NVM) -> None:
+        super().__init__()
+        struct.pack_into(
+            BME280.NVM_BLOCK_1_FORMAT,
+            self.defaults,
+            BME280NVMAddr.dig_t1.value,
+            *(nvm[f"dig_t{idx}"] for idx in range(1, 4)),
+            *(nvm[f"dig_p{idx}"] for idx in range(1, 10)),
+            nvm["dig_h1"],
+        )
+        dig_h4, dig_h5 = nvm["dig_h4"] & 0xFFF, nvm["dig_h5"] & 0xFFF
+        struct.pack_into(
+            BME280.NVM_BLOCK_2_FORMAT,
+            self.defaults,
+            BME280NVMAddr.dig_h2.value,
+            nvm["dig_h2"],
+            nvm["dig_h3"],
+            dig_h4 >> 4,
+            (dig_h5 & 0x0F) << 4 | (dig_h4 & 0x0F),
+            dig_h5 >> 4,
+            nvm["dig_h6"],
+        )
+        self.reset()
+        self.compensation = BME280()
+        self.compensation.load_nvm(nvm)
+
+    def read(self, reg_addr: int, length: int) -> bytes:
+        return super().read(reg_addr | SPI_ADDRESS_BIT, length)
+
+    def write_register(self, reg_addr: int, value: int) -> None:
+        super().write_register(reg_addr | SPI_ADDRESS_BIT, value)
+
+    @property
+    def is_measuring(self) -> bool:
+        return self.registers[BME280Addr.ctrl_meas.value] & NORMAL_MODE == NORMAL_MODE
+
+    def sample(self, now: float) -> None:
+        temperature = wave(now, 0.5, 0.05, offset=25.0)
+        pressure = wave(now, 50.0, 0.2, offset=101325.0)
+        humidity = wave(now, 5.0, 0.02, offset=45.0)
+        raw_temperature = invert(self.compensation.compensate_temperature, temperature, high=RAW_20_BIT_MAX)
+        raw_pressure = invert(
+            lambda raw: self.compensation.compensate_pressure(raw, raw_temperature), pressure, high=RAW_20_BIT_MAX
+        )
+        raw_humidity = invert(
+            lambda raw: self.compensation.compensate_humidity(raw, raw_temperature), humidity, high=0xFFFF
+        )
+        self.put_int24(BME280Addr.press_msb.value, raw_pressure << 4, raw_temperature << 4, byteorder="big")
+        self.put(BME280Addr.hum_msb.value, ">H", raw_humidity)
+
+
+class VirtualBME280Shuttle(VirtualShuttle):
+    SHUTTLE = BME280Shuttle
+
+    def __init__(self, **kw: Any) -> None:
+        self.sensor = VirtualBME280(kw.get("nvm", BME280_NVM))
+        super().__init__(**kw)
+
+    def attach(self, emulator: EmulatorCommunication) -> None:
+        # there is no interrupt line on the shuttle, data is polled
+        self.connect(emulator, self.sensor, i2c_address=BME280Shuttle.I2C_DEFAULT_ADDRESS, cs_pin=BME280Shuttle.CS)
@@ -1,9 +1,11 @@
 import logging
 import struct
-import time
 from array import array
+from collections.abc import Iterable
 from typing import Any, Self
 
+import numpy as np
+
 from umrx_app_v3.mcu_board.app_board_v3_rev0 import ApplicationBoardV3Rev0
 from umrx_app_v3.mcu_board.app_board_v3_rev1 import ApplicationBoardV3Rev1
 from umrx_app_v3.mcu_board.bst_app_board import ApplicationBoard
@@ -14,10 +16,10 @@ from umrx_app_v3.mcu_board.bst_protocol_constants import (
     SPIBus,
     StreamingSamplingUnit,
 )
-from umrx_app_v3.mcu_board.commands.spi import SPIConfigureCmd
 from umrx_app_v3.sensors.bmi088 import BMI088, BMI088AccelAddr, BMI088GyroAddr
 from umrx_app_v3.shuttle_board.bmi088.accel_streaming_packet import BMI088AccelPacket
 from umrx_app_v3.shuttle_board.bmi088.gyro_streaming_packet import BMI088GyroPacket
+from umrx_app_v3.shuttle_board.payload_layout import PayloadField, PayloadLayout, Payloads
 
 logger = logging.getLogger(__name__)
 
@@ -39,12 +41,33 @@ class BMI088Shuttle:
     GYRO_I2C_DEFAULT_ADDRESS = 0x68
     ACCEL_I2C_DEFAULT_ADDRESS = 0x18
 
+    # Streaming channels and payloads
+    ACCEL_CHANNEL_ID = 1
+    GYRO_CHANNEL_ID = 2
+    ACCEL_I2C_PAYLOAD_LAYOUT = PayloadLayout(
+        (
+            PayloadField("acc_x", 0, 2, signed=True),
+            PayloadField("acc_y", 2, 2, signed=True),
+            PayloadField("acc_z", 4, 2, signed=True),
+        )
+    )
+    ACCEL_SPI_PAYLOAD_LAYOUT = ACCEL_I2C_PAYLOAD_LAYOUT.with_dummy_bytes(1)
+    GYRO_PAYLOAD_LAYOUT = PayloadLayout(
+        (
+            PayloadField("gyr_x", 0, 2, signed=True),
+            PayloadField("gyr_y", 2, 2, signed=True),
+            PayloadField("gyr_z", 4, 2, signed=True),
+        )
+    )
+
     def __init__(self, **kw: Any) -> None:
         self.board: ApplicationBoard | None = kw["board"] if kw.get("board") else None
         self.sensor: BMI088 = BMI088()
         self.is_initialized: bool = False
         self.is_i2c_configured: bool = False
         self.is_spi_configured: bool = False
+        # the accel part starts in I2C mode and stays in SPI mode once switched, until the next reset
+        self.is_accel_spi_enabled: bool = False
         self.is_polling_streaming_configured: bool = False
         self.is_interrupt_streaming_configured: bool = False
 
@@ -72,34 +95,48 @@ class BMI088Shuttle:
 
     def assign_sensor_callbacks(self) -> None:
         self.sensor.assign_gyro_callbacks(
-            read_callback=self.read_gyro_register, write_callback=self.write_gyro_register
+            read_callback=self.read_gyro_register,
+            write_callback=self.write_gyro_register,
+            write_many_callback=self.write_gyro_registers,
         )
         self.sensor.assign_accel_callbacks(
-            read_callback=self.read_accel_register, write_callback=self.write_accel_register
+            read_callback=self.read_accel_register,
+            write_callback=self.write_accel_register,
+            write_many_callback=self.write_accel_registers,
         )
 
     def configure_i2c(self) -> None:
         self.board.set_pin_config(self.PS, PinDirection.OUTPUT, PinValue.HIGH)
         self.board.set_vdd_vddio(3.3, 3.3)
-        time.sleep(0.01)
         self.board.configure_i2c()
         self.assign_sensor_callbacks()
+        self.is_accel_spi_enabled = False
         self.is_i2c_configured = True
         self.is_spi_configured = False
+        self.board.wait_for_chip_id(lambda: self.sensor.gyro_chip_id, "BMI088 gyro chip id")
+        self.board.wait_for_chip_id(lambda: self.sensor.acc_chip_id, "BMI088 accel chip id")
 
     def configure_spi(self) -> None:
         self.board.set_pin_config(self.CSB1, PinDirection.OUTPUT, PinValue.HIGH)
         self.board.set_pin_config(self.CSB2, PinDirection.OUTPUT, PinValue.HIGH)
         self.board.set_pin_config(self.PS, PinDirection.OUTPUT, PinValue.LOW)
-        time.sleep(0.01)
         self.board.set_vdd_vddio(3.3, 3.3)
-        time.sleep(0.2)
         if isinstance(self.board, ApplicationBoardV3Rev1):
-            SPIConfigureCmd.set_bus(SPIBus.BUS_1)
+            self.board.spi_bus = SPIBus.BUS_1
         self.board.configure_spi()
         self.assign_sensor_callbacks()
+        self.is_accel_spi_enabled = False
         self.is_spi_configured = True
         self.is_i2c_configured = False
+        self.board.wait_for_chip_id(lambda: self.sensor.gyro_chip_id, "BMI088 gyro chip id")
+        self.board.wait_for_chip_id(lambda: self.sensor.acc_chip_id, "BMI088 accel chip id")
+
+    def enable_accel_spi(self) -> None:
+        # a rising edge on CSB1 switches the accel part to SPI, this takes one throwaway read after power-up or reset
+        if self.is_accel_spi_enabled:
+            return
+        _ = self.board.read_spi(self.CSB1, BMI088AccelAddr.acc_chip_id.value, 1)
+        self.is_accel_spi_enabled = True
 
     def read_accel_register(self, reg_addr: int, bytes_to_read: int = 1) -> array[int] | int:
         if isinstance(reg_addr, BMI088AccelAddr):
@@ -110,11 +147,11 @@ class BMI088Shuttle:
                 return values[0]
             return values
         if self.is_spi_configured:
-            if bytes_to_read == 1:
-                _ = self.board.read_spi(self.CSB1, reg_addr, 1)
+            self.enable_accel_spi()
+            # every accel SPI read starts with a dummy byte
             values = self.board.read_spi(self.CSB1, reg_addr, bytes_to_read + 1)
             if bytes_to_read == 1:
-                return values[0]
+                return values[1]
             return values[1:]
         error_message = "Configure I2C or SPI protocol prior to reading registers"
         raise BMI088ShuttleError(error_message)
@@ -125,10 +162,26 @@ class BMI088Shuttle:
         if self.is_i2c_configured:
             return self.board.write_i2c(self.ACCEL_I2C_DEFAULT_ADDRESS, reg_addr, array("B", (value,)))
         if self.is_spi_configured:
-            return self.board.write_spi(self.CSB1, reg_addr, array("B", (value,)))
+            self.enable_accel_spi()
+            self.board.write_spi(self.CSB1, reg_addr, array("B", (value,)))
+            self.is_accel_spi_enabled = reg_addr != BMI088AccelAddr.acc_soft_reset.value
+            return None
         error_message = "Configure I2C or SPI protocol prior to reading registers"
         raise BMI088ShuttleError(error_message)
 
+    def write_accel_registers(self, writes: Iterable[tuple[int, int]]) -> None:
+        requests = [(reg_addr, array("B", (value,))) for reg_addr, value in writes]
+        if self.is_i2c_configured:
+            return self.board.write_many(requests, i2c_address=self.ACCEL_I2C_DEFAULT_ADDRESS)
+        if self.is_spi_configured:
+            self.enable_accel_spi()
+            self.board.write_many(requests, cs_pin=self.CSB1)
+            if any(reg_addr == BMI088AccelAddr.acc_soft_reset.value for reg_addr, _ in requests):
+                self.is_accel_spi_enabled = False
+            return None
+        error_message = "Configure I2C or SPI protocol prior to writing registers"
+        raise BMI088ShuttleError(error_message)
+
     def read_gyro_register(self, reg_addr: int, bytes_to_read: int = 1) -> array[int] | int:
         if isinstance(reg_addr, BMI088GyroAddr):
             reg_addr = reg_addr.value
@@ -155,6 +208,15 @@ class BMI088Shuttle:
         error_message = "Configure I2C or SPI protocol prior to reading registers"
         raise BMI088ShuttleError(error_message)
 
+    def write_gyro_registers(self, writes: Iterable[tuple[int, int]]) -> None:
+        requests = [(reg_addr, array("B", (value,))) for reg_addr, value in writes]
+        if self.is_i2c_configured:
+            return self.board.write_many(requests, i2c_address=self.GYRO_I2C_DEFAULT_ADDRESS)
+        if self.is_spi_configured:
+            return self.board.write_many(requests, cs_pin=self.CSB2)
+        error_message = "Configure I2C or SPI protocol prior to writing registers"
+        raise BMI088ShuttleError(error_message)
+
     def _configure_i2c_polling_streaming(
         self,
         accel_sampling_time: int,
@@ -260,15 +322,16 @@ class BMI088Shuttle:
 
     def configure_interrupt_streaming(self) -> None:
         self.switch_on_accel()
-        self.sensor.acc_int1_io_ctrl = 0x0A
-        self.sensor.acc_int_map_data = 0x04
-        self.sensor.gyro_range = 0x03
-        self.sensor.gyro_bandwidth = 0x01
-        self.sensor.gyro_lpm1 = 0x00
-        self.sensor.gyro_int3_int4_io_map = 0x01
-        self.sensor.gyro_int3_int4_io_conf = 0x51
-        self.sensor.gyro_int_ctrl = 0x80
-        time.sleep(0.02)
+        with self.sensor.batch():
+            self.sensor.acc_int1_io_ctrl = 0x0A
+            self.sensor.acc_int_map_data = 0x04
+            self.sensor.gyro_range = 0x03
+            self.sensor.gyro_bandwidth = 0x01
+            self.sensor.gyro_lpm1 = 0x00
+            self.sensor.gyro_int3_int4_io_map = 0x01
+            self.sensor.gyro_int3_int4_io_conf = 0x51
+            self.sensor.gyro_int_ctrl = 0x80
+        self.board.pause(0.02, "interrupt configuration")
         if self.is_i2c_configured:
             return self._configure_i2c_interrupt_streaming()
         if self.is_spi_configured:
@@ -285,9 +348,7 @@ class BMI088Shuttle:
         raise BMI088ShuttleError(error_message)
 
     def stop_streaming(self) -> None:
-        self.board.stop_polling_streaming()
-        time.sleep(0.15)
-        self.board.stop_interrupt_streaming()
+        self.board.stop_streaming()
 
     def decode_gyro_streaming(self, payload: array[int]) -> BMI088GyroPacket:
         g_x, g_y, g_z = struct.unpack("<hhh", payload)
@@ -302,3 +363,16 @@ class BMI088Shuttle:
             return BMI088AccelPacket(a_x_raw=a_x, a_y_raw=a_y, a_z_raw=a_z)
         error_message = f"Cannot parse payload={payload} of length={len(payload)}"
         raise BMI088ShuttleError(error_message)
+
+    @property
+    def accel_payload_layout(self) -> PayloadLayout:
+        return self.ACCEL_SPI_PAYLOAD_LAYOUT if self.is_spi_configured else self.ACCEL_I2C_PAYLOAD_LAYOUT
+
+    def decode_accel_batch(self, frames: Payloads) -> np.ndarray:
+        return self.accel_payload_layout.decode(frames, channel_id=self.ACCEL_CHANNEL_ID)
+
+    def decode_gyro_batch(self, frames: Payloads) -> np.ndarray:
+        return self.GYRO_PAYLOAD_LAYOUT.decode(frames, channel_id=self.GYRO_CHANNEL_ID)
+
+    def decode_batch(self, frames: np.ndarray) -> dict[str, np.ndarray]:
+        return {"accel": self.decode_accel_batch(frames), "gyro": self.decode_gyro_batch(frames)}
@@ -0,0 +1,84 @@
+from typing import Any
+
+from umrx_app_v3.mcu_board.comm.emulator_comm import EmulatorCommunication
+from umrx_app_v3.sensors.bmi088 import BMI088AccelAddr, BMI088GyroAddr
+from umrx_app_v3.shuttle_board.bmi088.bmi088_shuttle import BMI088Shuttle
+from umrx_app_v3.shuttle_board.virtual_shuttle import VirtualSensor, VirtualShuttle, wave
+
+
+class VirtualBMI088Accel(VirtualSensor):
+    CHIP_ID = 0x1E
+    RESET_REGISTER = BMI088AccelAddr.acc_soft_reset.value
+    ODR = 100.0
+    LSB_PER_G = 5460  # +/-6 g after reset
+
+    def __init__(self) -> None:
+        super().__init__(
+            {BMI088AccelAddr.acc_conf.value: 0xA8, BMI088AccelAddr.acc_range.value: 0x01, 0x7C: 0x03},
+            spi_dummy_bytes=1,
+        )
+
+    @property
+    def is_measuring(self) -> bool:
+        return self.registers[BMI088AccelAddr.acc_pwr_ctrl.value] == 0x04
+
+    def sample(self, now: float) -> None:
+        self.put(
+            BMI088AccelAddr.acc_x_lsb.value,
+            "<hhh",
+            wave(now, 0.05 * self.LSB_PER_G, 1.0),
+            wave(now, 0.05 * self.LSB_PER_G, 1.0, phase=1.0),
+            wave(now, 0.05 * self.LSB_PER_G, 1.0, offset=self.LSB_PER_G),
+        )
+        self.put_int24(BMI088AccelAddr.acc_sensor_time_0.value, self.sensor_time(now))
+        # drdy flag
+        self.registers[BMI088AccelAddr.acc_status.value] = 0x80
+
+
+class VirtualBMI088Gyro(VirtualSensor):
+    CHIP_ID = 0x0F
+    RESET_REGISTER = BMI088GyroAddr.gyro_soft_reset.value
+    ODR = 2000.0
+    LSB_PER_DPS = 16.384  # +/-2000 dps after reset
+
+    def __init__(self) -> None:
+        super().__init__({BMI088GyroAddr.gyro_bandwidth.value: 0x80})
+
+    @property
+    def is_measuring(self) -> bool:
+        # normal mode
+        return self.registers[BMI088GyroAddr.gyro_lpm1.value] == 0x00
+
+    def sample(self, now: float) -> None:
+        self.put(
+            BMI088GyroAddr.gyro_rate_x_lsb.value,
+            "<hhh",
+            wave(now, 10 * self.LSB_PER_DPS, 2.0),
+            wave(now, 10 * self.LSB_PER_DPS, 2.0, phase=1.0),
+            wave(now, 10 * self.LSB_PER_DPS, 2.0, phase=2.0),
+        )
+
+
+class VirtualBMI088Shuttle(VirtualShuttle):
+    SHUTTLE = BMI088Shuttle
+
+    def __init__(self, **kw: Any) -> None:
+        self.accel = VirtualBMI088Accel()
+        self.gyro = VirtualBMI088Gyro()
+        super().__init__(**kw)
+
+    def attach(self, emulator: EmulatorCommunication) -> None:
+        self.connect(
+            emulator,
+            self.accel,
+            i2c_address=BMI088Shuttle.ACCEL_I2C_DEFAULT_ADDRESS,
+            cs_pin=BMI088Shuttle.CSB1,
+            interrupt_pins=(BMI088Shuttle.INT1,),
+        )
+        self.connect(
+            emulator,
+            self.gyro,
+            i2c_address=BMI088Shuttle.GYRO_I2C_DEFAULT_ADDRESS,
+            cs_pin=BMI088Shuttle.CSB2,
+            interrupt_pins=(BMI088Shuttle.INT3,),
+        )
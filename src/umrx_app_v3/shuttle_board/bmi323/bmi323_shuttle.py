@@ -1,8 +1,10 @@
 import logging
-import time
 from array import array
+from collections.abc import Iterable
 from typing import Any, Self
 
+import numpy as np
+
 from umrx_app_v3.mcu_board.app_board_v3_rev0 import ApplicationBoardV3Rev0
 from umrx_app_v3.mcu_board.app_board_v3_rev1 import ApplicationBoardV3Rev1
 from umrx_app_v3.mcu_board.bst_app_board import ApplicationBoard
@@ -14,8 +16,8 @@ from umrx_app_v3.mcu_board.bst_protocol_constants import (
     SPIBus,
     StreamingSamplingUnit,
 )
-from umrx_app_v3.mcu_board.commands.spi import SPIConfigureCmd
 from umrx_app_v3.sensors.bmi323 import BMI323, BMI323Addr
+from umrx_app_v3.shuttle_board.payload_layout import PayloadField, PayloadLayout, Payloads
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +37,39 @@ class BMI323Shuttle:
     I2C_DEFAULT_ADDRESS = 0x68
     I2C_ALTERNATIVE_ADDRESS = 0x69
 
+    # every read starts with dummy bytes, two over I2C and one over SPI
+    I2C_DUMMY_BYTES = 2
+    SPI_DUMMY_BYTES = 1
+
+    # Streaming channels and payloads
+    ACCEL_CHANNEL_ID = 1
+    GYRO_CHANNEL_ID = 2
+    I2C_PAYLOAD_LAYOUT = PayloadLayout(
+        (
+            PayloadField("acc_x", 0, 2, signed=True),
+            PayloadField("acc_y", 2, 2, signed=True),
+            PayloadField("acc_z", 4, 2, signed=True),
+            PayloadField("gyr_x", 6, 2, signed=True),
+            PayloadField("gyr_y", 8, 2, signed=True),
+            PayloadField("gyr_z", 10, 2, signed=True),
+            PayloadField("temperature", 12, 2, signed=True),
+            PayloadField("sensor_time", 14, 4),
+        ),
+        dummy_bytes=I2C_DUMMY_BYTES,
+    )
+    SPI_PAYLOAD_LAYOUT = I2C_PAYLOAD_LAYOUT.with_dummy_bytes(SPI_DUMMY_BYTES)
+    ACCEL_I2C_PAYLOAD_LAYOUT = PayloadLayout(I2C_PAYLOAD_LAYOUT.fields[:3], dummy_bytes=I2C_DUMMY_BYTES)
+    ACCEL_SPI_PAYLOAD_LAYOUT = ACCEL_I2C_PAYLOAD_LAYOUT.with_dummy_bytes(SPI_DUMMY_BYTES)
+    GYRO_I2C_PAYLOAD_LAYOUT = PayloadLayout(
+        (
+            PayloadField("gyr_x", 0, 2, signed=True),
+            PayloadField("gyr_y", 2, 2, signed=True),
+            PayloadField("gyr_z", 4, 2, signed=True),
+        ),
+        dummy_bytes=I2C_DUMMY_BYTES,
+    )
+    GYRO_SPI_PAYLOAD_LAYOUT = GYRO_I2C_PAYLOAD_LAYOUT.with_dummy_bytes(SPI_DUMMY_BYTES)
+
     def __init__(self, **kw: Any) -> None:
         self.board: ApplicationBoard | None = kw["board"] if kw.get("board") else None
         self.sensor: BMI323 = BMI323()
@@ -67,28 +102,32 @@ class BMI323Shuttle:
             raise BMI323ShuttleError(error_message)
 
     def assign_sensor_callbacks(self) -> None:
-        self.sensor.assign_callbacks(read_callback=self.read_register, write_callback=self.write_register)
+        self.sensor.assign_callbacks(
+            read_callback=self.read_register,
+            write_callback=self.write_register,
+            write_many_callback=self.write_registers,
+        )
 
     def configure_i2c(self) -> None:
         self.board.set_pin_config(self.SDO, PinDirection.OUTPUT, PinValue.LOW)
         self.board.set_pin_config(self.CS, PinDirection.OUTPUT, PinValue.HIGH)
         self.board.set_vdd_vddio(3.3, 3.3)
-        time.sleep(0.01)
         self.board.configure_i2c(I2CMode.FAST_MODE)
         self.assign_sensor_callbacks()
         self.is_i2c_configured = True
         self.is_spi_configured = False
+        self.board.wait_for_chip_id(lambda: self.sensor.chip_id, "BMI323 chip id")
 
     def configure_spi(self) -> None:
         self.board.set_pin_config(self.CS, PinDirection.OUTPUT, PinValue.HIGH)
         self.board.set_vdd_vddio(3.3, 3.3)
-        time.sleep(0.2)
         if isinstance(self.board, ApplicationBoardV3Rev1):
-            SPIConfigureCmd.set_bus(SPIBus.BUS_1)
+            self.board.spi_bus = SPIBus.BUS_1
         self.board.configure_spi()
         self.assign_sensor_callbacks()
         self.is_spi_configured = True
         self.is_i2c_configured = False
+        self.board.wait_for_chip_id(lambda: self.sensor.chip_id, "BMI323 chip id")
 
     def read_register(self, reg_addr: int, bytes_to_read: int = -1) -> array[int] | int:
         if isinstance(reg_addr, BMI323Addr):
@@ -106,22 +145,24 @@ class BMI323Shuttle:
         raise BMI323ShuttleError(error_message)
 
     def read_single_register_i2c(self, reg_addr: int) -> int:
-        values = self.board.read_i2c(self.I2C_DEFAULT_ADDRESS, reg_addr, bytes_to_read=4)
-        lsb, msb = values[2:]
+        values = self.board.read_i2c(self.I2C_DEFAULT_ADDRESS, reg_addr, bytes_to_read=self.I2C_DUMMY_BYTES + 2)
+        lsb, msb = values[self.I2C_DUMMY_BYTES :]
         return (msb << 8) | lsb
 
     def read_multiple_i2c(self, start_register_addr: int, bytes_to_read: int) -> array[int]:
-        values = self.board.read_i2c(self.I2C_DEFAULT_ADDRESS, start_register_addr, bytes_to_read + 2)
-        return values[2:]
+        values = self.board.read_i2c(
+            self.I2C_DEFAULT_ADDRESS, start_register_addr, self.I2C_DUMMY_BYTES + bytes_to_read
+        )
+        return values[self.I2C_DUMMY_BYTES :]
 
     def read_single_register_spi(self, reg_addr: int) -> int:
-        values = self.board.read_spi(self.CS, reg_addr, 3)
-        lsb, msb = values[1:]
+        values = self.board.read_spi(self.CS, reg_addr, self.SPI_DUMMY_BYTES + 2)
+        lsb, msb = values[self.SPI_DUMMY_BYTES :]
         return (msb << 8) | lsb
 
     def read_multiple_spi(self, start_register_addr: int, bytes_to_read: int) -> array[int]:
-        payload = self.board.read_spi(self.CS, start_register_addr, bytes_to_read + 1)
-        return payload[1:]
+        payload = self.board.read_spi(self.CS, start_register_addr, self.SPI_DUMMY_BYTES + bytes_to_read)
+        return payload[self.SPI_DUMMY_BYTES :]
 
     def write_register(self, reg_addr: int, value: int) -> None:
         if isinstance(reg_addr, BMI323Addr):
@@ -134,6 +175,15 @@ class BMI323Shuttle:
         error_message = "Configure I2C or SPI protocol prior to reading registers"
         raise BMI323ShuttleError(error_message)
 
+    def write_registers(self, writes: Iterable[tuple[int, int]]) -> None:
+        requests = [(reg_addr, array("B", (value & 0xFF, (value >> 8) & 0xFF))) for reg_addr, value in writes]
+        if self.is_i2c_configured:
+            return self.board.write_many(requests, i2c_address=self.I2C_DEFAULT_ADDRESS, register_width=2)
+        if self.is_spi_configured:
+            return self.board.write_many(requests, cs_pin=self.CS, register_width=2)
+        error_message = "Configure I2C or SPI protocol prior to writing registers"
+        raise BMI323ShuttleError(error_message)
+
     def _configure_i2c_polling_streaming(
         self,
         sampling_time: int,
@@ -144,7 +194,7 @@ class BMI323Shuttle:
             sampling_time=sampling_time,
             sampling_unit=sampling_unit,
             register_address=BMI323Addr.acc_data_x.value,
-            bytes_to_read=(2 + 6 + 6 + 2 + 4),
+            bytes_to_read=self.I2C_PAYLOAD_LAYOUT.size,
         )
         self.board.configure_streaming_polling(interface="i2c")
         self.is_polling_streaming_configured = True
@@ -159,14 +209,16 @@ class BMI323Shuttle:
             sampling_time=sampling_time,
             sampling_unit=sampling_unit,
             register_address=BMI323Addr.acc_data_x.value,
-            bytes_to_read=(1 + 6 + 6 + 2 + 4),
+            bytes_to_read=self.SPI_PAYLOAD_LAYOUT.size,
         )
         self.board.configure_streaming_polling(interface="spi")
         self.is_polling_streaming_configured = True
 
     def switch_on_accel_and_gyro(self) -> None:
-        self.sensor.acc_conf = 0x4027
-        self.sensor.gyr_conf = 0x404B
+        # acc_conf and gyr_conf are adjacent, both go out in a single burst
+        with self.sensor.batch():
+            self.sensor.acc_conf = 0x4027
+            self.sensor.gyr_conf = 0x404B
 
     def configure_polling_streaming(
         self,
@@ -186,13 +238,13 @@ class BMI323Shuttle:
             interrupt_pin=self.INT1,
             i2c_address=BMI323Shuttle.I2C_DEFAULT_ADDRESS,
             register_address=BMI323Addr.acc_data_x.value,
-            bytes_to_read=(2 + 6),
+            bytes_to_read=self.ACCEL_I2C_PAYLOAD_LAYOUT.size,
         )
         self.board.streaming_interrupt_set_i2c_channel(
             interrupt_pin=self.INT2,
             i2c_address=BMI323Shuttle.I2C_DEFAULT_ADDRESS,
             register_address=BMI323Addr.gyr_data_x.value,
-            bytes_to_read=(2 + 6),
+            bytes_to_read=self.GYRO_I2C_PAYLOAD_LAYOUT.size,
         )
         self.board.configure_streaming_interrupt(interface="i2c")
         self.is_interrupt_streaming_configured = True
@@ -202,23 +254,24 @@ class BMI323Shuttle:
             interrupt_pin=self.INT1,
             cs_pin=self.CS,
             register_address=BMI323Addr.acc_data_x.value,
-            bytes_to_read=(1 + 6),
+            bytes_to_read=self.ACCEL_SPI_PAYLOAD_LAYOUT.size,
         )
         self.board.streaming_interrupt_set_spi_channel(
             interrupt_pin=self.INT2,
             cs_pin=self.CS,
             register_address=BMI323Addr.gyr_data_x.value,
-            bytes_to_read=(1 + 6),
+            bytes_to_read=self.GYRO_SPI_PAYLOAD_LAYOUT.size,
         )
         self.board.configure_streaming_interrupt(interface="spi")
         self.is_interrupt_streaming_configured = True
 
     def configure_interrupt_streaming(self) -> None:
-        self.switch_on_accel_and_gyro()
-        self.sensor.int_map2 = (0b01 << 10) | (0b10 << 8)
-        self.sensor.int_conf = 0x0000
-        self.sensor.io_int_ctrl = (0b101 << 8) | 0b101
-        time.sleep(0.02)
+        with self.sensor.batch():
+            self.switch_on_accel_and_gyro()
+            self.sensor.int_map2 = (0b01 << 10) | (0b10 << 8)
+            self.sensor.int_conf = 0x0000
+            self.sensor.io_int_ctrl = (0b101 << 8) | 0b101
+        self.board.pause(0.02, "interrupt configuration")
         if self.is_i2c_configured:
             return self._configure_i2c_interrupt_streaming()
         if self.is_spi_configured:
@@ -235,6 +288,22 @@ class BMI323Shuttle:
         raise BMI323ShuttleError(error_message)
 
     def stop_streaming(self) -> None:
-        self.board.stop_polling_streaming()
-        time.sleep(0.15)
-        self.board.stop_interrupt_streaming()
+        self.board.stop_streaming()
+
+    @property
+    def payload_layout(self) -> PayloadLayout:
+        return self.SPI_PAYLOAD_LAYOUT if self.is_spi_configured else self.I2C_PAYLOAD_LAYOUT
+
+    def decode_accel_batch(self, frames: Payloads) -> np.ndarray:
+        layout = self.ACCEL_SPI_PAYLOAD_LAYOUT if self.is_spi_configured else self.ACCEL_I2C_PAYLOAD_LAYOUT
+        return layout.decode(frames, channel_id=self.ACCEL_CHANNEL_ID)
+
+    def decode_gyro_batch(self, frames: Payloads) -> np.ndarray:
+        layout = self.GYRO_SPI_PAYLOAD_LAYOUT if self.is_spi_configured else self.GYRO_I2C_PAYLOAD_LAYOUT
+        return layout.decode(frames, channel_id=self.GYRO_CHANNEL_ID)
+
+    def decode_batch(self, frames: Payloads) -> np.ndarray | dict[str, np.ndarray]:
+        # interrupt streaming reads accel and gyro on separate channels
+        if self.is_interrupt_streaming_configured:
+            return {"accel": self.decode_accel_batch(frames), "gyro": self.decode_gyro_batch(frames)}
+        return self.payload_layout.decode(frames)
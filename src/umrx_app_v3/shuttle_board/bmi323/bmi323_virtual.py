@@ -0,0 +1,95 @@
+from typing import Any
+
+from umrx_app_v3.mcu_board.comm.emulator_comm import EmulatorCommunication
+from umrx_app_v3.sensors.bmi323 import BMI323Addr
+from umrx_app_v3.shuttle_board.bmi323.bmi323_shuttle import BMI323Shuttle
+from umrx_app_v3.shuttle_board.virtual_shuttle import VirtualSensor, VirtualShuttle, wave
+
+SOFT_RESET_COMMAND = 0xDEAF
+SENSOR_MODE_MASK = 0x7000
+FEATURE_ENGINE_STARTUP = 0x012C
+FEATURE_ENGINE_ACTIVATED = 0x0001
+WORD_SIZE = 2
+
+
+class VirtualBMI323(VirtualSensor):
+    # registers are 16 bit wide, a register address selects a little endian word
+    CHIP_ID = 0x43
+    ODR = 800.0  # gyro rate the shuttle configures, data registers change at this rate
+    ACCEL_ODR = 50.0
+    LSB_PER_G = 4096  # +/-8 g
+    LSB_PER_DPS = 16.4  # +/-2000 dps
+    LSB_PER_DEGC = 512
+
+    def __init__(self) -> None:
+        super().__init__(i2c_dummy_bytes=BMI323Shuttle.I2C_DUMMY_BYTES, spi_dummy_bytes=BMI323Shuttle.SPI_DUMMY_BYTES)
+        for reg_addr, value in ((BMI323Addr.acc_conf.value, 0x0028), (BMI323Addr.gyr_conf.value, 0x0048)):
+            self.defaults[WORD_SIZE * reg_addr : WORD_SIZE * reg_addr + WORD_SIZE] = value.to_bytes(2, "little")
+        self.reset()
+
+    def word(self, reg_addr: int) -> int:
+        return int.from_bytes(self.registers[WORD_SIZE * reg_addr : WORD_SIZE * reg_addr + WORD_SIZE], "little")
+
+    def set_word(self, reg_addr: int, value: int) -> None:
+        self.put(WORD_SIZE * reg_addr, "<H", value)
+
+    def read(self, reg_addr: int, length: int) -> bytes:
+        return super().read(WORD_SIZE * reg_addr, length)
+
+    def write(self, reg_addr: int, data: bytes) -> None:
+        for idx in range(len(data) // WORD_SIZE):
+            self.write_word(
+                reg_addr + idx, int.from_bytes(data[WORD_SIZE * idx : WORD_SIZE * idx + WORD_SIZE], "little")
+            )
+
+    def write_word(self, reg_addr: int, value: int) -> None:
+        if reg_addr == BMI323Addr.cmd.value and value == SOFT_RESET_COMMAND:
+            self.reset()
+            return
+        self.set_word(reg_addr, value)
+        if reg_addr == BMI323Addr.feature_ctrl.value and value & 0x01:
+            # the feature engine starts when the startup word was written before it is enabled
+            started = self.word(BMI323Addr.feature_io2.value) == FEATURE_ENGINE_STARTUP
+            self.set_word(BMI323Addr.feature_io1.value, FEATURE_ENGINE_ACTIVATED if started else 0x0000)
+
+    @property
+    def is_measuring(self) -> bool:
+        return bool((self.word(BMI323Addr.acc_conf.value) | self.word(BMI323Addr.gyr_conf.value)) & SENSOR_MODE_MASK)
+
+    def sample(self, now: float) -> None:
+        # the accel part updates at its own, lower rate
+        accel_time = int(now * self.ACCEL_ODR) / self.ACCEL_ODR
+        self.put(
+            WORD_SIZE * BMI323Addr.acc_data_x.value,
+            "<hhhhhhhI",
+            wave(accel_time, 0.02 * self.LSB_PER_G, 1.5),
+            wave(accel_time, 0.02 * self.LSB_PER_G, 1.5, phase=1.0),
+            wave(accel_time, 0.02 * self.LSB_PER_G, 1.5, offset=self.LSB_PER_G),
+            wave(now, 10 * self.LSB_PER_DPS, 2.0),
+            wave(now, 10 * self.LSB_PER_DPS, 2.0, phase=1.0),
+            wave(now, 10 * self.LSB_PER_DPS, 2.0, phase=2.0),
+            # 0 LSB is 23 degC
+            wave(now, 0.1 * self.LSB_PER_DEGC, 0.01, offset=2 * self.LSB_PER_DEGC),
+            int(now / self.SENSOR_TIME_RESOLUTION) & 0xFFFFFFFF,
+        )
+        # drdy_temp, drdy_gyr, drdy_acc
+        self.set_word(BMI323Addr.status.value, 0x00E0)
+
+
+class VirtualBMI323Shuttle(VirtualShuttle):
+    SHUTTLE = BMI323Shuttle
+
+    def __init__(self, **kw: Any) -> None:
+        self.sensor = VirtualBMI323()
+        super().__init__(**kw)
+
+    def attach(self, emulator: EmulatorCommunication) -> None:
+        self.connect(
+            emulator,
+            self.sensor,
+            i2c_address=BMI323Shuttle.I2C_DEFAULT_ADDRESS,
+            cs_pin=BMI323Shuttle.CS,
+            interrupt_pins=(BMI323Shuttle.INT2,),
+        )
+        # accel data ready is mapped to INT1
+        emulator.set_interrupt_odr(BMI323Shuttle.INT1, self.sensor.ACCEL_ODR)
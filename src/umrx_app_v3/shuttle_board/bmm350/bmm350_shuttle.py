@@ -1,8 +1,10 @@
 import logging
-import time
 from array import array
+from collections.abc import Iterable
 from typing import Any, Self
 
+import numpy as np
+
 from umrx_app_v3.mcu_board.app_board_v3_rev0 import ApplicationBoardV3Rev0
 from umrx_app_v3.mcu_board.app_board_v3_rev1 import ApplicationBoardV3Rev1
 from umrx_app_v3.mcu_board.bst_app_board import ApplicationBoard
@@ -14,6 +16,8 @@ from umrx_app_v3.mcu_board.bst_protocol_constants import (
     StreamingSamplingUnit,
 )
 from umrx_app_v3.sensors.bmm350 import BMM350, BMM350Addr
+from umrx_app_v3.shuttle_board.calibration_cache import CalibrationCache
+from umrx_app_v3.shuttle_board.payload_layout import PayloadField, PayloadLayout, Payloads
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +35,21 @@ class BMM350Shuttle:
     I2C_DEFAULT_ADDRESS = 0x14
     I2C_ALTERNATIVE_ADDRESS = 0x15
 
+    # every I2C read starts with two dummy bytes
+    I2C_DUMMY_BYTES = 2
+
+    # Streaming payload
+    PAYLOAD_LAYOUT = PayloadLayout(
+        (
+            PayloadField("mag_x", 0, 3, signed=True),
+            PayloadField("mag_y", 3, 3, signed=True),
+            PayloadField("mag_z", 6, 3, signed=True),
+            PayloadField("temperature", 9, 3, signed=True),
+            PayloadField("sensor_time", 12, 3),
+        ),
+        dummy_bytes=I2C_DUMMY_BYTES,
+    )
+
     def __init__(self, **kw: Any) -> None:
         self.board: ApplicationBoard | None = kw["board"] if kw.get("board") else None
         self.sensor: BMM350 = BMM350()
@@ -63,27 +82,30 @@ class BMM350Shuttle:
             raise BMM350ShuttleError(error_message)
 
     def assign_sensor_callbacks(self) -> None:
-        self.sensor.assign_callbacks(read_callback=self.read_register, write_callback=self.write_register)
+        self.sensor.assign_callbacks(
+            read_callback=self.read_register,
+            write_callback=self.write_register,
+            write_many_callback=self.write_registers,
+        )
 
     def configure_i2c(self) -> None:
-        self.board.set_vdd_vddio(0.0, 0.0)
-        time.sleep(0.1)
+        self.board.power_off()
         self.board.set_pin_config(self.ADSEL, PinDirection.OUTPUT, PinValue.LOW)
         self.board.set_vdd_vddio(2.7, 2.7)
-        time.sleep(0.01)
         self.board.configure_i2c(I2CMode.FAST_MODE)
         self.assign_sensor_callbacks()
         self.is_i2c_configured = True
         self.is_spi_configured = False
+        self.board.wait_for_chip_id(lambda: self.sensor.chip_id, "BMM350 chip id")
 
     def read_register(self, reg_addr: int, bytes_to_read: int = 1) -> array[int] | int:
         if isinstance(reg_addr, BMM350Addr):
             reg_addr = reg_addr.value
         if self.is_i2c_configured:
-            values = self.board.read_i2c(self.I2C_DEFAULT_ADDRESS, reg_addr, bytes_to_read + 2)
+            values = self.board.read_i2c(self.I2C_DEFAULT_ADDRESS, reg_addr, self.I2C_DUMMY_BYTES + bytes_to_read)
             if bytes_to_read == 1:
-                return values[2]
-            return values[2:]
+                return values[self.I2C_DUMMY_BYTES]
+            return values[self.I2C_DUMMY_BYTES :]
         error_message = "Configure I2C protocol prior to reading registers"
         raise BMM350ShuttleError(error_message)
 
@@ -95,6 +117,13 @@ class BMM350Shuttle:
         error_message = "Configure I2C protocol prior to reading registers"
         raise BMM350ShuttleError(error_message)
 
+    def write_registers(self, writes: Iterable[tuple[int, int]]) -> None:
+        requests = [(reg_addr, array("B", (value,))) for reg_addr, value in writes]
+        if self.is_i2c_configured:
+            return self.board.write_many(requests, i2c_address=self.I2C_DEFAULT_ADDRESS)
+        error_message = "Configure I2C protocol prior to writing registers"
+        raise BMM350ShuttleError(error_message)
+
     def _configure_i2c_polling_streaming(
         self,
         sampling_time: int,
@@ -105,11 +134,24 @@ class BMM350Shuttle:
             sampling_time=sampling_time,
             sampling_unit=sampling_unit,
             register_address=BMM350Addr.mag_x_xlsb.value,
-            bytes_to_read=(2 + 9 + 3 + 3),
+            bytes_to_read=self.PAYLOAD_LAYOUT.size,
         )
         self.board.configure_streaming_polling(interface="i2c")
         self.is_polling_streaming_configured = True
 
+    def read_otp(self, cache: CalibrationCache | None = None) -> dict[str, int]:
+        if cache is None:
+            return self.sensor.read_otp()
+        key = cache.key(self.SHUTTLE_ID, self.sensor.chip_identity())
+        words = cache.load(key)
+        if words is None:
+            words = self.sensor.read_otp()
+            cache.store(key, words)
+            return words
+        logger.info(f"Loaded BMM350 OTP from calibration cache {key}")
+        self.sensor.load_otp(words)
+        return words
+
     def close_otp(self) -> None:
         self.sensor.otp_cmd_reg = 0x80
 
@@ -134,7 +176,7 @@ class BMM350Shuttle:
             interrupt_pin=self.INT,
             i2c_address=self.I2C_DEFAULT_ADDRESS,
             register_address=BMM350Addr.mag_x_xlsb.value,
-            bytes_to_read=(2 + 9 + 3 + 3),
+            bytes_to_read=self.PAYLOAD_LAYOUT.size,
         )
         self.board.configure_streaming_interrupt(interface="i2c")
         self.is_interrupt_streaming_configured = True
@@ -142,7 +184,7 @@ class BMM350Shuttle:
     def configure_interrupt_streaming(self) -> None:
         self.start_measurement()
         self.sensor.int_ctrl = (1 << 7) | (1 << 3) | (1 << 2) | (1 << 1)
-        time.sleep(0.02)
+        self.board.pause(0.02, "interrupt configuration")
         if self.is_i2c_configured:
             return self._configure_i2c_interrupt_streaming()
         error_message = "Configure I2C protocol first"
@@ -157,6 +199,7 @@ class BMM350Shuttle:
         raise BMM350ShuttleError(error_message)
 
     def stop_streaming(self) -> None:
-        self.board.stop_polling_streaming()
-        time.sleep(0.15)
-        self.board.stop_interrupt_streaming()
+        self.board.stop_streaming()
+
+    def decode_batch(self, frames: Payloads) -> np.ndarray:
+        return self.PAYLOAD_LAYOUT.decode(frames)
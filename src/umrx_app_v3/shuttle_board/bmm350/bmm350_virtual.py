@@ -0,0 +1,73 @@
+from typing import Any
+
+from umrx_app_v3.mcu_board.comm.emulator_comm import EmulatorCommunication
+from umrx_app_v3.sensors.bmm350 import BMM350Addr, BMM350OtpAddr
+from umrx_app_v3.shuttle_board.bmm350.bmm350_shuttle import BMM350Shuttle
+from umrx_app_v3.shuttle_board.virtual_shuttle import VirtualSensor, VirtualShuttle, wave
+
+# trim words of one part, within the ranges seen on real sensors
+BMM350_OTP_WORDS = {
+    BMM350OtpAddr.temp_off_sens.value: 0x0A05,
+    BMM350OtpAddr.mag_offset_x.value: 0x1FF2,
+    BMM350OtpAddr.mag_offset_y.value: 0x0308,
+    BMM350OtpAddr.mag_offset_z.value: 0xFC14,
+    BMM350OtpAddr.mag_sens_y.value: 0x04FE,
+    BMM350OtpAddr.mag_tco_x.value: 0x0203,
+    BMM350OtpAddr.mag_tco_y.value: 0xFFFE,
+    BMM350OtpAddr.mag_tco_z.value: 0x0101,
+    BMM350OtpAddr.cross_x_y.value: 0x02FD,
+    BMM350OtpAddr.cross_z_x.value: 0xFE04,
+    BMM350OtpAddr.mag_dut_t_0.value: 0x0480,
+}
+OTP_READ_COMMAND = 0x20
+OTP_ADDRESS_MASK = 0x1F
+PMU_SUSPEND_MODE = 0x00
+PMU_NORMAL_MODE = 0x01
+
+
+class VirtualBMM350(VirtualSensor):
+    CHIP_ID = 0x33
+    RESET_REGISTER = BMM350Addr.cmd.value
+    ODR = 100.0
+
+    def __init__(self, otp_words: dict[int, int] | None = None) -> None:
+        super().__init__(i2c_dummy_bytes=BMM350Shuttle.I2C_DUMMY_BYTES)
+        self.otp_words = BMM350_OTP_WORDS if otp_words is None else otp_words
+
+    def write_register(self, reg_addr: int, value: int) -> None:
+        super().write_register(reg_addr, value)
+        if reg_addr == BMM350Addr.otp_cmd_reg.value and value & OTP_READ_COMMAND:
+            self.put(BMM350Addr.otp_data_msb_reg.value, ">H", self.otp_words.get(value & OTP_ADDRESS_MASK, 0))
+            # command done, no error bits
+            self.registers[BMM350Addr.otp_status_reg.value] = 0x01
+        elif reg_addr == BMM350Addr.pmu_cmd.value and value in (PMU_SUSPEND_MODE, PMU_NORMAL_MODE):
+            self.registers[BMM350Addr.pmu_cmd_status_1.value] = value
+
+    @property
+    def is_measuring(self) -> bool:
+        return self.registers[BMM350Addr.pmu_cmd_status_1.value] == PMU_NORMAL_MODE
+
+    def sample(self, now: float) -> None:
+        self.put_int24(
+            BMM350Addr.mag_x_xlsb.value,
+            wave(now, 20000, 0.5, offset=-12000),
+            wave(now, 20000, 0.5, offset=3500, phase=1.0),
+            wave(now, 5000, 0.5, offset=-80000),
+            wave(now, 200, 0.01, offset=25 * 4096),
+            self.sensor_time(now),
+        )
+        # data ready
+        self.registers[BMM350Addr.int_status.value] = 0x04
+
+
+class VirtualBMM350Shuttle(VirtualShuttle):
+    SHUTTLE = BMM350Shuttle
+
+    def __init__(self, **kw: Any) -> None:
+        self.sensor = VirtualBMM350(kw.get("otp_words"))
+        super().__init__(**kw)
+
+    def attach(self, emulator: EmulatorCommunication) -> None:
+        self.connect(
+            emulator, self.sensor, i2c_address=BMM350Shuttle.I2C_DEFAULT_ADDRESS, interrupt_pins=(BMM350Shuttle.INT,)
+        )
@@ -0,0 +1,56 @@
+import struct
+from typing import Any
+
+from umrx_app_v3.mcu_board.comm.emulator_comm import EmulatorCommunication
+from umrx_app_v3.sensors.bmp390 import BMP390, BMP390Addr, BMP390NVMAddr
+from umrx_app_v3.shuttle_board.bmp390.bmp390_shuttle import BMP390Shuttle
+from umrx_app_v3.shuttle_board.virtual_shuttle import invert, VirtualSensor, VirtualShuttle, wave
+
+# calibration coefficients of one part, in the order of `BMP390.NVM_FORMAT`
+BMP390_NVM = (27497, 19020, -7, -20, -3001, 35, 1, 25186, 30376, 3, -6, 3836, 6, -60)
+NORMAL_MODE = 0b11 << 4
+
+
+class VirtualBMP390(VirtualSensor):
+    CHIP_ID = 0x60
+    ODR = 200.0
+
+    def __init__(self, nvm: tuple[int, ...] = BMP390_NVM) -> None:
+        super().__init__({BMP390Addr.rev_id.value: 0x01, BMP390Addr.status.value: 0x10}, spi_dummy_bytes=1)
+        struct.pack_into(BMP390.NVM_FORMAT, self.defaults, BMP390NVMAddr.nvm_par_t1.value, *nvm)
+        self.reset()
+        # the driver's own compensation, raw values are generated so that they compensate to the target
+        self.compensation = BMP390()
+        self.compensation.load_nvm(dict(zip((addr.name for addr in BMP390NVMAddr), nvm, strict=True)))
+
+    @property
+    def is_measuring(self) -> bool:
+        return self.registers[BMP390Addr.pwr_ctrl.value] & NORMAL_MODE == NORMAL_MODE
+
+    def sample(self, now: float) -> None:
+        temperature = wave(now, 0.5, 0.05, offset=25.0)
+        pressure = wave(now, 50.0, 0.2, offset=101325.0)
+        raw_temperature = invert(self.compensation.compensate_temperature, temperature)
+        compensated_temperature = self.compensation.compensate_temperature(raw_temperature)
+        raw_pressure = invert(lambda raw: self.compensation.compensate_pressure(raw, compensated_temperature), pressure)
+        self.put_int24(BMP390Addr.data_0.value, raw_pressure, raw_temperature)
+        self.put_int24(BMP390Addr.sensor_time_0.value, self.sensor_time(now))
+        # command ready, pressure and temperature data ready
+        self.registers[BMP390Addr.status.value] = 0x70
+
+
+class VirtualBMP390Shuttle(VirtualShuttle):
+    SHUTTLE = BMP390Shuttle
+
+    def __init__(self, **kw: Any) -> None:
+        self.sensor = VirtualBMP390(kw.get("nvm", BMP390_NVM))
+        super().__init__(**kw)
+
+    def attach(self, emulator: EmulatorCommunication) -> None:
+        self.connect(
+            emulator,
+            self.sensor,
+            i2c_address=BMP390Shuttle.I2C_DEFAULT_ADDRESS,
+            cs_pin=BMP390Shuttle.CS,
+            interrupt_pins=(BMP390Shuttle.INT1,),
+        )
@@ -0,0 +1,81 @@
+from typing import Any
+
+from umrx_app_v3.mcu_board.comm.emulator_comm import EmulatorCommunication
+from umrx_app_v3.sensors.bmp585 import BMP585Addr
+from umrx_app_v3.shuttle_board.bmp585.bmp585_shuttle import BMP585Shuttle
+from umrx_app_v3.shuttle_board.virtual_shuttle import VirtualSensor, VirtualShuttle, wave
+
+# NVM reads are unlocked by the command sequence 0x5D, 0xA5
+NVM_FIRST_COMMAND = 0x5D
+NVM_READ_ENABLE_COMMAND = 0xA5
+NVM_ADDRESS_MASK = 0x3F
+POWER_MODE_MASK = 0b11
+STANDBY_MODE = 0b00
+NVM_READY = 1 << 1
+POWER_ON_RESET = 1 << 4
+LSB_PER_DEGC = 1 << 16
+LSB_PER_PA = 1 << 6
+
+
+class VirtualBMP585(VirtualSensor):
+    CHIP_ID_REGISTER = BMP585Addr.chip_id.value
+    CHIP_ID = 0x51
+    RESET_REGISTER = BMP585Addr.cmd.value
+    ODR = 240.0
+
+    def __init__(self, nvm_words: dict[int, int] | None = None) -> None:
+        super().__init__(
+            {
+                BMP585Addr.rev_id.value: 0x32,
+                BMP585Addr.status.value: NVM_READY,
+                BMP585Addr.int_status.value: POWER_ON_RESET,
+            }
+        )
+        self.nvm_words = nvm_words or {}
+        self.last_command = 0x00
+
+    def write_register(self, reg_addr: int, value: int) -> None:
+        super().write_register(reg_addr, value)
+        if reg_addr != BMP585Addr.cmd.value:
+            return
+        if self.last_command == NVM_FIRST_COMMAND and value == NVM_READ_ENABLE_COMMAND:
+            nvm_addr = self.registers[BMP585Addr.nvm_addr.value] & NVM_ADDRESS_MASK
+            self.put(BMP585Addr.nvm_data_lsb.value, "<H", self.nvm_words.get(nvm_addr, 0))
+        self.last_command = value
+
+    def read(self, reg_addr: int, length: int) -> bytes:
+        data = super().read(reg_addr, length)
+        if reg_addr <= BMP585Addr.int_status.value < reg_addr + length:
+            # int_status is cleared on read
+            self.registers[BMP585Addr.int_status.value] = 0x00
+        return data
+
+    @property
+    def is_measuring(self) -> bool:
+        return self.registers[BMP585Addr.odr_config.value] & POWER_MODE_MASK != STANDBY_MODE
+
+    def sample(self, now: float) -> None:
+        self.put_int24(
+            BMP585Addr.temp_data_xlsb.value,
+            wave(now, 0.5, 0.05, offset=25.0) * LSB_PER_DEGC,
+            wave(now, 50.0, 0.2, offset=101325.0) * LSB_PER_PA,
+        )
+        # data ready
+        self.registers[BMP585Addr.int_status.value] |= 0x01
+
+
+class VirtualBMP585Shuttle(VirtualShuttle):
+    SHUTTLE = BMP585Shuttle
+
+    def __init__(self, **kw: Any) -> None:
+        self.sensor = VirtualBMP585(kw.get("nvm_words"))
+        super().__init__(**kw)
+
+    def attach(self, emulator: EmulatorCommunication) -> None:
+        self.connect(
+            emulator,
+            self.sensor,
+            i2c_address=BMP585Shuttle.I2C_DEFAULT_ADDRESS,
+            cs_pin=BMP585Shuttle.CS,
+            interrupt_pins=(BMP585Shuttle.INT1,),
+        )
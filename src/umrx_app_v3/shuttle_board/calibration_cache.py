@@ -0,0 +1,41 @@
+import json
+import logging
+import os
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class CalibrationCache:
+    def __init__(self, path: Path | str | None = None) -> None:
+        self.path: Path = Path(path) if path is not None else CalibrationCache.default_path()
+
+    @staticmethod
+    def default_path() -> Path:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        return Path(cache_home) / "umrx_app_v3" / "calibration.json"
+
+    @staticmethod
+    def key(shuttle_id: int, chip_identity: tuple[int, ...]) -> str:
+        return f"{shuttle_id:04X}:" + "-".join(f"{value:04X}" for value in chip_identity)
+
+    def read_all(self) -> dict[str, dict[str, int]]:
+        try:
+            return json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            logger.warning(f"Ignoring unreadable calibration cache {self.path}")
+            return {}
+
+    def load(self, key: str) -> dict[str, int] | None:
+        return self.read_all().get(key)
+
+    def store(self, key: str, coefficients: dict[str, int]) -> None:
+        entries = self.read_all()
+        entries[key] = coefficients
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # write aside and rename, so that a power-cycled rig never sees a half-written file
+        temporary_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        temporary_path.write_text(json.dumps(entries, indent=2, sort_keys=True))
+        temporary_path.replace(self.path)
@@ -0,0 +1,98 @@
+import logging
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from typing import Literal, Self
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+Payloads = np.ndarray | bytes | bytearray | memoryview | array | Iterable[bytes | memoryview | array]
+
+
+class PayloadLayoutError(Exception): ...
+
+
+@dataclass(frozen=True)
+class PayloadField:
+    name: str
+    offset: int
+    size: int
+    signed: bool = False
+    byteorder: Literal["little", "big"] = "little"
+    shift: int = 0
+    bits: int | None = None
+
+    @property
+    def width(self) -> int:
+        return self.size * 8 - self.shift if self.bits is None else self.bits
+
+    @property
+    def dtype(self) -> np.dtype:
+        if self.width < 32 or (self.signed and self.width == 32):
+            return np.dtype(np.int32)
+        return np.dtype(np.int64)
+
+
+@dataclass(frozen=True)
+class PayloadLayout:
+    fields: tuple[PayloadField, ...]
+    # bytes in front of the register data, e.g. the SPI dummy byte
+    dummy_bytes: int = 0
+
+    @property
+    def size(self) -> int:
+        return self.dummy_bytes + max(field.offset + field.size for field in self.fields)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype([(field.name, field.dtype) for field in self.fields])
+
+    def with_dummy_bytes(self, dummy_bytes: int) -> Self:
+        return replace(self, dummy_bytes=dummy_bytes)
+
+    def as_payload_array(self, payloads: Payloads, channel_id: int | None = None) -> np.ndarray:
+        if isinstance(payloads, np.ndarray) and payloads.dtype.names is not None:
+            # structured batch from `decode_streaming_batch`
+            if channel_id is not None:
+                payloads = payloads[payloads["channel_id"] == channel_id]
+            if np.any(payloads["payload_length"] != self.size):
+                error_message = f"Expect payloads of {self.size} bytes, got {np.unique(payloads['payload_length'])}"
+                raise PayloadLayoutError(error_message)
+            return payloads["payload"][:, : self.size]
+        if isinstance(payloads, np.ndarray):
+            data = payloads.astype(np.uint8, copy=False)
+        else:
+            if not isinstance(payloads, bytes | bytearray | memoryview | array):
+                payloads = b"".join(payloads)
+            data = np.frombuffer(payloads, dtype=np.uint8)
+            if data.size % self.size != 0:
+                error_message = f"Cannot split {data.size} bytes into payloads of {self.size} bytes"
+                raise PayloadLayoutError(error_message)
+            data = data.reshape(-1, self.size)
+        if data.ndim != 2 or data.shape[1] != self.size:
+            error_message = f"Expect payloads of {self.size} bytes, got array of shape {data.shape}"
+            raise PayloadLayoutError(error_message)
+        return data
+
+    def decode_field(self, data: np.ndarray, field: PayloadField) -> np.ndarray:
+        start = self.dummy_bytes + field.offset
+        columns = data[:, start : start + field.size]
+        if field.byteorder == "little":
+            columns = columns[:, ::-1]
+        value = np.zeros(data.shape[0], dtype=np.int64)
+        for idx in range(field.size):
+            value = (value << 8) | columns[:, idx]
+        value = (value >> field.shift) & ((1 << field.width) - 1)
+        if field.signed:
+            sign_bit = 1 << (field.width - 1)
+            value = (value ^ sign_bit) - sign_bit
+        return value
+
+    def decode(self, payloads: Payloads, channel_id: int | None = None) -> np.ndarray:
+        data = self.as_payload_array(payloads, channel_id)
+        result = np.empty(data.shape[0], dtype=self.dtype)
+        for field in self.fields:
+            result[field.name] = self.decode_field(data, field)
+        return result
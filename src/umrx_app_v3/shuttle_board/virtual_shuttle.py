@@ -0,0 +1,133 @@
+import abc
+import logging
+import math
+import struct
+from collections.abc import Callable
+from typing import Any
+
+from umrx_app_v3.mcu_board.app_board_v3_rev1 import ApplicationBoardV3Rev1
+from umrx_app_v3.mcu_board.bst_protocol_constants import MultiIOPin
+from umrx_app_v3.mcu_board.comm.emulator_comm import EmulatorCommunication, RegisterDevice
+
+logger = logging.getLogger(__name__)
+
+
+def wave(now: float, amplitude: float, frequency: float, offset: float = 0.0, phase: float = 0.0) -> float:
+    # deterministic test signal, the same time always gives the same sample
+    return offset + amplitude * math.sin(2 * math.pi * frequency * now + phase)
+
+
+def invert(compensate: Callable[[int], float], target: float, low: int = 0, high: int = (1 << 24) - 1) -> int:
+    # raw value that the sensor driver compensates to `target`, `compensate` has to be monotonic on [low, high]
+    increasing = compensate(high) > compensate(low)
+    while low < high:
+        middle = (low + high) // 2
+        value = compensate(middle)
+        if value < target if increasing else value > target:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+class VirtualSensor(RegisterDevice):
+    CHIP_ID_REGISTER = 0x00
+    CHIP_ID = 0x00
+    RESET_REGISTER = 0x7E
+    RESET_COMMAND = 0xB6
+    ODR = 100.0  # Hz, data registers change at this rate
+    SENSOR_TIME_RESOLUTION = 39.0625e-6  # seconds per tick of the 24-bit sensor time
+
+    def __init__(self, registers: dict[int, int] | None = None, **kw: Any) -> None:
+        super().__init__({self.CHIP_ID_REGISTER: self.CHIP_ID, **(registers or {})}, **kw)
+        self.sample_index = -1
+
+    def reset(self) -> None:
+        super().reset()
+        self.sample_index = -1
+
+    def write(self, reg_addr: int, data: bytes) -> None:
+        for offset, value in enumerate(data):
+            self.write_register(reg_addr + offset, value)
+
+    def write_register(self, reg_addr: int, value: int) -> None:
+        if reg_addr == self.RESET_REGISTER and value == self.RESET_COMMAND:
+            logger.debug(f"{type(self).__name__}: soft reset")
+            self.reset()
+            return
+        if reg_addr < len(self.registers):
+            self.registers[reg_addr] = value
+
+    @property
+    def is_measuring(self) -> bool:
+        return False
+
+    def update(self, now: float) -> None:
+        if not self.is_measuring:
+            return
+        # sample and hold: reading faster than the ODR returns the same sample again
+        sample_index = int(now * self.ODR)
+        if sample_index != self.sample_index:
+            self.sample_index = sample_index
+            self.sample(sample_index / self.ODR)
+
+    @abc.abstractmethod
+    def sample(self, now: float) -> None: ...
+
+    def put(self, reg_addr: int, fmt: str, *values: float) -> None:
+        struct.pack_into(fmt, self.registers, reg_addr, *(round(value) for value in values))
+
+    def put_int24(self, reg_addr: int, *values: float, byteorder: str = "little") -> None:
+        for idx, value in enumerate(values):
+            self.registers[reg_addr + 3 * idx : reg_addr + 3 * idx + 3] = (round(value) & 0xFFFFFF).to_bytes(
+                3, byteorder
+            )
+
+    def sensor_time(self, now: float) -> int:
+        return int(now / self.SENSOR_TIME_RESOLUTION) & 0xFFFFFF
+
+
+class VirtualApplicationBoard(ApplicationBoardV3Rev1):
+    def pause(self, duration: float, description: str) -> None:
+        logger.debug(f"Pause: {description} for {duration * 1e3:.1f} ms")
+        self.protocol.communication.sleep(duration)
+
+
+class VirtualShuttle(abc.ABC):
+    # the real shuttle class this one stands in for
+    SHUTTLE: type
+
+    def __init__(self, **kw: Any) -> None:
+        self.emulator: EmulatorCommunication = (
+            kw["emulator"]
+            if kw.get("emulator")
+            else EmulatorCommunication(shuttle_id=self.SHUTTLE.SHUTTLE_ID, realtime=kw.get("realtime", False))
+        )
+        self.attach(self.emulator)
+
+    @abc.abstractmethod
+    def attach(self, emulator: EmulatorCommunication) -> None: ...
+
+    @staticmethod
+    def connect(
+        emulator: EmulatorCommunication,
+        sensor: VirtualSensor,
+        *,
+        i2c_address: int | None = None,
+        cs_pin: MultiIOPin | None = None,
+        interrupt_pins: tuple[MultiIOPin, ...] = (),
+    ) -> VirtualSensor:
+        if i2c_address is not None:
+            emulator.attach_i2c(i2c_address, sensor)
+        if cs_pin is not None:
+            emulator.attach_spi(cs_pin, sensor)
+        for interrupt_pin in interrupt_pins:
+            # data ready interrupts fire at the output data rate of the sensor
+            emulator.set_interrupt_odr(interrupt_pin, sensor.ODR)
+        return sensor
+
+    def create_board(self) -> VirtualApplicationBoard:
+        return VirtualApplicationBoard(communication=self.emulator)
+
+    def create_shuttle(self) -> Any:
+        return self.SHUTTLE(board=self.create_board())
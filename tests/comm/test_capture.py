@@ -0,0 +1,182 @@
+import logging
+import time
+from array import array
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from umrx_app_v3.mcu_board.app_board_v3_rev1 import ApplicationBoardV3Rev1
+from umrx_app_v3.mcu_board.bst_protocol_constants import MultiIOPin
+from umrx_app_v3.mcu_board.comm.capture_comm import (
+    Capture,
+    CaptureError,
+    CaptureRecord,
+    CaptureWriter,
+    Direction,
+    Framing,
+    read_capture,
+    RecordingCommunication,
+    ReplayCommunication,
+    ReplayCommunicationError,
+    ReplayCommunicationTimeoutError,
+)
+from umrx_app_v3.mcu_board.comm.emulator_comm import EmulatorCommunication, RegisterDevice
+from umrx_app_v3.mcu_board.commands.command import Command
+
+I2C_ADDRESS = 0x68
+CS_PIN = MultiIOPin.MINI_SHUTTLE_PIN_2_1
+INT_PIN = MultiIOPin.MINI_SHUTTLE_PIN_1_6
+
+
+class CountingDevice(RegisterDevice):
+    def update(self, now: float) -> None:
+        self.registers[0x12] = int(now * 1000) & 0xFF
+
+
+def run_session(board: ApplicationBoardV3Rev1, advance: callable) -> tuple:
+    board.start_communication()
+    board.set_vdd_vddio(3.3, 3.3)
+    board.configure_spi()
+    chip_id = list(board.read_spi(CS_PIN, 0x00, 2))
+    board.write_spi(CS_PIN, 0x40, array("B", [0xAB]))
+    board.streaming_interrupt_set_spi_channel(
+        interrupt_pin=INT_PIN, cs_pin=CS_PIN, register_address=0x12, bytes_to_read=2
+    )
+    board.configure_streaming_interrupt("spi")
+    board.enable_timer()
+    board.start_interrupt_streaming()
+    advance(0.1)
+    batch = board.receive_interrupt_streaming_batch(includes_mcu_timestamp=True)
+    board.stop_streaming()
+    return board.board_info, chip_id, batch
+
+
+@pytest.fixture
+def emulator() -> EmulatorCommunication:
+    emulator = EmulatorCommunication(shuttle_id=0x1A1)
+    emulator.attach_spi(CS_PIN, CountingDevice({0x00: 0x1E}, spi_dummy_bytes=1))
+    emulator.set_interrupt_odr(INT_PIN, 400.0)
+    return emulator
+
+
+@pytest.fixture
+def capture_path(tmp_path: Path, emulator: EmulatorCommunication) -> tuple[Path, tuple]:
+    path = tmp_path / "session.cap"
+    recorder = RecordingCommunication(emulator, path)
+    board = ApplicationBoardV3Rev1(communication=recorder)
+
+    def advance(seconds: float) -> None:
+        emulator.virtual_time += seconds
+
+    recorded = run_session(board, advance)
+    recorder.disconnect()
+    return path, recorded
+
+
+def test_record_and_replay_session(capture_path: tuple[Path, tuple]) -> None:
+    path, (board_info, chip_id, batch) = capture_path
+    capture = read_capture(path)
+    assert capture.framing == Framing.STREAM
+    assert capture.records[0].direction == Direction.SENT
+    assert {record.direction for record in capture.records} == {Direction.SENT, Direction.RECEIVED}
+    assert all(np.diff([record.time_ns for record in capture.records]) >= 0)
+
+    replay = ReplayCommunication(path, strict=True)
+    replayed = run_session(ApplicationBoardV3Rev1(communication=replay), lambda _: None)
+    assert replayed[0] == board_info
+    assert replayed[1] == chip_id == [0, 0x1E]
+    assert len(replayed[2]) == len(batch) > 1
+    assert np.array_equal(replayed[2], batch)
+    assert replay.is_exhausted
+    assert replay.mismatch_count == 0
+
+    replay.rewind()
+    assert not replay.is_exhausted
+    assert run_session(ApplicationBoardV3Rev1(communication=replay), lambda _: None)[1] == chip_id
+
+
+def test_recording_restores_transport_on_disconnect(tmp_path: Path, emulator: EmulatorCommunication) -> None:
+    recorder = RecordingCommunication(emulator, tmp_path / "session.cap")
+    board_info = ApplicationBoardV3Rev1(communication=recorder).board_info
+    recorder.disconnect()
+    assert "send" not in vars(emulator)
+    assert recorder.read_method not in vars(emulator)
+
+    num_records = len(read_capture(tmp_path / "session.cap").records)
+    assert ApplicationBoardV3Rev1(communication=emulator).board_info == board_info
+    assert len(read_capture(tmp_path / "session.cap").records) == num_records
+
+
+def test_replay_detects_diverging_host(capture_path: tuple[Path, tuple], caplog: pytest.LogCaptureFixture) -> None:
+    path, _ = capture_path
+    board = ApplicationBoardV3Rev1(communication=ReplayCommunication(path, strict=True))
+    with pytest.raises(ReplayCommunicationError):
+        board.set_vdd_vddio(1.8, 1.8)
+
+    replay = ReplayCommunication(path)
+    board = ApplicationBoardV3Rev1(communication=replay)
+    with caplog.at_level(logging.WARNING):
+        board.set_vdd_vddio(1.8, 1.8)
+    assert replay.mismatch_count == 1
+    assert "capture recorded" in caplog.text
+
+
+def test_replay_streaming_reassembles_chunks(tmp_path: Path) -> None:
+    frames = b"".join(
+        bytes(Command.create_message_from((0x01, 0, 0x8A, 1, 0, 0, 0, count, 0xAB, count))) for count in range(1, 4)
+    )
+    path = tmp_path / "chunks.cap"
+    writer = CaptureWriter(path)
+    # frames cut at arbitrary points, as the serial port delivers them
+    for chunk in (frames[:5], frames[5:17], frames[17:]):
+        writer.write(Direction.RECEIVED, chunk)
+    writer.close()
+
+    replay = ReplayCommunication(path)
+    board = ApplicationBoardV3Rev1(communication=replay)
+    counts = []
+    while not replay.is_exhausted:
+        counts.extend(packet[1] for packet in board.receive_interrupt_streaming_multiple())
+    assert counts == [1, 2, 3]
+    assert replay.resync_count == 0
+    assert list(board.receive_interrupt_streaming_multiple()) == []
+
+
+def test_replay_usb_packets() -> None:
+    message = bytes(Command.create_message_from((0x01, 0, 0x42, 0x15)))
+    padded = message + bytes([0xFF] * (64 - len(message)))
+    records = [
+        CaptureRecord(Direction.SENT, 0, b"\x01"),
+        CaptureRecord(Direction.RECEIVED, 1, bytes(64)),
+        CaptureRecord(Direction.RECEIVED, 2, padded),
+    ]
+    replay = ReplayCommunication(Capture(Framing.PACKET, records))
+    assert replay.send_receive(b"\x01") == message
+    with pytest.raises(ReplayCommunicationTimeoutError):
+        replay.receive()
+
+
+def test_replay_realtime_pace() -> None:
+    records = [CaptureRecord(Direction.RECEIVED, 0, b"\x01"), CaptureRecord(Direction.RECEIVED, 50_000_000, b"\x02")]
+    replay = ReplayCommunication(Capture(Framing.STREAM, records), realtime=True)
+    start = time.monotonic()
+    assert replay.receive() + replay.receive() == b"\x01\x02"
+    assert time.monotonic() - start >= 0.05
+
+
+def test_read_capture_errors(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    path = tmp_path / "bad.cap"
+    path.write_bytes(b"not a capture")
+    with pytest.raises(CaptureError):
+        read_capture(path)
+
+    writer = CaptureWriter(path)
+    writer.write(Direction.SENT, [1, 2, 3])
+    writer.write(Direction.RECEIVED, [4, 5, 6])
+    writer.close()
+    path.write_bytes(path.read_bytes()[:-2])
+    with caplog.at_level(logging.WARNING):
+        capture = read_capture(path)
+    assert [record.data for record in capture.records] == [b"\x01\x02\x03"]
+    assert "truncated, 14 trailing bytes" in caplog.text
@@ -0,0 +1,117 @@
+from array import array
+
+import pytest
+
+from umrx_app_v3.mcu_board.app_board_v3_rev1 import ApplicationBoardV3Rev1
+from umrx_app_v3.mcu_board.bst_app_board import ApplicationBoard, BoardInfo
+from umrx_app_v3.mcu_board.bst_protocol_constants import MultiIOPin, PinDirection, PinValue, StreamingSamplingUnit
+from umrx_app_v3.mcu_board.comm.emulator_comm import (
+    EmulatorCommunication,
+    EmulatorCommunicationTimeoutError,
+    RegisterDevice,
+)
+from umrx_app_v3.mcu_board.commands.command import CommandError
+
+I2C_ADDRESS = 0x68
+CS_PIN = MultiIOPin.MINI_SHUTTLE_PIN_2_1
+INT_PIN = MultiIOPin.MINI_SHUTTLE_PIN_1_6
+
+
+@pytest.fixture
+def emulator() -> EmulatorCommunication:
+    emulator = EmulatorCommunication(shuttle_id=0x1A1)
+    emulator.attach_i2c(I2C_ADDRESS, RegisterDevice({0x00: 0x43, 0x10: 0x01, 0x11: 0x02}, i2c_dummy_bytes=2))
+    emulator.attach_spi(CS_PIN, RegisterDevice({0x00: 0x1E, 0x12: 0x34}, spi_dummy_bytes=1))
+    return emulator
+
+
+@pytest.fixture
+def board(emulator: EmulatorCommunication) -> ApplicationBoard:
+    board = ApplicationBoard(communication=emulator)
+    board.initialize()
+    board.start_communication()
+    board.set_vdd_vddio(3.3, 3.3)
+    return board
+
+
+def test_emulator_board_info(board: ApplicationBoard) -> None:
+    assert board.board_info == BoardInfo(hardware_id=0x11, software_id=0x171, board_id=0x09, shuttle_id=0x1A1)
+    assert board.is_responsive()
+
+
+def test_emulator_register_access(board: ApplicationBoard) -> None:
+    board.configure_i2c()
+    assert list(board.read_i2c(I2C_ADDRESS, 0x00, 3)) == [0, 0, 0x43]
+    board.write_i2c(I2C_ADDRESS, 0x20, array("B", [5, 6]))
+    assert list(board.read_i2c(I2C_ADDRESS, 0x20, 4)) == [0, 0, 5, 6]
+    with pytest.raises(CommandError):
+        board.read_i2c(0x18, 0x00, 1)
+
+    board.configure_spi()
+    assert list(board.read_spi(CS_PIN, 0x00, 2)) == [0, 0x1E]
+    board.write_spi(CS_PIN, 0x40, array("B", [0xAB]))
+    assert list(board.read_spi(CS_PIN, 0x40, 2)) == [0, 0xAB]
+    assert list(board.read_spi(MultiIOPin.MINI_SHUTTLE_PIN_1_4, 0x00, 2)) == [0xFF, 0xFF]
+
+    board.write_many([(0x50, [1]), (0x51, [2, 3])], cs_pin=CS_PIN)
+    reads = board.read_many([(0x50, 3)], cs_pin=CS_PIN, dummy_bytes=1)
+    assert [list(read) for read in reads] == [[1, 2, 3]]
+
+
+def test_emulator_power_and_pins(board: ApplicationBoard, emulator: EmulatorCommunication) -> None:
+    board.write_i2c(I2C_ADDRESS, 0x00, array("B", [0x99]))
+    board.power_off()
+    with pytest.raises(CommandError):
+        board.read_i2c(I2C_ADDRESS, 0x00, 3)
+    board.set_vdd_vddio(1.8, 1.8)
+    assert emulator.vdd == pytest.approx(1.8)
+    assert board.read_i2c(I2C_ADDRESS, 0x00, 3)[-1] == 0x43, "power cycle resets the registers"
+
+    assert board.get_pin_config(INT_PIN) == (PinDirection.INPUT, PinValue.LOW)
+    board.set_pin_config(INT_PIN, PinDirection.OUTPUT, PinValue.HIGH)
+    assert board.get_pin_config(INT_PIN) == (PinDirection.OUTPUT, PinValue.HIGH)
+
+
+def test_emulator_polling_streaming(board: ApplicationBoard, emulator: EmulatorCommunication) -> None:
+    board.streaming_polling_set_i2c_channel(
+        i2c_address=I2C_ADDRESS,
+        sampling_time=10,
+        sampling_unit=StreamingSamplingUnit.MILLI_SECOND,
+        register_address=0x10,
+        bytes_to_read=4,
+    )
+    board.configure_streaming_polling("i2c")
+    board.start_polling_streaming()
+    assert emulator.is_streaming
+    assert board.receive_polling_streaming() == (1, array("B", [0, 0, 1, 2]))
+    assert emulator.now() == pytest.approx(0.01)
+
+    board.stop_streaming()
+    assert not emulator.is_streaming
+    with pytest.raises(EmulatorCommunicationTimeoutError):
+        board.receive_polling_streaming()
+
+
+def test_emulator_interrupt_streaming(emulator: EmulatorCommunication) -> None:
+    emulator.max_packets_per_receive = 8
+    emulator.set_interrupt_odr(INT_PIN, 400.0)
+    board = ApplicationBoardV3Rev1(communication=emulator)
+    board.start_communication()
+    board.set_vdd_vddio(3.3, 3.3)
+    board.streaming_interrupt_set_spi_channel(
+        interrupt_pin=INT_PIN, cs_pin=CS_PIN, register_address=0x12, bytes_to_read=2
+    )
+    board.configure_streaming_interrupt("spi")
+    board.enable_timer()
+    board.start_interrupt_streaming()
+
+    packets = list(board.receive_interrupt_streaming_multiple(includes_mcu_timestamp=True))
+    assert [packet[1] for packet in packets] == [1]
+    assert packets[0][2] == 2500
+    assert list(packets[0][3]) == [0, 0x34]
+
+    emulator.virtual_time += 0.1
+    batch = board.receive_interrupt_streaming_batch(includes_mcu_timestamp=True)
+    assert len(batch) == 8
+    assert list(batch["packet_count"]) == list(range(2, 10))
+    board.stop_streaming()
@@ -0,0 +1,92 @@
+import logging
+import threading
+
+import pytest
+
+from umrx_app_v3.mcu_board.comm.ring_buffer import (
+    ByteRingBuffer,
+    OverflowPolicy,
+    RingBufferError,
+    RingBufferOverflowError,
+)
+
+logger = logging.getLogger(__name__)
+
+FRAME = bytes((0xAA, 0x08, 0x01, 0x00, 0x87, 0x42, 0x0D, 0x0A))
+
+
+def test_ring_buffer_invalid_capacity() -> None:
+    with pytest.raises(RingBufferError):
+        ByteRingBuffer(capacity=0)
+
+
+def test_ring_buffer_write_read_wraps_around() -> None:
+    ring_buffer = ByteRingBuffer(capacity=10)
+    ring_buffer.write(b"0123456")
+    assert ring_buffer.read(5) == b"01234"
+    ring_buffer.write(b"789ABC")
+    assert len(ring_buffer) == 8
+    assert ring_buffer.read() == b"56789ABC"
+    assert ring_buffer.bytes_written == 13
+    assert ring_buffer.bytes_dropped == 0
+
+
+def test_ring_buffer_read_timeout_returns_empty() -> None:
+    ring_buffer = ByteRingBuffer(capacity=10)
+    assert ring_buffer.read(timeout=0.01) == b""
+
+
+def test_ring_buffer_drop_oldest_drops_whole_frames() -> None:
+    ring_buffer = ByteRingBuffer(capacity=3 * len(FRAME), overflow_policy=OverflowPolicy.DROP_OLDEST)
+    ring_buffer.write(FRAME * 3)
+    ring_buffer.write(FRAME[:3])
+    assert ring_buffer.frames_dropped == 1
+    assert ring_buffer.bytes_dropped == len(FRAME)
+    assert ring_buffer.read() == FRAME * 2 + FRAME[:3]
+
+
+def test_ring_buffer_drop_oldest_larger_than_capacity() -> None:
+    ring_buffer = ByteRingBuffer(capacity=4, overflow_policy=OverflowPolicy.DROP_OLDEST)
+    ring_buffer.write(b"0123456789")
+    assert ring_buffer.read() == b"6789"
+    assert ring_buffer.bytes_dropped == 6
+    assert ring_buffer.frames_dropped == 0
+
+
+def test_ring_buffer_drop_oldest_counts_frames_cut_from_large_write() -> None:
+    ring_buffer = ByteRingBuffer(capacity=2 * len(FRAME), overflow_policy=OverflowPolicy.DROP_OLDEST)
+    ring_buffer.write(b"\x00" + FRAME * 3 + FRAME[:3])
+    # the head cut by the write holds the first frame and the start of the second one
+    assert ring_buffer.bytes_dropped == 1 + len(FRAME) + 3
+    assert ring_buffer.frames_dropped == 2
+    assert ring_buffer.read() == FRAME[3:] + FRAME + FRAME[:3]
+
+
+def test_ring_buffer_raise_on_overflow() -> None:
+    ring_buffer = ByteRingBuffer(capacity=4, overflow_policy=OverflowPolicy.RAISE)
+    ring_buffer.write(b"012")
+    with pytest.raises(RingBufferOverflowError):
+        ring_buffer.write(b"34")
+    assert ring_buffer.read() == b"012"
+
+
+def test_ring_buffer_block_waits_for_consumer() -> None:
+    ring_buffer = ByteRingBuffer(capacity=4, overflow_policy=OverflowPolicy.BLOCK)
+    ring_buffer.write(b"0123")
+    writer = threading.Thread(target=ring_buffer.write, args=(b"45",))
+    writer.start()
+    assert ring_buffer.read(2, timeout=1.0) == b"01"
+    writer.join(timeout=1.0)
+    assert not writer.is_alive()
+    assert ring_buffer.read() == b"2345"
+    assert ring_buffer.bytes_dropped == 0
+
+
+def test_ring_buffer_close_releases_blocked_writer() -> None:
+    ring_buffer = ByteRingBuffer(capacity=2, overflow_policy=OverflowPolicy.BLOCK)
+    ring_buffer.write(b"01")
+    writer = threading.Thread(target=ring_buffer.write, args=(b"23",))
+    writer.start()
+    ring_buffer.close()
+    writer.join(timeout=1.0)
+    assert not writer.is_alive()
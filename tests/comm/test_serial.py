@@ -1,8 +1,16 @@
 import logging
+from array import array
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import call, MagicMock, patch
 
-from umrx_app_v3.mcu_board.comm.serial_comm import SerialCommunication
+import pytest
+
+from umrx_app_v3.mcu_board.comm.ring_buffer import OverflowPolicy
+from umrx_app_v3.mcu_board.comm.serial_comm import (
+    SerialCommunication,
+    SerialCommunicationError,
+    SerialCommunicationTimeoutError,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +20,15 @@ def test_serial_comm_init(serial_comm: SerialCommunication) -> None:
     assert serial_comm.port is None
 
 
+def test_serial_comm_disconnect_closes_port(serial_comm: SerialCommunication) -> None:
+    port = serial_comm.port = MagicMock()
+    serial_comm.disconnect()
+    port.close.assert_called_once()
+    assert serial_comm.port is None
+    serial_comm.disconnect()
+    port.close.assert_called_once()
+
+
 def test_serial_message_split(serial_comm: SerialCommunication) -> None:
     current_folder = Path(__file__).parent
     with Path.open(current_folder / "message.bytes", "rb") as f:
@@ -22,3 +39,96 @@ def test_serial_message_split(serial_comm: SerialCommunication) -> None:
         for _ in serial_comm.receive_multiple_streaming_packets():
             num_packets += 1
         assert num_packets == 273
+
+
+def test_serial_receive_blocks_in_kernel(serial_comm: SerialCommunication) -> None:
+    with patch.object(serial_comm, "port") as mocked_port:
+        mocked_port.timeout = None
+        mocked_port.read.side_effect = [b"\xaa", b"\x06\x02\x1f\r\n"]
+        mocked_port.in_waiting = 5
+        message = serial_comm.receive(timeout=0.5)
+        assert message == b"\xaa\x06\x02\x1f\r\n"
+        assert mocked_port.timeout == 0.5
+        assert mocked_port.read.call_args_list == [call(1), call(5)]
+
+
+def test_serial_receive_timeout_raises(serial_comm: SerialCommunication) -> None:
+    with patch.object(serial_comm, "port") as mocked_port:
+        mocked_port.read.return_value = b""
+        with pytest.raises(SerialCommunicationTimeoutError):
+            serial_comm.receive(timeout=0.01)
+
+
+def test_serial_streaming_receive_timeout_yields_nothing(serial_comm: SerialCommunication) -> None:
+    with patch.object(serial_comm, "port") as mocked_port:
+        mocked_port.read.return_value = b""
+        assert list(serial_comm.receive_multiple_streaming_packets()) == []
+
+
+def test_serial_send_receive_deadline(serial_comm: SerialCommunication) -> None:
+    with (
+        patch.object(serial_comm, "send", return_value=True),
+        patch.object(serial_comm, "receive", return_value=b"\xaa\x06\x02\x1f\r\n") as mocked_receive,
+    ):
+        serial_comm.send_receive(array("B", (0xAA, 0x06, 0x02, 0x1F, 0x0D, 0x0A)), timeout=0.25)
+        (timeout,) = mocked_receive.call_args.kwargs.values()
+        assert 0.0 <= timeout <= 0.25
+
+
+def test_serial_send_receive_failed_send_raises(serial_comm: SerialCommunication) -> None:
+    with patch.object(serial_comm, "send", return_value=False), pytest.raises(SerialCommunicationError):
+        serial_comm.send_receive(array("B", (0xAA, 0x06, 0x02, 0x1F, 0x0D, 0x0A)))
+
+
+def test_serial_background_reader_feeds_streaming(serial_comm: SerialCommunication) -> None:
+    frame = b"\xaa\x0f\x01\x00\x87\x00\x00\x00\x00\x00\x00\x00\x01\r\n"
+    chunks = [frame[:1], frame[1:] + frame]
+
+    def fake_read(size: int) -> bytes:
+        return chunks.pop(0) if chunks else b""
+
+    with patch.object(serial_comm, "port") as mocked_port:
+        mocked_port.read.side_effect = fake_read
+        mocked_port.in_waiting = len(chunks[1])
+        serial_comm.reader_poll_interval = 0.01
+        ring_buffer = serial_comm.start_reader(capacity=64, overflow_policy=OverflowPolicy.RAISE)
+        try:
+            assert serial_comm.is_reader_running
+            packets = list(serial_comm.receive_multiple_streaming_packets())
+            assert packets == [frame, frame]
+            assert ring_buffer.bytes_written == 2 * len(frame)
+        finally:
+            serial_comm.stop_reader()
+        assert not serial_comm.is_reader_running
+        assert serial_comm.ring_buffer is None
+
+
+def test_serial_streaming_frame_split_across_reads(serial_comm: SerialCommunication) -> None:
+    frame = b"\xaa\x0f\x01\x00\x87N\x00v\x00\x8e\x05\x00\x02\r\n"
+    serial_comm.reset_reassembly_buffer()
+    with patch.object(serial_comm, "_receive", side_effect=[frame + frame[:6], frame[6:] + frame[:1], frame[1:]]):
+        assert list(serial_comm.receive_multiple_streaming_packets()) == [frame]
+        assert serial_comm.reassembly_buffer == frame[:6]
+        assert list(serial_comm.receive_multiple_streaming_packets()) == [frame]
+        assert list(serial_comm.receive_multiple_streaming_packets()) == [frame]
+    assert len(serial_comm.reassembly_buffer) == 0
+
+
+def test_serial_streaming_resync_on_garbage(serial_comm: SerialCommunication) -> None:
+    frame = b"\xaa\x0f\x01\x00\x87N\x00v\x00\x8e\x05\x00\x02\r\n"
+    garbage = b"\x00\x01\xaa\x0f\x02"
+    serial_comm.reset_reassembly_buffer()
+    resync_count = serial_comm.resync_count
+    with patch.object(serial_comm, "_receive", return_value=garbage + frame + frame):
+        assert list(serial_comm.receive_multiple_streaming_packets()) == [frame, frame]
+    assert serial_comm.resync_count == resync_count + 2
+    assert len(serial_comm.reassembly_buffer) == 0
+
+
+def test_serial_discard_input(serial_comm: SerialCommunication) -> None:
+    serial_comm.reassembly_buffer = b"\xaa\x0a\x01"
+    with patch.object(serial_comm, "port") as mocked_port:
+        mocked_port.in_waiting = 7
+        assert serial_comm.discard_input() == 10
+        mocked_port.reset_input_buffer.assert_called_once()
+    assert serial_comm.reassembly_buffer == b""
@@ -0,0 +1,50 @@
+import logging
+from array import array
+
+import pytest
+
+from umrx_app_v3.mcu_board.commands.frame_scanner import FrameScanner
+
+logger = logging.getLogger(__name__)
+
+FRAME = bytes((0xAA, 0x0F, 0x01, 0x00, 0x87, 0xE4, 0xFF, 0xDE, 0xFF, 0xE8, 0xFF, 0x00, 0x02, 0x0D, 0x0A))
+
+
+@pytest.mark.commands
+def test_frame_scanner_yields_views_without_copy() -> None:
+    buffer = bytearray(FRAME * 3)
+    scanner = FrameScanner()
+    frames = list(scanner.scan(buffer))
+    assert frames == [FRAME, FRAME, FRAME]
+    assert all(isinstance(frame, memoryview) for frame in frames)
+    assert all(frame.obj is buffer for frame in frames)
+    assert scanner.offset == len(buffer)
+    assert scanner.resync_count == 0
+    for frame in frames:
+        frame.release()
+
+
+@pytest.mark.commands
+def test_frame_scanner_stops_at_incomplete_frame() -> None:
+    scanner = FrameScanner()
+    buffer = FRAME + FRAME[:7]
+    assert list(scanner.scan(buffer)) == [FRAME]
+    assert scanner.offset == len(FRAME)
+
+
+@pytest.mark.commands
+def test_frame_scanner_resynchronises_on_garbage() -> None:
+    scanner = FrameScanner()
+    buffer = b"\x0d\x0a\x00" + FRAME + b"\xaa\x03" + FRAME
+    assert list(scanner.scan(buffer)) == [FRAME, FRAME]
+    assert scanner.resync_count == 2
+    assert scanner.offset == len(buffer)
+
+
+@pytest.mark.commands
+def test_frame_scanner_accepts_array_and_offset() -> None:
+    scanner = FrameScanner()
+    buffer = array("B", FRAME * 2)
+    assert list(scanner.scan(buffer, offset=len(FRAME))) == [FRAME]
+    assert scanner.find_frame_start(buffer, 1) == len(FRAME)
+    assert scanner.find_frame_start(FRAME, 1) == len(FRAME)
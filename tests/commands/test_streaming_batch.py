@@ -0,0 +1,86 @@
+import logging
+
+import numpy as np
+import pytest
+
+from umrx_app_v3.mcu_board.commands.command import CommandError
+from umrx_app_v3.mcu_board.commands.streaming_batch import big_endian, frame_offsets
+from umrx_app_v3.mcu_board.commands.streaming_interrupt import StreamingInterruptCmd
+from umrx_app_v3.mcu_board.commands.streaming_polling import StreamingPollingCmd
+
+logger = logging.getLogger(__name__)
+
+interrupt_frame = bytes((170, 18, 1, 0, 138, 2, 0, 0, 1, 238, 228, 255, 191, 255, 205, 255, 13, 10))
+interrupt_frame_with_timestamp = bytes(
+    (0xAA, 0x18, 0x01, 0x00, 0x8A, 0x02, 0x00, 0x00, 0x00, 0x0F, 0x06, 0x00)
+) + bytes((0x4B, 0x00, 0xEF, 0xFF, 0x00, 0x00, 0x16, 0x3D, 0x8C, 0xBA, 0x0D, 0x0A))
+polling_frame = bytes((0xAA, 0x0F, 0x01, 0x00, 0x87, 0xE4, 0xFF, 0xDE, 0xFF, 0xE8, 0xFF, 0x00, 0x02, 0x0D, 0x0A))
+short_polling_frame = bytes((0xAA, 0x0D, 0x01, 0x00, 0x87, 0x01, 0x02, 0x03, 0x04, 0x01, 0x03, 0x0D, 0x0A))
+
+
+@pytest.mark.commands
+def test_streaming_batch_frame_offsets() -> None:
+    uniform = polling_frame * 3
+    offsets, lengths = frame_offsets(uniform, np.frombuffer(uniform, dtype=np.uint8))
+    assert offsets.tolist() == [0, 15, 30]
+    assert lengths.tolist() == [15, 15, 15]
+
+    with_garbage = b"\x00\x01" + polling_frame + short_polling_frame + polling_frame[:4]
+    offsets, lengths = frame_offsets(with_garbage, np.frombuffer(with_garbage, dtype=np.uint8))
+    assert offsets.tolist() == [2, 17]
+    assert lengths.tolist() == [15, 13]
+
+
+@pytest.mark.commands
+def test_streaming_batch_big_endian() -> None:
+    columns = np.array([[0, 0, 1, 238], [0x16, 0x3D, 0x8C, 0xBA]], dtype=np.uint8)
+    assert big_endian(columns).tolist() == [494, 0x163D8CBA]
+
+
+@pytest.mark.commands
+def test_streaming_batch_decode_interrupt() -> None:
+    batch = StreamingInterruptCmd.decode_streaming_batch([interrupt_frame] * 4)
+    assert batch.shape == (4,)
+    assert np.all(batch["channel_id"] == 2)
+    assert np.all(batch["packet_count"] == 494)
+    assert np.all(batch["mcu_timestamp_us"] == -1)
+    assert np.all(batch["payload_length"] == 6)
+    assert batch["payload"][0].tolist() == [228, 255, 191, 255, 205, 255]
+
+    batch = StreamingInterruptCmd.decode_streaming_batch(interrupt_frame_with_timestamp, includes_mcu_timestamp=True)
+    assert batch["packet_count"].tolist() == [0x0F]
+    assert batch["mcu_timestamp_us"].tolist() == [12437749]
+    assert batch["payload"][0].tolist() == [0x06, 0x00, 0x4B, 0x00, 0xEF, 0xFF]
+
+
+@pytest.mark.commands
+def test_streaming_batch_decode_polling_mixed_lengths() -> None:
+    batch = StreamingPollingCmd.decode_streaming_batch(b"\x0d" + polling_frame + short_polling_frame + polling_frame)
+    assert batch["channel_id"].tolist() == [2, 0x0103, 2]
+    assert batch["payload_length"].tolist() == [6, 4, 6]
+    assert batch["payload"][1].tolist() == [1, 2, 3, 4, 0, 0]
+    assert batch["payload"][2].tolist() == [0xE4, 0xFF, 0xDE, 0xFF, 0xE8, 0xFF]
+    assert np.all(batch["packet_count"] == 0)
+
+
+@pytest.mark.commands
+def test_streaming_batch_decode_matches_per_frame_parse() -> None:
+    frames = [polling_frame, short_polling_frame] * 8
+    batch = StreamingPollingCmd.decode_streaming_batch(frames)
+    for packet, frame in zip(batch, frames, strict=True):
+        channel_id, payload = StreamingPollingCmd.parse_streaming_packet(frame)
+        assert packet["channel_id"] == channel_id
+        assert packet["payload"][: packet["payload_length"]].tobytes() == payload.tobytes()
+
+
+@pytest.mark.commands
+def test_streaming_batch_decode_errors() -> None:
+    assert StreamingPollingCmd.decode_streaming_batch(b"").shape == (0,)
+
+    failed_status = bytearray(polling_frame)
+    failed_status[3] = 0x01
+    with pytest.raises(CommandError):
+        StreamingPollingCmd.decode_streaming_batch(polling_frame + failed_status)
+
+    with pytest.raises(CommandError):
+        StreamingInterruptCmd.decode_streaming_batch(polling_frame)
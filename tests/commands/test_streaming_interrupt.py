@@ -493,3 +493,16 @@ def test_command_interrupt_streaming_parse_with_timestamp(streaming_interrupt_co
     assert packet_count == 0xF
     assert timestamp == 12437749
     assert payload == array("B", (0x06, 0x00, 0x4B, 0x00, 0xEF, 0xFF))
+
+
+@pytest.mark.commands
+def test_command_interrupt_streaming_scan_packets(streaming_interrupt_command: StreamingInterruptCmd) -> None:
+    frame_1 = bytes((170, 18, 1, 0, 138, 1, 0, 0, 0, 49, 168, 0, 69, 0, 77, 21, 13, 10))
+    frame_2 = bytes((170, 18, 1, 0, 138, 2, 0, 0, 1, 238, 228, 255, 191, 255, 205, 255, 13, 10))
+    packets = list(streaming_interrupt_command.scan_streaming_packets(frame_1 + frame_2 + frame_1[:5]))
+    assert [(channel_id, packet_count, timestamp) for channel_id, packet_count, timestamp, _ in packets] == [
+        (1, 49, -1),
+        (2, 494, -1),
+    ]
+    assert packets[0][3] == bytes((168, 0, 69, 0, 77, 21))
+    assert packets[1][3] == bytes((228, 255, 191, 255, 205, 255))
@@ -455,3 +455,15 @@ def test_polling_streaming_parse_errors(streaming_polling_command: StreamingPoll
 def test_polling_invalid_interface(streaming_polling_command: StreamingPollingCmd) -> None:
     with pytest.raises(CommandError):
         streaming_polling_command.assemble(sensor_interface="usb")
+
+
+@pytest.mark.commands
+def test_polling_streaming_scan_packets(streaming_polling_command: StreamingPollingCmd) -> None:
+    buffer = bytes((0xAA, 0x0F, 0x01, 0x00, 0x87, 0x7C, 0x00, 0xC1, 0x00, 0x4B, 0x15, 0x00, 0x01, 0x0D, 0x0A)) + bytes(
+        (0xAA, 0x0F, 0x01, 0x00, 0x87, 0x06, 0x00, 0xCB, 0xFF, 0x24, 0x00, 0x00, 0x02, 0x0D, 0x0A)
+    )
+    packets = list(streaming_polling_command.scan_streaming_packets(buffer))
+    assert [sensor_id for sensor_id, _ in packets] == [1, 2]
+    assert packets[0][1] == bytes((0x7C, 0x00, 0xC1, 0x00, 0x4B, 0x15))
+    assert packets[1][1] == bytes((0x06, 0x00, 0xCB, 0xFF, 0x24, 0x00))
+    assert all(isinstance(payload, memoryview) for _, payload in packets)
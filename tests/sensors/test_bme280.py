@@ -1,8 +1,12 @@
 import struct
+from enum import Enum
 from functools import cached_property
 from typing import Any
 from unittest.mock import patch
 
+import numpy as np
+import pytest
+
 from umrx_app_v3.sensors.bme280 import BME280
 
 
@@ -44,3 +48,60 @@ def test_bme280_write_properties(bme280: BME280) -> None:
         with patch.object(bme280, "write") as mocked_write:
             setattr(bme280, writable_property, 123)
             mocked_write.assert_called_once()
+
+
+def test_bme280_compensate_batch_matches_scalar() -> None:
+    sensor = BME280()
+    sensor.__dict__.update(
+        dig_t1=27504,
+        dig_t2=26435,
+        dig_t3=-1000,
+        dig_p1=36477,
+        dig_p2=-10685,
+        dig_p3=3024,
+        dig_p4=2855,
+        dig_p5=140,
+        dig_p6=-7,
+        dig_p7=15500,
+        dig_p8=-14600,
+        dig_p9=6000,
+        dig_h1=75,
+        dig_h2=362,
+        dig_h3=0,
+        dig_h4=313,
+        dig_h5=50,
+        dig_h6=30,
+    )
+    rng = np.random.default_rng(280)
+    raw_pressure = rng.integers(200000, 500000, 64)
+    raw_temperature = rng.integers(400000, 600000, 64)
+    raw_humidity = rng.integers(20000, 40000, 64)
+
+    temperature, pressure, humidity = sensor.compensate_batch(raw_pressure, raw_temperature, raw_humidity)
+    for idx in range(64):
+        raw_p, raw_t, raw_h = int(raw_pressure[idx]), int(raw_temperature[idx]), int(raw_humidity[idx])
+        assert temperature[idx] == pytest.approx(sensor.compensate_temperature(raw_t), rel=1e-12)
+        assert pressure[idx] == pytest.approx(sensor.compensate_pressure(raw_p, raw_t), rel=1e-12)
+        assert humidity[idx] == pytest.approx(sensor.compensate_humidity(raw_h, raw_t), rel=1e-12, abs=1e-12)
+
+
+def test_bme280_read_nvm_in_two_bursts() -> None:
+    memory = bytearray(np.random.default_rng(280).integers(0, 256, 256, dtype=np.uint8).tobytes())
+    # sign bits of dig_h4 and dig_h5 set
+    memory[0xE4] = memory[0xE6] = 0xF3
+
+    def fake_read(addr: Enum, bytes_to_read: int = 1) -> int | bytes:
+        if bytes_to_read == 1:
+            return memory[addr.value]
+        return bytes(memory[addr.value : addr.value + bytes_to_read])
+
+    sensor_with_burst, sensor = BME280(), BME280()
+    sensor.assign_callbacks(read_callback=fake_read, write_callback=None)
+    with patch.object(sensor_with_burst, "read", side_effect=fake_read) as mocked_read:
+        coefficients = sensor_with_burst.read_nvm()
+        assert mocked_read.call_count == 2
+
+    assert coefficients == {name: getattr(sensor, name) for name in coefficients}
+    assert len(coefficients) == 18
+    assert coefficients["dig_h4"] < 0
+    assert coefficients["dig_h5"] < 0
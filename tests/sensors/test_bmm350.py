@@ -1,12 +1,14 @@
 import logging
 import struct
+from enum import Enum
 from functools import cached_property
 from typing import Any
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
-from umrx_app_v3.sensors.bmm350 import BMM350, BMM350Error, BMM350OtpAddr
+from umrx_app_v3.sensors.bmm350 import BMM350, BMM350Addr, BMM350Error, BMM350OtpAddr
 
 logger = logging.getLogger(__name__)
 
@@ -114,3 +116,71 @@ def test_incorrect_opt_status_raises(bmm350: BMM350) -> None:
         pytest.raises(BMM350Error),
     ):
         bmm350.read_otp_word(BMM350OtpAddr.cross_x_y)
+
+
+def test_compensate_batch_matches_scalar() -> None:
+    sensor = BMM350()
+    # OTP words of a real part
+    sensor.__dict__.update(
+        otp_temp_off_sens=0xFC05,
+        otp_mag_offset_x=0x1FF3,
+        otp_mag_offset_y=0x0E0B,
+        otp_mag_offset_z=0x0F0A,
+        otp_mag_sens_x=0x0300,
+        otp_mag_sens_y=0x00FD,
+        otp_mag_sens_z=0xF900,
+        otp_mag_tco_x=0x00F4,
+        otp_mag_tco_y=0x0009,
+        otp_mag_tco_z=0x00E8,
+        otp_mag_tcs_x=0xF700,
+        otp_mag_tcs_y=0xF900,
+        otp_mag_tcs_z=0xF500,
+        otp_mag_dut_t_0=0x0BB8,
+        otp_cross_x_y=0x00FD,
+        otp_cross_y_x=0x0500,
+        otp_cross_z_x=0x0002,
+        otp_cross_z_y=0xFA00,
+    )
+    rng = np.random.default_rng(350)
+    m_x, m_y, m_z = rng.integers(-(1 << 23), 1 << 23, (3, 64))
+    temp = rng.integers(-(1 << 23), 1 << 23, 64)
+    temp[:2] = 0, 1
+
+    batch = sensor.compensate_batch(m_x, m_y, m_z, temp)
+    for idx in range(64):
+        expected = sensor.compensate_magnetometer_and_temperature(
+            int(m_x[idx]), int(m_y[idx]), int(m_z[idx]), int(temp[idx])
+        )
+        actual = tuple(float(values[idx]) for values in batch)
+        assert actual == pytest.approx(expected, rel=1e-12, abs=1e-9)
+
+
+def test_bmm350_read_otp_reads_each_word_once() -> None:
+    otp = np.random.default_rng(350).integers(0, 1 << 16, 32).tolist()
+    registers = {BMM350Addr.otp_status_reg.value: 0x01, BMM350Addr.otp_data_msb_reg.value + 2: 0x00}
+
+    def fake_write(addr: Enum, value: int) -> None:
+        word = otp[value & 0x1F]
+        registers[BMM350Addr.otp_data_msb_reg.value] = word >> 8
+        registers[BMM350Addr.otp_data_lsb_reg.value] = word & 0xFF
+
+    def fake_read(addr: Enum, bytes_to_read: int = 1) -> int | list[int]:
+        if bytes_to_read == 1:
+            return registers[addr.value]
+        return [registers[addr.value + idx] for idx in range(bytes_to_read)]
+
+    sensor_with_burst, sensor = BMM350(), BMM350()
+    sensor.assign_callbacks(read_callback=fake_read, write_callback=fake_write)
+    sensor_with_burst.assign_callbacks(read_callback=fake_read, write_callback=fake_write)
+    with patch.object(sensor_with_burst, "read", side_effect=fake_read) as mocked_read:
+        words = sensor_with_burst.read_otp()
+        unique_words = len({addr.value for addr in BMM350OtpAddr})
+        assert mocked_read.call_count == unique_words
+        assert sensor_with_burst.cross_z_y == sensor.cross_z_y
+
+    assert words == {name: getattr(sensor, name) for name in words}
+    assert len(words) == len(BMM350OtpAddr.__members__)
+
+    registers[BMM350Addr.otp_status_reg.value] = 0xFF
+    with pytest.raises(BMM350Error):
+        sensor_with_burst.read_otp()
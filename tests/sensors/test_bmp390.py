@@ -1,9 +1,13 @@
 import logging
 import struct
+from enum import Enum
 from functools import cached_property
 from typing import Any
 from unittest.mock import patch
 
+import numpy as np
+import pytest
+
 from umrx_app_v3.sensors.bmp390 import BMP390
 
 logger = logging.getLogger(__name__)
@@ -48,3 +52,54 @@ def test_bmp390_write_properties(bmp390: BMP390) -> None:
         with patch.object(bmp390, "write") as mocked_write:
             setattr(bmp390, writable_property, 123)
             mocked_write.assert_called_once()
+
+
+def test_bmp390_compensate_batch_matches_scalar() -> None:
+    sensor = BMP390()
+    sensor.__dict__.update(
+        nvm_par_t1=27886,
+        nvm_par_t2=19098,
+        nvm_par_t3=-7,
+        nvm_par_p1=1054,
+        nvm_par_p2=2436,
+        nvm_par_p3=35,
+        nvm_par_p4=0,
+        nvm_par_p5=25395,
+        nvm_par_p6=30807,
+        nvm_par_p7=3,
+        nvm_par_p8=-6,
+        nvm_par_p9=15631,
+        nvm_par_p10=11,
+        nvm_par_p11=-60,
+    )
+    rng = np.random.default_rng(390)
+    raw_pressure = rng.integers(6000000, 9000000, 64)
+    raw_temperature = rng.integers(7000000, 9000000, 64)
+
+    temperature, pressure = sensor.compensate_batch(raw_pressure, raw_temperature)
+    for idx in range(64):
+        expected_temperature = sensor.compensate_temperature(int(raw_temperature[idx]))
+        assert temperature[idx] == pytest.approx(expected_temperature, rel=1e-12)
+        assert pressure[idx] == pytest.approx(
+            sensor.compensate_pressure(int(raw_pressure[idx]), expected_temperature), rel=1e-12
+        )
+
+
+def test_bmp390_read_nvm_in_one_burst() -> None:
+    memory = np.random.default_rng(390).integers(0, 256, 256, dtype=np.uint8).tobytes()
+
+    def fake_read(addr: Enum, bytes_to_read: int = 1) -> int | bytes:
+        if bytes_to_read == 1:
+            return memory[addr.value]
+        return memory[addr.value : addr.value + bytes_to_read]
+
+    sensor_with_burst, sensor = BMP390(), BMP390()
+    sensor_with_burst.assign_callbacks(read_callback=fake_read, write_callback=None)
+    sensor.assign_callbacks(read_callback=fake_read, write_callback=None)
+    with patch.object(sensor_with_burst, "read", side_effect=fake_read) as mocked_read:
+        coefficients = sensor_with_burst.read_nvm()
+        assert sensor_with_burst.par_p11 == sensor.par_p11
+        mocked_read.assert_called_once()
+
+    assert coefficients == {name: getattr(sensor, name) for name in coefficients}
+    assert len(coefficients) == 14
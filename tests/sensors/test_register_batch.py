@@ -0,0 +1,111 @@
+from array import array
+from unittest.mock import MagicMock
+
+import pytest
+
+from umrx_app_v3.sensors.bmi088 import BMI088
+from umrx_app_v3.sensors.bmi323 import BMI323, BMI323Addr
+from umrx_app_v3.sensors.register_batch import RegisterBatch, RegisterBatchError
+
+
+class FakeRegisters:
+    def __init__(self) -> None:
+        self.registers: dict[int, int] = {}
+        self.write_calls: list[list[tuple[int, int]]] = []
+
+    def read(self, reg_addr: BMI323Addr | int, bytes_to_read: int = 1) -> int | array:
+        reg_addr = reg_addr.value if isinstance(reg_addr, BMI323Addr) else reg_addr
+        if bytes_to_read == 1:
+            return self.registers.get(reg_addr, 0)
+        return array("H", (self.registers.get(reg_addr + idx, 0) for idx in range(bytes_to_read)))
+
+    def write(self, reg_addr: BMI323Addr | int, value: int) -> None:
+        self.write_many([(reg_addr.value if isinstance(reg_addr, BMI323Addr) else reg_addr, value)])
+
+    def write_many(self, writes: list[tuple[int, int]]) -> None:
+        self.write_calls.append(list(writes))
+        self.registers.update(writes)
+
+
+@pytest.fixture
+def registers() -> FakeRegisters:
+    return FakeRegisters()
+
+
+@pytest.fixture
+def batched_bmi323(registers: FakeRegisters) -> BMI323:
+    sensor = BMI323()
+    sensor.assign_callbacks(registers.read, registers.write, registers.write_many)
+    return sensor
+
+
+def test_batch_flushes_writes_in_order(batched_bmi323: BMI323, registers: FakeRegisters) -> None:
+    with batched_bmi323.batch():
+        batched_bmi323.gyr_conf = 0x404B
+        batched_bmi323.acc_conf = 0x4027
+        batched_bmi323.io_int_ctrl = 0x0505
+        assert registers.write_calls == []
+        assert batched_bmi323.acc_conf == 0
+
+    assert registers.write_calls == [[(0x21, 0x404B), (0x20, 0x4027), (0x38, 0x0505)]]
+    assert batched_bmi323.acc_conf == 0x4027
+    assert batched_bmi323.write == registers.write
+
+
+def test_batch_without_write_many_writes_sequentially(registers: FakeRegisters) -> None:
+    sensor = BMI323()
+    sensor.assign_callbacks(registers.read, registers.write)
+    with sensor.batch():
+        sensor.acc_conf = 1
+        sensor.gyr_conf = 2
+    assert registers.write_calls == [[(0x20, 1)], [(0x21, 2)]]
+
+
+def test_batch_discards_writes_on_error(batched_bmi323: BMI323, registers: FakeRegisters) -> None:
+    def configure() -> None:
+        with batched_bmi323.batch():
+            batched_bmi323.acc_conf = 1
+            error_message = "configuration failed"
+            raise ValueError(error_message)
+
+    with pytest.raises(ValueError, match="configuration failed"):
+        configure()
+    assert registers.write_calls == []
+    assert batched_bmi323.write == registers.write
+
+
+def test_nested_batch_is_flushed_by_outer(batched_bmi323: BMI323, registers: FakeRegisters) -> None:
+    with batched_bmi323.batch():
+        batched_bmi323.int_conf = 0
+        with batched_bmi323.batch():
+            batched_bmi323.acc_conf = 1
+        assert registers.write_calls == []
+    assert registers.write_calls == [[(0x39, 0), (0x20, 1)]]
+
+
+def test_batch_verify(batched_bmi323: BMI323, registers: FakeRegisters) -> None:
+    with batched_bmi323.batch(verify=True):
+        batched_bmi323.acc_conf = 1
+        batched_bmi323.acc_conf = 2
+
+    registers.write_many = MagicMock()
+    batched_bmi323.write_many = registers.write_many
+    with pytest.raises(RegisterBatchError, match="0x21"), batched_bmi323.batch(verify=True):
+        batched_bmi323.gyr_conf = 3
+
+    RegisterBatch.verify_writes(registers.read, [(0x20, [2, 0])])
+    with pytest.raises(RegisterBatchError):
+        RegisterBatch.verify_writes(registers.read, [(0x20, [2, 1])])
+
+
+def test_bmi088_batch_keeps_register_files_apart() -> None:
+    gyro, accel = FakeRegisters(), FakeRegisters()
+    sensor = BMI088()
+    sensor.assign_gyro_callbacks(gyro.read, gyro.write, gyro.write_many)
+    sensor.assign_accel_callbacks(accel.read, accel.write, accel.write_many)
+    with sensor.batch():
+        sensor.acc_int1_io_ctrl = 0x0A
+        sensor.gyro_range = 0x03
+        sensor.gyro_bandwidth = 0x01
+    assert accel.write_calls == [[(0x53, 0x0A)]]
+    assert gyro.write_calls == [[(0x0F, 0x03), (0x10, 0x01)]]
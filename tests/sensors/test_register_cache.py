@@ -0,0 +1,137 @@
+from array import array
+from enum import Enum
+from unittest.mock import MagicMock
+
+import pytest
+
+from umrx_app_v3.sensors.bma456 import BMA456, BMA456Addr
+from umrx_app_v3.sensors.bmi088 import BMI088
+from umrx_app_v3.sensors.register_batch import RegisterBatchError
+from umrx_app_v3.sensors.register_cache import RegisterCache
+
+
+class FakeDevice:
+    def __init__(self) -> None:
+        self.registers = bytearray(256)
+        self.reads: list[int] = []
+        self.writes: list[int] = []
+
+    def read(self, reg_addr: Enum | int, bytes_to_read: int = 1) -> int | array:
+        reg_addr = reg_addr.value if isinstance(reg_addr, Enum) else reg_addr
+        self.reads.append(reg_addr)
+        if bytes_to_read == 1:
+            return self.registers[reg_addr]
+        return array("B", self.registers[reg_addr : reg_addr + bytes_to_read])
+
+    def write(self, reg_addr: Enum | int, value: int | array) -> None:
+        reg_addr = reg_addr.value if isinstance(reg_addr, Enum) else reg_addr
+        self.writes.append(reg_addr)
+        data = [value] if isinstance(value, int) else list(value)
+        self.registers[reg_addr : reg_addr + len(data)] = bytes(data)
+
+    def write_many(self, writes: list[tuple[int, int]]) -> None:
+        for reg_addr, value in writes:
+            self.write(reg_addr, value)
+
+
+@pytest.fixture
+def device() -> FakeDevice:
+    return FakeDevice()
+
+
+@pytest.fixture
+def cached_bma456(device: FakeDevice) -> BMA456:
+    sensor = BMA456()
+    sensor.assign_callbacks(device.read, device.write, device.write_many)
+    sensor.enable_cache()
+    return sensor
+
+
+def test_cache_serves_repeated_reads(cached_bma456: BMA456, device: FakeDevice) -> None:
+    device.registers[BMA456Addr.chip_id.value] = 0x16
+    assert [cached_bma456.chip_id for _ in range(3)] == [0x16] * 3
+    assert device.reads == [BMA456Addr.chip_id.value]
+    assert cached_bma456.cache.stats.hits == 2
+    assert cached_bma456.cache.stats.misses == 1
+    assert cached_bma456.cache.stats.hit_rate == pytest.approx(2 / 3)
+
+
+def test_cache_write_through(cached_bma456: BMA456, device: FakeDevice) -> None:
+    cached_bma456.pwr_ctrl = 0x04
+    cached_bma456.pwr_ctrl = 0x04 | cached_bma456.pwr_ctrl
+    assert device.reads == []
+    assert device.writes == [BMA456Addr.pwr_ctrl.value] * 2
+    assert device.registers[BMA456Addr.pwr_ctrl.value] == 0x04
+
+    with cached_bma456.batch():
+        cached_bma456.acc_conf = 0xA8
+        cached_bma456.acc_range = 0x01
+    assert (cached_bma456.acc_conf, cached_bma456.acc_range) == (0xA8, 0x01)
+    assert device.reads == []
+
+
+def test_cache_skips_volatile_registers(cached_bma456: BMA456, device: FakeDevice) -> None:
+    for _ in range(2):
+        _ = cached_bma456.status
+        _ = cached_bma456.acc_data
+    assert device.reads.count(BMA456Addr.status.value) == 2
+    assert device.reads.count(BMA456Addr.acc_x_lsb.value) == 2
+    assert cached_bma456.cache.stats.hits == 0
+
+
+def test_cache_invalidation(cached_bma456: BMA456, device: FakeDevice) -> None:
+    _ = cached_bma456.acc_conf, cached_bma456.acc_range
+    device.registers[BMA456Addr.acc_conf.value] = 0x17
+    assert cached_bma456.acc_conf != 0x17
+    cached_bma456.cache.invalidate(BMA456Addr.acc_conf)
+    assert cached_bma456.acc_conf == 0x17
+    assert BMA456Addr.acc_range.value in cached_bma456.cache.registers
+
+    cached_bma456.cmd = 0xB6
+    assert cached_bma456.cache.registers == {}
+    assert cached_bma456.cache.stats.invalidations == 3
+
+    cached_bma456.write(BMA456Addr.acc_conf, array("B", [1, 2]))
+    assert cached_bma456.acc_conf == 1
+    assert cached_bma456.acc_range == 2
+
+
+def test_cache_enable_disable(device: FakeDevice) -> None:
+    sensor = BMA456()
+    sensor.assign_callbacks(device.read, device.write)
+    cache = sensor.enable_cache()
+    assert sensor.enable_cache() is cache
+    assert sensor.write_many is None
+
+    new_read = MagicMock(return_value=0x16)
+    sensor.assign_callbacks(new_read, device.write)
+    assert sensor.read == cache.read
+    assert sensor.chip_id == 0x16
+    new_read.assert_called_once()
+
+    sensor.disable_cache()
+    assert sensor.read is new_read
+    assert not cache.is_attached
+
+
+def test_bmi088_cache_per_register_file() -> None:
+    gyro, accel = FakeDevice(), FakeDevice()
+    sensor = BMI088()
+    sensor.assign_gyro_callbacks(gyro.read, gyro.write)
+    sensor.assign_accel_callbacks(accel.read, accel.write)
+    gyro_cache, accel_cache = sensor.enable_cache()
+    assert isinstance(gyro_cache, RegisterCache)
+
+    sensor.gyro_range = 0x03
+    sensor.acc_range = 0x01
+    assert (sensor.gyro_range, sensor.acc_range) == (0x03, 0x01)
+    assert gyro.reads == accel.reads == []
+    sensor.acc_soft_reset = 0xB6
+    assert accel_cache.registers == {}
+    assert gyro_cache.registers != {}
+
+
+def test_batch_verify_reads_device(cached_bma456: BMA456, device: FakeDevice) -> None:
+    device.write = MagicMock()
+    with pytest.raises(RegisterBatchError), cached_bma456.batch(verify=True):
+        cached_bma456.acc_conf = 0xA8
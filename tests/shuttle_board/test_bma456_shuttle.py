@@ -0,0 +1,134 @@
+from array import array
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from umrx_app_v3.mcu_board.bst_protocol import BstProtocol
+from umrx_app_v3.mcu_board.commands.command import Command
+from umrx_app_v3.sensors.bma456 import BMA456Addr
+from umrx_app_v3.shuttle_board.bma456.bma456_shuttle import BMA456Shuttle, BMA456ShuttleError
+
+WRITE_OK_RESPONSE = Command.create_message_from((0x01, 0x00, 0x42, 0x28))
+WRITE_FAILED_RESPONSE = Command.create_message_from((0x01, 0x01, 0x42, 0x28))
+I2C_WRITE_HEADER_LENGTH = 2 + 14
+CONFIG_FILE = BMA456Shuttle.load_config_file("mm")
+
+
+def shuttle_with_mocked_protocol(*, spi: bool = False) -> BMA456Shuttle:
+    shuttle = BMA456Shuttle(board=MagicMock())
+    shuttle.is_spi_configured = spi
+    shuttle.is_i2c_configured = not spi
+    # the transport is mocked, pipelining runs through the real protocol
+    shuttle.board.protocol = BstProtocol()
+    shuttle.board.protocol.communication = MagicMock()
+    pending = bytearray()
+
+    def send(message: array) -> bool:
+        pending.extend(WRITE_OK_RESPONSE)
+        return True
+
+    def receive() -> bytes:
+        data = bytes(pending)
+        pending.clear()
+        return data
+
+    shuttle.board.protocol.communication.send.side_effect = send
+    shuttle.board.protocol.communication.receive.side_effect = receive
+    return shuttle
+
+
+def sent_messages(shuttle: BMA456Shuttle) -> list[array]:
+    return [call.args[0] for call in shuttle.board.protocol.communication.send.call_args_list]
+
+
+def reassemble_i2c_upload(messages: list[array]) -> tuple[list[int], bytes]:
+    offsets, data = [], b""
+    for offset_message, chunk_message in zip(messages[::2], messages[1::2], strict=True):
+        assert offset_message[10] == BMA456Addr.features_offset_lsb.value
+        assert chunk_message[10] == BMA456Addr.features_in.value
+        lsb, msb = offset_message[I2C_WRITE_HEADER_LENGTH:-2]
+        offsets.append(msb << 4 | lsb)
+        assert offsets[-1] * 2 == len(data)
+        data += bytes(chunk_message[I2C_WRITE_HEADER_LENGTH:-2])
+    return offsets, data
+
+
+def test_bma456_shuttle_write_config_file() -> None:
+    shuttle = shuttle_with_mocked_protocol()
+    shuttle.write_config_file(CONFIG_FILE)
+
+    num_chunks = -(-len(CONFIG_FILE) // BMA456Shuttle.CONFIG_FILE_CHUNK_SIZE)
+    assert shuttle.board.protocol.communication.send.call_count == 2 * num_chunks
+    # one request in flight: every response is read before the next request goes out
+    assert shuttle.board.protocol.communication.receive.call_count == 2 * num_chunks
+    offsets, data = reassemble_i2c_upload(sent_messages(shuttle))
+    assert offsets[1] == BMA456Shuttle.CONFIG_FILE_CHUNK_SIZE // 2
+    assert data == bytes(CONFIG_FILE)
+
+
+def test_bma456_shuttle_write_config_file_spi() -> None:
+    shuttle = shuttle_with_mocked_protocol(spi=True)
+    shuttle.write_config_file(CONFIG_FILE, chunk_size=8)
+    assert shuttle.board.protocol.communication.send.call_count == 2 * -(-len(CONFIG_FILE) // 8)
+
+
+def test_bma456_shuttle_write_config_file_pipelined() -> None:
+    shuttle = shuttle_with_mocked_protocol()
+    pipeline_depth = 16
+    pending = bytearray()
+
+    def send(message: array) -> bool:
+        pending.extend(WRITE_OK_RESPONSE)
+        return True
+
+    def receive() -> bytes:
+        # responses arrive coalesced and split in the middle of a frame
+        data = bytes(pending[: len(pending) // 2 + 1])
+        del pending[: len(data)]
+        return data
+
+    shuttle.board.protocol.communication.send.side_effect = send
+    shuttle.board.protocol.communication.receive.side_effect = receive
+
+    shuttle.write_config_file(CONFIG_FILE, pipeline_depth=pipeline_depth)
+
+    shuttle.board.protocol.communication.send_receive.assert_not_called()
+    assert reassemble_i2c_upload(sent_messages(shuttle))[1] == bytes(CONFIG_FILE)
+    assert len(pending) == 0
+
+
+def test_bma456_shuttle_write_config_file_errors() -> None:
+    shuttle = shuttle_with_mocked_protocol()
+    shuttle.board.protocol.communication.receive.side_effect = None
+    shuttle.board.protocol.communication.receive.return_value = WRITE_OK_RESPONSE + WRITE_FAILED_RESPONSE
+    with pytest.raises(BMA456ShuttleError):
+        shuttle.write_config_file(CONFIG_FILE, pipeline_depth=2)
+
+    shuttle.board.protocol.communication.receive.return_value = WRITE_FAILED_RESPONSE
+    with pytest.raises(BMA456ShuttleError):
+        shuttle.write_config_file(CONFIG_FILE)
+
+    for chunk_size in (0, 7, BMA456Shuttle.CONFIG_FILE_CHUNK_SIZE + 2):
+        with pytest.raises(BMA456ShuttleError):
+            shuttle.write_config_file(CONFIG_FILE, chunk_size=chunk_size)
+
+    shuttle.is_i2c_configured = False
+    with pytest.raises(BMA456ShuttleError):
+        shuttle.write_config_file(CONFIG_FILE)
+
+
+def test_bma456_shuttle_load_config_file() -> None:
+    sizes = {"an": 1200, "h": 6144, "mm": 6144, "tablet": 3872, "w": 5016}
+    for name, size in sizes.items():
+        config_file = BMA456Shuttle.load_config_file(name)
+        assert isinstance(config_file, bytes)
+        assert len(config_file) == size
+        assert BMA456Shuttle.load_config_file(name) is config_file
+
+    with pytest.raises(BMA456ShuttleError):
+        BMA456Shuttle.load_config_file("unknown")
+
+    shuttle = shuttle_with_mocked_protocol()
+    with patch.object(shuttle, "write_config_file") as mocked_write_config_file:
+        shuttle.write_w_config_file()
+    mocked_write_config_file.assert_called_once_with(BMA456Shuttle.load_config_file("w"))
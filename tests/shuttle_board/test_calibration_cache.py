@@ -0,0 +1,41 @@
+from pathlib import Path
+from unittest.mock import patch
+
+from umrx_app_v3.shuttle_board.bmm350.bmm350_shuttle import BMM350Shuttle
+from umrx_app_v3.shuttle_board.calibration_cache import CalibrationCache
+
+
+def test_calibration_cache_store_load(tmp_path: Path) -> None:
+    cache = CalibrationCache(tmp_path / "nested" / "calibration.json")
+    key = cache.key(0x27, (0x33, 0x1234))
+    assert key == "0027:0033-1234"
+    assert cache.load(key) is None
+
+    cache.store(key, {"otp_temp_off_sens": 42})
+    cache.store("0027:0033-4321", {"otp_temp_off_sens": 7})
+    assert CalibrationCache(cache.path).load(key) == {"otp_temp_off_sens": 42}
+    assert list(cache.path.parent.iterdir()) == [cache.path]
+
+    cache.path.write_text("{not json")
+    assert cache.load(key) is None
+
+
+def test_bmm350_shuttle_read_otp_from_cache(tmp_path: Path) -> None:
+    cache = CalibrationCache(tmp_path / "calibration.json")
+    words = {"otp_temp_off_sens": 0xFC05, "otp_mag_dut_t_0": 0x0BB8}
+    shuttle = BMM350Shuttle()
+    with (
+        patch.object(shuttle.sensor, "chip_identity", return_value=(0x33, 0xFC05, 0x0BB8)),
+        patch.object(shuttle.sensor, "read_otp", return_value=words) as mocked_read_otp,
+    ):
+        assert shuttle.read_otp(cache) == words
+        mocked_read_otp.assert_called_once()
+
+    reattached_shuttle = BMM350Shuttle()
+    with (
+        patch.object(reattached_shuttle.sensor, "chip_identity", return_value=(0x33, 0xFC05, 0x0BB8)),
+        patch.object(reattached_shuttle.sensor, "read_otp") as mocked_read_otp,
+    ):
+        assert reattached_shuttle.read_otp(cache) == words
+        mocked_read_otp.assert_not_called()
+    assert reattached_shuttle.sensor.dut_t0 == 0x0BB8 / 512.0 + 23.0
@@ -0,0 +1,71 @@
+from array import array
+from unittest.mock import MagicMock
+
+from umrx_app_v3.sensors.bmi088 import BMI088AccelAddr
+from umrx_app_v3.shuttle_board.bmi088.bmi088_shuttle import BMI088Shuttle
+from umrx_app_v3.shuttle_board.bmi323.bmi323_shuttle import BMI323Shuttle
+from umrx_app_v3.shuttle_board.bmm350.bmm350_shuttle import BMM350Shuttle
+
+
+def spi_shuttle(shuttle_class: type) -> object:
+    shuttle = shuttle_class(board=MagicMock())
+    shuttle.is_spi_configured, shuttle.is_i2c_configured = True, False
+    return shuttle
+
+
+def i2c_shuttle(shuttle_class: type) -> object:
+    shuttle = shuttle_class(board=MagicMock())
+    shuttle.is_spi_configured, shuttle.is_i2c_configured = False, True
+    return shuttle
+
+
+def test_bmi088_accel_spi_is_switched_on_once() -> None:
+    shuttle = spi_shuttle(BMI088Shuttle)
+    shuttle.board.read_spi.side_effect = lambda _cs, _reg, length: array("B", [0xFF, *range(0x1E, 0x1E + length - 1)])
+
+    assert shuttle.read_accel_register(BMI088AccelAddr.acc_chip_id) == 0x1E
+    assert shuttle.read_accel_register(BMI088AccelAddr.acc_x_lsb, 2) == array("B", [0x1E, 0x1F])
+    assert shuttle.read_accel_register(BMI088AccelAddr.acc_status) == 0x1E
+    lengths = [call.args[2] for call in shuttle.board.read_spi.call_args_list]
+    assert lengths == [1, 2, 3, 2]
+
+    shuttle.write_accel_register(BMI088AccelAddr.acc_soft_reset, 0xB6)
+    assert not shuttle.is_accel_spi_enabled
+    shuttle.board.read_spi.reset_mock()
+    shuttle.read_accel_register(BMI088AccelAddr.acc_chip_id)
+    assert shuttle.board.read_spi.call_count == 2
+
+    shuttle.write_accel_registers([(BMI088AccelAddr.acc_range.value, 0x01)])
+    assert shuttle.is_accel_spi_enabled
+    shuttle.board.read_spi.reset_mock()
+    shuttle.write_accel_registers([(BMI088AccelAddr.acc_soft_reset.value, 0xB6)])
+    assert not shuttle.is_accel_spi_enabled
+    shuttle.board.read_spi.assert_not_called()
+
+
+def test_bmi088_accel_i2c_reads_no_dummy_byte() -> None:
+    shuttle = i2c_shuttle(BMI088Shuttle)
+    shuttle.board.read_i2c.return_value = array("B", [0x1E])
+    assert shuttle.read_accel_register(BMI088AccelAddr.acc_chip_id) == 0x1E
+    shuttle.board.read_i2c.assert_called_once_with(BMI088Shuttle.ACCEL_I2C_DEFAULT_ADDRESS, 0x00, 1)
+    shuttle.board.read_spi.assert_not_called()
+
+
+def test_bmi323_and_bmm350_read_only_the_dummy_bytes() -> None:
+    shuttle = i2c_shuttle(BMI323Shuttle)
+    shuttle.board.read_i2c.return_value = array("B", [0, 0, 0x43, 0x00])
+    assert shuttle.read_register(0x00) == 0x0043
+    assert shuttle.board.read_i2c.call_args.kwargs["bytes_to_read"] == 4
+    shuttle.board.read_i2c.return_value = array("B", [0, 0, 1, 2, 3, 4, 5, 6])
+    assert shuttle.read_register(0x03, 6) == array("B", [1, 2, 3, 4, 5, 6])
+    assert shuttle.board.read_i2c.call_args.args[2] == 8
+
+    shuttle = spi_shuttle(BMI323Shuttle)
+    shuttle.board.read_spi.return_value = array("B", [0, 0x43, 0x00])
+    assert shuttle.read_register(0x00) == 0x0043
+    assert shuttle.board.read_spi.call_args.args[2] == 3
+
+    shuttle = i2c_shuttle(BMM350Shuttle)
+    shuttle.board.read_i2c.return_value = array("B", [0, 0, 0x33])
+    assert shuttle.read_register(0x00) == 0x33
+    assert shuttle.board.read_i2c.call_args.args[2] == 3
@@ -0,0 +1,105 @@
+import struct
+
+import numpy as np
+import pytest
+
+from umrx_app_v3.mcu_board.commands.streaming_polling import StreamingPollingCmd
+from umrx_app_v3.shuttle_board.bma400.bma400_shuttle import BMA400Shuttle
+from umrx_app_v3.shuttle_board.bme280.bme280_shuttle import BME280Shuttle
+from umrx_app_v3.shuttle_board.bmi088.bmi088_shuttle import BMI088Shuttle
+from umrx_app_v3.shuttle_board.bmi323.bmi323_shuttle import BMI323Shuttle
+from umrx_app_v3.shuttle_board.bmm350.bmm350_shuttle import BMM350Shuttle
+from umrx_app_v3.shuttle_board.payload_layout import PayloadField, PayloadLayout, PayloadLayoutError
+
+
+def polling_frame(channel_id: int, payload: bytes) -> bytes:
+    frame_len = 5 + len(payload) + 4
+    return bytes((0xAA, frame_len, 0x01, 0x00, 0x87)) + payload + bytes((0x00, channel_id, 0x0D, 0x0A))
+
+
+def test_payload_layout_decode_fields() -> None:
+    layout = PayloadLayout(
+        (
+            PayloadField("a", 0, 2, signed=True),
+            PayloadField("b", 2, 3, signed=True),
+            PayloadField("c", 5, 3, byteorder="big", shift=4),
+            PayloadField("d", 8, 2, signed=True, bits=12),
+        ),
+        dummy_bytes=1,
+    )
+    payload = bytes((0x55, 0xFE, 0xFF, 0x01, 0x02, 0x80, 0x12, 0x34, 0x56, 0xFF, 0x0F))
+    assert layout.size == 11
+
+    decoded = layout.decode([payload, payload])
+    assert decoded["a"].tolist() == [-2, -2]
+    assert decoded["b"].tolist() == [0x800201 - (1 << 24)] * 2
+    assert decoded["c"].tolist() == [0x12345] * 2
+    assert decoded["d"].tolist() == [-1, -1]
+
+
+def test_payload_layout_errors() -> None:
+    layout = BMI088Shuttle.GYRO_PAYLOAD_LAYOUT
+    with pytest.raises(PayloadLayoutError):
+        layout.decode(bytes(7))
+    with pytest.raises(PayloadLayoutError):
+        layout.decode(np.zeros((2, 5), dtype=np.uint8))
+
+    batch = StreamingPollingCmd.decode_streaming_batch(polling_frame(1, bytes(7)))
+    with pytest.raises(PayloadLayoutError):
+        layout.decode(batch)
+
+
+def test_payload_layout_matches_struct_unpack() -> None:
+    rng = np.random.default_rng(1234)
+    payloads = [rng.integers(0, 256, 20, dtype=np.uint8).tobytes() for _ in range(32)]
+
+    shuttle = BMI323Shuttle()
+    shuttle.is_i2c_configured = True
+    decoded = shuttle.decode_batch(payloads)
+    for packet, payload in zip(decoded, payloads, strict=True):
+        a_x, a_y, a_z, g_x, g_y, g_z, temperature, time_stamp = struct.unpack("<xxhhhhhhhI", payload)
+        assert packet.tolist() == (a_x, a_y, a_z, g_x, g_y, g_z, temperature, time_stamp)
+
+    shuttle = BME280Shuttle()
+    decoded = shuttle.decode_batch([payload[:8] for payload in payloads])
+    for packet, payload in zip(decoded, payloads, strict=True):
+        pressure = (payload[0] << 12) | (payload[1] << 4) | (payload[2] >> 4)
+        temperature = (payload[3] << 12) | (payload[4] << 4) | (payload[5] >> 4)
+        assert packet.tolist() == (pressure, temperature, (payload[6] << 8) | payload[7])
+
+
+def test_payload_layout_spi_dummy_byte() -> None:
+    shuttle = BMA400Shuttle()
+    shuttle.is_spi_configured = True
+    decoded = shuttle.decode_batch(bytes((0xAA, 0xFF, 0x0F, 0x01, 0x00, 0x00, 0x08, 0x01, 0x02, 0x03)))
+    assert decoded.tolist() == [(-1, 1, -2048, 0x030201)]
+
+    shuttle.is_spi_configured = False
+    shuttle.is_i2c_configured = True
+    decoded = shuttle.decode_batch(bytes((0xFF, 0x0F, 0x01, 0x00, 0x00, 0x08, 0x01, 0x02, 0x03)))
+    assert decoded.tolist() == [(-1, 1, -2048, 0x030201)]
+
+
+def test_payload_layout_split_channels() -> None:
+    shuttle = BMI088Shuttle()
+    shuttle.is_spi_configured = True
+    accel_payload = struct.pack("<xhhh", -1, 2, -3)
+    gyro_payload = struct.pack("<hhh", 100, -200, 300)
+    frames = [polling_frame(1, accel_payload), polling_frame(2, gyro_payload), polling_frame(1, accel_payload)]
+
+    decoded = shuttle.decode_batch(StreamingPollingCmd.decode_streaming_batch(frames))
+    assert decoded["accel"].tolist() == [(-1, 2, -3), (-1, 2, -3)]
+    assert decoded["gyro"].tolist() == [(100, -200, 300)]
+
+
+def test_payload_layout_bmm350() -> None:
+    shuttle = BMM350Shuttle()
+    payload = bytes(
+        (0x00, 0x00, 0x01, 0x02, 0xFF, 0x03, 0x04, 0x05, 0x06, 0x07, 0x80, 0x09, 0x09, 0x09, 0x01, 0x02, 0x03)
+    )
+    decoded = shuttle.decode_batch(payload)
+    assert decoded["mag_x"].tolist() == [0xFF0201 - (1 << 24)]
+    assert decoded["mag_y"].tolist() == [0x050403]
+    assert decoded["mag_z"].tolist() == [0x800706 - (1 << 24)]
+    assert decoded["temperature"].tolist() == [0x090909]
+    assert decoded["sensor_time"].tolist() == [0x030201]
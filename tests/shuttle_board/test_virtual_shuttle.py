@@ -0,0 +1,156 @@
+import numpy as np
+import pytest
+
+from umrx_app_v3.sensors.bmi323 import BMI323Addr
+from umrx_app_v3.shuttle_board.bma400.bma400_virtual import VirtualBMA400Shuttle
+from umrx_app_v3.shuttle_board.bma456.bma456_virtual import VirtualBMA456Shuttle
+from umrx_app_v3.shuttle_board.bma530.bma530_virtual import VirtualBMA530Shuttle
+from umrx_app_v3.shuttle_board.bma580.bma580_virtual import VirtualBMA580Shuttle
+from umrx_app_v3.shuttle_board.bme280.bme280_virtual import VirtualBME280Shuttle
+from umrx_app_v3.shuttle_board.bmi088.bmi088_virtual import VirtualBMI088Shuttle
+from umrx_app_v3.shuttle_board.bmi323.bmi323_virtual import FEATURE_ENGINE_STARTUP, VirtualBMI323Shuttle
+from umrx_app_v3.shuttle_board.bmm350.bmm350_virtual import BMM350_OTP_WORDS, VirtualBMM350Shuttle
+from umrx_app_v3.shuttle_board.bmp390.bmp390_virtual import BMP390_NVM, VirtualBMP390Shuttle
+from umrx_app_v3.shuttle_board.bmp585.bmp585_virtual import VirtualBMP585Shuttle
+from umrx_app_v3.shuttle_board.virtual_shuttle import invert, VirtualShuttle
+
+INTERRUPT_STREAMING = (
+    (VirtualBMA400Shuttle, "spi"),
+    (VirtualBMA456Shuttle, "spi"),
+    (VirtualBMA530Shuttle, "i2c"),
+    (VirtualBMA580Shuttle, "i2c"),
+    (VirtualBMI088Shuttle, "spi"),
+    (VirtualBMI323Shuttle, "i2c"),
+    (VirtualBMM350Shuttle, "i2c"),
+    (VirtualBMP390Shuttle, "i2c"),
+    (VirtualBMP585Shuttle, "spi"),
+)
+
+
+def bring_up(virtual_shuttle: VirtualShuttle, interface: str) -> object:
+    shuttle = virtual_shuttle.create_shuttle()
+    shuttle.initialize()
+    shuttle.check_connected_hw()
+    getattr(shuttle, f"configure_{interface}")()
+    return shuttle
+
+
+@pytest.mark.parametrize(("virtual_shuttle_class", "interface"), INTERRUPT_STREAMING)
+def test_virtual_shuttle_interrupt_streaming(virtual_shuttle_class: type[VirtualShuttle], interface: str) -> None:
+    virtual_shuttle = virtual_shuttle_class()
+    shuttle = bring_up(virtual_shuttle, interface)
+    shuttle.configure_interrupt_streaming()
+    shuttle.board.enable_timer()
+    shuttle.start_streaming()
+    virtual_shuttle.emulator.virtual_time += 0.2
+    batch = shuttle.board.receive_interrupt_streaming_batch(includes_mcu_timestamp=True)
+    shuttle.stop_streaming()
+
+    assert len(batch) > 1
+    assert np.all(np.diff(batch["mcu_timestamp_us"]) >= 0)
+    decoded = shuttle.decode_batch(batch)
+    for samples in decoded.values() if isinstance(decoded, dict) else (decoded,):
+        assert len(samples) > 1
+        assert len(np.unique(samples)) > 1, "every packet is read at its own sample time"
+
+
+def test_virtual_shuttle_pause_moves_virtual_clock() -> None:
+    virtual_shuttle = VirtualBMP585Shuttle()
+    shuttle = bring_up(virtual_shuttle, "i2c")
+    start = virtual_shuttle.emulator.now()
+    shuttle.configure_interrupt_streaming()
+    assert virtual_shuttle.emulator.now() - start == pytest.approx(0.1 + 0.2)
+
+
+def test_virtual_bmi088_polling_streaming_i2c() -> None:
+    virtual_shuttle = VirtualBMI088Shuttle()
+    shuttle = bring_up(virtual_shuttle, "i2c")
+    shuttle.configure_polling_streaming()
+    shuttle.start_streaming()
+    virtual_shuttle.emulator.virtual_time += 0.01
+    decoded = shuttle.decode_batch(shuttle.board.receive_polling_streaming_batch())
+    assert np.all(np.abs(decoded["accel"]["acc_z"] - virtual_shuttle.accel.LSB_PER_G) < 300)
+    # accel data ready is 100 Hz, it is polled at 1.6 kHz and repeats
+    assert len(np.unique(decoded["accel"]["acc_x"])) < len(decoded["accel"])
+
+
+def test_virtual_bmm350_otp() -> None:
+    shuttle = bring_up(VirtualBMM350Shuttle(), "i2c")
+    words = shuttle.read_otp()
+    assert words["otp_mag_dut_t_0"] == BMM350_OTP_WORDS[0x18]
+    assert words["otp_temp_off_sens"] == BMM350_OTP_WORDS[0x0D]
+    assert shuttle.sensor.dut_t0 == pytest.approx(25.25)
+
+
+def test_virtual_bmp390_nvm_and_compensation() -> None:
+    virtual_shuttle = VirtualBMP390Shuttle()
+    shuttle = bring_up(virtual_shuttle, "spi")
+    assert tuple(shuttle.sensor.read_nvm().values()) == BMP390_NVM
+    shuttle.configure_polling_streaming()
+    shuttle.start_streaming()
+    decoded = shuttle.decode_batch(shuttle.board.receive_polling_streaming_batch())
+    temperature, pressure = shuttle.sensor.compensate_batch(decoded["pressure"], decoded["temperature"])
+    assert temperature == pytest.approx(25.0, abs=0.5)
+    assert pressure == pytest.approx(101325.0, abs=60.0)
+
+
+def test_virtual_bme280_nvm_and_compensation() -> None:
+    virtual_shuttle = VirtualBME280Shuttle()
+    shuttle = bring_up(virtual_shuttle, "spi")
+    coefficients = shuttle.sensor.read_nvm()
+    assert coefficients["dig_t1"] == 27504
+    assert (coefficients["dig_h4"], coefficients["dig_h5"]) == (313, 50)
+    shuttle.configure_polling_streaming()
+    shuttle.start_streaming()
+    decoded = shuttle.decode_batch(shuttle.board.receive_polling_streaming_batch())
+    temperature, pressure, humidity = shuttle.sensor.compensate_batch(
+        decoded["pressure"], decoded["temperature"], decoded["humidity"]
+    )
+    assert temperature == pytest.approx(25.0, abs=0.5)
+    assert pressure == pytest.approx(101325.0, abs=60.0)
+    assert humidity == pytest.approx(45.0, abs=5.5)
+
+
+@pytest.mark.parametrize(("interface", "pipeline_depth"), [("i2c", 1), ("spi", 4)])
+def test_virtual_bma456_config_file_upload(interface: str, pipeline_depth: int) -> None:
+    virtual_shuttle = VirtualBMA456Shuttle()
+    shuttle = bring_up(virtual_shuttle, interface)
+    config_file = shuttle.load_config_file("mm")
+    shuttle.sensor.init_ctrl = 0x00
+    shuttle.write_config_file(config_file, pipeline_depth=pipeline_depth)
+    shuttle.sensor.init_ctrl = 0x01
+    assert shuttle.sensor.internal_status == 0x01
+    assert virtual_shuttle.sensor.config_file(len(config_file)) == config_file
+
+
+def test_virtual_bma456_init_without_config_file_fails() -> None:
+    shuttle = bring_up(VirtualBMA456Shuttle(), "i2c")
+    shuttle.sensor.init_ctrl = 0x01
+    assert shuttle.sensor.internal_status == 0x02
+
+
+@pytest.mark.parametrize("virtual_shuttle_class", [VirtualBMA530Shuttle, VirtualBMA580Shuttle])
+def test_virtual_bma5_extended_registers(virtual_shuttle_class: type[VirtualShuttle]) -> None:
+    virtual_shuttle = virtual_shuttle_class(extended_registers={0x03: 0x1234})
+    shuttle = bring_up(virtual_shuttle, "spi")
+    assert shuttle.sensor.general_settings_0 == 0x1234
+    shuttle.sensor.foc_0 = 0xBEEF
+    assert shuttle.sensor.foc_0 == 0xBEEF
+
+    shuttle.sensor.cmd = 0xB6
+    assert shuttle.sensor.general_settings_0 == 0x1234
+    assert shuttle.sensor.foc_0 == 0x0000
+
+
+def test_virtual_bmi323_feature_engine() -> None:
+    virtual_shuttle = VirtualBMI323Shuttle()
+    shuttle = bring_up(virtual_shuttle, "i2c")
+    assert shuttle.sensor.chip_id == 0x0043
+    shuttle.sensor.write(BMI323Addr.feature_io2, FEATURE_ENGINE_STARTUP)
+    shuttle.sensor.feature_ctrl = 0x0001
+    assert virtual_shuttle.sensor.word(BMI323Addr.feature_io1.value) == 0x0001
+
+
+def test_invert() -> None:
+    assert invert(lambda raw: 2.0 * raw + 1.0, 11.0, high=100) == 5
+    assert invert(lambda raw: -raw, -42.0, high=100) == 42
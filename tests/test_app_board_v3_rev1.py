@@ -1,5 +1,5 @@
 import logging
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -80,3 +80,39 @@ def test_app_board_v3_rev1_receive_streaming_multiple(app_board_v3_rev1: Applica
 
         assert num_messages == 3
         mocked_protocol_initialize.assert_called_once()
+
+
+@pytest.mark.app_board
+def test_app_board_v3_rev1_receive_streaming_batch(app_board_v3_rev1: ApplicationBoardV3Rev1) -> None:
+    example_payload = (
+        b"\xaa\x0f\x01\x00\x87\x00\x00\x00\x00\x00\x00\x00\x01\r\n\xaa\x0f\x01\x00\x87N\x00v\x00"
+        b"\x8e\x05\x00\x02\r\n\xaa\x0f\x01\x00\x87\x00\x00\x00\x00\x00\x00\x00\x01\r\n"
+    )
+
+    with patch.object(app_board_v3_rev1.protocol.communication, "_receive", return_value=example_payload):
+        batch = app_board_v3_rev1.receive_polling_streaming_batch()
+
+    assert batch["channel_id"].tolist() == [1, 2, 1]
+    assert batch["payload"][1].tolist() == [0x4E, 0x00, 0x76, 0x00, 0x8E, 0x05]
+
+
+@pytest.mark.app_board
+def test_app_board_v3_rev1_streaming_runs_serial_reader(app_board_v3_rev1: ApplicationBoardV3Rev1) -> None:
+    calls = MagicMock()
+    communication = app_board_v3_rev1.protocol.communication
+    with (
+        patch.object(communication, "start_reader", calls.start_reader),
+        patch.object(communication, "stop_reader", calls.stop_reader),
+        patch.object(app_board_v3_rev1.protocol, "send_receive", calls.send_receive),
+    ):
+        app_board_v3_rev1.start_interrupt_streaming()
+        app_board_v3_rev1.stop_interrupt_streaming()
+        app_board_v3_rev1.start_polling_streaming()
+        app_board_v3_rev1.stop_polling_streaming()
+    # the reader runs before the start request and until the stop request is answered
+    assert [name for name, _, _ in calls.mock_calls] == [
+        "start_reader",
+        "send_receive",
+        "send_receive",
+        "stop_reader",
+    ] * 2
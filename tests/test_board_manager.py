@@ -0,0 +1,181 @@
+import threading
+import time
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+import usb.core
+from serial.tools.list_ports_common import ListPortInfo
+
+from umrx_app_v3.mcu_board.app_board_v3_rev0 import ApplicationBoardV3Rev0
+from umrx_app_v3.mcu_board.app_board_v3_rev1 import ApplicationBoardV3Rev1
+from umrx_app_v3.mcu_board.board_manager import BoardAddress, BoardManager, BoardManagerError
+from umrx_app_v3.mcu_board.comm.serial_comm import SerialCommunication
+from umrx_app_v3.mcu_board.comm.usb_comm import UsbCommunication
+
+BRING_UP_DELAY = 0.2
+
+
+def port_info(device: str, serial_number: str, vid: int = 0x108C, pid: int = 0xAB38) -> ListPortInfo:
+    info = ListPortInfo(device, skip_link_detection=True)
+    info.serial_number, info.vid, info.pid = serial_number, vid, pid
+    return info
+
+
+PORTS = [
+    port_info("/dev/ttyACM1", "B1"),
+    port_info("/dev/ttyACM0", "B0"),
+    port_info("/dev/ttyUSB0", "X0", vid=0x0403, pid=0x6001),
+]
+
+
+class FakeShuttle:
+    def __init__(self, board: Any) -> None:
+        self.board = board
+        self.thread_name: str | None = None
+
+    def initialize(self) -> None:
+        self.thread_name = threading.current_thread().name
+        time.sleep(BRING_UP_DELAY)
+
+    def check_connected_hw(self) -> None:
+        if self.board.serial_number == "broken":
+            error_message = "Unexpected shuttle"
+            raise ValueError(error_message)
+
+
+def addresses(*serial_numbers: str) -> list[BoardAddress]:
+    return [BoardAddress("v3_rev1", serial_number=serial_number) for serial_number in serial_numbers]
+
+
+def fake_board(address: BoardAddress) -> MagicMock:
+    return MagicMock(serial_number=address.serial_number)
+
+
+def test_board_manager_discover() -> None:
+    with (
+        patch("serial.tools.list_ports.comports", return_value=PORTS),
+        patch.object(UsbCommunication, "list_devices", side_effect=usb.core.NoBackendError),
+    ):
+        found = BoardManager.discover()
+    assert [(address.port, address.serial_number) for address in found] == [
+        ("/dev/ttyACM0", "B0"),
+        ("/dev/ttyACM1", "B1"),
+    ]
+    assert all(address.hardware == "v3_rev1" for address in found)
+
+    assert BoardManager.select(found, serial_numbers=["B1"]) == [found[1]]
+    assert BoardManager.select(found, ports=["/dev/ttyACM0"]) == [found[0]]
+    assert BoardManager.select(found, serial_numbers=["B1"], ports=["/dev/ttyACM0"]) == []
+
+    usb_device = SimpleNamespace(serial_number="R0", bus=1, address=2)
+    with (
+        patch("serial.tools.list_ports.comports", return_value=[]),
+        patch.object(UsbCommunication, "list_devices", return_value=[usb_device]),
+    ):
+        assert BoardManager.discover() == [BoardAddress("v3_rev0", serial_number="R0", port="1:2")]
+
+
+class UnreadableUsbDevice:
+    def __init__(self, bus: int, address: int) -> None:
+        self.bus, self.address = bus, address
+
+    @property
+    def serial_number(self) -> str:
+        error_message = "The device has no langid (permission issue, no string descriptors supported or device error)"
+        raise ValueError(error_message)
+
+
+def test_board_manager_rev0_boards_without_serial_number() -> None:
+    usb_devices = [UnreadableUsbDevice(1, 2), UnreadableUsbDevice(1, 3)]
+    with (
+        patch("serial.tools.list_ports.comports", return_value=[]),
+        patch.object(UsbCommunication, "list_devices", return_value=usb_devices),
+    ):
+        found = BoardManager.discover()
+    assert found == [
+        BoardAddress("v3_rev0", serial_number=None, port="1:2"),
+        BoardAddress("v3_rev0", serial_number=None, port="1:3"),
+    ]
+
+    manager = BoardManager()
+    boards = [manager.open_board(address) for address in found]
+    assert len(manager.boards) == len(usb_devices)
+    assert boards[0] is not boards[1]
+
+    def find(custom_match: Callable[[Any], bool], **kwargs: Any) -> Any:
+        return next((device for device in usb_devices if custom_match(device)), None)
+
+    with patch.object(usb.core, "find", side_effect=find):
+        for board, usb_device in zip(boards, usb_devices, strict=True):
+            usb_comm = board.protocol.communication
+            usb_comm.find_device()
+            assert usb_comm.usb_device is usb_device
+
+
+def test_board_manager_create_board() -> None:
+    board = BoardManager.create_board(BoardAddress("v3_rev1", serial_number="B1", port="/dev/ttyACM1"))
+    assert isinstance(board, ApplicationBoardV3Rev1)
+    assert board.protocol.communication.port_name == "/dev/ttyACM1"
+    assert board.protocol.communication.serial_number == "B1"
+
+    board = BoardManager.create_board(BoardAddress("v3_rev0", serial_number="R0", port="1:2"))
+    assert isinstance(board, ApplicationBoardV3Rev0)
+    assert board.protocol.communication.serial_number == "R0"
+    assert board.protocol.communication.port == "1:2"
+
+    with pytest.raises(BoardManagerError):
+        BoardManager.create_board(BoardAddress("v2", serial_number="R0"))
+
+
+def test_serial_comm_find_device_by_serial_number() -> None:
+    with patch("serial.tools.list_ports.comports", return_value=PORTS):
+        serial_comm = SerialCommunication(serial_number="B1")
+        assert serial_comm.find_device()
+        assert serial_comm.port_name == "/dev/ttyACM1"
+        assert not SerialCommunication(serial_number="missing").find_device()
+
+
+def test_board_manager_bring_up_in_parallel() -> None:
+    configured = []
+    num_boards = 4
+    manager = BoardManager()
+    with patch.object(BoardManager, "create_board", side_effect=fake_board):
+        start = time.monotonic()
+        shuttles = manager.bring_up(
+            FakeShuttle, configure=lambda shuttle: configured.append(shuttle), addresses=addresses("0", "1", "2", "3")
+        )
+        elapsed = time.monotonic() - start
+
+    assert elapsed < num_boards * BRING_UP_DELAY / 2
+    assert [shuttle.board.serial_number for shuttle in shuttles] == ["0", "1", "2", "3"]
+    assert len({shuttle.thread_name for shuttle in shuttles}) == num_boards
+    assert sorted(configured, key=lambda shuttle: shuttle.board.serial_number) == shuttles
+
+    boards = list(manager.boards.values())
+    manager.close()
+    assert manager.boards == {}
+    for board in boards:
+        board.protocol.communication.disconnect.assert_called_once()
+
+
+def test_board_manager_initialize_boards() -> None:
+    with BoardManager(max_workers=2) as manager, patch.object(BoardManager, "create_board", side_effect=fake_board):
+        boards = manager.initialize_boards(addresses("0", "1", "2"))
+        for board in boards:
+            board.initialize.assert_called_once()
+            board.start_communication.assert_called_once()
+        assert manager.open_board(addresses("1")[0]) is boards[1]
+
+
+def test_board_manager_bring_up_errors() -> None:
+    manager = BoardManager()
+    with patch.object(BoardManager, "create_board", side_effect=fake_board):
+        with pytest.raises(BoardManagerError) as exc_info:
+            manager.bring_up(FakeShuttle, addresses=addresses("0", "broken", "2"))
+        assert isinstance(exc_info.value.__cause__, ValueError)
+        assert "1 of 3" in str(exc_info.value)
+
+        assert manager.bring_up(FakeShuttle, addresses=[]) == []
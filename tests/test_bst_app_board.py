@@ -1,30 +1,31 @@
 import logging
 import time
 from array import array
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 import pytest
 
-from umrx_app_v3.mcu_board.bst_app_board import ApplicationBoard
+from umrx_app_v3.mcu_board.bst_app_board import AppBoardError, ApplicationBoard
 from umrx_app_v3.mcu_board.bst_protocol import BstProtocol
 from umrx_app_v3.mcu_board.bst_protocol_constants import (
     I2CMode,
     MultiIOPin,
     PinDirection,
     PinValue,
+    SPIBus,
     SPISpeed,
     StreamingSamplingUnit,
 )
 from umrx_app_v3.mcu_board.comm.serial_comm import SerialCommunication
+from umrx_app_v3.mcu_board.commands.command import Command, CommandError
 from umrx_app_v3.mcu_board.commands.spi import SPIConfigureCmd
 from umrx_app_v3.mcu_board.commands.streaming_interrupt import (
-    StreamingInterruptCmd,
     StreamingInterruptI2cChannelConfig,
     StreamingInterruptI2cConfig,
     StreamingInterruptSpiChannelConfig,
     StreamingInterruptSpiConfig,
 )
-from umrx_app_v3.mcu_board.commands.streaming_polling import StreamingPollingCmd
 
 logger = logging.getLogger(__name__)
 
@@ -59,16 +60,16 @@ def test_app_board_board_info(bst_app_board_with_serial: ApplicationBoard) -> No
 
 @pytest.mark.app_board
 def test_app_board_disable_timer(bst_app_board_with_serial: ApplicationBoard) -> None:
-    with patch.object(bst_app_board_with_serial.protocol.communication, "send_receive") as mocked_send_receive:
+    with patch.object(bst_app_board_with_serial.protocol, "send_receive_many") as mocked_send_receive:
         bst_app_board_with_serial.disable_timer()
-        assert mocked_send_receive.call_count == 2
+        assert len(list(mocked_send_receive.call_args.args[0])) == 2
 
 
 @pytest.mark.app_board
 def test_app_board_enable_timer(bst_app_board_with_serial: ApplicationBoard) -> None:
-    with patch.object(bst_app_board_with_serial.protocol.communication, "send_receive") as mocked_send_receive:
+    with patch.object(bst_app_board_with_serial.protocol, "send_receive_many") as mocked_send_receive:
         bst_app_board_with_serial.enable_timer()
-        assert mocked_send_receive.call_count == 2
+        assert len(list(mocked_send_receive.call_args.args[0])) == 2
 
 
 @pytest.mark.app_board
@@ -121,10 +122,10 @@ def test_app_board_switch_usb_dfu_bl(bst_app_board_with_serial: ApplicationBoard
 @pytest.mark.app_board
 def test_app_board_configure_i2c(bst_app_board_with_serial: ApplicationBoard) -> None:
     with (
-        patch.object(bst_app_board_with_serial.protocol, "send_receive") as mocked_send_receive,
+        patch.object(bst_app_board_with_serial.protocol, "send_receive_many") as mocked_send_receive,
     ):
         bst_app_board_with_serial.configure_i2c(I2CMode.STANDARD_MODE)
-        assert mocked_send_receive.call_count == 2
+        assert len(list(mocked_send_receive.call_args.args[0])) == 2
 
 
 @pytest.mark.app_board
@@ -174,10 +175,75 @@ def test_app_board_write_i2c(bst_app_board_with_serial: ApplicationBoard) -> Non
         mocked_send_receive.assert_called_with(expected_payload)
 
 
+BOARD_INFO_RESPONSE = array(
+    "B", [0xAA, 0x0F, 0x01, 0x00, 0x42, 0x1F, 0x01, 0x41, 0x00, 0x10, 0x00, 0x09, 0x05, 0x0D, 0x0A]
+)
+STREAMING_PACKET = array("B", (0xAA, 0x0A, 0x01, 0x00, 0x87, 0x01, 0x11, 0x22, 0x0D, 0x0A))
+OK_RESPONSE = array("B", (0xAA, 0x06, 0x01, 0x00, 0x0D, 0x0A))
+
+
 @pytest.mark.app_board
 def test_app_board_start_communication(bst_app_board_with_serial: ApplicationBoard) -> None:
-    with patch.object(bst_app_board_with_serial.protocol, "send_receive"), patch.object(time, "sleep"):
+    # streaming packets still in flight delay the board info response by two polls
+    responses = [OK_RESPONSE] * 2 + [STREAMING_PACKET, STREAMING_PACKET + BOARD_INFO_RESPONSE[:7], BOARD_INFO_RESPONSE]
+    with (
+        patch.object(bst_app_board_with_serial.protocol, "send_receive", side_effect=responses) as mocked_send_receive,
+        patch.object(bst_app_board_with_serial.protocol, "send_receive_many") as mocked_send_receive_many,
+        patch.object(bst_app_board_with_serial.protocol, "discard_input", return_value=0) as mocked_discard_input,
+        patch.object(time, "sleep") as mocked_sleep,
+    ):
         bst_app_board_with_serial.start_communication()
+    assert mocked_send_receive.call_count == len(responses)
+    mocked_send_receive_many.assert_called_once()
+    assert mocked_discard_input.call_count == 3
+    assert all(call.args[0] == ApplicationBoard.READY_POLL_INTERVAL for call in mocked_sleep.call_args_list)
+
+
+@pytest.mark.app_board
+def test_app_board_wait_until(bst_app_board_with_serial: ApplicationBoard) -> None:
+    board = bst_app_board_with_serial
+    assert board.wait_until(lambda: True, "ready") < board.READY_TIMEOUT
+    with pytest.raises(AppBoardError):
+        board.wait_until(lambda: False, "never ready", timeout=0.01)
+
+    with (
+        patch.object(board.protocol, "send_receive", return_value=STREAMING_PACKET),
+        patch.object(board.protocol, "discard_input", return_value=len(STREAMING_PACKET)),
+        pytest.raises(AppBoardError),
+    ):
+        board.wait_until(board.is_responsive, "board response", timeout=0.01)
+
+
+@pytest.mark.app_board
+def test_app_board_wait_for_chip_id(bst_app_board_with_serial: ApplicationBoard) -> None:
+    chip_ids = iter([CommandError("NACK"), 0xFF, 0x00, 0x90])
+
+    def read_chip_id() -> int:
+        chip_id = next(chip_ids)
+        if isinstance(chip_id, Exception):
+            raise chip_id
+        return chip_id
+
+    with patch.object(time, "sleep") as mocked_sleep:
+        bst_app_board_with_serial.wait_for_chip_id(read_chip_id, "sensor chip id")
+    assert mocked_sleep.call_count == 3
+
+
+@pytest.mark.app_board
+def test_app_board_stop_streaming(bst_app_board_with_serial: ApplicationBoard) -> None:
+    board = bst_app_board_with_serial
+    with (
+        patch.object(board.protocol, "send_receive", side_effect=[OK_RESPONSE, OK_RESPONSE, BOARD_INFO_RESPONSE]),
+        patch.object(board.protocol, "discard_input", return_value=0),
+        patch.object(time, "sleep") as mocked_sleep,
+    ):
+        board.stop_streaming()
+    mocked_sleep.assert_not_called()
+
+    with patch.object(board, "set_vdd_vddio") as mocked_set_vdd_vddio, patch.object(time, "sleep") as mocked_sleep:
+        board.power_off()
+    mocked_set_vdd_vddio.assert_called_once_with(0.0, 0.0)
+    mocked_sleep.assert_called_once_with(board.POWER_OFF_TIME)
 
 
 @pytest.mark.app_board
@@ -206,11 +272,11 @@ def test_app_board_get_pin_config(bst_app_board_with_serial: ApplicationBoard) -
 @pytest.mark.app_board
 def test_app_board_configure_spi(bst_app_board_with_serial: ApplicationBoard) -> None:
     with (
-        patch.object(bst_app_board_with_serial.protocol, "send_receive") as mocked_send_receive,
+        patch.object(bst_app_board_with_serial.protocol, "send_receive_many") as mocked_send_receive,
         patch.object(SPIConfigureCmd, "parse"),
     ):
         bst_app_board_with_serial.configure_spi(SPISpeed.MHz_5)
-        assert mocked_send_receive.call_count == 2
+        assert len(list(mocked_send_receive.call_args.args[0])) == 2
 
 
 @pytest.mark.app_board
@@ -289,18 +355,18 @@ def test_app_board_write_spi(bst_app_board_with_serial: ApplicationBoard) -> Non
 def test_app_board_set_streaming_polling_i2c(bst_app_board_with_serial: ApplicationBoard) -> None:
     bst_app_board_with_serial.streaming_polling_set_i2c_configuration()
 
-    assert StreamingPollingCmd.polling_streaming_config is not None
+    assert bst_app_board_with_serial.polling_streaming_config is not None
 
-    assert len(StreamingPollingCmd.polling_streaming_config.channel_configs) == 0
+    assert len(bst_app_board_with_serial.polling_streaming_config.channel_configs) == 0
 
 
 @pytest.mark.app_board
 def test_app_board_set_streaming_polling_spi(bst_app_board_with_serial: ApplicationBoard) -> None:
     bst_app_board_with_serial.streaming_polling_set_spi_configuration()
 
-    assert StreamingPollingCmd.polling_streaming_config is not None
+    assert bst_app_board_with_serial.polling_streaming_config is not None
 
-    assert len(StreamingPollingCmd.polling_streaming_config.channel_configs) == 0
+    assert len(bst_app_board_with_serial.polling_streaming_config.channel_configs) == 0
 
 
 @pytest.mark.app_board
@@ -323,12 +389,12 @@ def test_app_board_polling_configure_i2c_2_channel(bst_app_board_with_serial: Ap
         bytes_to_read=6,
     )
 
-    assert len(StreamingPollingCmd.polling_streaming_config.channel_configs) == 2
+    assert len(bst_app_board_with_serial.polling_streaming_config.channel_configs) == 2
 
-    with patch.object(bst_app_board_with_serial.protocol, "send_receive") as mocked_send_receive:
+    with patch.object(bst_app_board_with_serial.protocol, "send_receive_many") as mocked_send_receive:
         bst_app_board_with_serial.configure_streaming_polling(interface="i2c")
 
-        assert mocked_send_receive.call_count == 3
+        assert len(list(mocked_send_receive.call_args.args[0])) == 3
 
 
 @pytest.mark.app_board
@@ -343,12 +409,12 @@ def test_app_board_polling_configure_i2c_1_channel(bst_app_board_with_serial: Ap
         bytes_to_read=6,
     )
 
-    assert len(StreamingPollingCmd.polling_streaming_config.channel_configs) == 1
+    assert len(bst_app_board_with_serial.polling_streaming_config.channel_configs) == 1
 
-    with patch.object(bst_app_board_with_serial.protocol, "send_receive") as mocked_send_receive:
+    with patch.object(bst_app_board_with_serial.protocol, "send_receive_many") as mocked_send_receive:
         bst_app_board_with_serial.configure_streaming_polling(interface="i2c")
 
-        assert mocked_send_receive.call_count == 2
+        assert len(list(mocked_send_receive.call_args.args[0])) == 2
 
 
 @pytest.mark.app_board
@@ -371,12 +437,59 @@ def test_app_board_polling_configure_spi_2_channel(bst_app_board_with_serial: Ap
         bytes_to_read=6,
     )
 
-    assert len(StreamingPollingCmd.polling_streaming_config.channel_configs) == 2
+    assert len(bst_app_board_with_serial.polling_streaming_config.channel_configs) == 2
 
-    with patch.object(bst_app_board_with_serial.protocol, "send_receive") as mocked_send_receive:
+    with patch.object(bst_app_board_with_serial.protocol, "send_receive_many") as mocked_send_receive:
         bst_app_board_with_serial.configure_streaming_polling(interface="spi")
 
-        assert mocked_send_receive.call_count == 3
+        assert len(list(mocked_send_receive.call_args.args[0])) == 3
+
+
+@pytest.mark.app_board
+def test_app_board_streaming_config_per_board() -> None:
+    boards = [ApplicationBoard(protocol=BstProtocol()) for _ in range(8)]
+
+    def configure(board_idx: int) -> None:
+        for channel_idx in range(2):
+            boards[board_idx].streaming_polling_set_i2c_channel(
+                i2c_address=0x18 + board_idx,
+                sampling_time=1 + channel_idx,
+                sampling_unit=StreamingSamplingUnit.MILLI_SECOND,
+                register_address=0x12,
+                bytes_to_read=6,
+            )
+        boards[board_idx].streaming_interrupt_set_spi_channel(
+            interrupt_pin=MultiIOPin.MINI_SHUTTLE_PIN_1_6,
+            cs_pin=MultiIOPin.MINI_SHUTTLE_PIN_2_1,
+            register_address=0x12,
+            bytes_to_read=7,
+        )
+
+    with ThreadPoolExecutor(max_workers=len(boards)) as executor:
+        list(executor.map(configure, range(len(boards))))
+
+    for board_idx, board in enumerate(boards):
+        channel_configs = board.polling_streaming_config.channel_configs
+        assert [config.id for config in channel_configs] == [1, 2]
+        assert {config.i2c_address for config in channel_configs} == {0x18 + board_idx}
+        assert [config.id for config in board.interrupt_streaming_config.channel_configs] == [1]
+
+    with pytest.raises(AppBoardError):
+        ApplicationBoard(protocol=BstProtocol()).configure_streaming_polling(interface="i2c")
+
+
+@pytest.mark.app_board
+def test_app_board_spi_bus_per_board() -> None:
+    board_0, board_1 = ApplicationBoard(protocol=BstProtocol()), ApplicationBoard(protocol=BstProtocol())
+    board_1.spi_bus = SPIBus.BUS_1
+    for board, expected_bus in ((board_0, SPIBus.BUS_0), (board_1, SPIBus.BUS_1)):
+        with (
+            patch.object(board.protocol, "send_receive_many") as mocked_send_receive,
+            patch.object(SPIConfigureCmd, "parse"),
+        ):
+            board.configure_spi(SPISpeed.MHz_5)
+        spi_settings = list(mocked_send_receive.call_args.args[0])[1]
+        assert spi_settings[4] == expected_bus.value
 
 
 @pytest.mark.app_board
@@ -410,8 +523,8 @@ def test_app_board_start_interrupt_streaming(bst_app_board_with_serial: Applicat
 def test_app_board_interrupt_set_spi_config(bst_app_board_with_serial: ApplicationBoard) -> None:
     bst_app_board_with_serial.streaming_interrupt_set_spi_configuration()
 
-    assert isinstance(StreamingInterruptCmd.streaming_interrupt_config, StreamingInterruptSpiConfig)
-    assert len(StreamingInterruptCmd.streaming_interrupt_config.channel_configs) == 0
+    assert isinstance(bst_app_board_with_serial.interrupt_streaming_config, StreamingInterruptSpiConfig)
+    assert len(bst_app_board_with_serial.interrupt_streaming_config.channel_configs) == 0
 
 
 @pytest.mark.app_board
@@ -431,15 +544,15 @@ def test_app_board_interrupt_config_spi_channel(bst_app_board_with_serial: Appli
         bytes_to_read=7,
     )
 
-    assert StreamingInterruptCmd.streaming_interrupt_config.channel_configs[0] == config_1
+    assert bst_app_board_with_serial.interrupt_streaming_config.channel_configs[0] == config_1
 
 
 @pytest.mark.app_board
 def test_app_board_interrupt_set_i2c_config(bst_app_board_with_serial: ApplicationBoard) -> None:
     bst_app_board_with_serial.streaming_interrupt_set_i2c_configuration()
 
-    assert isinstance(StreamingInterruptCmd.streaming_interrupt_config, StreamingInterruptI2cConfig)
-    assert len(StreamingInterruptCmd.streaming_interrupt_config.channel_configs) == 0
+    assert isinstance(bst_app_board_with_serial.interrupt_streaming_config, StreamingInterruptI2cConfig)
+    assert len(bst_app_board_with_serial.interrupt_streaming_config.channel_configs) == 0
 
 
 @pytest.mark.app_board
@@ -452,7 +565,7 @@ def test_app_board_interrupt_config_i2c_channel(bst_app_board_with_serial: Appli
         interrupt_pin=MultiIOPin.MINI_SHUTTLE_PIN_1_6, i2c_address=0x18, register_address=0x12, bytes_to_read=6
     )
 
-    assert StreamingInterruptCmd.streaming_interrupt_config.channel_configs[0] == config_1
+    assert bst_app_board_with_serial.interrupt_streaming_config.channel_configs[0] == config_1
 
 
 @pytest.mark.app_board
@@ -466,10 +579,10 @@ def test_app_board_interrupt_configure_streaming(bst_app_board_with_serial: Appl
         interrupt_pin=MultiIOPin.MINI_SHUTTLE_PIN_1_7, i2c_address=0x68, register_address=0x02, bytes_to_read=6
     )
 
-    with patch.object(bst_app_board_with_serial.protocol, "send_receive") as mocked_send_receive:
+    with patch.object(bst_app_board_with_serial.protocol, "send_receive_many") as mocked_send_receive:
         bst_app_board_with_serial.configure_streaming_interrupt(interface="i2c")
 
-        assert mocked_send_receive.call_count == 2
+        assert len(list(mocked_send_receive.call_args.args[0])) == 2
 
 
 @pytest.mark.app_board
@@ -519,3 +632,105 @@ def test_app_board_interrupt_receive_streaming(bst_app_board_with_serial: Applic
         assert packet_count == 0x0F
         assert timestamp == 12437749
         assert payload == array("B", (0x06, 0x00, 0x4B, 0x00, 0xEF, 0xFF))
+
+
+@pytest.mark.app_board
+def test_app_board_decode_streaming_batch(bst_app_board_with_serial: ApplicationBoard) -> None:
+    interrupt_frame = bytes((170, 18, 1, 0, 138, 2, 0, 0, 1, 238, 228, 255, 191, 255, 205, 255, 13, 10))
+    batch = bst_app_board_with_serial.decode_interrupt_streaming_batch(interrupt_frame * 3)
+    assert batch["channel_id"].tolist() == [2, 2, 2]
+    assert batch["packet_count"].tolist() == [494, 494, 494]
+    assert batch["payload"][2].tolist() == [228, 255, 191, 255, 205, 255]
+
+    polling_frame = bytes((0xAA, 0x0F, 0x01, 0x00, 0x87, 0xE4, 0xFF, 0xDE, 0xFF, 0xE8, 0xFF, 0x00, 0x02, 0x0D, 0x0A))
+    batch = bst_app_board_with_serial.decode_polling_streaming_batch([polling_frame, polling_frame])
+    assert batch["channel_id"].tolist() == [2, 2]
+    assert batch["payload"][0].tolist() == [0xE4, 0xFF, 0xDE, 0xFF, 0xE8, 0xFF]
+
+
+class FakeRegisterFile:
+    def __init__(self, *, dummy_byte: bool = False, register_width: int = 1) -> None:
+        self.registers = bytearray(range(256))
+        self.dummy_byte = dummy_byte
+        self.register_width = register_width
+        self.requests: list[tuple[int, int]] = []
+
+    def send_receive_many(self, messages: list[array]) -> list[array]:
+        responses = []
+        for message in messages:
+            register_address = message[10] & 0x7F
+            if message[2] == 0x02:  # DD_GET, a read
+                length = message[11] << 8 | message[12]
+                start = register_address * self.register_width
+                data = self.registers[start : start + length - self.dummy_byte]
+                data = b"\xff" * self.dummy_byte + data
+                responses.append(Command.create_message_from((0x01, 0x00, 0x42, 0x16, 1, 0, 1, 1, 0, *data)))
+            else:
+                length = message[12]
+                self.registers[register_address : register_address + length] = bytes(message[16 : 16 + length])
+                responses.append(Command.create_message_from((0x01, 0x00, 0x42, 0x16)))
+            self.requests.append((register_address, length))
+        return responses
+
+
+@pytest.mark.app_board
+def test_app_board_merge_registers() -> None:
+    bursts = ApplicationBoard.merge_reads([(0x10, 2), (0x12, 1), (0x20, 1), (0x13, 1), (0x14, 4)], max_length=5)
+    assert bursts == [(0x10, 3, [0, 1]), (0x20, 1, [2]), (0x13, 5, [3, 4])]
+
+    bursts = ApplicationBoard.merge_writes([(0x40, b"\x01"), (0x41, (2, 3)), (0x40, [4]), (0x41, array("B", [5]))], 8)
+    assert bursts == [(0x40, array("B", [1, 2, 3])), (0x40, array("B", [4, 5]))]
+    assert ApplicationBoard.merge_writes([(0x40, b"\x01\x02"), (0x42, b"\x03")], max_length=2) == [
+        (0x40, array("B", [1, 2])),
+        (0x42, array("B", [3])),
+    ]
+    bursts = ApplicationBoard.merge_reads([(0x03, 2), (0x05, 2), (0x04, 2)], max_length=8, register_width=2)
+    assert bursts == [(0x03, 2, [0]), (0x05, 2, [1]), (0x04, 2, [2])]
+    assert ApplicationBoard.merge_reads([(0x03, 2), (0x04, 4)], max_length=8, register_width=2) == [(0x03, 6, [0, 1])]
+    assert ApplicationBoard.merge_writes([(0x20, b"\x01\x02"), (0x21, b"\x03\x04")], 8, register_width=2) == [
+        (0x20, array("B", [1, 2, 3, 4])),
+    ]
+
+
+@pytest.mark.app_board
+def test_app_board_read_write_many(bst_app_board_with_serial: ApplicationBoard) -> None:
+    board = bst_app_board_with_serial
+    register_file = FakeRegisterFile()
+    with patch.object(board.protocol, "send_receive_many", side_effect=register_file.send_receive_many):
+        results = board.read_many([(0x12, 2), (0x14, 1), (0x00, 1), (0x15, 3)], i2c_address=0x18)
+        assert results == [
+            array("B", [0x12, 0x13]),
+            array("B", [0x14]),
+            array("B", [0x00]),
+            array("B", [0x15, 0x16, 0x17]),
+        ]
+        assert register_file.requests == [(0x12, 3), (0x00, 1), (0x15, 3)]
+
+        register_file.requests.clear()
+        board.write_many([(0x40, b"\xaa"), (0x41, b"\xbb\xcc"), (0x7C, [0x04])], i2c_address=0x18)
+        assert register_file.requests == [(0x40, 3), (0x7C, 1)]
+        assert register_file.registers[0x40:0x43] == b"\xaa\xbb\xcc"
+        assert register_file.registers[0x7C] == 0x04
+
+        with pytest.raises(AppBoardError):
+            board.read_many([(0x00, 1)])
+        with pytest.raises(AppBoardError):
+            board.write_many([(0x00, b"\x00")], i2c_address=0x18, cs_pin=MultiIOPin.MINI_SHUTTLE_PIN_2_1)
+
+    register_file = FakeRegisterFile(dummy_byte=True)
+    with patch.object(board.protocol, "send_receive_many", side_effect=register_file.send_receive_many):
+        results = board.read_many([(0x04, 2), (0x06, 2)], cs_pin=MultiIOPin.MINI_SHUTTLE_PIN_2_1, dummy_bytes=1)
+        assert results == [array("B", [0x04, 0x05]), array("B", [0x06, 0x07])]
+        assert register_file.requests == [(0x04, 5)]
+
+    # 16-bit register file as on the BMI323: register 0x03 holds bytes 6 and 7
+    register_file = FakeRegisterFile(register_width=2)
+    with patch.object(board.protocol, "send_receive_many", side_effect=register_file.send_receive_many):
+        results = board.read_many([(0x03, 2), (0x05, 2), (0x04, 2)], i2c_address=0x68, register_width=2)
+        assert results == [array("B", [6, 7]), array("B", [10, 11]), array("B", [8, 9])]
+        assert register_file.requests == [(0x03, 2), (0x05, 2), (0x04, 2)]
+
+        register_file.requests.clear()
+        results = board.read_many([(0x03, 2), (0x04, 2), (0x05, 4)], i2c_address=0x68, register_width=2)
+        assert results == [array("B", [6, 7]), array("B", [8, 9]), array("B", [10, 11, 12, 13])]
+        assert register_file.requests == [(0x03, 8)]
@@ -182,3 +182,63 @@ def test_bst_protocol_comm_serial() -> None:
 def test_bst_protocol_comm_usb() -> None:
     bst_protocol_usb = BstProtocol(comm="usb")
     assert isinstance(bst_protocol_usb.communication, UsbCommunication)
+
+
+def response_for(request_idx: int, status: int = 0x00) -> array:
+    return Command.create_message_from((0x01, status, 0x42, request_idx))
+
+
+STREAMING_PACKET = Command.create_message_from((0x01, 0x00, 0x87, 0x01, 0x11, 0x22))
+
+
+@pytest.mark.bst_protocol
+def test_bst_protocol_send_receive_many(bst_protocol_serial: BstProtocol) -> None:
+    messages = [Command.create_message_from((0x02, idx)) for idx in range(5)]
+    in_flight, max_in_flight = [], []
+
+    def send(message: array) -> bool:
+        in_flight.append(message[-3])
+        max_in_flight.append(len(in_flight))
+        return True
+
+    def receive() -> bytes:
+        # responses arrive coalesced, with a late streaming packet in between
+        data = bytes(STREAMING_PACKET) + b"".join(bytes(response_for(idx)) for idx in in_flight)
+        in_flight.clear()
+        return data
+
+    with (
+        patch.object(bst_protocol_serial, "send", side_effect=send),
+        patch.object(bst_protocol_serial, "receive", side_effect=receive),
+    ):
+        responses = bst_protocol_serial.send_receive_many(messages, max_in_flight=2)
+        assert [response[-3] for response in responses] == list(range(5))
+        assert max(max_in_flight) == 2
+        assert all(isinstance(response, array) for response in responses)
+
+        with bst_protocol_serial.pipeline() as pipeline:
+            indices = [pipeline.send_receive(message) for message in messages]
+        assert [pipeline.responses[idx][-3] for idx in indices] == list(range(5))
+        assert max(max_in_flight) == len(messages)
+
+
+@pytest.mark.bst_protocol
+def test_bst_protocol_send_receive_many_errors(bst_protocol_serial: BstProtocol) -> None:
+    messages = [Command.create_message_from((0x02, idx)) for idx in range(3)]
+    with (
+        patch.object(bst_protocol_serial, "send", return_value=True),
+        patch.object(bst_protocol_serial, "receive", return_value=response_for(0) + response_for(1, status=0x01)),
+        pytest.raises(BstProtocolError, match="Request 1 failed"),
+    ):
+        bst_protocol_serial.send_receive_many(messages)
+
+    with (
+        patch.object(bst_protocol_serial, "send", side_effect=[True, True, False]),
+        patch.object(bst_protocol_serial, "receive", return_value=response_for(0) + response_for(1)),
+        pytest.raises(BstProtocolError, match="Sending request 2 failed"),
+    ):
+        bst_protocol_serial.send_receive_many(messages, max_in_flight=2)
+
+    with patch.object(bst_protocol_serial, "send") as mocked_send:
+        assert bst_protocol_serial.send_receive_many([]) == []
+        mocked_send.assert_not_called()
@@ -0,0 +1,106 @@
+import logging
+
+import pytest
+
+from umrx_app_v3.mcu_board.bst_app_board import ApplicationBoard
+from umrx_app_v3.mcu_board.bst_protocol_constants import CommandId, CommandType, MultiIOPin, StreamingDataResponse
+from umrx_app_v3.mcu_board.bst_protocol_stats import (
+    command_key,
+    command_name,
+    LatencyHistogram,
+    ProtocolStats,
+    streaming_key,
+    UNFRAMED_KEY,
+)
+from umrx_app_v3.mcu_board.comm.emulator_comm import EmulatorCommunication, RegisterDevice
+from umrx_app_v3.mcu_board.commands.command import Command
+
+CS_PIN = MultiIOPin.MINI_SHUTTLE_PIN_2_1
+
+
+@pytest.fixture
+def board() -> ApplicationBoard:
+    emulator = EmulatorCommunication(shuttle_id=0x1A1)
+    emulator.attach_spi(CS_PIN, RegisterDevice({0x00: 0x1E}, spi_dummy_bytes=1))
+    board = ApplicationBoard(communication=emulator)
+    board.initialize()
+    board.start_communication()
+    return board
+
+
+def test_instrumentation_counts_and_latencies(board: ApplicationBoard) -> None:
+    stats = board.protocol.enable_instrumentation()
+    board.set_vdd_vddio(3.3, 3.3)
+    board.configure_spi()
+    for _ in range(3):
+        board.read_spi(CS_PIN, 0x00, 2)
+    board.write_many([(0x50, [1]), (0x60, [2])], cs_pin=CS_PIN)
+
+    snapshot = stats.snapshot()
+    vdd = snapshot["DD_SET/SHUTTLE_BOARD_VDD_VDDIO_CONFIGURATION"]
+    assert (vdd.requests, vdd.responses) == (1, 1)
+    assert vdd.bytes_sent > 0
+    assert vdd.bytes_received > 0
+    assert vdd.round_trip.count == 1
+    # the host time of a response is known once the next request goes out
+    assert vdd.host.count == 1
+
+    reads = snapshot["DD_GET/SENSOR_WRITE_AND_READ"]
+    assert (reads.requests, reads.responses, reads.round_trip.count) == (3, 3, 3)
+    writes = snapshot["DD_SET/SENSOR_WRITE_AND_READ"]
+    assert (writes.requests, writes.responses) == (2, 2), "pipelined responses are matched to their requests"
+    assert not stats.pending
+
+    board.protocol.disable_instrumentation()
+    assert "send" not in vars(board.protocol)
+    board.read_spi(CS_PIN, 0x00, 2)
+    assert stats.snapshot()["DD_GET/SENSOR_WRITE_AND_READ"].requests == 3
+    assert board.protocol.enable_instrumentation() is stats
+
+
+def test_instrumentation_snapshot_is_a_copy(board: ApplicationBoard) -> None:
+    stats = board.protocol.enable_instrumentation()
+    board.set_vdd_vddio(3.3, 3.3)
+    snapshot = stats.snapshot()
+    board.set_vdd_vddio(1.8, 1.8)
+    assert snapshot["DD_SET/SHUTTLE_BOARD_VDD_VDDIO_CONFIGURATION"].requests == 1
+    assert stats.snapshot()["DD_SET/SHUTTLE_BOARD_VDD_VDDIO_CONFIGURATION"].requests == 2
+    stats.reset()
+    assert stats.snapshot() == {}
+
+
+def test_instrumentation_summary_log(board: ApplicationBoard, caplog: pytest.LogCaptureFixture) -> None:
+    board.protocol.enable_instrumentation(summary_interval=0.0)
+    with caplog.at_level(logging.INFO, logger="umrx_app_v3.mcu_board.bst_protocol_stats"):
+        board.set_vdd_vddio(3.3, 3.3)
+    assert "DD_SET/SHUTTLE_BOARD_VDD_VDDIO_CONFIGURATION: requests=1 responses=1" in caplog.text
+
+
+def test_received_streaming_and_unframed_bytes() -> None:
+    stats = ProtocolStats(None)
+    frame = bytes(Command.create_message_from((0x01, 0, StreamingDataResponse.INTERRUPT.value, 1, 0, 0, 0, 1, 0xAB)))
+    stats.record_received(frame + frame + frame[:4], now=0.0)
+    streaming = stats.commands[streaming_key(StreamingDataResponse.INTERRUPT.value)]
+    assert (streaming.responses, streaming.bytes_received) == (2, 2 * len(frame))
+    assert stats.commands[UNFRAMED_KEY].bytes_received == 4
+
+
+def test_command_names() -> None:
+    board_info = Command.create_message_from((CommandType.DD_GET.value, CommandId.BOARD_INFORMATION.value))
+    assert command_name(command_key(board_info)) == "DD_GET/BOARD_INFORMATION"
+    start = Command.create_message_from((CommandType.DD_START_STOP_STREAMING_INTERRUPT.value, 0xFF))
+    assert command_name(command_key(start)) == "DD_START_STOP_STREAMING_INTERRUPT"
+    assert command_name(streaming_key(StreamingDataResponse.POLLING.value)) == "STREAMING_POLLING"
+    assert command_name((0x7F, None)) == "0x7F"
+
+
+def test_latency_histogram() -> None:
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) == 0.0
+    for latency in (100e-6, 200e-6, 300e-6, 10e-3):
+        histogram.add(latency)
+    assert histogram.count == 4
+    assert histogram.mean == pytest.approx(2.65e-3)
+    assert (histogram.min, histogram.max) == (100e-6, 10e-3)
+    assert histogram.percentile(50) == pytest.approx(256e-6)
+    assert histogram.percentile(100) == pytest.approx(10e-3)
@@ -0,0 +1,63 @@
+import subprocess
+import sys
+
+import pytest
+
+OFFLINE_MODULES = (
+    "umrx_app_v3.mcu_board.commands.streaming_batch",
+    "umrx_app_v3.shuttle_board.bma400.bma400_shuttle",
+    "umrx_app_v3.shuttle_board.bma456.bma456_shuttle",
+    "umrx_app_v3.shuttle_board.bma530.bma530_shuttle",
+    "umrx_app_v3.shuttle_board.bma580.bma580_shuttle",
+    "umrx_app_v3.shuttle_board.bme280.bme280_shuttle",
+    "umrx_app_v3.shuttle_board.bmi088.bmi088_shuttle",
+    "umrx_app_v3.shuttle_board.bmi323.bmi323_shuttle",
+    "umrx_app_v3.shuttle_board.bmm350.bmm350_shuttle",
+    "umrx_app_v3.shuttle_board.bmp390.bmp390_shuttle",
+    "umrx_app_v3.shuttle_board.bmp585.bmp585_shuttle",
+)
+# sum of the self import time of all `umrx_app_v3` modules, third-party packages are not counted
+IMPORT_TIME_BUDGET_US = 300_000
+
+
+def import_times(*modules: str) -> dict[str, int]:
+    statement = "; ".join(f"import {module}" for module in modules)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    )
+    self_times = {}
+    for line in result.stderr.splitlines()[1:]:
+        self_us, _, name = line.removeprefix("import time:").split("|")
+        self_times[name.strip()] = int(self_us)
+    return self_times
+
+
+def test_import_package_is_lazy() -> None:
+    imported = import_times("umrx_app_v3", "umrx_app_v3.mcu_board", "umrx_app_v3.shuttle_board")
+    assert "numpy" not in imported
+    assert not [name for name in imported if name.startswith("umrx_app_v3.") and name.count(".") > 1]
+
+
+@pytest.mark.parametrize("module", OFFLINE_MODULES)
+def test_offline_import_does_not_load_usb_serial(module: str) -> None:
+    imported = import_times(module)
+    assert module in imported
+    assert not [name for name in imported if name.split(".")[0] in ("usb", "serial")]
+
+
+def test_import_time_budget() -> None:
+    imported = import_times(*OFFLINE_MODULES)
+    own_import_time_us = sum(us for name, us in imported.items() if name.split(".")[0] == "umrx_app_v3")
+    assert own_import_time_us < IMPORT_TIME_BUDGET_US
+
+
+def test_lazy_attributes() -> None:
+    import umrx_app_v3
+    from umrx_app_v3 import mcu_board, shuttle_board
+
+    assert "shuttle_board" in dir(umrx_app_v3)
+    assert "BMM350Shuttle" in shuttle_board.__all__
+    assert shuttle_board.BMM350Shuttle.SHUTTLE_ID == 0x27
+    assert mcu_board.ApplicationBoard.__name__ == "ApplicationBoard"
+    with pytest.raises(AttributeError):
+        _ = shuttle_board.NoSuchShuttle